@@ -0,0 +1,58 @@
+"""Desktop fast path for loading the steam tables.
+
+tools/build_data.py writes a pickled cache next to steam_data.py; loading
+it skips re-tokenizing thousands of float literals on CPython. The cache is
+only trusted when it is at least as new as the Python module, and any
+problem falls back to a plain import. The TI bundle never uses this file.
+"""
+
+import array
+import os
+import pickle
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_PY_PATH = os.path.join(_HERE, "steam_data.py")
+_PKL_PATH = os.path.join(_HERE, "steam_data.pkl")
+
+_TABLE_KEYS = ("SAT_T", "SAT_P", "SH", "COMP", "PRECISION")
+
+
+def load_tables():
+    """Return {"SAT_T", "SAT_P", "SH", "COMP", "PRECISION"}."""
+    try:
+        if os.path.getmtime(_PKL_PATH) >= os.path.getmtime(_PY_PATH):
+            with open(_PKL_PATH, "rb") as handle:
+                payload = pickle.load(handle)
+            if all(key in payload for key in _TABLE_KEYS):
+                return payload
+    except Exception:
+        # Any cache problem — missing, truncated (EOFError), or unreadable —
+        # must degrade to the plain module import, never surface.
+        pass
+
+    from data import steam_data
+
+    return {key: getattr(steam_data, key) for key in _TABLE_KEYS}
+
+
+def _packed(column):
+    if column and isinstance(column[0], (list, tuple)):
+        return tuple(array.array("d", row) for row in column)
+    return array.array("d", column)
+
+
+def load_arrays():
+    """Like load_tables, but numeric columns become packed array('d') blocks.
+
+    Contiguous doubles keep a whole saturation column in a few cache lines
+    for desktop sweep scripts; the arrays index and bisect exactly like the
+    tuple columns. PRECISION stays a plain dict.
+    """
+    tables = load_tables()
+    out = {}
+    for key in _TABLE_KEYS:
+        if key == "PRECISION":
+            out[key] = tables[key]
+        else:
+            out[key] = {name: _packed(col) for name, col in tables[key].items()}
+    return out
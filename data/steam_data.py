@@ -2,12384 +2,584 @@
 Generated by tools/build_data.py from immutable canonical CSV tables.
 """
 
-SAT_T = {'T': [0.01,
-       5.0,
-       10.0,
-       15.0,
-       20.0,
-       25.0,
-       30.0,
-       35.0,
-       40.0,
-       45.0,
-       50.0,
-       55.0,
-       60.0,
-       65.0,
-       70.0,
-       75.0,
-       80.0,
-       85.0,
-       90.0,
-       95.0,
-       100.0,
-       105.0,
-       110.0,
-       115.0,
-       120.0,
-       125.0,
-       130.0,
-       135.0,
-       140.0,
-       145.0,
-       150.0,
-       155.0,
-       160.0,
-       165.0,
-       170.0,
-       175.0,
-       180.0,
-       185.0,
-       190.0,
-       195.0,
-       200.0,
-       205.0,
-       210.0,
-       215.0,
-       220.0,
-       225.0,
-       230.0,
-       235.0,
-       240.0,
-       245.0,
-       250.0,
-       255.0,
-       260.0,
-       265.0,
-       270.0,
-       275.0,
-       280.0,
-       285.0,
-       290.0,
-       295.0,
-       300.0,
-       305.0,
-       310.0,
-       315.0,
-       320.0,
-       325.0,
-       330.0,
-       335.0,
-       340.0,
-       345.0,
-       350.0,
-       355.0,
-       360.0,
-       365.0,
-       370.0,
-       373.95],
- 'P': [0.612,
-       0.873,
-       1.228,
-       1.706,
-       2.339,
-       3.17,
-       4.247,
-       5.629,
-       7.385,
-       9.595,
-       12.35,
-       15.76,
-       19.95,
-       25.04,
-       31.2,
-       38.6,
-       47.41,
-       57.87,
-       70.18,
-       84.61,
-       101.4,
-       120.9,
-       143.4,
-       169.2,
-       198.7,
-       232.2,
-       270.3,
-       313.2,
-       361.5,
-       415.7,
-       476.2,
-       543.5,
-       618.2,
-       700.9,
-       792.2,
-       892.6,
-       1002.8,
-       1123.5,
-       1255.2,
-       1398.8,
-       1554.9,
-       1724.3,
-       1907.7,
-       2105.8,
-       2319.6,
-       2549.7,
-       2797.1,
-       3062.5,
-       3346.9,
-       3651.2,
-       3976.2,
-       4322.9,
-       4692.3,
-       5085.3,
-       5503.0,
-       5946.4,
-       6416.6,
-       6914.7,
-       7441.8,
-       7999.1,
-       8587.9,
-       9209.4,
-       9865.1,
-       10556.0,
-       11284.0,
-       12051.0,
-       12858.0,
-       13707.0,
-       14601.0,
-       15541.0,
-       16529.0,
-       17570.0,
-       18666.0,
-       19821.0,
-       21044.0,
-       22064.0],
- 'vf': [0.001,
-        0.001,
-        0.001,
-        0.001001,
-        0.001002,
-        0.001003,
-        0.001004,
-        0.001006,
-        0.001008,
-        0.00101,
-        0.001012,
-        0.001015,
-        0.001017,
-        0.00102,
-        0.001023,
-        0.001026,
-        0.001029,
-        0.001032,
-        0.001036,
-        0.00104,
-        0.001043,
-        0.001047,
-        0.001052,
-        0.001056,
-        0.00106,
-        0.001065,
-        0.00107,
-        0.001075,
-        0.00108,
-        0.001085,
-        0.001091,
-        0.001096,
-        0.001102,
-        0.001108,
-        0.001114,
-        0.001121,
-        0.001127,
-        0.001134,
-        0.001141,
-        0.001149,
-        0.001157,
-        0.001164,
-        0.001173,
-        0.001181,
-        0.00119,
-        0.001199,
-        0.001209,
-        0.001219,
-        0.001229,
-        0.00124,
-        0.001252,
-        0.001264,
-        0.001276,
-        0.001289,
-        0.001303,
-        0.001318,
-        0.001333,
-        0.001349,
-        0.001366,
-        0.001385,
-        0.001404,
-        0.001425,
-        0.001448,
-        0.001472,
-        0.001499,
-        0.001528,
-        0.001561,
-        0.001597,
-        0.001638,
-        0.001685,
-        0.00174,
-        0.001808,
-        0.001895,
-        0.002017,
-        0.002215,
-        0.003106],
- 'vg': [205.99,
-        147.01,
-        106.3,
-        77.875,
-        57.757,
-        43.337,
-        32.878,
-        25.205,
-        19.515,
-        15.252,
-        12.027,
-        9.5643,
-        7.6672,
-        6.1935,
-        5.0395,
-        4.1289,
-        3.4052,
-        2.8258,
-        2.3591,
-        1.9806,
-        1.6718,
-        1.4184,
-        1.2093,
-        1.0358,
-        0.891212,
-        0.770026,
-        0.668005,
-        0.581729,
-        0.508454,
-        0.445962,
-        0.392453,
-        0.34646,
-        0.306782,
-        0.272431,
-        0.242589,
-        0.216581,
-        0.193842,
-        0.173901,
-        0.156362,
-        0.140892,
-        0.12721,
-        0.115078,
-        0.104292,
-        0.094679,
-        0.086092,
-        0.078403,
-        0.071503,
-        0.065298,
-        0.059705,
-        0.054654,
-        0.050083,
-        0.045938,
-        0.042173,
-        0.038746,
-        0.035621,
-        0.032766,
-        0.030153,
-        0.027756,
-        0.025555,
-        0.023529,
-        0.02166,
-        0.019933,
-        0.018335,
-        0.016851,
-        0.015471,
-        0.014183,
-        0.012979,
-        0.011847,
-        0.010781,
-        0.009769,
-        0.008802,
-        0.007868,
-        0.006949,
-        0.006012,
-        0.004954,
-        0.003106],
- 'uf': [0.0,
-        21.02,
-        42.02,
-        62.98,
-        83.91,
-        104.83,
-        125.73,
-        146.63,
-        167.53,
-        188.43,
-        209.33,
-        230.24,
-        251.16,
-        272.09,
-        293.03,
-        313.99,
-        334.96,
-        355.95,
-        376.97,
-        398.0,
-        419.06,
-        440.15,
-        461.26,
-        482.41,
-        503.6,
-        524.83,
-        546.09,
-        567.41,
-        588.77,
-        610.19,
-        631.66,
-        653.19,
-        674.79,
-        696.46,
-        718.2,
-        740.02,
-        761.92,
-        783.91,
-        806.0,
-        828.18,
-        850.47,
-        872.87,
-        895.39,
-        918.04,
-        940.82,
-        963.74,
-        986.81,
-        1010.0,
-        1033.4,
-        1057.0,
-        1080.8,
-        1104.8,
-        1129.0,
-        1153.4,
-        1178.1,
-        1203.1,
-        1228.3,
-        1253.9,
-        1279.9,
-        1306.2,
-        1332.9,
-        1360.2,
-        1387.9,
-        1416.3,
-        1445.3,
-        1475.1,
-        1505.8,
-        1537.6,
-        1570.6,
-        1605.3,
-        1642.1,
-        1682.0,
-        1726.3,
-        1777.8,
-        1844.1,
-        2015.7],
- 'ug': [2374.9,
-        2381.8,
-        2388.6,
-        2395.5,
-        2402.3,
-        2409.1,
-        2415.9,
-        2422.7,
-        2429.4,
-        2436.1,
-        2442.7,
-        2449.3,
-        2455.9,
-        2462.4,
-        2468.9,
-        2475.2,
-        2481.6,
-        2487.8,
-        2494.0,
-        2500.0,
-        2506.0,
-        2511.9,
-        2517.7,
-        2523.3,
-        2528.9,
-        2534.3,
-        2539.5,
-        2544.7,
-        2549.6,
-        2554.4,
-        2559.1,
-        2563.5,
-        2567.8,
-        2571.9,
-        2575.7,
-        2579.4,
-        2582.8,
-        2586.0,
-        2589.0,
-        2591.7,
-        2594.2,
-        2596.4,
-        2598.3,
-        2599.9,
-        2601.2,
-        2602.2,
-        2602.9,
-        2603.2,
-        2603.1,
-        2602.7,
-        2601.8,
-        2600.5,
-        2598.7,
-        2596.5,
-        2593.7,
-        2590.3,
-        2586.4,
-        2581.8,
-        2576.5,
-        2570.5,
-        2563.6,
-        2555.9,
-        2547.1,
-        2537.2,
-        2526.0,
-        2513.4,
-        2499.2,
-        2483.0,
-        2464.4,
-        2443.1,
-        2418.1,
-        2388.4,
-        2351.8,
-        2303.8,
-        2230.3,
-        2015.7],
- 'hf': [0.0,
-        21.02,
-        42.02,
-        62.98,
-        83.91,
-        104.83,
-        125.73,
-        146.63,
-        167.53,
-        188.43,
-        209.34,
-        230.26,
-        251.18,
-        272.12,
-        293.07,
-        314.03,
-        335.01,
-        356.01,
-        377.04,
-        398.09,
-        419.17,
-        440.27,
-        461.42,
-        482.59,
-        503.81,
-        525.07,
-        546.38,
-        567.74,
-        589.16,
-        610.64,
-        632.18,
-        653.79,
-        675.47,
-        697.24,
-        719.08,
-        741.02,
-        763.05,
-        785.19,
-        807.43,
-        829.79,
-        852.27,
-        874.88,
-        897.63,
-        920.53,
-        943.58,
-        966.8,
-        990.19,
-        1013.8,
-        1037.6,
-        1061.5,
-        1085.8,
-        1110.2,
-        1135.0,
-        1160.0,
-        1185.3,
-        1210.9,
-        1236.9,
-        1263.3,
-        1290.0,
-        1317.3,
-        1345.0,
-        1373.3,
-        1402.2,
-        1431.8,
-        1462.2,
-        1493.5,
-        1525.9,
-        1559.5,
-        1594.5,
-        1631.5,
-        1670.9,
-        1713.7,
-        1761.7,
-        1817.8,
-        1890.7,
-        2084.3],
- 'hg': [2500.9,
-        2510.1,
-        2519.2,
-        2528.3,
-        2537.4,
-        2546.5,
-        2555.5,
-        2564.5,
-        2573.5,
-        2582.4,
-        2591.3,
-        2600.1,
-        2608.8,
-        2617.5,
-        2626.1,
-        2634.6,
-        2643.0,
-        2651.3,
-        2659.5,
-        2667.6,
-        2675.6,
-        2683.4,
-        2691.1,
-        2698.6,
-        2705.9,
-        2713.1,
-        2720.1,
-        2726.9,
-        2733.4,
-        2739.8,
-        2745.9,
-        2751.8,
-        2757.4,
-        2762.8,
-        2767.9,
-        2772.7,
-        2777.2,
-        2781.4,
-        2785.3,
-        2788.8,
-        2792.0,
-        2794.8,
-        2797.3,
-        2799.3,
-        2800.9,
-        2802.1,
-        2802.9,
-        2803.2,
-        2803.0,
-        2802.2,
-        2800.9,
-        2799.1,
-        2796.6,
-        2793.5,
-        2789.7,
-        2785.2,
-        2779.9,
-        2773.7,
-        2766.7,
-        2758.7,
-        2749.6,
-        2739.4,
-        2727.9,
-        2715.1,
-        2700.6,
-        2684.3,
-        2666.0,
-        2645.4,
-        2621.8,
-        2594.9,
-        2563.6,
-        2526.6,
-        2481.5,
-        2422.9,
-        2334.5,
-        2084.3],
- 'sf': [0.0,
-        0.0763,
-        0.1511,
-        0.2245,
-        0.2965,
-        0.3672,
-        0.4368,
-        0.5051,
-        0.5724,
-        0.6386,
-        0.7038,
-        0.768,
-        0.8313,
-        0.8937,
-        0.9551,
-        1.0158,
-        1.0756,
-        1.1346,
-        1.1929,
-        1.2504,
-        1.3072,
-        1.3633,
-        1.4188,
-        1.4737,
-        1.5279,
-        1.5816,
-        1.6346,
-        1.6872,
-        1.7392,
-        1.7907,
-        1.8418,
-        1.8924,
-        1.9426,
-        1.9923,
-        2.0417,
-        2.0906,
-        2.1392,
-        2.1875,
-        2.2355,
-        2.2832,
-        2.3305,
-        2.3777,
-        2.4245,
-        2.4712,
-        2.5177,
-        2.564,
-        2.6101,
-        2.6561,
-        2.702,
-        2.7478,
-        2.7935,
-        2.8392,
-        2.8849,
-        2.9307,
-        2.9765,
-        3.0224,
-        3.0685,
-        3.1147,
-        3.1612,
-        3.208,
-        3.2552,
-        3.3028,
-        3.351,
-        3.3998,
-        3.4494,
-        3.5,
-        3.5518,
-        3.605,
-        3.6601,
-        3.7176,
-        3.7784,
-        3.8439,
-        3.9167,
-        4.0014,
-        4.1112,
-        4.407],
- 'sg': [9.1555,
-        9.0248,
-        8.8998,
-        8.7803,
-        8.666,
-        8.5566,
-        8.452,
-        8.3517,
-        8.2555,
-        8.1633,
-        8.0748,
-        7.9898,
-        7.9081,
-        7.8296,
-        7.754,
-        7.6812,
-        7.6111,
-        7.5434,
-        7.4781,
-        7.4151,
-        7.3541,
-        7.2952,
-        7.2381,
-        7.1828,
-        7.1291,
-        7.077,
-        7.0264,
-        6.9772,
-        6.9293,
-        6.8826,
-        6.8371,
-        6.7926,
-        6.7491,
-        6.7066,
-        6.665,
-        6.6241,
-        6.584,
-        6.5447,
-        6.5059,
-        6.4678,
-        6.4302,
-        6.393,
-        6.3563,
-        6.32,
-        6.284,
-        6.2483,
-        6.2128,
-        6.1775,
-        6.1423,
-        6.1072,
-        6.0721,
-        6.0369,
-        6.0016,
-        5.9661,
-        5.9304,
-        5.8944,
-        5.8579,
-        5.8209,
-        5.7834,
-        5.7451,
-        5.7059,
-        5.6657,
-        5.6244,
-        5.5816,
-        5.5372,
-        5.4908,
-        5.4422,
-        5.3906,
-        5.3356,
-        5.2762,
-        5.211,
-        5.138,
-        5.0536,
-        4.9497,
-        4.8012,
-        4.407]}
+SAT_T = {
+    'T': (0.01,5.0,10.0,15.0,20.0,25.0,30.0,35.0,40.0,45.0,50.0,55.0,60.0,65.0,70.0,75.0,80.0,85.0,90.0,95.0,100.0,105.0,110.0,115.0,120.0,125.0,130.0,135.0,140.0,145.0,150.0,155.0,160.0,165.0,170.0,175.0,180.0,185.0,190.0,195.0,200.0,205.0,210.0,215.0,220.0,225.0,230.0,235.0,240.0,245.0,250.0,255.0,260.0,265.0,270.0,275.0,280.0,285.0,290.0,295.0,300.0,305.0,310.0,315.0,320.0,325.0,330.0,335.0,340.0,345.0,350.0,355.0,360.0,365.0,370.0,373.95),
+    'P': (0.612,0.873,1.228,1.706,2.339,3.17,4.247,5.629,7.385,9.595,12.35,15.76,19.95,25.04,31.2,38.6,47.41,57.87,70.18,84.61,101.4,120.9,143.4,169.2,198.7,232.2,270.3,313.2,361.5,415.7,476.2,543.5,618.2,700.9,792.2,892.6,1002.8,1123.5,1255.2,1398.8,1554.9,1724.3,1907.7,2105.8,2319.6,2549.7,2797.1,3062.5,3346.9,3651.2,3976.2,4322.9,4692.3,5085.3,5503.0,5946.4,6416.6,6914.7,7441.8,7999.1,8587.9,9209.4,9865.1,10556.0,11284.0,12051.0,12858.0,13707.0,14601.0,15541.0,16529.0,17570.0,18666.0,19821.0,21044.0,22064.0),
+    'vf': (0.001,0.001,0.001,0.001001,0.001002,0.001003,0.001004,0.001006,0.001008,0.00101,0.001012,0.001015,0.001017,0.00102,0.001023,0.001026,0.001029,0.001032,0.001036,0.00104,0.001043,0.001047,0.001052,0.001056,0.00106,0.001065,0.00107,0.001075,0.00108,0.001085,0.001091,0.001096,0.001102,0.001108,0.001114,0.001121,0.001127,0.001134,0.001141,0.001149,0.001157,0.001164,0.001173,0.001181,0.00119,0.001199,0.001209,0.001219,0.001229,0.00124,0.001252,0.001264,0.001276,0.001289,0.001303,0.001318,0.001333,0.001349,0.001366,0.001385,0.001404,0.001425,0.001448,0.001472,0.001499,0.001528,0.001561,0.001597,0.001638,0.001685,0.00174,0.001808,0.001895,0.002017,0.002215,0.003106),
+    'vg': (205.99,147.01,106.3,77.875,57.757,43.337,32.878,25.205,19.515,15.252,12.027,9.5643,7.6672,6.1935,5.0395,4.1289,3.4052,2.8258,2.3591,1.9806,1.6718,1.4184,1.2093,1.0358,0.891212,0.770026,0.668005,0.581729,0.508454,0.445962,0.392453,0.34646,0.306782,0.272431,0.242589,0.216581,0.193842,0.173901,0.156362,0.140892,0.12721,0.115078,0.104292,0.094679,0.086092,0.078403,0.071503,0.065298,0.059705,0.054654,0.050083,0.045938,0.042173,0.038746,0.035621,0.032766,0.030153,0.027756,0.025555,0.023529,0.02166,0.019933,0.018335,0.016851,0.015471,0.014183,0.012979,0.011847,0.010781,0.009769,0.008802,0.007868,0.006949,0.006012,0.004954,0.003106),
+    'uf': (0.0,21.02,42.02,62.98,83.91,104.83,125.73,146.63,167.53,188.43,209.33,230.24,251.16,272.09,293.03,313.99,334.96,355.95,376.97,398.0,419.06,440.15,461.26,482.41,503.6,524.83,546.09,567.41,588.77,610.19,631.66,653.19,674.79,696.46,718.2,740.02,761.92,783.91,806.0,828.18,850.47,872.87,895.39,918.04,940.82,963.74,986.81,1010.0,1033.4,1057.0,1080.8,1104.8,1129.0,1153.4,1178.1,1203.1,1228.3,1253.9,1279.9,1306.2,1332.9,1360.2,1387.9,1416.3,1445.3,1475.1,1505.8,1537.6,1570.6,1605.3,1642.1,1682.0,1726.3,1777.8,1844.1,2015.7),
+    'ug': (2374.9,2381.8,2388.6,2395.5,2402.3,2409.1,2415.9,2422.7,2429.4,2436.1,2442.7,2449.3,2455.9,2462.4,2468.9,2475.2,2481.6,2487.8,2494.0,2500.0,2506.0,2511.9,2517.7,2523.3,2528.9,2534.3,2539.5,2544.7,2549.6,2554.4,2559.1,2563.5,2567.8,2571.9,2575.7,2579.4,2582.8,2586.0,2589.0,2591.7,2594.2,2596.4,2598.3,2599.9,2601.2,2602.2,2602.9,2603.2,2603.1,2602.7,2601.8,2600.5,2598.7,2596.5,2593.7,2590.3,2586.4,2581.8,2576.5,2570.5,2563.6,2555.9,2547.1,2537.2,2526.0,2513.4,2499.2,2483.0,2464.4,2443.1,2418.1,2388.4,2351.8,2303.8,2230.3,2015.7),
+    'hf': (0.0,21.02,42.02,62.98,83.91,104.83,125.73,146.63,167.53,188.43,209.34,230.26,251.18,272.12,293.07,314.03,335.01,356.01,377.04,398.09,419.17,440.27,461.42,482.59,503.81,525.07,546.38,567.74,589.16,610.64,632.18,653.79,675.47,697.24,719.08,741.02,763.05,785.19,807.43,829.79,852.27,874.88,897.63,920.53,943.58,966.8,990.19,1013.8,1037.6,1061.5,1085.8,1110.2,1135.0,1160.0,1185.3,1210.9,1236.9,1263.3,1290.0,1317.3,1345.0,1373.3,1402.2,1431.8,1462.2,1493.5,1525.9,1559.5,1594.5,1631.5,1670.9,1713.7,1761.7,1817.8,1890.7,2084.3),
+    'hg': (2500.9,2510.1,2519.2,2528.3,2537.4,2546.5,2555.5,2564.5,2573.5,2582.4,2591.3,2600.1,2608.8,2617.5,2626.1,2634.6,2643.0,2651.3,2659.5,2667.6,2675.6,2683.4,2691.1,2698.6,2705.9,2713.1,2720.1,2726.9,2733.4,2739.8,2745.9,2751.8,2757.4,2762.8,2767.9,2772.7,2777.2,2781.4,2785.3,2788.8,2792.0,2794.8,2797.3,2799.3,2800.9,2802.1,2802.9,2803.2,2803.0,2802.2,2800.9,2799.1,2796.6,2793.5,2789.7,2785.2,2779.9,2773.7,2766.7,2758.7,2749.6,2739.4,2727.9,2715.1,2700.6,2684.3,2666.0,2645.4,2621.8,2594.9,2563.6,2526.6,2481.5,2422.9,2334.5,2084.3),
+    'sf': (0.0,0.0763,0.1511,0.2245,0.2965,0.3672,0.4368,0.5051,0.5724,0.6386,0.7038,0.768,0.8313,0.8937,0.9551,1.0158,1.0756,1.1346,1.1929,1.2504,1.3072,1.3633,1.4188,1.4737,1.5279,1.5816,1.6346,1.6872,1.7392,1.7907,1.8418,1.8924,1.9426,1.9923,2.0417,2.0906,2.1392,2.1875,2.2355,2.2832,2.3305,2.3777,2.4245,2.4712,2.5177,2.564,2.6101,2.6561,2.702,2.7478,2.7935,2.8392,2.8849,2.9307,2.9765,3.0224,3.0685,3.1147,3.1612,3.208,3.2552,3.3028,3.351,3.3998,3.4494,3.5,3.5518,3.605,3.6601,3.7176,3.7784,3.8439,3.9167,4.0014,4.1112,4.407),
+    'sg': (9.1555,9.0248,8.8998,8.7803,8.666,8.5566,8.452,8.3517,8.2555,8.1633,8.0748,7.9898,7.9081,7.8296,7.754,7.6812,7.6111,7.5434,7.4781,7.4151,7.3541,7.2952,7.2381,7.1828,7.1291,7.077,7.0264,6.9772,6.9293,6.8826,6.8371,6.7926,6.7491,6.7066,6.665,6.6241,6.584,6.5447,6.5059,6.4678,6.4302,6.393,6.3563,6.32,6.284,6.2483,6.2128,6.1775,6.1423,6.1072,6.0721,6.0369,6.0016,5.9661,5.9304,5.8944,5.8579,5.8209,5.7834,5.7451,5.7059,5.6657,5.6244,5.5816,5.5372,5.4908,5.4422,5.3906,5.3356,5.2762,5.211,5.138,5.0536,4.9497,4.8012,4.407),
+}
 
-SAT_P = {'T': [0.03,
-       6.97,
-       13.02,
-       17.49,
-       21.08,
-       24.08,
-       26.67,
-       28.96,
-       31.01,
-       32.87,
-       34.58,
-       36.16,
-       37.63,
-       39.0,
-       40.29,
-       41.51,
-       42.66,
-       43.76,
-       44.81,
-       45.81,
-       53.97,
-       60.06,
-       64.96,
-       69.1,
-       72.68,
-       75.86,
-       78.71,
-       81.32,
-       91.76,
-       99.61,
-       105.97,
-       111.35,
-       116.04,
-       120.21,
-       123.97,
-       127.41,
-       130.58,
-       133.52,
-       136.27,
-       138.86,
-       141.3,
-       143.61,
-       147.9,
-       151.83,
-       155.46,
-       158.83,
-       161.98,
-       164.95,
-       167.75,
-       170.41,
-       172.94,
-       175.35,
-       177.66,
-       179.88,
-       184.06,
-       187.96,
-       191.6,
-       195.04,
-       198.29,
-       205.73,
-       212.38,
-       218.41,
-       223.95,
-       229.08,
-       233.85,
-       238.33,
-       242.56,
-       246.56,
-       250.35,
-       253.98,
-       257.44,
-       260.75,
-       263.94,
-       267.01,
-       269.97,
-       272.82,
-       275.58,
-       278.26,
-       280.86,
-       283.38,
-       285.83,
-       290.54,
-       295.01,
-       299.27,
-       303.34,
-       307.25,
-       311.0,
-       314.6,
-       318.08,
-       321.43,
-       324.68,
-       327.81,
-       330.85,
-       333.8,
-       336.67,
-       339.45,
-       342.16,
-       344.79,
-       347.35,
-       349.85,
-       352.29,
-       354.67,
-       356.99,
-       359.26,
-       361.47,
-       363.64,
-       365.75,
-       367.81,
-       369.83,
-       371.79,
-       373.71,
-       373.95],
- 'P': [0.6125,
-       1.0,
-       1.5,
-       2.0,
-       2.5,
-       3.0,
-       3.5,
-       4.0,
-       4.5,
-       5.0,
-       5.5,
-       6.0,
-       6.5,
-       7.0,
-       7.5,
-       8.0,
-       8.5,
-       9.0,
-       9.5,
-       10.0,
-       15.0,
-       20.0,
-       25.0,
-       30.0,
-       35.0,
-       40.0,
-       45.0,
-       50.0,
-       75.0,
-       100.0,
-       125.0,
-       150.0,
-       175.0,
-       200.0,
-       225.0,
-       250.0,
-       275.0,
-       300.0,
-       325.0,
-       350.0,
-       375.0,
-       400.0,
-       450.0,
-       500.0,
-       550.0,
-       600.0,
-       650.0,
-       700.0,
-       750.0,
-       800.0,
-       850.0,
-       900.0,
-       950.0,
-       1000.0,
-       1100.0,
-       1200.0,
-       1300.0,
-       1400.0,
-       1500.0,
-       1750.0,
-       2000.0,
-       2250.0,
-       2500.0,
-       2750.0,
-       3000.0,
-       3250.0,
-       3500.0,
-       3750.0,
-       4000.0,
-       4250.0,
-       4500.0,
-       4750.0,
-       5000.0,
-       5250.0,
-       5500.0,
-       5750.0,
-       6000.0,
-       6250.0,
-       6500.0,
-       6750.0,
-       7000.0,
-       7500.0,
-       8000.0,
-       8500.0,
-       9000.0,
-       9500.0,
-       10000.0,
-       10500.0,
-       11000.0,
-       11500.0,
-       12000.0,
-       12500.0,
-       13000.0,
-       13500.0,
-       14000.0,
-       14500.0,
-       15000.0,
-       15500.0,
-       16000.0,
-       16500.0,
-       17000.0,
-       17500.0,
-       18000.0,
-       18500.0,
-       19000.0,
-       19500.0,
-       20000.0,
-       20500.0,
-       21000.0,
-       21500.0,
-       22000.0,
-       22064.0],
- 'vf': [0.001,
-        0.001,
-        0.001001,
-        0.001001,
-        0.001002,
-        0.001003,
-        0.001003,
-        0.001004,
-        0.001005,
-        0.001005,
-        0.001006,
-        0.001006,
-        0.001007,
-        0.001008,
-        0.001008,
-        0.001008,
-        0.001009,
-        0.001009,
-        0.00101,
-        0.00101,
-        0.001014,
-        0.001017,
-        0.00102,
-        0.001022,
-        0.001024,
-        0.001026,
-        0.001028,
-        0.00103,
-        0.001037,
-        0.001043,
-        0.001048,
-        0.001053,
-        0.001057,
-        0.001061,
-        0.001064,
-        0.001067,
-        0.00107,
-        0.001073,
-        0.001076,
-        0.001079,
-        0.001081,
-        0.001084,
-        0.001088,
-        0.001093,
-        0.001097,
-        0.001101,
-        0.001104,
-        0.001108,
-        0.001111,
-        0.001115,
-        0.001118,
-        0.001121,
-        0.001124,
-        0.001127,
-        0.001133,
-        0.001139,
-        0.001144,
-        0.001149,
-        0.001154,
-        0.001166,
-        0.001177,
-        0.001187,
-        0.001197,
-        0.001207,
-        0.001217,
-        0.001226,
-        0.001235,
-        0.001244,
-        0.001253,
-        0.001261,
-        0.00127,
-        0.001278,
-        0.001286,
-        0.001295,
-        0.001303,
-        0.001311,
-        0.001319,
-        0.001327,
-        0.001336,
-        0.001344,
-        0.001352,
-        0.001368,
-        0.001385,
-        0.001401,
-        0.001418,
-        0.001435,
-        0.001453,
-        0.00147,
-        0.001489,
-        0.001507,
-        0.001526,
-        0.001546,
-        0.001566,
-        0.001588,
-        0.00161,
-        0.001633,
-        0.001657,
-        0.001682,
-        0.001709,
-        0.001738,
-        0.001769,
-        0.001803,
-        0.00184,
-        0.001881,
-        0.001927,
-        0.001979,
-        0.00204,
-        0.002113,
-        0.002206,
-        0.002347,
-        0.002704,
-        0.003106],
- 'vg': [205.72,
-        129.18,
-        87.959,
-        66.987,
-        54.24,
-        45.653,
-        39.466,
-        34.791,
-        31.131,
-        28.185,
-        25.762,
-        23.733,
-        22.009,
-        20.524,
-        19.233,
-        18.099,
-        17.095,
-        16.199,
-        15.396,
-        14.67,
-        10.02,
-        7.648,
-        6.2032,
-        5.2284,
-        45251.0,
-        3.993,
-        3.5759,
-        3.24,
-        2.217,
-        1.6939,
-        1.3749,
-        1.1593,
-        1.0036,
-        0.885682,
-        0.793202,
-        0.718659,
-        0.65725,
-        0.60576,
-        0.561939,
-        0.524179,
-        0.491292,
-        0.462383,
-        0.413897,
-        0.374806,
-        0.342596,
-        0.315583,
-        0.29259,
-        0.272775,
-        0.255514,
-        0.24034,
-        0.226891,
-        0.214887,
-        0.204103,
-        0.194362,
-        0.177448,
-        0.163262,
-        0.151186,
-        0.140778,
-        0.131711,
-        0.113435,
-        0.099585,
-        0.088715,
-        0.079949,
-        0.072725,
-        0.066664,
-        0.061505,
-        0.057058,
-        0.053183,
-        0.049776,
-        0.046756,
-        0.044059,
-        0.041636,
-        0.039446,
-        0.037457,
-        0.035642,
-        0.033978,
-        0.032448,
-        0.031035,
-        0.029727,
-        0.028511,
-        0.027378,
-        0.02533,
-        0.023526,
-        0.021923,
-        0.02049,
-        0.019199,
-        0.01803,
-        0.016965,
-        0.01599,
-        0.015093,
-        0.014264,
-        0.013496,
-        0.01278,
-        0.012112,
-        0.011485,
-        0.010895,
-        0.010338,
-        0.009811,
-        0.009309,
-        0.00883,
-        0.008371,
-        0.007929,
-        0.007502,
-        0.007086,
-        0.006677,
-        0.006273,
-        0.005865,
-        0.005446,
-        0.004996,
-        0.004473,
-        0.003647,
-        0.003106],
- 'uf': [0.0,
-        29.3,
-        54.68,
-        73.43,
-        88.42,
-        100.97,
-        111.82,
-        121.38,
-        129.96,
-        137.74,
-        144.88,
-        151.47,
-        157.61,
-        163.34,
-        168.74,
-        173.83,
-        178.66,
-        183.24,
-        187.62,
-        191.8,
-        225.93,
-        251.4,
-        271.93,
-        289.24,
-        304.27,
-        317.58,
-        329.57,
-        340.49,
-        384.36,
-        417.4,
-        444.22,
-        466.97,
-        486.82,
-        504.49,
-        520.47,
-        535.08,
-        548.56,
-        561.1,
-        572.84,
-        583.88,
-        594.32,
-        604.22,
-        622.65,
-        639.54,
-        655.16,
-        669.72,
-        683.36,
-        696.23,
-        708.4,
-        719.97,
-        731.0,
-        741.55,
-        751.67,
-        761.39,
-        779.78,
-        796.96,
-        813.11,
-        828.36,
-        842.83,
-        876.13,
-        906.14,
-        933.57,
-        958.91,
-        982.53,
-        1004.7,
-        1025.6,
-        1045.5,
-        1064.4,
-        1082.5,
-        1099.8,
-        1116.5,
-        1132.6,
-        1148.2,
-        1163.3,
-        1177.9,
-        1192.2,
-        1206.0,
-        1219.5,
-        1232.7,
-        1245.6,
-        1258.2,
-        1282.7,
-        1306.2,
-        1329.0,
-        1351.1,
-        1372.6,
-        1393.5,
-        1414.0,
-        1434.1,
-        1453.8,
-        1473.1,
-        1492.3,
-        1511.1,
-        1529.9,
-        1548.4,
-        1566.9,
-        1585.3,
-        1603.8,
-        1622.3,
-        1641.0,
-        1659.9,
-        1679.2,
-        1699.0,
-        1719.3,
-        1740.5,
-        1762.8,
-        1786.4,
-        1812.0,
-        1841.2,
-        1879.1,
-        1951.8,
-        2015.7],
- 'ug': [2374.9,
-        2384.5,
-        2392.8,
-        2398.9,
-        2403.8,
-        2407.9,
-        2411.4,
-        2414.5,
-        2417.3,
-        2419.8,
-        2422.1,
-        2424.2,
-        2426.2,
-        2428.0,
-        2429.8,
-        2431.4,
-        2433.0,
-        2434.4,
-        2435.8,
-        2437.2,
-        2448.0,
-        2456.0,
-        2462.4,
-        2467.7,
-        2472.3,
-        2476.3,
-        2479.9,
-        2483.2,
-        2496.1,
-        2505.6,
-        2513.0,
-        2519.2,
-        2524.5,
-        2529.1,
-        2533.2,
-        2536.8,
-        2540.1,
-        2543.2,
-        2545.9,
-        2548.5,
-        2550.9,
-        2553.1,
-        2557.1,
-        2560.7,
-        2563.9,
-        2566.8,
-        2569.4,
-        2571.8,
-        2574.0,
-        2576.0,
-        2577.9,
-        2579.6,
-        2581.2,
-        2582.7,
-        2585.5,
-        2587.8,
-        2589.9,
-        2591.8,
-        2593.4,
-        2596.7,
-        2599.1,
-        2600.9,
-        2602.1,
-        2602.8,
-        2603.2,
-        2603.2,
-        2602.9,
-        2602.4,
-        2601.7,
-        2600.8,
-        2599.7,
-        2598.4,
-        2597.0,
-        2595.4,
-        2593.7,
-        2591.9,
-        2589.9,
-        2587.8,
-        2585.7,
-        2583.4,
-        2581.0,
-        2575.9,
-        2570.5,
-        2564.7,
-        2558.5,
-        2552.0,
-        2545.2,
-        2538.0,
-        2530.5,
-        2522.6,
-        2514.3,
-        2505.6,
-        2496.5,
-        2487.0,
-        2477.1,
-        2466.6,
-        2455.6,
-        2444.1,
-        2431.8,
-        2418.9,
-        2405.2,
-        2390.5,
-        2374.8,
-        2357.8,
-        2339.1,
-        2318.5,
-        2295.0,
-        2267.6,
-        2233.7,
-        2186.9,
-        2092.8,
-        2015.7],
- 'hf': [0.0,
-        29.3,
-        54.68,
-        73.43,
-        88.42,
-        100.98,
-        111.82,
-        121.39,
-        129.96,
-        137.75,
-        144.88,
-        151.48,
-        157.61,
-        163.35,
-        168.75,
-        173.84,
-        178.67,
-        183.25,
-        187.63,
-        191.81,
-        225.94,
-        251.42,
-        271.96,
-        289.27,
-        304.3,
-        317.62,
-        329.62,
-        340.54,
-        384.44,
-        417.5,
-        444.35,
-        467.13,
-        487.0,
-        504.7,
-        520.71,
-        535.34,
-        548.86,
-        561.43,
-        573.19,
-        584.26,
-        594.73,
-        604.65,
-        623.14,
-        640.09,
-        655.76,
-        670.38,
-        684.08,
-        697.0,
-        709.24,
-        720.86,
-        731.95,
-        742.56,
-        752.74,
-        762.52,
-        781.03,
-        798.33,
-        814.6,
-        829.97,
-        844.56,
-        878.17,
-        908.5,
-        936.24,
-        961.91,
-        985.85,
-        1008.4,
-        1029.6,
-        1049.8,
-        1069.1,
-        1087.5,
-        1105.2,
-        1122.2,
-        1138.7,
-        1154.6,
-        1170.1,
-        1185.1,
-        1199.7,
-        1213.9,
-        1227.8,
-        1241.4,
-        1254.7,
-        1267.7,
-        1292.9,
-        1317.3,
-        1340.9,
-        1363.9,
-        1386.2,
-        1408.1,
-        1429.4,
-        1450.4,
-        1471.1,
-        1491.5,
-        1511.6,
-        1531.5,
-        1551.3,
-        1571.0,
-        1590.6,
-        1610.2,
-        1629.9,
-        1649.7,
-        1669.7,
-        1690.0,
-        1710.8,
-        1732.1,
-        1754.1,
-        1777.2,
-        1801.4,
-        1827.2,
-        1855.3,
-        1887.6,
-        1929.5,
-        2011.3,
-        2084.3],
- 'hg': [2501.0,
-        2513.7,
-        2524.7,
-        2532.9,
-        2539.4,
-        2544.8,
-        2549.5,
-        2553.7,
-        2557.4,
-        2560.7,
-        2563.8,
-        2566.6,
-        2569.3,
-        2571.7,
-        2574.0,
-        2576.2,
-        2578.3,
-        2580.2,
-        2582.1,
-        2583.9,
-        2598.3,
-        2608.9,
-        2617.4,
-        2624.5,
-        2630.7,
-        2636.1,
-        2640.9,
-        2645.2,
-        2662.4,
-        2674.9,
-        2684.9,
-        2693.1,
-        2700.1,
-        2706.2,
-        2711.6,
-        2716.5,
-        2720.9,
-        2724.9,
-        2728.6,
-        2732.0,
-        2735.1,
-        2738.1,
-        2743.4,
-        2748.1,
-        2752.3,
-        2756.1,
-        2759.6,
-        2762.8,
-        2765.6,
-        2768.3,
-        2770.8,
-        2773.0,
-        2775.1,
-        2777.1,
-        2780.6,
-        2783.7,
-        2786.5,
-        2788.8,
-        2791.0,
-        2795.2,
-        2798.3,
-        2800.5,
-        2801.9,
-        2802.8,
-        2803.2,
-        2803.1,
-        2802.6,
-        2801.9,
-        2800.8,
-        2799.5,
-        2797.9,
-        2796.2,
-        2794.2,
-        2792.0,
-        2789.7,
-        2787.2,
-        2784.6,
-        2781.8,
-        2778.9,
-        2775.8,
-        2772.6,
-        2765.9,
-        2758.7,
-        2751.0,
-        2742.9,
-        2734.4,
-        2725.5,
-        2716.1,
-        2706.3,
-        2696.1,
-        2685.4,
-        2674.3,
-        2662.7,
-        2650.5,
-        2637.9,
-        2624.6,
-        2610.7,
-        2596.1,
-        2580.8,
-        2564.6,
-        2547.5,
-        2529.3,
-        2509.8,
-        2488.8,
-        2466.0,
-        2440.8,
-        2412.3,
-        2379.3,
-        2338.6,
-        2283.1,
-        2173.1,
-        2084.3],
- 'sf': [0.0,
-        0.1059,
-        0.1956,
-        0.2606,
-        0.3118,
-        0.3543,
-        0.3906,
-        0.4224,
-        0.4507,
-        0.4762,
-        0.4994,
-        0.5208,
-        0.5406,
-        0.559,
-        0.5763,
-        0.5925,
-        0.6078,
-        0.6223,
-        0.6361,
-        0.6492,
-        0.7549,
-        0.832,
-        0.8932,
-        0.9441,
-        0.9877,
-        1.0261,
-        1.0603,
-        1.0912,
-        1.2132,
-        1.3028,
-        1.3741,
-        1.4337,
-        1.485,
-        1.5302,
-        1.5706,
-        1.6072,
-        1.6408,
-        1.6717,
-        1.7005,
-        1.7274,
-        1.7526,
-        1.7765,
-        1.8205,
-        1.8604,
-        1.897,
-        1.9308,
-        1.9623,
-        1.9918,
-        2.0195,
-        2.0457,
-        2.0705,
-        2.094,
-        2.1165,
-        2.1381,
-        2.1785,
-        2.2159,
-        2.2508,
-        2.2835,
-        2.3143,
-        2.3845,
-        2.4468,
-        2.5029,
-        2.5543,
-        2.6016,
-        2.6455,
-        2.6867,
-        2.7254,
-        2.762,
-        2.7968,
-        2.8299,
-        2.8615,
-        2.8918,
-        2.921,
-        2.9491,
-        2.9762,
-        3.0024,
-        3.0278,
-        3.0524,
-        3.0764,
-        3.0997,
-        3.1224,
-        3.1662,
-        3.2081,
-        3.2483,
-        3.287,
-        3.3244,
-        3.3606,
-        3.3959,
-        3.4303,
-        3.4638,
-        3.4967,
-        3.529,
-        3.5608,
-        3.5921,
-        3.6232,
-        3.6539,
-        3.6846,
-        3.7151,
-        3.7457,
-        3.7765,
-        3.8077,
-        3.8394,
-        3.8718,
-        3.9053,
-        3.9401,
-        3.9767,
-        4.0156,
-        4.0579,
-        4.1064,
-        4.1698,
-        4.2945,
-        4.407],
- 'sg': [9.155,
-        8.9749,
-        8.827,
-        8.7226,
-        8.642,
-        8.5764,
-        8.5211,
-        8.4734,
-        8.4313,
-        8.3938,
-        8.3599,
-        8.329,
-        8.3007,
-        8.2745,
-        8.2501,
-        8.2273,
-        8.206,
-        8.1858,
-        8.1668,
-        8.1488,
-        8.0071,
-        7.9072,
-        7.8302,
-        7.7675,
-        7.7146,
-        7.669,
-        7.6288,
-        7.593,
-        7.4557,
-        7.3588,
-        7.284,
-        7.223,
-        7.1715,
-        7.1269,
-        7.0876,
-        7.0524,
-        7.0207,
-        6.9916,
-        6.9649,
-        6.9401,
-        6.9171,
-        6.8955,
-        6.856,
-        6.8207,
-        6.7886,
-        6.7592,
-        6.7322,
-        6.7071,
-        6.6836,
-        6.6616,
-        6.6409,
-        6.6213,
-        6.6027,
-        6.585,
-        6.552,
-        6.5217,
-        6.4936,
-        6.4675,
-        6.443,
-        6.3877,
-        6.339,
-        6.2954,
-        6.2558,
-        6.2194,
-        6.1856,
-        6.154,
-        6.1243,
-        6.0963,
-        6.0696,
-        6.0441,
-        6.0197,
-        5.9963,
-        5.9737,
-        5.9518,
-        5.9307,
-        5.9101,
-        5.8901,
-        5.8706,
-        5.8516,
-        5.833,
-        5.8148,
-        5.7793,
-        5.745,
-        5.7117,
-        5.6791,
-        5.6473,
-        5.616,
-        5.5851,
-        5.5545,
-        5.5241,
-        5.4939,
-        5.4638,
-        5.4336,
-        5.4032,
-        5.3727,
-        5.3418,
-        5.3106,
-        5.2788,
-        5.2463,
-        5.213,
-        5.1787,
-        5.1431,
-        5.1061,
-        5.067,
-        5.0256,
-        4.9808,
-        4.9314,
-        4.8753,
-        4.8079,
-        4.7181,
-        4.5446,
-        4.407]}
+SAT_P = {
+    'T': (0.03,6.97,13.02,17.49,21.08,24.08,26.67,28.96,31.01,32.87,34.58,36.16,37.63,39.0,40.29,41.51,42.66,43.76,44.81,45.81,53.97,60.06,64.96,69.1,72.68,75.86,78.71,81.32,91.76,99.61,105.97,111.35,116.04,120.21,123.97,127.41,130.58,133.52,136.27,138.86,141.3,143.61,147.9,151.83,155.46,158.83,161.98,164.95,167.75,170.41,172.94,175.35,177.66,179.88,184.06,187.96,191.6,195.04,198.29,205.73,212.38,218.41,223.95,229.08,233.85,238.33,242.56,246.56,250.35,253.98,257.44,260.75,263.94,267.01,269.97,272.82,275.58,278.26,280.86,283.38,285.83,290.54,295.01,299.27,303.34,307.25,311.0,314.6,318.08,321.43,324.68,327.81,330.85,333.8,336.67,339.45,342.16,344.79,347.35,349.85,352.29,354.67,356.99,359.26,361.47,363.64,365.75,367.81,369.83,371.79,373.71,373.95),
+    'P': (0.6125,1.0,1.5,2.0,2.5,3.0,3.5,4.0,4.5,5.0,5.5,6.0,6.5,7.0,7.5,8.0,8.5,9.0,9.5,10.0,15.0,20.0,25.0,30.0,35.0,40.0,45.0,50.0,75.0,100.0,125.0,150.0,175.0,200.0,225.0,250.0,275.0,300.0,325.0,350.0,375.0,400.0,450.0,500.0,550.0,600.0,650.0,700.0,750.0,800.0,850.0,900.0,950.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1750.0,2000.0,2250.0,2500.0,2750.0,3000.0,3250.0,3500.0,3750.0,4000.0,4250.0,4500.0,4750.0,5000.0,5250.0,5500.0,5750.0,6000.0,6250.0,6500.0,6750.0,7000.0,7500.0,8000.0,8500.0,9000.0,9500.0,10000.0,10500.0,11000.0,11500.0,12000.0,12500.0,13000.0,13500.0,14000.0,14500.0,15000.0,15500.0,16000.0,16500.0,17000.0,17500.0,18000.0,18500.0,19000.0,19500.0,20000.0,20500.0,21000.0,21500.0,22000.0,22064.0),
+    'vf': (0.001,0.001,0.001001,0.001001,0.001002,0.001003,0.001003,0.001004,0.001005,0.001005,0.001006,0.001006,0.001007,0.001008,0.001008,0.001008,0.001009,0.001009,0.00101,0.00101,0.001014,0.001017,0.00102,0.001022,0.001024,0.001026,0.001028,0.00103,0.001037,0.001043,0.001048,0.001053,0.001057,0.001061,0.001064,0.001067,0.00107,0.001073,0.001076,0.001079,0.001081,0.001084,0.001088,0.001093,0.001097,0.001101,0.001104,0.001108,0.001111,0.001115,0.001118,0.001121,0.001124,0.001127,0.001133,0.001139,0.001144,0.001149,0.001154,0.001166,0.001177,0.001187,0.001197,0.001207,0.001217,0.001226,0.001235,0.001244,0.001253,0.001261,0.00127,0.001278,0.001286,0.001295,0.001303,0.001311,0.001319,0.001327,0.001336,0.001344,0.001352,0.001368,0.001385,0.001401,0.001418,0.001435,0.001453,0.00147,0.001489,0.001507,0.001526,0.001546,0.001566,0.001588,0.00161,0.001633,0.001657,0.001682,0.001709,0.001738,0.001769,0.001803,0.00184,0.001881,0.001927,0.001979,0.00204,0.002113,0.002206,0.002347,0.002704,0.003106),
+    'vg': (205.72,129.18,87.959,66.987,54.24,45.653,39.466,34.791,31.131,28.185,25.762,23.733,22.009,20.524,19.233,18.099,17.095,16.199,15.396,14.67,10.02,7.648,6.2032,5.2284,45251.0,3.993,3.5759,3.24,2.217,1.6939,1.3749,1.1593,1.0036,0.885682,0.793202,0.718659,0.65725,0.60576,0.561939,0.524179,0.491292,0.462383,0.413897,0.374806,0.342596,0.315583,0.29259,0.272775,0.255514,0.24034,0.226891,0.214887,0.204103,0.194362,0.177448,0.163262,0.151186,0.140778,0.131711,0.113435,0.099585,0.088715,0.079949,0.072725,0.066664,0.061505,0.057058,0.053183,0.049776,0.046756,0.044059,0.041636,0.039446,0.037457,0.035642,0.033978,0.032448,0.031035,0.029727,0.028511,0.027378,0.02533,0.023526,0.021923,0.02049,0.019199,0.01803,0.016965,0.01599,0.015093,0.014264,0.013496,0.01278,0.012112,0.011485,0.010895,0.010338,0.009811,0.009309,0.00883,0.008371,0.007929,0.007502,0.007086,0.006677,0.006273,0.005865,0.005446,0.004996,0.004473,0.003647,0.003106),
+    'uf': (0.0,29.3,54.68,73.43,88.42,100.97,111.82,121.38,129.96,137.74,144.88,151.47,157.61,163.34,168.74,173.83,178.66,183.24,187.62,191.8,225.93,251.4,271.93,289.24,304.27,317.58,329.57,340.49,384.36,417.4,444.22,466.97,486.82,504.49,520.47,535.08,548.56,561.1,572.84,583.88,594.32,604.22,622.65,639.54,655.16,669.72,683.36,696.23,708.4,719.97,731.0,741.55,751.67,761.39,779.78,796.96,813.11,828.36,842.83,876.13,906.14,933.57,958.91,982.53,1004.7,1025.6,1045.5,1064.4,1082.5,1099.8,1116.5,1132.6,1148.2,1163.3,1177.9,1192.2,1206.0,1219.5,1232.7,1245.6,1258.2,1282.7,1306.2,1329.0,1351.1,1372.6,1393.5,1414.0,1434.1,1453.8,1473.1,1492.3,1511.1,1529.9,1548.4,1566.9,1585.3,1603.8,1622.3,1641.0,1659.9,1679.2,1699.0,1719.3,1740.5,1762.8,1786.4,1812.0,1841.2,1879.1,1951.8,2015.7),
+    'ug': (2374.9,2384.5,2392.8,2398.9,2403.8,2407.9,2411.4,2414.5,2417.3,2419.8,2422.1,2424.2,2426.2,2428.0,2429.8,2431.4,2433.0,2434.4,2435.8,2437.2,2448.0,2456.0,2462.4,2467.7,2472.3,2476.3,2479.9,2483.2,2496.1,2505.6,2513.0,2519.2,2524.5,2529.1,2533.2,2536.8,2540.1,2543.2,2545.9,2548.5,2550.9,2553.1,2557.1,2560.7,2563.9,2566.8,2569.4,2571.8,2574.0,2576.0,2577.9,2579.6,2581.2,2582.7,2585.5,2587.8,2589.9,2591.8,2593.4,2596.7,2599.1,2600.9,2602.1,2602.8,2603.2,2603.2,2602.9,2602.4,2601.7,2600.8,2599.7,2598.4,2597.0,2595.4,2593.7,2591.9,2589.9,2587.8,2585.7,2583.4,2581.0,2575.9,2570.5,2564.7,2558.5,2552.0,2545.2,2538.0,2530.5,2522.6,2514.3,2505.6,2496.5,2487.0,2477.1,2466.6,2455.6,2444.1,2431.8,2418.9,2405.2,2390.5,2374.8,2357.8,2339.1,2318.5,2295.0,2267.6,2233.7,2186.9,2092.8,2015.7),
+    'hf': (0.0,29.3,54.68,73.43,88.42,100.98,111.82,121.39,129.96,137.75,144.88,151.48,157.61,163.35,168.75,173.84,178.67,183.25,187.63,191.81,225.94,251.42,271.96,289.27,304.3,317.62,329.62,340.54,384.44,417.5,444.35,467.13,487.0,504.7,520.71,535.34,548.86,561.43,573.19,584.26,594.73,604.65,623.14,640.09,655.76,670.38,684.08,697.0,709.24,720.86,731.95,742.56,752.74,762.52,781.03,798.33,814.6,829.97,844.56,878.17,908.5,936.24,961.91,985.85,1008.4,1029.6,1049.8,1069.1,1087.5,1105.2,1122.2,1138.7,1154.6,1170.1,1185.1,1199.7,1213.9,1227.8,1241.4,1254.7,1267.7,1292.9,1317.3,1340.9,1363.9,1386.2,1408.1,1429.4,1450.4,1471.1,1491.5,1511.6,1531.5,1551.3,1571.0,1590.6,1610.2,1629.9,1649.7,1669.7,1690.0,1710.8,1732.1,1754.1,1777.2,1801.4,1827.2,1855.3,1887.6,1929.5,2011.3,2084.3),
+    'hg': (2501.0,2513.7,2524.7,2532.9,2539.4,2544.8,2549.5,2553.7,2557.4,2560.7,2563.8,2566.6,2569.3,2571.7,2574.0,2576.2,2578.3,2580.2,2582.1,2583.9,2598.3,2608.9,2617.4,2624.5,2630.7,2636.1,2640.9,2645.2,2662.4,2674.9,2684.9,2693.1,2700.1,2706.2,2711.6,2716.5,2720.9,2724.9,2728.6,2732.0,2735.1,2738.1,2743.4,2748.1,2752.3,2756.1,2759.6,2762.8,2765.6,2768.3,2770.8,2773.0,2775.1,2777.1,2780.6,2783.7,2786.5,2788.8,2791.0,2795.2,2798.3,2800.5,2801.9,2802.8,2803.2,2803.1,2802.6,2801.9,2800.8,2799.5,2797.9,2796.2,2794.2,2792.0,2789.7,2787.2,2784.6,2781.8,2778.9,2775.8,2772.6,2765.9,2758.7,2751.0,2742.9,2734.4,2725.5,2716.1,2706.3,2696.1,2685.4,2674.3,2662.7,2650.5,2637.9,2624.6,2610.7,2596.1,2580.8,2564.6,2547.5,2529.3,2509.8,2488.8,2466.0,2440.8,2412.3,2379.3,2338.6,2283.1,2173.1,2084.3),
+    'sf': (0.0,0.1059,0.1956,0.2606,0.3118,0.3543,0.3906,0.4224,0.4507,0.4762,0.4994,0.5208,0.5406,0.559,0.5763,0.5925,0.6078,0.6223,0.6361,0.6492,0.7549,0.832,0.8932,0.9441,0.9877,1.0261,1.0603,1.0912,1.2132,1.3028,1.3741,1.4337,1.485,1.5302,1.5706,1.6072,1.6408,1.6717,1.7005,1.7274,1.7526,1.7765,1.8205,1.8604,1.897,1.9308,1.9623,1.9918,2.0195,2.0457,2.0705,2.094,2.1165,2.1381,2.1785,2.2159,2.2508,2.2835,2.3143,2.3845,2.4468,2.5029,2.5543,2.6016,2.6455,2.6867,2.7254,2.762,2.7968,2.8299,2.8615,2.8918,2.921,2.9491,2.9762,3.0024,3.0278,3.0524,3.0764,3.0997,3.1224,3.1662,3.2081,3.2483,3.287,3.3244,3.3606,3.3959,3.4303,3.4638,3.4967,3.529,3.5608,3.5921,3.6232,3.6539,3.6846,3.7151,3.7457,3.7765,3.8077,3.8394,3.8718,3.9053,3.9401,3.9767,4.0156,4.0579,4.1064,4.1698,4.2945,4.407),
+    'sg': (9.155,8.9749,8.827,8.7226,8.642,8.5764,8.5211,8.4734,8.4313,8.3938,8.3599,8.329,8.3007,8.2745,8.2501,8.2273,8.206,8.1858,8.1668,8.1488,8.0071,7.9072,7.8302,7.7675,7.7146,7.669,7.6288,7.593,7.4557,7.3588,7.284,7.223,7.1715,7.1269,7.0876,7.0524,7.0207,6.9916,6.9649,6.9401,6.9171,6.8955,6.856,6.8207,6.7886,6.7592,6.7322,6.7071,6.6836,6.6616,6.6409,6.6213,6.6027,6.585,6.552,6.5217,6.4936,6.4675,6.443,6.3877,6.339,6.2954,6.2558,6.2194,6.1856,6.154,6.1243,6.0963,6.0696,6.0441,6.0197,5.9963,5.9737,5.9518,5.9307,5.9101,5.8901,5.8706,5.8516,5.833,5.8148,5.7793,5.745,5.7117,5.6791,5.6473,5.616,5.5851,5.5545,5.5241,5.4939,5.4638,5.4336,5.4032,5.3727,5.3418,5.3106,5.2788,5.2463,5.213,5.1787,5.1431,5.1061,5.067,5.0256,4.9808,4.9314,4.8753,4.8079,4.7181,4.5446,4.407),
+}
 
-SH = {'P': [10.0,
-       20.0,
-       30.0,
-       50.0,
-       75.0,
-       100.0,
-       150.0,
-       200.0,
-       250.0,
-       300.0,
-       350.0,
-       400.0,
-       450.0,
-       500.0,
-       600.0,
-       700.0,
-       800.0,
-       900.0,
-       1000.0,
-       1200.0,
-       1400.0,
-       1600.0,
-       1800.0,
-       2000.0,
-       2250.0,
-       2500.0,
-       2750.0,
-       3000.0,
-       3250.0,
-       3500.0,
-       3750.0,
-       4000.0,
-       4250.0,
-       4500.0,
-       4750.0,
-       5000.0,
-       5500.0,
-       6000.0,
-       6500.0,
-       7000.0,
-       7500.0,
-       8000.0,
-       8500.0,
-       9000.0,
-       9500.0,
-       10000.0,
-       11000.0,
-       12000.0,
-       13000.0,
-       14000.0,
-       15000.0,
-       16000.0,
-       17000.0,
-       18000.0,
-       19000.0,
-       20000.0,
-       22500.0,
-       25000.0,
-       27500.0,
-       30000.0,
-       32500.0,
-       35000.0,
-       37500.0,
-       40000.0,
-       42500.0,
-       45000.0,
-       47500.0,
-       50000.0,
-       52500.0,
-       55000.0,
-       57500.0,
-       60000.0,
-       62500.0],
- 'T_by_P': [[45.81,
-             50.0,
-             100.0,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [60.06,
-             100.0,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [69.1,
-             100.0,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [81.32,
-             100.0,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [91.76,
-             100.0,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [99.61,
-             100.0,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [111.35,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [120.21,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [127.41,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [133.52,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [138.86,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [143.61,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [147.9,
-             150.0,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [151.83,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [158.83,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [164.95,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [170.41,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [175.35,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [179.88,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [187.96,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [195.04,
-             200.0,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [201.37,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [207.11,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [212.38,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [218.41,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [223.95,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [229.08,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [233.85,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [238.33,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [242.56,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [246.56,
-             250.0,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [250.35,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [253.98,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [257.44,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [260.75,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [263.94,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [269.97,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [275.58,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [280.86,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [285.83,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [290.54,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [295.01,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [299.27,
-             300.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [303.34,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [307.25,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [311.0,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [318.08,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [324.68,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [330.85,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [336.67,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [342.16,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [347.35,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [352.29,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [356.99,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [361.47,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [365.75,
-             400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0],
-            [400.0,
-             500.0,
-             600.0,
-             700.0,
-             800.0,
-             900.0,
-             1000.0,
-             1100.0,
-             1200.0,
-             1300.0,
-             1400.0,
-             1500.0,
-             1600.0,
-             1700.0]],
- 'u_by_P': [[2437.2,
-             2443.3,
-             2515.5,
-             2587.9,
-             2661.3,
-             2736.1,
-             2812.3,
-             2969.3,
-             3132.9,
-             3303.3,
-             3480.8,
-             3665.3,
-             3856.9,
-             4055.2,
-             4260.0,
-             4470.9,
-             4687.4,
-             4909.1,
-             5135.6,
-             5366.6,
-             5601.6],
-            [2456.0,
-             2514.5,
-             2587.4,
-             2661.0,
-             2735.8,
-             2812.1,
-             2969.2,
-             3132.8,
-             3303.3,
-             3480.7,
-             3665.3,
-             3856.9,
-             4055.2,
-             4260.0,
-             4470.8,
-             4687.3,
-             4909.1,
-             5135.6,
-             5366.6,
-             5601.6],
-            [2467.7,
-             2513.5,
-             2586.8,
-             2660.7,
-             2735.6,
-             2811.9,
-             2969.1,
-             3132.7,
-             3303.2,
-             3480.7,
-             3665.3,
-             3856.8,
-             4055.2,
-             4260.0,
-             4470.8,
-             4687.3,
-             4909.0,
-             5135.6,
-             5366.6,
-             5601.6],
-            [2483.2,
-             2511.5,
-             2585.7,
-             2660.0,
-             2735.1,
-             2811.6,
-             2968.9,
-             3132.6,
-             3303.1,
-             3480.6,
-             3665.2,
-             3856.8,
-             4055.1,
-             4259.9,
-             4470.8,
-             4687.3,
-             4909.0,
-             5135.6,
-             5366.5,
-             5601.6],
-            [2496.1,
-             2508.9,
-             2584.3,
-             2659.1,
-             2734.5,
-             2811.1,
-             2968.6,
-             3132.4,
-             3302.9,
-             3480.5,
-             3665.1,
-             3856.7,
-             4055.1,
-             4259.9,
-             4470.7,
-             4687.2,
-             4909.0,
-             5135.5,
-             5366.5,
-             5601.6],
-            [2505.6,
-             2506.2,
-             2582.9,
-             2658.2,
-             2733.9,
-             2810.6,
-             2968.3,
-             3132.2,
-             3302.8,
-             3480.4,
-             3665.0,
-             3856.6,
-             4055.0,
-             4259.8,
-             4470.7,
-             4687.2,
-             4908.9,
-             5135.5,
-             5366.5,
-             5601.5],
-            [2519.2,
-             2580.1,
-             2656.4,
-             2732.7,
-             2809.7,
-             2967.7,
-             3131.8,
-             3302.5,
-             3480.1,
-             3664.8,
-             3856.5,
-             4054.9,
-             4259.7,
-             4470.6,
-             4687.1,
-             4908.9,
-             5135.4,
-             5366.4,
-             5601.5],
-            [2529.1,
-             2577.1,
-             2654.6,
-             2731.4,
-             2808.8,
-             2967.1,
-             3131.4,
-             3302.2,
-             3479.9,
-             3664.7,
-             3856.3,
-             4054.8,
-             4259.6,
-             4470.5,
-             4687.0,
-             4908.8,
-             5135.4,
-             5366.4,
-             5601.4],
-            [2536.8,
-             2574.1,
-             2652.8,
-             2730.2,
-             2807.9,
-             2966.6,
-             3131.0,
-             3301.9,
-             3479.7,
-             3664.5,
-             3856.2,
-             4054.6,
-             4259.5,
-             4470.4,
-             4687.0,
-             4908.7,
-             5135.3,
-             5366.3,
-             5601.4],
-            [2543.2,
-             2571.0,
-             2651.0,
-             2728.9,
-             2807.0,
-             2966.0,
-             3130.6,
-             3301.6,
-             3479.5,
-             3664.3,
-             3856.0,
-             4054.5,
-             4259.4,
-             4470.3,
-             4686.9,
-             4908.7,
-             5135.3,
-             5366.3,
-             5601.3],
-            [2548.5,
-             2567.8,
-             2649.1,
-             2727.7,
-             2806.1,
-             2965.4,
-             3130.2,
-             3301.3,
-             3479.2,
-             3664.1,
-             3855.9,
-             4054.4,
-             4259.3,
-             4470.2,
-             4686.8,
-             4908.6,
-             5135.2,
-             5366.2,
-             5601.3],
-            [2553.1,
-             2564.4,
-             2647.2,
-             2726.4,
-             2805.1,
-             2964.9,
-             3129.8,
-             3301.0,
-             3479.0,
-             3663.9,
-             3855.7,
-             4054.3,
-             4259.2,
-             4470.1,
-             4686.7,
-             4908.5,
-             5135.1,
-             5366.2,
-             5601.2],
-            [2557.1,
-             2560.9,
-             2645.3,
-             2725.1,
-             2804.2,
-             2964.3,
-             3129.4,
-             3300.7,
-             3478.8,
-             3663.7,
-             3855.6,
-             4054.1,
-             4259.1,
-             4470.0,
-             4686.6,
-             4908.5,
-             5135.1,
-             5366.1,
-             5601.2],
-            [2560.7,
-             2643.3,
-             2723.8,
-             2803.2,
-             2963.7,
-             3129.0,
-             3300.4,
-             3478.5,
-             3663.6,
-             3855.4,
-             4054.0,
-             4259.0,
-             4470.0,
-             4686.6,
-             4908.4,
-             5135.0,
-             5366.1,
-             5601.2],
-            [2566.8,
-             2639.3,
-             2721.2,
-             2801.4,
-             2962.5,
-             3128.2,
-             3299.8,
-             3478.1,
-             3663.2,
-             3855.1,
-             4053.7,
-             4258.7,
-             4469.8,
-             4686.4,
-             4908.2,
-             5134.9,
-             5365.9,
-             5601.1],
-            [2571.8,
-             2635.3,
-             2718.6,
-             2799.5,
-             2961.4,
-             3127.4,
-             3299.2,
-             3477.6,
-             3662.8,
-             3854.8,
-             4053.5,
-             4258.5,
-             4469.6,
-             4686.2,
-             4908.1,
-             5134.8,
-             5365.8,
-             5601.0],
-            [2576.0,
-             2631.0,
-             2715.9,
-             2797.5,
-             2960.2,
-             3126.6,
-             3298.7,
-             3477.2,
-             3662.4,
-             3854.5,
-             4053.2,
-             4258.3,
-             4469.4,
-             4686.1,
-             4908.0,
-             5134.6,
-             5365.7,
-             5600.9],
-            [2579.6,
-             2626.7,
-             2713.1,
-             2795.6,
-             2959.0,
-             3125.8,
-             3298.1,
-             3476.7,
-             3662.1,
-             3854.2,
-             4053.0,
-             4258.1,
-             4469.2,
-             4685.9,
-             4907.8,
-             5134.5,
-             5365.6,
-             5600.8],
-            [2582.7,
-             2622.2,
-             2710.4,
-             2793.6,
-             2957.9,
-             3125.0,
-             3297.5,
-             3476.2,
-             3661.7,
-             3853.9,
-             4052.7,
-             4257.9,
-             4469.0,
-             4685.8,
-             4907.7,
-             5134.4,
-             5365.5,
-             5600.7],
-            [2587.8,
-             2612.9,
-             2704.7,
-             2789.7,
-             2955.5,
-             3123.4,
-             3296.3,
-             3475.3,
-             3661.0,
-             3853.3,
-             4052.2,
-             4257.5,
-             4468.7,
-             4685.4,
-             4907.4,
-             5134.1,
-             5365.3,
-             5600.5],
-            [2591.8,
-             2602.7,
-             2698.9,
-             2785.7,
-             2953.1,
-             3121.8,
-             3295.1,
-             3474.4,
-             3660.2,
-             3852.7,
-             4051.7,
-             4257.0,
-             4468.3,
-             4685.1,
-             4907.1,
-             5133.9,
-             5365.1,
-             5600.3],
-            [2594.8,
-             2692.9,
-             2781.6,
-             2950.7,
-             3120.1,
-             3293.9,
-             3473.5,
-             3659.5,
-             3852.1,
-             4051.2,
-             4256.6,
-             4467.9,
-             4684.8,
-             4906.8,
-             5133.6,
-             5364.8,
-             5600.1],
-            [2597.2,
-             2686.7,
-             2777.4,
-             2948.3,
-             3118.5,
-             3292.7,
-             3472.6,
-             3658.8,
-             3851.5,
-             4050.7,
-             4256.2,
-             4467.5,
-             4684.5,
-             4906.6,
-             5133.4,
-             5364.6,
-             5599.9],
-            [2599.1,
-             2680.2,
-             2773.2,
-             2945.9,
-             3116.9,
-             3291.5,
-             3471.6,
-             3658.0,
-             3850.9,
-             4050.2,
-             4255.7,
-             4467.2,
-             4684.1,
-             4906.3,
-             5133.1,
-             5364.4,
-             5599.7],
-            [2600.9,
-             2671.9,
-             2767.8,
-             2942.9,
-             3114.8,
-             3290.0,
-             3470.5,
-             3657.1,
-             3850.1,
-             4049.6,
-             4255.2,
-             4466.7,
-             4683.7,
-             4905.9,
-             5132.8,
-             5364.1,
-             5599.4],
-            [2602.1,
-             2663.3,
-             2762.2,
-             2939.8,
-             3112.8,
-             3288.5,
-             3469.3,
-             3656.2,
-             3849.4,
-             4048.9,
-             4254.7,
-             4466.2,
-             4683.3,
-             4905.6,
-             5132.5,
-             5363.9,
-             5599.2],
-            [2602.8,
-             2654.2,
-             2756.6,
-             2936.7,
-             3110.7,
-             3287.0,
-             3468.2,
-             3655.3,
-             3848.6,
-             4048.3,
-             4254.1,
-             4465.8,
-             4682.9,
-             4905.2,
-             5132.2,
-             5363.6,
-             5598.9],
-            [2603.2,
-             2644.7,
-             2750.8,
-             2933.5,
-             3108.6,
-             3285.5,
-             3467.0,
-             3654.3,
-             3847.9,
-             4047.7,
-             4253.6,
-             4465.3,
-             4682.5,
-             4904.9,
-             5131.9,
-             5363.3,
-             5598.7],
-            [2603.2,
-             2634.6,
-             2744.9,
-             2930.4,
-             3106.5,
-             3284.0,
-             3465.9,
-             3653.4,
-             3847.1,
-             4047.0,
-             4253.0,
-             4464.9,
-             4682.1,
-             4904.5,
-             5131.6,
-             5363.0,
-             5598.5],
-            [2602.9,
-             2624.0,
-             2738.8,
-             2927.2,
-             3104.5,
-             3282.5,
-             3464.7,
-             3652.5,
-             3846.4,
-             4046.4,
-             4252.5,
-             4464.4,
-             4681.7,
-             4904.2,
-             5131.3,
-             5362.8,
-             5598.2],
-            [2602.4,
-             2612.7,
-             2732.6,
-             2924.0,
-             3102.4,
-             3281.0,
-             3463.5,
-             3651.6,
-             3845.6,
-             4045.8,
-             4252.0,
-             4463.9,
-             4681.3,
-             4903.8,
-             5131.0,
-             5362.5,
-             5598.0],
-            [2601.7,
-             2726.2,
-             2920.7,
-             3100.3,
-             3279.4,
-             3462.4,
-             3650.6,
-             3844.8,
-             4045.1,
-             4251.4,
-             4463.5,
-             4680.9,
-             4903.5,
-             5130.7,
-             5362.2,
-             5597.7],
-            [2600.8,
-             2719.7,
-             2917.5,
-             3098.1,
-             3277.9,
-             3461.2,
-             3649.7,
-             3844.1,
-             4044.5,
-             4250.9,
-             4463.0,
-             4680.5,
-             4903.1,
-             5130.4,
-             5361.9,
-             5597.5],
-            [2599.7,
-             2713.0,
-             2914.2,
-             3096.0,
-             3276.4,
-             3460.0,
-             3648.8,
-             3843.3,
-             4043.9,
-             4250.4,
-             4462.5,
-             4680.1,
-             4902.7,
-             5130.0,
-             5361.7,
-             5597.2],
-            [2598.4,
-             2706.1,
-             2910.8,
-             3093.9,
-             3274.9,
-             3458.9,
-             3647.8,
-             3842.6,
-             4043.2,
-             4249.8,
-             4462.1,
-             4679.7,
-             4902.4,
-             5129.7,
-             5361.4,
-             5597.0],
-            [2597.0,
-             2699.0,
-             2907.5,
-             3091.7,
-             3273.3,
-             3457.7,
-             3646.9,
-             3841.8,
-             4042.6,
-             4249.3,
-             4461.6,
-             4679.3,
-             4902.0,
-             5129.4,
-             5361.1,
-             5596.7],
-            [2593.7,
-             2684.2,
-             2900.7,
-             3087.4,
-             3270.2,
-             3455.4,
-             3645.1,
-             3840.3,
-             4041.3,
-             4248.2,
-             4460.7,
-             4678.5,
-             4901.3,
-             5128.8,
-             5360.6,
-             5596.3],
-            [2589.9,
-             2668.4,
-             2893.7,
-             3083.1,
-             3267.2,
-             3453.0,
-             3643.2,
-             3838.8,
-             4040.1,
-             4247.1,
-             4459.8,
-             4677.7,
-             4900.6,
-             5128.2,
-             5360.0,
-             5595.8],
-            [2585.7,
-             2651.6,
-             2886.7,
-             3078.7,
-             3264.1,
-             3450.7,
-             3641.3,
-             3837.2,
-             4038.8,
-             4246.0,
-             4458.8,
-             4676.9,
-             4899.9,
-             5127.6,
-             5359.5,
-             5595.3],
-            [2581.0,
-             2633.5,
-             2879.5,
-             3074.3,
-             3260.9,
-             3448.3,
-             3639.5,
-             3835.7,
-             4037.5,
-             4245.0,
-             4457.9,
-             4676.1,
-             4899.2,
-             5126.9,
-             5358.9,
-             5594.8],
-            [2575.9,
-             2613.8,
-             2872.1,
-             3069.8,
-             3257.8,
-             3445.9,
-             3637.6,
-             3834.2,
-             4036.2,
-             4243.9,
-             4457.0,
-             4675.3,
-             4898.5,
-             5126.3,
-             5358.4,
-             5594.3],
-            [2570.5,
-             2592.3,
-             2864.6,
-             3065.4,
-             3254.7,
-             3443.6,
-             3635.7,
-             3832.6,
-             4035.0,
-             4242.8,
-             4456.1,
-             4674.5,
-             4897.8,
-             5125.7,
-             5357.8,
-             5593.8],
-            [2564.7,
-             2568.2,
-             2857.0,
-             3060.8,
-             3251.5,
-             3441.2,
-             3633.8,
-             3831.1,
-             4033.7,
-             4241.7,
-             4455.1,
-             4673.7,
-             4897.1,
-             5125.1,
-             5357.3,
-             5593.3],
-            [2558.5,
-             2849.2,
-             3056.3,
-             3248.4,
-             3438.8,
-             3632.0,
-             3829.6,
-             4032.4,
-             4240.6,
-             4454.2,
-             4672.9,
-             4896.4,
-             5124.5,
-             5356.7,
-             5592.8],
-            [2552.0,
-             2841.2,
-             3051.7,
-             3245.2,
-             3436.4,
-             3630.1,
-             3828.1,
-             4031.1,
-             4239.6,
-             4453.3,
-             4672.1,
-             4895.7,
-             5123.8,
-             5356.2,
-             5592.3],
-            [2545.2,
-             2833.1,
-             3047.0,
-             3242.0,
-             3434.0,
-             3628.2,
-             3826.5,
-             4029.9,
-             4238.5,
-             4452.3,
-             4671.3,
-             4895.0,
-             5123.2,
-             5355.6,
-             5591.9],
-            [2530.5,
-             2816.3,
-             3037.6,
-             3235.6,
-             3429.2,
-             3624.4,
-             3823.5,
-             4027.3,
-             4236.3,
-             4450.5,
-             4669.7,
-             4893.6,
-             5122.0,
-             5354.5,
-             5590.9],
-            [2514.3,
-             2798.7,
-             3028.1,
-             3229.1,
-             3424.4,
-             3620.6,
-             3820.4,
-             4024.8,
-             4234.2,
-             4448.6,
-             4668.1,
-             4892.2,
-             5120.7,
-             5353.4,
-             5589.9],
-            [2496.5,
-             2780.3,
-             3018.3,
-             3222.5,
-             3419.6,
-             3616.9,
-             3817.3,
-             4022.2,
-             4232.0,
-             4446.8,
-             4666.5,
-             4890.8,
-             5119.5,
-             5352.3,
-             5588.9],
-            [2477.1,
-             2761.0,
-             3008.4,
-             3216.0,
-             3414.7,
-             3613.1,
-             3814.2,
-             4019.7,
-             4229.8,
-             4444.9,
-             4664.8,
-             4889.4,
-             5118.3,
-             5351.2,
-             5587.9],
-            [2455.6,
-             2740.6,
-             2998.4,
-             3209.3,
-             3409.8,
-             3609.2,
-             3811.2,
-             4017.1,
-             4227.7,
-             4443.1,
-             4663.2,
-             4888.0,
-             5117.0,
-             5350.1,
-             5587.0],
-            [2431.8,
-             2719.1,
-             2988.1,
-             3202.6,
-             3404.9,
-             3605.4,
-             3808.1,
-             4014.5,
-             4225.5,
-             4441.2,
-             4661.6,
-             4886.6,
-             5115.8,
-             5349.0,
-             5586.0],
-            [2405.2,
-             2696.2,
-             2977.7,
-             3195.9,
-             3400.0,
-             3601.6,
-             3805.0,
-             4012.0,
-             4223.4,
-             4439.4,
-             4660.0,
-             4885.2,
-             5114.6,
-             5347.9,
-             5585.0],
-            [2374.8,
-             2671.9,
-             2967.1,
-             3189.1,
-             3395.0,
-             3597.8,
-             3801.9,
-             4009.4,
-             4221.2,
-             4437.5,
-             4658.4,
-             4883.8,
-             5113.3,
-             5346.8,
-             5584.0],
-            [2339.1,
-             2645.9,
-             2956.3,
-             3182.2,
-             3390.1,
-             3593.9,
-             3798.8,
-             4006.9,
-             4219.0,
-             4435.7,
-             4656.8,
-             4882.4,
-             5112.1,
-             5345.7,
-             5583.1],
-            [2295.0,
-             2617.9,
-             2945.3,
-             3175.3,
-             3385.1,
-             3590.1,
-             3795.7,
-             4004.3,
-             4216.9,
-             4433.8,
-             4655.2,
-             4881.0,
-             5110.8,
-             5344.6,
-             5582.1],
-            [2536.2,
-             2917.0,
-             3157.8,
-             3372.5,
-             3580.4,
-             3787.9,
-             3997.9,
-             4211.5,
-             4429.2,
-             4651.2,
-             4877.4,
-             5107.8,
-             5341.9,
-             5579.7],
-            [2428.5,
-             2887.3,
-             3140.0,
-             3359.9,
-             3570.7,
-             3780.2,
-             3991.5,
-             4206.0,
-             4424.6,
-             4647.2,
-             4873.9,
-             5104.7,
-             5339.2,
-             5577.2],
-            [2268.0,
-             2856.4,
-             3121.9,
-             3347.1,
-             3561.0,
-             3772.4,
-             3985.0,
-             4200.6,
-             4419.9,
-             4643.2,
-             4870.4,
-             5101.6,
-             5336.5,
-             5574.8],
-            [2068.9,
-             2824.0,
-             3103.4,
-             3334.3,
-             3551.2,
-             3764.6,
-             3978.6,
-             4195.2,
-             4415.3,
-             4639.2,
-             4867.0,
-             5098.5,
-             5333.7,
-             5572.4],
-            [1966.7,
-             2790.3,
-             3084.7,
-             3321.3,
-             3541.4,
-             3756.8,
-             3972.2,
-             4189.8,
-             4410.7,
-             4635.2,
-             4863.5,
-             5095.5,
-             5331.0,
-             5570.0],
-            [1914.9,
-             2755.3,
-             3065.6,
-             3308.3,
-             3531.5,
-             3748.9,
-             3965.8,
-             4184.4,
-             4406.1,
-             4631.2,
-             4860.0,
-             5092.4,
-             5328.3,
-             5567.5],
-            [1880.8,
-             2719.0,
-             3046.3,
-             3295.1,
-             3521.7,
-             3741.1,
-             3959.3,
-             4179.0,
-             4401.5,
-             4627.2,
-             4856.5,
-             5089.3,
-             5325.6,
-             5565.1],
-            [1854.9,
-             2681.6,
-             3026.8,
-             3282.0,
-             3511.8,
-             3733.3,
-             3952.9,
-             4173.7,
-             4396.9,
-             4623.3,
-             4853.0,
-             5086.3,
-             5322.9,
-             5562.7],
-            [1834.1,
-             2643.3,
-             3007.1,
-             3268.7,
-             3501.9,
-             3725.5,
-             3946.5,
-             4168.3,
-             4392.3,
-             4619.3,
-             4849.6,
-             5083.2,
-             5320.2,
-             5560.3],
-            [1816.5,
-             2604.7,
-             2987.2,
-             3255.4,
-             3492.0,
-             3717.6,
-             3940.1,
-             4162.9,
-             4387.7,
-             4615.3,
-             4846.1,
-             5080.2,
-             5317.5,
-             5557.9],
-            [1801.3,
-             2566.1,
-             2967.2,
-             3242.1,
-             3482.1,
-             3709.8,
-             3933.7,
-             4157.6,
-             4383.1,
-             4611.4,
-             4842.7,
-             5077.2,
-             5314.8,
-             5555.5],
-            [1787.8,
-             2528.1,
-             2947.1,
-             3228.7,
-             3472.2,
-             3702.0,
-             3927.3,
-             4152.2,
-             4378.6,
-             4607.4,
-             4839.2,
-             5074.1,
-             5312.1,
-             5553.2],
-            [1775.7,
-             2491.4,
-             2927.0,
-             3215.4,
-             3462.3,
-             3694.2,
-             3921.0,
-             4146.9,
-             4374.0,
-             4603.5,
-             4835.8,
-             5071.1,
-             5309.4,
-             5550.8],
-            [1764.7,
-             2456.5,
-             2906.9,
-             3202.0,
-             3452.4,
-             3686.4,
-             3914.6,
-             4141.5,
-             4369.5,
-             4599.6,
-             4832.4,
-             5068.1,
-             5306.8,
-             5548.4],
-            [1754.6,
-             2423.7,
-             2886.8,
-             3188.7,
-             3442.5,
-             3678.7,
-             3908.3,
-             4136.2,
-             4365.0,
-             4595.7,
-             4829.0,
-             5065.1,
-             5304.1,
-             5546.0],
-            [1745.2,
-             2393.2,
-             2866.8,
-             3175.4,
-             3432.6,
-             3670.9,
-             3901.9,
-             4130.9,
-             4360.4,
-             4591.8,
-             4825.5,
-             5062.1,
-             5301.5,
-             5543.7],
-            [1736.5,
-             2365.0,
-             2847.0,
-             3162.1,
-             3422.8,
-             3663.2,
-             3895.6,
-             4125.7,
-             4355.9,
-             4587.9,
-             4822.1,
-             5059.1,
-             5298.8,
-             5541.3]],
- 'h_by_P': [[2583.9,
-             2592.0,
-             2687.5,
-             2783.0,
-             2879.6,
-             2977.4,
-             3076.7,
-             3279.9,
-             3489.7,
-             3706.3,
-             3929.9,
-             4160.6,
-             4398.3,
-             4642.8,
-             4893.7,
-             5150.7,
-             5413.4,
-             5681.3,
-             5954.0,
-             6231.1,
-             6512.3],
-            [2608.9,
-             2686.2,
-             2782.3,
-             2879.1,
-             2977.1,
-             3076.5,
-             3279.8,
-             3489.6,
-             3706.2,
-             3929.8,
-             4160.6,
-             4398.3,
-             4642.8,
-             4893.7,
-             5150.7,
-             5413.4,
-             5681.3,
-             5954.0,
-             6231.1,
-             6512.3],
-            [2624.5,
-             2685.0,
-             2781.6,
-             2878.7,
-             2976.8,
-             3076.2,
-             3279.6,
-             3489.5,
-             3706.1,
-             3929.8,
-             4160.5,
-             4398.3,
-             4642.8,
-             4893.7,
-             5150.7,
-             5413.4,
-             5681.2,
-             5953.9,
-             6231.1,
-             6512.3],
-            [2645.2,
-             2682.4,
-             2780.2,
-             2877.8,
-             2976.1,
-             3075.8,
-             3279.3,
-             3489.3,
-             3706.0,
-             3929.7,
-             4160.4,
-             4398.2,
-             4642.7,
-             4893.7,
-             5150.7,
-             5413.3,
-             5681.2,
-             5953.9,
-             6231.1,
-             6512.3],
-            [2662.4,
-             2679.2,
-             2778.4,
-             2876.6,
-             2975.3,
-             3075.1,
-             3278.9,
-             3489.0,
-             3705.8,
-             3929.5,
-             4160.3,
-             4398.1,
-             4642.6,
-             4893.6,
-             5150.6,
-             5413.3,
-             5681.2,
-             5953.9,
-             6231.0,
-             6512.2],
-            [2674.9,
-             2675.8,
-             2776.6,
-             2875.5,
-             2974.5,
-             3074.5,
-             3278.6,
-             3488.7,
-             3705.6,
-             3929.4,
-             4160.2,
-             4398.0,
-             4642.6,
-             4893.5,
-             5150.6,
-             5413.2,
-             5681.2,
-             5953.9,
-             6231.0,
-             6512.2],
-            [2693.1,
-             2772.9,
-             2873.1,
-             2972.9,
-             3073.3,
-             3277.8,
-             3488.2,
-             3705.2,
-             3929.1,
-             4160.0,
-             4397.8,
-             4642.4,
-             4893.4,
-             5150.5,
-             5413.2,
-             5681.1,
-             5953.8,
-             6231.0,
-             6512.2],
-            [2706.2,
-             2769.1,
-             2870.7,
-             2971.2,
-             3072.1,
-             3277.0,
-             3487.7,
-             3704.8,
-             3928.8,
-             4159.8,
-             4397.6,
-             4642.3,
-             4893.3,
-             5150.4,
-             5413.1,
-             5681.0,
-             5953.8,
-             6230.9,
-             6512.2],
-            [2716.5,
-             2765.2,
-             2868.3,
-             2969.5,
-             3070.8,
-             3276.2,
-             3487.1,
-             3704.4,
-             3928.5,
-             4159.5,
-             4397.5,
-             4642.1,
-             4893.2,
-             5150.3,
-             5413.0,
-             5681.0,
-             5953.7,
-             6230.9,
-             6512.1],
-            [2724.9,
-             2761.2,
-             2865.9,
-             2967.9,
-             3069.6,
-             3275.5,
-             3486.6,
-             3704.0,
-             3928.2,
-             4159.3,
-             4397.3,
-             4642.0,
-             4893.1,
-             5150.2,
-             5412.9,
-             5680.9,
-             5953.7,
-             6230.9,
-             6512.1],
-            [2732.0,
-             2757.1,
-             2863.4,
-             2966.2,
-             3068.3,
-             3274.7,
-             3486.1,
-             3703.6,
-             3927.9,
-             4159.1,
-             4397.1,
-             4641.8,
-             4893.0,
-             5150.1,
-             5412.9,
-             5680.8,
-             5953.6,
-             6230.8,
-             6512.1],
-            [2738.1,
-             2752.8,
-             2860.9,
-             2964.5,
-             3067.1,
-             3273.9,
-             3485.5,
-             3703.2,
-             3927.6,
-             4158.8,
-             4396.9,
-             4641.7,
-             4892.8,
-             5150.0,
-             5412.8,
-             5680.8,
-             5953.6,
-             6230.8,
-             6512.0],
-            [2743.4,
-             2748.3,
-             2858.4,
-             2962.8,
-             3065.8,
-             3273.1,
-             3485.0,
-             3702.9,
-             3927.3,
-             4158.6,
-             4396.7,
-             4641.5,
-             4892.7,
-             5149.9,
-             5412.7,
-             5680.7,
-             5953.5,
-             6230.7,
-             6512.0],
-            [2748.1,
-             2855.8,
-             2961.0,
-             3064.6,
-             3272.3,
-             3484.5,
-             3702.5,
-             3927.0,
-             4158.4,
-             4396.6,
-             4641.4,
-             4892.6,
-             5149.8,
-             5412.6,
-             5680.6,
-             5953.5,
-             6230.7,
-             6512.0],
-            [2756.1,
-             2850.6,
-             2957.6,
-             3062.0,
-             3270.8,
-             3483.4,
-             3701.7,
-             3926.4,
-             4157.9,
-             4396.2,
-             4641.1,
-             4892.4,
-             5149.6,
-             5412.5,
-             5680.5,
-             5953.4,
-             6230.6,
-             6511.9],
-            [2762.8,
-             2845.3,
-             2954.0,
-             3059.4,
-             3269.2,
-             3482.3,
-             3700.9,
-             3925.8,
-             4157.5,
-             4395.8,
-             4640.8,
-             4892.1,
-             5149.4,
-             5412.3,
-             5680.4,
-             5953.3,
-             6230.5,
-             6511.8],
-            [2768.3,
-             2839.7,
-             2950.4,
-             3056.9,
-             3267.6,
-             3481.3,
-             3700.1,
-             3925.3,
-             4157.0,
-             4395.5,
-             4640.5,
-             4891.9,
-             5149.2,
-             5412.2,
-             5680.3,
-             5953.2,
-             6230.5,
-             6511.8],
-            [2773.0,
-             2834.1,
-             2946.8,
-             3054.3,
-             3266.1,
-             3480.2,
-             3699.4,
-             3924.7,
-             4156.6,
-             4395.1,
-             4640.2,
-             4891.7,
-             5149.0,
-             5412.0,
-             5680.1,
-             5953.1,
-             6230.4,
-             6511.7],
-            [2777.1,
-             2828.3,
-             2943.1,
-             3051.6,
-             3264.5,
-             3479.1,
-             3698.6,
-             3924.1,
-             4156.1,
-             4394.8,
-             4639.9,
-             4891.4,
-             5148.9,
-             5411.9,
-             5680.0,
-             5953.0,
-             6230.3,
-             6511.7],
-            [2783.7,
-             2816.1,
-             2935.6,
-             3046.3,
-             3261.3,
-             3476.9,
-             3697.0,
-             3922.9,
-             4155.2,
-             4394.0,
-             4639.4,
-             4891.0,
-             5148.5,
-             5411.5,
-             5679.8,
-             5952.8,
-             6230.1,
-             6511.5],
-            [2788.8,
-             2803.0,
-             2927.9,
-             3040.9,
-             3258.1,
-             3474.8,
-             3695.4,
-             3921.7,
-             4154.3,
-             4393.3,
-             4638.8,
-             4890.5,
-             5148.1,
-             5411.2,
-             5679.5,
-             5952.6,
-             6230.0,
-             6511.4],
-            [2792.8,
-             2919.9,
-             3035.4,
-             3254.9,
-             3472.6,
-             3693.9,
-             3920.5,
-             4153.3,
-             4392.6,
-             4638.2,
-             4890.0,
-             5147.7,
-             5410.9,
-             5679.3,
-             5952.4,
-             6229.8,
-             6511.3],
-            [2795.9,
-             2911.7,
-             3029.9,
-             3251.6,
-             3470.4,
-             3692.3,
-             3919.4,
-             4152.4,
-             4391.9,
-             4637.6,
-             4889.5,
-             5147.3,
-             5410.6,
-             5679.0,
-             5952.1,
-             6229.6,
-             6511.1],
-            [2798.3,
-             2903.2,
-             3024.2,
-             3248.3,
-             3468.2,
-             3690.7,
-             3918.2,
-             4151.5,
-             4391.1,
-             4637.0,
-             4889.1,
-             5147.0,
-             5410.3,
-             5678.8,
-             5951.9,
-             6229.5,
-             6511.0],
-            [2800.5,
-             2892.3,
-             3017.0,
-             3244.2,
-             3465.5,
-             3688.8,
-             3916.7,
-             4150.4,
-             4390.2,
-             4636.3,
-             4888.5,
-             5146.5,
-             5409.9,
-             5678.4,
-             5951.7,
-             6229.3,
-             6510.9],
-            [2801.9,
-             2880.9,
-             3009.6,
-             3240.1,
-             3462.7,
-             3686.8,
-             3915.2,
-             4149.2,
-             4389.3,
-             4635.6,
-             4887.9,
-             5146.0,
-             5409.5,
-             5678.1,
-             5951.4,
-             6229.1,
-             6510.7],
-            [2802.8,
-             2869.0,
-             3002.0,
-             3235.9,
-             3460.0,
-             3684.8,
-             3913.7,
-             4148.1,
-             4388.4,
-             4634.9,
-             4887.3,
-             5145.5,
-             5409.1,
-             5677.8,
-             5951.2,
-             6228.9,
-             6510.5],
-            [2803.2,
-             2856.5,
-             2994.3,
-             3231.7,
-             3457.2,
-             3682.8,
-             3912.2,
-             4146.9,
-             4387.5,
-             4634.1,
-             4886.7,
-             5145.0,
-             5408.8,
-             5677.5,
-             5950.9,
-             6228.7,
-             6510.4],
-            [2803.1,
-             2843.5,
-             2986.5,
-             3227.4,
-             3454.4,
-             3680.8,
-             3910.7,
-             4145.8,
-             4386.6,
-             4633.4,
-             4886.1,
-             5144.6,
-             5408.4,
-             5677.2,
-             5950.7,
-             6228.5,
-             6510.2],
-            [2802.6,
-             2829.7,
-             2978.4,
-             3223.2,
-             3451.6,
-             3678.9,
-             3909.3,
-             4144.6,
-             4385.7,
-             4632.7,
-             4885.6,
-             5144.1,
-             5408.0,
-             5676.9,
-             5950.4,
-             6228.3,
-             6510.1],
-            [2801.9,
-             2815.0,
-             2970.1,
-             3218.8,
-             3448.8,
-             3676.9,
-             3907.8,
-             4143.5,
-             4384.8,
-             4632.0,
-             4885.0,
-             5143.6,
-             5407.6,
-             5676.6,
-             5950.2,
-             6228.1,
-             6509.9],
-            [2800.8,
-             2961.7,
-             3214.5,
-             3446.0,
-             3674.9,
-             3906.3,
-             4142.3,
-             4383.9,
-             4631.2,
-             4884.4,
-             5143.1,
-             5407.2,
-             5676.3,
-             5949.9,
-             6227.9,
-             6509.8],
-            [2799.5,
-             2953.0,
-             3210.1,
-             3443.2,
-             3672.9,
-             3904.8,
-             4141.2,
-             4383.0,
-             4630.5,
-             4883.8,
-             5142.7,
-             5406.8,
-             5675.9,
-             5949.7,
-             6227.7,
-             6509.6],
-            [2797.9,
-             2944.2,
-             3205.6,
-             3440.4,
-             3670.9,
-             3903.3,
-             4140.0,
-             4382.1,
-             4629.8,
-             4883.2,
-             5142.2,
-             5406.4,
-             5675.6,
-             5949.4,
-             6227.5,
-             6509.4],
-            [2796.2,
-             2935.1,
-             3201.2,
-             3437.5,
-             3668.9,
-             3901.8,
-             4138.9,
-             4381.1,
-             4629.1,
-             4882.6,
-             5141.7,
-             5406.0,
-             5675.3,
-             5949.2,
-             6227.3,
-             6509.3],
-            [2794.2,
-             2925.7,
-             3196.7,
-             3434.7,
-             3666.8,
-             3900.3,
-             4137.7,
-             4380.2,
-             4628.3,
-             4882.0,
-             5141.2,
-             5405.7,
-             5675.0,
-             5948.9,
-             6227.1,
-             6509.1],
-            [2789.7,
-             2906.2,
-             3187.5,
-             3428.9,
-             3662.8,
-             3897.3,
-             4135.4,
-             4378.4,
-             4626.9,
-             4880.9,
-             5140.3,
-             5404.9,
-             5674.4,
-             5948.4,
-             6226.7,
-             6508.8],
-            [2784.6,
-             2885.5,
-             3178.2,
-             3423.1,
-             3658.7,
-             3894.3,
-             4133.1,
-             4376.6,
-             4625.4,
-             4879.7,
-             5139.3,
-             5404.1,
-             5673.7,
-             5947.9,
-             6226.3,
-             6508.5],
-            [2778.9,
-             2863.5,
-             3168.8,
-             3417.3,
-             3654.7,
-             3891.3,
-             4130.8,
-             4374.8,
-             4624.0,
-             4878.5,
-             5138.4,
-             5403.3,
-             5673.1,
-             5947.4,
-             6225.9,
-             6508.2],
-            [2772.6,
-             2839.9,
-             3159.2,
-             3411.4,
-             3650.6,
-             3888.2,
-             4128.4,
-             4373.0,
-             4622.5,
-             4877.3,
-             5137.4,
-             5402.6,
-             5672.5,
-             5946.9,
-             6225.5,
-             6507.9],
-            [2765.9,
-             2814.4,
-             3149.4,
-             3405.5,
-             3646.5,
-             3885.2,
-             4126.1,
-             4371.1,
-             4621.1,
-             4876.2,
-             5136.5,
-             5401.8,
-             5671.9,
-             5946.4,
-             6225.1,
-             6507.6],
-            [2758.7,
-             2786.5,
-             3139.4,
-             3399.5,
-             3642.4,
-             3882.2,
-             4123.8,
-             4369.3,
-             4619.6,
-             4875.0,
-             5135.5,
-             5401.0,
-             5671.2,
-             5945.9,
-             6224.7,
-             6507.2],
-            [2751.0,
-             2755.5,
-             3129.2,
-             3393.5,
-             3638.2,
-             3879.1,
-             4121.5,
-             4367.5,
-             4618.1,
-             4873.8,
-             5134.6,
-             5400.3,
-             5670.6,
-             5945.4,
-             6224.3,
-             6506.9],
-            [2742.9,
-             3118.8,
-             3387.4,
-             3634.1,
-             3876.1,
-             4119.1,
-             4365.7,
-             4616.7,
-             4872.7,
-             5133.6,
-             5399.5,
-             5670.0,
-             5944.9,
-             6223.9,
-             6506.6],
-            [2734.4,
-             3108.2,
-             3381.3,
-             3629.9,
-             3873.0,
-             4116.8,
-             4363.8,
-             4615.2,
-             4871.5,
-             5132.7,
-             5398.7,
-             5669.4,
-             5944.4,
-             6223.5,
-             6506.3],
-            [2725.5,
-             3097.4,
-             3375.1,
-             3625.8,
-             3870.0,
-             4114.5,
-             4362.0,
-             4613.8,
-             4870.3,
-             5131.7,
-             5397.9,
-             5668.7,
-             5943.9,
-             6223.1,
-             6506.0],
-            [2706.3,
-             3075.2,
-             3362.7,
-             3617.4,
-             3863.9,
-             4109.8,
-             4358.3,
-             4610.9,
-             4868.0,
-             5129.8,
-             5396.4,
-             5667.5,
-             5942.9,
-             6222.3,
-             6505.4],
-            [2685.4,
-             3052.0,
-             3350.0,
-             3608.9,
-             3857.7,
-             4105.1,
-             4354.7,
-             4608.0,
-             4865.6,
-             5127.9,
-             5394.9,
-             5666.3,
-             5941.9,
-             6221.5,
-             6504.7],
-            [2662.7,
-             3027.7,
-             3337.1,
-             3600.4,
-             3851.5,
-             4100.4,
-             4351.0,
-             4605.0,
-             4863.3,
-             5126.0,
-             5393.3,
-             5665.0,
-             5940.9,
-             6220.7,
-             6504.1],
-            [2637.9,
-             3002.3,
-             3324.1,
-             3591.8,
-             3845.3,
-             4095.8,
-             4347.4,
-             4602.1,
-             4860.9,
-             5124.2,
-             5391.8,
-             5663.8,
-             5939.9,
-             6219.9,
-             6503.5],
-            [2610.7,
-             2975.7,
-             3310.8,
-             3583.1,
-             3839.1,
-             4091.1,
-             4343.7,
-             4599.2,
-             4858.6,
-             5122.3,
-             5390.3,
-             5662.5,
-             5938.9,
-             6219.1,
-             6502.9],
-            [2580.8,
-             2947.6,
-             3297.3,
-             3574.4,
-             3832.9,
-             4086.3,
-             4340.0,
-             4596.3,
-             4856.3,
-             5120.4,
-             5388.7,
-             5661.3,
-             5937.9,
-             6218.3,
-             6502.3],
-            [2547.5,
-             2917.9,
-             3283.6,
-             3565.7,
-             3826.6,
-             4081.6,
-             4336.4,
-             4593.4,
-             4853.9,
-             5118.5,
-             5387.2,
-             5660.1,
-             5936.9,
-             6217.5,
-             6501.6],
-            [2509.8,
-             2886.4,
-             3269.7,
-             3556.8,
-             3820.4,
-             4076.9,
-             4332.7,
-             4590.5,
-             4851.6,
-             5116.6,
-             5385.7,
-             5658.8,
-             5935.9,
-             6216.7,
-             6501.0],
-            [2466.0,
-             2852.8,
-             3255.5,
-             3548.0,
-             3814.1,
-             4072.2,
-             4329.0,
-             4587.6,
-             4849.3,
-             5114.7,
-             5384.2,
-             5657.6,
-             5934.9,
-             6215.9,
-             6500.4],
-            [2412.3,
-             2816.9,
-             3241.2,
-             3539.0,
-             3807.8,
-             4067.5,
-             4325.4,
-             4584.7,
-             4846.9,
-             5112.8,
-             5382.6,
-             5656.4,
-             5933.9,
-             6215.1,
-             6499.8],
-            [2713.1,
-             3204.3,
-             3516.4,
-             3791.9,
-             4055.6,
-             4316.2,
-             4577.4,
-             4841.1,
-             5108.2,
-             5378.8,
-             5653.3,
-             5931.5,
-             6213.2,
-             6498.3],
-            [2578.6,
-             3165.9,
-             3493.5,
-             3776.0,
-             4043.8,
-             4307.1,
-             4570.2,
-             4835.4,
-             5103.5,
-             5375.1,
-             5650.3,
-             5929.0,
-             6211.2,
-             6496.8],
-            [2383.6,
-             3126.1,
-             3470.3,
-             3760.0,
-             4031.9,
-             4297.9,
-             4563.0,
-             4829.6,
-             5098.8,
-             5371.3,
-             5647.2,
-             5926.6,
-             6209.3,
-             6495.3],
-            [2152.8,
-             3084.7,
-             3446.7,
-             3743.9,
-             4020.0,
-             4288.8,
-             4555.8,
-             4823.8,
-             5094.2,
-             5367.6,
-             5644.2,
-             5924.2,
-             6207.4,
-             6493.8],
-            [2041.6,
-             3042.0,
-             3423.0,
-             3727.7,
-             4008.1,
-             4279.7,
-             4548.6,
-             4818.1,
-             5089.6,
-             5363.8,
-             5641.2,
-             5921.8,
-             6205.5,
-             6492.3],
-            [1988.6,
-             2997.9,
-             3398.9,
-             3711.6,
-             3996.3,
-             4270.6,
-             4541.5,
-             4812.4,
-             5085.0,
-             5360.1,
-             5638.2,
-             5919.4,
-             6203.6,
-             6490.8],
-            [1955.4,
-             2952.6,
-             3374.7,
-             3695.3,
-             3984.4,
-             4261.5,
-             4534.4,
-             4806.7,
-             5080.5,
-             5356.5,
-             5635.3,
-             5917.0,
-             6201.7,
-             6489.4],
-            [1931.4,
-             2906.5,
-             3350.4,
-             3679.1,
-             3972.6,
-             4252.5,
-             4527.3,
-             4801.1,
-             5075.9,
-             5352.8,
-             5632.3,
-             5914.6,
-             6199.9,
-             6487.9],
-            [1912.8,
-             2859.8,
-             3325.9,
-             3662.9,
-             3960.9,
-             4243.5,
-             4520.3,
-             4795.5,
-             5071.4,
-             5349.2,
-             5629.4,
-             5912.3,
-             6198.0,
-             6486.5],
-            [1897.7,
-             2813.2,
-             3301.5,
-             3646.8,
-             3949.1,
-             4234.6,
-             4513.3,
-             4789.9,
-             5066.9,
-             5345.6,
-             5626.5,
-             5910.0,
-             6196.2,
-             6485.1],
-            [1885.1,
-             2767.2,
-             3277.0,
-             3630.6,
-             3937.4,
-             4225.7,
-             4506.3,
-             4784.4,
-             5062.5,
-             5342.0,
-             5623.6,
-             5907.7,
-             6194.4,
-             6483.7],
-            [1874.4,
-             2722.6,
-             3252.5,
-             3614.6,
-             3925.8,
-             4216.8,
-             4499.4,
-             4778.9,
-             5058.1,
-             5338.4,
-             5620.8,
-             5905.4,
-             6192.6,
-             6482.3],
-            [1865.1,
-             2680.2,
-             3228.2,
-             3598.6,
-             3914.2,
-             4208.0,
-             4492.5,
-             4773.4,
-             5053.7,
-             5334.9,
-             5617.9,
-             5903.2,
-             6190.8,
-             6480.9],
-            [1856.9,
-             2640.5,
-             3204.1,
-             3582.7,
-             3902.7,
-             4199.3,
-             4485.7,
-             4768.0,
-             5049.4,
-             5331.4,
-             5615.1,
-             5900.9,
-             6189.0,
-             6479.6],
-            [1849.7,
-             2603.8,
-             3180.3,
-             3566.9,
-             3891.3,
-             4190.6,
-             4478.9,
-             4762.6,
-             5045.0,
-             5328.0,
-             5612.3,
-             5898.7,
-             6187.3,
-             6478.2],
-            [1843.2,
-             2570.3,
-             3156.8,
-             3551.3,
-             3880.0,
-             4182.0,
-             4472.2,
-             4757.3,
-             5040.8,
-             5324.5,
-             5609.6,
-             5896.5,
-             6185.6,
-             6476.9],
-            [1837.4,
-             2540.0,
-             3133.7,
-             3535.8,
-             3868.8,
-             4173.5,
-             4465.5,
-             4752.0,
-             5036.5,
-             5321.1,
-             5606.8,
-             5894.3,
-             6183.9,
-             6475.6]],
- 'v_by_P': [[14.67,
-             14.867,
-             17.196,
-             19.513,
-             21.826,
-             24.136,
-             26.446,
-             31.063,
-             35.68,
-             40.296,
-             44.911,
-             49.527,
-             54.142,
-             58.758,
-             63.373,
-             67.988,
-             72.604,
-             77.219,
-             81.834,
-             86.45,
-             91.065],
-            [7.648,
-             8.5854,
-             9.7485,
-             10.907,
-             12.064,
-             13.22,
-             15.53,
-             17.838,
-             20.147,
-             22.455,
-             24.763,
-             27.071,
-             29.379,
-             31.686,
-             33.994,
-             36.302,
-             38.61,
-             40.917,
-             43.225,
-             45.533],
-            [5.2284,
-             5.7151,
-             6.4937,
-             7.2677,
-             8.0399,
-             8.811,
-             10.352,
-             11.891,
-             13.431,
-             14.97,
-             16.508,
-             18.047,
-             19.586,
-             21.124,
-             22.663,
-             24.201,
-             25.74,
-             27.278,
-             28.817,
-             30.355],
-            [3.24,
-             3.4187,
-             3.8897,
-             4.3562,
-             4.8206,
-             5.284,
-             6.2094,
-             7.1338,
-             8.0576,
-             8.9812,
-             9.9047,
-             10.828,
-             11.751,
-             12.674,
-             13.598,
-             14.521,
-             15.444,
-             16.367,
-             17.29,
-             18.213],
-            [2.217,
-             2.2703,
-             2.5877,
-             2.9004,
-             3.211,
-             3.5206,
-             4.1383,
-             4.7549,
-             5.3711,
-             5.9871,
-             6.6028,
-             7.2185,
-             7.8341,
-             8.4496,
-             9.0651,
-             9.6806,
-             10.296,
-             10.911,
-             11.527,
-             12.142],
-            [1.6939,
-             1.6959,
-             1.9367,
-             2.1724,
-             2.4062,
-             2.6388,
-             3.1027,
-             3.5655,
-             4.0279,
-             4.49,
-             4.9519,
-             5.4137,
-             5.8754,
-             6.3371,
-             6.7988,
-             7.2604,
-             7.722,
-             8.1836,
-             8.6452,
-             9.1068],
-            [1.1593,
-             1.2855,
-             1.4445,
-             1.6013,
-             1.7571,
-             2.0671,
-             2.3761,
-             2.6846,
-             2.9929,
-             3.301,
-             3.6089,
-             3.9168,
-             4.2247,
-             4.5325,
-             4.8403,
-             5.1481,
-             5.4558,
-             5.7636,
-             6.0713],
-            [0.885682,
-             0.959855,
-             1.0805,
-             1.1989,
-             1.3162,
-             1.5493,
-             1.7814,
-             2.013,
-             2.2443,
-             2.4755,
-             2.7066,
-             2.9375,
-             3.1685,
-             3.3994,
-             3.6302,
-             3.8611,
-             4.0919,
-             4.3228,
-             4.5536],
-            [0.718659,
-             0.764389,
-             0.862059,
-             0.957428,
-             1.0517,
-             1.2387,
-             1.4246,
-             1.61,
-             1.7952,
-             1.9802,
-             2.1651,
-             2.35,
-             2.5347,
-             2.7195,
-             2.9042,
-             3.0889,
-             3.2736,
-             3.4583,
-             3.6429],
-            [0.60576,
-             0.634014,
-             0.716424,
-             0.796444,
-             0.875344,
-             1.0315,
-             1.1867,
-             1.3414,
-             1.4958,
-             1.65,
-             1.8042,
-             1.9582,
-             2.1122,
-             2.2662,
-             2.4202,
-             2.5741,
-             2.728,
-             2.8819,
-             3.0358],
-            [0.524179,
-             0.54083,
-             0.612381,
-             0.681448,
-             0.749373,
-             0.883601,
-             1.0168,
-             1.1495,
-             1.2819,
-             1.4142,
-             1.5463,
-             1.6784,
-             1.8105,
-             1.9425,
-             2.0745,
-             2.2064,
-             2.3383,
-             2.4703,
-             2.6022],
-            [0.462383,
-             0.470883,
-             0.534334,
-             0.595196,
-             0.654892,
-             0.772645,
-             0.889357,
-             1.0056,
-             1.1215,
-             1.2373,
-             1.353,
-             1.4686,
-             1.5841,
-             1.6997,
-             1.8152,
-             1.9306,
-             2.0461,
-             2.1615,
-             2.277],
-            [0.413897,
-             0.41642,
-             0.473617,
-             0.528105,
-             0.581404,
-             0.686344,
-             0.790239,
-             0.893636,
-             0.996761,
-             1.0997,
-             1.2026,
-             1.3054,
-             1.4081,
-             1.5108,
-             1.6135,
-             1.7161,
-             1.8188,
-             1.9214,
-             2.024],
-            [0.374806,
-             0.425032,
-             0.474428,
-             0.522612,
-             0.617304,
-             0.710944,
-             0.804086,
-             0.896955,
-             0.989661,
-             1.0823,
-             1.1748,
-             1.2673,
-             1.3597,
-             1.4521,
-             1.5445,
-             1.6369,
-             1.7293,
-             1.8216],
-            [0.315583,
-             0.352121,
-             0.393901,
-             0.434418,
-             0.513741,
-             0.592002,
-             0.669761,
-             0.747246,
-             0.824568,
-             0.901785,
-             0.978931,
-             1.056,
-             1.1331,
-             1.2101,
-             1.2871,
-             1.3641,
-             1.4411,
-             1.5181],
-            [0.272775,
-             0.300004,
-             0.336367,
-             0.371416,
-             0.439767,
-             0.507042,
-             0.573814,
-             0.640311,
-             0.706645,
-             0.772873,
-             0.839031,
-             0.905138,
-             0.97121,
-             1.0373,
-             1.1033,
-             1.1693,
-             1.2353,
-             1.3013],
-            [0.24034,
-             0.260881,
-             0.293205,
-             0.32416,
-             0.384284,
-             0.443322,
-             0.501853,
-             0.56011,
-             0.618202,
-             0.676189,
-             0.734105,
-             0.791972,
-             0.849802,
-             0.907605,
-             0.965388,
-             1.0232,
-             1.0809,
-             1.1387],
-            [0.214887,
-             0.230421,
-             0.259623,
-             0.2874,
-             0.34113,
-             0.393761,
-             0.445884,
-             0.497731,
-             0.549413,
-             0.600991,
-             0.652497,
-             0.703953,
-             0.755373,
-             0.806766,
-             0.858139,
-             0.909496,
-             0.96084,
-             1.0122],
-            [0.194362,
-             0.206022,
-             0.232747,
-             0.257988,
-             0.306606,
-             0.354113,
-             0.401108,
-             0.447828,
-             0.494382,
-             0.540832,
-             0.58721,
-             0.633538,
-             0.679831,
-             0.726096,
-             0.77234,
-             0.818569,
-             0.864785,
-             0.910991],
-            [0.163262,
-             0.169339,
-             0.192407,
-             0.213858,
-             0.254816,
-             0.294639,
-             0.333945,
-             0.372973,
-             0.411836,
-             0.450593,
-             0.48928,
-             0.527916,
-             0.566516,
-             0.60509,
-             0.643642,
-             0.682179,
-             0.720703,
-             0.759217],
-            [0.140778,
-             0.143025,
-             0.163561,
-             0.182324,
-             0.21782,
-             0.252156,
-             0.28597,
-             0.319505,
-             0.352874,
-             0.386137,
-             0.41933,
-             0.452472,
-             0.485578,
-             0.518657,
-             0.551715,
-             0.584757,
-             0.617787,
-             0.650807],
-            [0.12374,
-             0.141898,
-             0.158662,
-             0.190071,
-             0.220293,
-             0.249989,
-             0.279404,
-             0.308653,
-             0.337795,
-             0.366867,
-             0.395888,
-             0.424874,
-             0.453832,
-             0.48277,
-             0.511691,
-             0.5406,
-             0.569499],
-            [0.110368,
-             0.125022,
-             0.140248,
-             0.168485,
-             0.19551,
-             0.222003,
-             0.248214,
-             0.274258,
-             0.300196,
-             0.326063,
-             0.351879,
-             0.37766,
-             0.403413,
-             0.429146,
-             0.454862,
-             0.480566,
-             0.50626],
-            [0.099585,
-             0.111496,
-             0.125507,
-             0.151215,
-             0.175683,
-             0.199615,
-             0.223262,
-             0.246743,
-             0.270117,
-             0.293419,
-             0.316672,
-             0.339888,
-             0.363078,
-             0.386246,
-             0.409399,
-             0.432539,
-             0.455669],
-            [0.088715,
-             0.097937,
-             0.110753,
-             0.133941,
-             0.155855,
-             0.177226,
-             0.19831,
-             0.219227,
-             0.240037,
-             0.260776,
-             0.281465,
-             0.302117,
-             0.322742,
-             0.343347,
-             0.363936,
-             0.384512,
-             0.405078],
-            [0.079949,
-             0.087053,
-             0.098937,
-             0.120119,
-             0.139992,
-             0.159314,
-             0.178349,
-             0.197215,
-             0.215974,
-             0.234661,
-             0.253299,
-             0.2719,
-             0.290474,
-             0.309028,
-             0.327565,
-             0.34609,
-             0.364605],
-            [0.072725,
-             0.078113,
-             0.089257,
-             0.108808,
-             0.127012,
-             0.144659,
-             0.162016,
-             0.179204,
-             0.196285,
-             0.213295,
-             0.230254,
-             0.247177,
-             0.264073,
-             0.280948,
-             0.297807,
-             0.314654,
-             0.33149],
-            [0.066664,
-             0.070627,
-             0.081179,
-             0.099379,
-             0.116195,
-             0.132446,
-             0.148406,
-             0.164196,
-             0.179878,
-             0.195489,
-             0.21105,
-             0.226574,
-             0.242072,
-             0.257548,
-             0.273009,
-             0.288457,
-             0.303895],
-            [0.061505,
-             0.064256,
-             0.074332,
-             0.091399,
-             0.107041,
-             0.122112,
-             0.136889,
-             0.151496,
-             0.165996,
-             0.180423,
-             0.194801,
-             0.209142,
-             0.223456,
-             0.237749,
-             0.252026,
-             0.266291,
-             0.280545],
-            [0.057058,
-             0.058757,
-             0.068453,
-             0.084556,
-             0.099195,
-             0.113254,
-             0.127018,
-             0.140611,
-             0.154096,
-             0.167509,
-             0.180872,
-             0.194199,
-             0.207499,
-             0.220778,
-             0.234041,
-             0.247291,
-             0.260531],
-            [0.053183,
-             0.05395,
-             0.063347,
-             0.078624,
-             0.092393,
-             0.105576,
-             0.118462,
-             0.131177,
-             0.143783,
-             0.156317,
-             0.168801,
-             0.181249,
-             0.19367,
-             0.20607,
-             0.218453,
-             0.230825,
-             0.243186],
-            [0.049776,
-             0.05887,
-             0.073431,
-             0.086442,
-             0.098859,
-             0.110976,
-             0.122922,
-             0.134759,
-             0.146525,
-             0.158239,
-             0.169918,
-             0.181569,
-             0.1932,
-             0.204814,
-             0.216417,
-             0.228008],
-            [0.046756,
-             0.054909,
-             0.068848,
-             0.08119,
-             0.092931,
-             0.104371,
-             0.115638,
-             0.126797,
-             0.137884,
-             0.14892,
-             0.15992,
-             0.170892,
-             0.181844,
-             0.19278,
-             0.203703,
-             0.214617],
-            [0.044059,
-             0.051378,
-             0.064772,
-             0.076521,
-             0.087662,
-             0.0985,
-             0.109164,
-             0.11972,
-             0.130203,
-             0.140636,
-             0.151032,
-             0.161402,
-             0.17175,
-             0.182083,
-             0.192403,
-             0.202713],
-            [0.041636,
-             0.048208,
-             0.061123,
-             0.072343,
-             0.082947,
-             0.093246,
-             0.103371,
-             0.113387,
-             0.123331,
-             0.133224,
-             0.143081,
-             0.15291,
-             0.162719,
-             0.172512,
-             0.182292,
-             0.192062],
-            [0.039446,
-             0.045346,
-             0.057837,
-             0.068583,
-             0.078704,
-             0.088518,
-             0.098158,
-             0.107688,
-             0.117146,
-             0.126553,
-             0.135924,
-             0.145268,
-             0.154591,
-             0.163898,
-             0.173192,
-             0.182477],
-            [0.035642,
-             0.040373,
-             0.052158,
-             0.062086,
-             0.071374,
-             0.080351,
-             0.089152,
-             0.097844,
-             0.106463,
-             0.115031,
-             0.123563,
-             0.132067,
-             0.140551,
-             0.149019,
-             0.157474,
-             0.165919],
-            [0.032448,
-             0.036189,
-             0.047419,
-             0.056671,
-             0.065265,
-             0.073545,
-             0.081648,
-             0.089641,
-             0.09756,
-             0.105429,
-             0.113262,
-             0.121067,
-             0.128852,
-             0.13662,
-             0.144376,
-             0.152122],
-            [0.029727,
-             0.032607,
-             0.043404,
-             0.052087,
-             0.060096,
-             0.067786,
-             0.075298,
-             0.082699,
-             0.090027,
-             0.097305,
-             0.104545,
-             0.111759,
-             0.118952,
-             0.126129,
-             0.133293,
-             0.140447],
-            [0.027378,
-             0.029492,
-             0.039958,
-             0.048157,
-             0.055665,
-             0.06285,
-             0.069855,
-             0.07675,
-             0.083571,
-             0.090341,
-             0.097074,
-             0.103781,
-             0.110467,
-             0.117136,
-             0.123793,
-             0.13044],
-            [0.02533,
-             0.026742,
-             0.036966,
-             0.04475,
-             0.051824,
-             0.058572,
-             0.065138,
-             0.071593,
-             0.077975,
-             0.084306,
-             0.0906,
-             0.096866,
-             0.103113,
-             0.109343,
-             0.11556,
-             0.121768],
-            [0.023526,
-             0.024279,
-             0.034344,
-             0.041767,
-             0.048463,
-             0.054828,
-             0.061011,
-             0.067082,
-             0.073079,
-             0.079025,
-             0.084934,
-             0.090816,
-             0.096678,
-             0.102523,
-             0.108356,
-             0.114179],
-            [0.021923,
-             0.022036,
-             0.032025,
-             0.039134,
-             0.045497,
-             0.051525,
-             0.057369,
-             0.063101,
-             0.068759,
-             0.074365,
-             0.079935,
-             0.085478,
-             0.091,
-             0.096506,
-             0.102,
-             0.107483],
-            [0.02049,
-             0.02996,
-             0.036793,
-             0.042861,
-             0.048589,
-             0.054132,
-             0.059562,
-             0.064918,
-             0.070224,
-             0.075492,
-             0.080733,
-             0.085954,
-             0.091158,
-             0.09635,
-             0.101532],
-            [0.019199,
-             0.028108,
-             0.034698,
-             0.040502,
-             0.045962,
-             0.051236,
-             0.056396,
-             0.061483,
-             0.066518,
-             0.071516,
-             0.076487,
-             0.081438,
-             0.086373,
-             0.091295,
-             0.096206],
-            [0.01803,
-             0.026436,
-             0.032811,
-             0.038378,
-             0.043597,
-             0.048629,
-             0.053547,
-             0.05839,
-             0.063183,
-             0.067938,
-             0.072667,
-             0.077374,
-             0.082066,
-             0.086745,
-             0.091414],
-            [0.01599,
-             0.023537,
-             0.029549,
-             0.034709,
-             0.039513,
-             0.044126,
-             0.048625,
-             0.053049,
-             0.057422,
-             0.061758,
-             0.066067,
-             0.070355,
-             0.074627,
-             0.078886,
-             0.083136],
-            [0.014264,
-             0.021106,
-             0.026828,
-             0.031651,
-             0.036109,
-             0.040375,
-             0.044524,
-             0.048599,
-             0.052622,
-             0.056608,
-             0.060567,
-             0.064505,
-             0.068428,
-             0.072337,
-             0.076237],
-            [0.01278,
-             0.019033,
-             0.024523,
-             0.029063,
-             0.033229,
-             0.0372,
-             0.041054,
-             0.044833,
-             0.04856,
-             0.052251,
-             0.055914,
-             0.059556,
-             0.063182,
-             0.066796,
-             0.0704],
-            [0.011485,
-             0.01724,
-             0.022544,
-             0.026845,
-             0.030761,
-             0.034479,
-             0.03808,
-             0.041605,
-             0.045079,
-             0.048516,
-             0.051925,
-             0.055314,
-             0.058687,
-             0.062047,
-             0.065397],
-            [0.010338,
-             0.015671,
-             0.020827,
-             0.024921,
-             0.028621,
-             0.032121,
-             0.035503,
-             0.038808,
-             0.042062,
-             0.045279,
-             0.048468,
-             0.051637,
-             0.05479,
-             0.057931,
-             0.061061],
-            [0.009309,
-             0.014281,
-             0.019323,
-             0.023238,
-             0.026749,
-             0.030058,
-             0.033247,
-             0.036361,
-             0.039422,
-             0.042447,
-             0.045444,
-             0.04842,
-             0.051381,
-             0.054329,
-             0.057267],
-            [0.008371,
-             0.013038,
-             0.017994,
-             0.021752,
-             0.025097,
-             0.028237,
-             0.031258,
-             0.034202,
-             0.037093,
-             0.039948,
-             0.042775,
-             0.045582,
-             0.048373,
-             0.051151,
-             0.053919],
-            [0.007502,
-             0.011916,
-             0.01681,
-             0.020431,
-             0.023629,
-             0.026619,
-             0.029489,
-             0.032282,
-             0.035023,
-             0.037727,
-             0.040403,
-             0.043059,
-             0.045699,
-             0.048327,
-             0.050944],
-            [0.006677,
-             0.010892,
-             0.01575,
-             0.019249,
-             0.022316,
-             0.025172,
-             0.027907,
-             0.030565,
-             0.033171,
-             0.03574,
-             0.038281,
-             0.040802,
-             0.043307,
-             0.045799,
-             0.048282],
-            [0.005865,
-             0.00995,
-             0.014793,
-             0.018185,
-             0.021133,
-             0.023869,
-             0.026483,
-             0.02902,
-             0.031504,
-             0.033952,
-             0.036371,
-             0.038771,
-             0.041154,
-             0.043525,
-             0.045886],
-            [0.007862,
-             0.012769,
-             0.015938,
-             0.018638,
-             0.02112,
-             0.023478,
-             0.025759,
-             0.027986,
-             0.030177,
-             0.03234,
-             0.034482,
-             0.036609,
-             0.038723,
-             0.040828],
-            [0.006005,
-             0.011143,
-             0.01414,
-             0.016643,
-             0.018922,
-             0.021075,
-             0.02315,
-             0.025172,
-             0.027157,
-             0.029115,
-             0.031052,
-             0.032974,
-             0.034883,
-             0.036782],
-            [0.004204,
-             0.009807,
-             0.01267,
-             0.015012,
-             0.017124,
-             0.01911,
-             0.021017,
-             0.022871,
-             0.024688,
-             0.026477,
-             0.028246,
-             0.029999,
-             0.03174,
-             0.033471],
-            [0.002798,
-             0.00869,
-             0.011445,
-             0.013653,
-             0.015628,
-             0.017473,
-             0.01924,
-             0.020953,
-             0.02263,
-             0.024279,
-             0.025908,
-             0.027521,
-             0.029122,
-             0.030713],
-            [0.002305,
-             0.007744,
-             0.010409,
-             0.012505,
-             0.014362,
-             0.016089,
-             0.017737,
-             0.019332,
-             0.020889,
-             0.02242,
-             0.02393,
-             0.025425,
-             0.026907,
-             0.028379],
-            [0.002105,
-             0.006932,
-             0.009523,
-             0.011523,
-             0.013278,
-             0.014904,
-             0.01645,
-             0.017942,
-             0.019398,
-             0.020827,
-             0.022235,
-             0.023628,
-             0.025009,
-             0.026379],
-            [0.00199,
-             0.006232,
-             0.008757,
-             0.010672,
-             0.01234,
-             0.013877,
-             0.015335,
-             0.016739,
-             0.018106,
-             0.019446,
-             0.020767,
-             0.022071,
-             0.023364,
-             0.024646],
-            [0.001911,
-             0.005623,
-             0.008089,
-             0.00993,
-             0.011521,
-             0.01298,
-             0.01436,
-             0.015686,
-             0.016976,
-             0.018239,
-             0.019482,
-             0.020709,
-             0.021925,
-             0.02313],
-            [0.001851,
-             0.005094,
-             0.007502,
-             0.009276,
-             0.010799,
-             0.012189,
-             0.0135,
-             0.014758,
-             0.015979,
-             0.017174,
-             0.018349,
-             0.019508,
-             0.020655,
-             0.021792],
-            [0.001803,
-             0.004633,
-             0.006982,
-             0.008697,
-             0.010158,
-             0.011487,
-             0.012737,
-             0.013934,
-             0.015094,
-             0.016228,
-             0.017342,
-             0.01844,
-             0.019527,
-             0.020604],
-            [0.001764,
-             0.004234,
-             0.006521,
-             0.00818,
-             0.009586,
-             0.01086,
-             0.012054,
-             0.013197,
-             0.014302,
-             0.015381,
-             0.016441,
-             0.017485,
-             0.018517,
-             0.01954],
-            [0.001731,
-             0.00389,
-             0.006108,
-             0.007717,
-             0.009072,
-             0.010296,
-             0.011441,
-             0.012534,
-             0.01359,
-             0.01462,
-             0.015631,
-             0.016626,
-             0.017609,
-             0.018583],
-            [0.001702,
-             0.003595,
-             0.005738,
-             0.007299,
-             0.008609,
-             0.009787,
-             0.010887,
-             0.011934,
-             0.012946,
-             0.013932,
-             0.014898,
-             0.015849,
-             0.016788,
-             0.017717],
-            [0.001676,
-             0.003345,
-             0.005405,
-             0.006921,
-             0.008188,
-             0.009325,
-             0.010383,
-             0.01139,
-             0.012361,
-             0.013306,
-             0.014232,
-             0.015142,
-             0.016041,
-             0.016931],
-            [0.001653,
-             0.003132,
-             0.005105,
-             0.006578,
-             0.007806,
-             0.008904,
-             0.009924,
-             0.010894,
-             0.011827,
-             0.012735,
-             0.013624,
-             0.014498,
-             0.01536,
-             0.016212],
-            [0.001633,
-             0.002952,
-             0.004833,
-             0.006265,
-             0.007456,
-             0.008519,
-             0.009504,
-             0.010439,
-             0.011339,
-             0.012212,
-             0.013067,
-             0.013907,
-             0.014735,
-             0.015554],
-            [0.001614,
-             0.0028,
-             0.004587,
-             0.005979,
-             0.007135,
-             0.008165,
-             0.009118,
-             0.010021,
-             0.010889,
-             0.011732,
-             0.012555,
-             0.013364,
-             0.014161,
-             0.014949]],
- 's_by_P': [[8.1488,
-             8.1741,
-             8.4489,
-             8.6892,
-             8.9049,
-             9.1015,
-             9.2827,
-             9.6094,
-             9.8998,
-             10.163,
-             10.406,
-             10.631,
-             10.843,
-             11.043,
-             11.233,
-             11.413,
-             11.586,
-             11.751,
-             11.909,
-             12.061,
-             12.207],
-            [7.9072,
-             8.1263,
-             8.368,
-             8.5843,
-             8.7811,
-             8.9625,
-             9.2893,
-             9.5798,
-             9.8431,
-             10.086,
-             10.311,
-             10.523,
-             10.723,
-             10.913,
-             11.093,
-             11.266,
-             11.431,
-             11.589,
-             11.741,
-             11.887],
-            [7.7675,
-             7.9365,
-             8.1796,
-             8.3964,
-             8.5935,
-             8.775,
-             9.102,
-             9.3925,
-             9.6559,
-             9.8984,
-             10.124,
-             10.336,
-             10.536,
-             10.725,
-             10.906,
-             11.079,
-             11.244,
-             11.402,
-             11.554,
-             11.7],
-            [7.593,
-             7.6953,
-             7.9413,
-             8.1592,
-             8.3568,
-             8.5386,
-             8.8659,
-             9.1566,
-             9.4201,
-             9.6625,
-             9.8882,
-             10.1,
-             10.3,
-             10.49,
-             10.67,
-             10.843,
-             11.008,
-             11.166,
-             11.318,
-             11.464],
-            [7.4557,
-             7.5011,
-             7.7509,
-             7.9702,
-             8.1685,
-             8.3507,
-             8.6783,
-             8.9692,
-             9.2328,
-             9.4753,
-             9.701,
-             9.9128,
-             10.113,
-             10.303,
-             10.483,
-             10.656,
-             10.821,
-             10.979,
-             11.131,
-             11.277],
-            [7.3588,
-             7.361,
-             7.6148,
-             7.8356,
-             8.0346,
-             8.2172,
-             8.5452,
-             8.8361,
-             9.0998,
-             9.3424,
-             9.5681,
-             9.78,
-             9.98,
-             10.17,
-             10.35,
-             10.523,
-             10.688,
-             10.846,
-             10.998,
-             11.145],
-            [7.223,
-             7.4208,
-             7.6447,
-             7.8451,
-             8.0284,
-             8.3572,
-             8.6485,
-             8.9124,
-             9.155,
-             9.3808,
-             9.5927,
-             9.7927,
-             9.9825,
-             10.163,
-             10.336,
-             10.501,
-             10.659,
-             10.811,
-             10.957],
-            [7.1269,
-             7.281,
-             7.5081,
-             7.71,
-             7.8941,
-             8.2236,
-             8.5152,
-             8.7792,
-             9.022,
-             9.2479,
-             9.4598,
-             9.6599,
-             9.8497,
-             10.03,
-             10.203,
-             10.368,
-             10.526,
-             10.678,
-             10.825],
-            [7.0524,
-             7.1708,
-             7.4012,
-             7.6046,
-             7.7895,
-             8.1197,
-             8.4117,
-             8.6759,
-             8.9188,
-             9.1448,
-             9.3567,
-             9.5568,
-             9.7466,
-             9.9273,
-             10.1,
-             10.265,
-             10.423,
-             10.575,
-             10.722],
-            [6.9916,
-             7.0791,
-             7.3131,
-             7.518,
-             7.7037,
-             8.0347,
-             8.3271,
-             8.5914,
-             8.8344,
-             9.0604,
-             9.2724,
-             9.4726,
-             9.6624,
-             9.8431,
-             10.016,
-             10.181,
-             10.339,
-             10.491,
-             10.637],
-            [6.9401,
-             7.0003,
-             7.238,
-             7.4444,
-             7.6309,
-             7.9627,
-             8.2554,
-             8.52,
-             8.7631,
-             8.9891,
-             9.2012,
-             9.4013,
-             9.5912,
-             9.7719,
-             9.9445,
-             10.11,
-             10.268,
-             10.42,
-             10.566],
-            [6.8955,
-             6.9306,
-             7.1723,
-             7.3804,
-             7.5677,
-             7.9002,
-             8.1933,
-             8.458,
-             8.7012,
-             8.9273,
-             9.1394,
-             9.3396,
-             9.5295,
-             9.7102,
-             9.8828,
-             10.048,
-             10.206,
-             10.358,
-             10.505],
-            [6.856,
-             6.8678,
-             7.1138,
-             7.3235,
-             7.5117,
-             7.845,
-             8.1384,
-             8.4033,
-             8.6466,
-             8.8728,
-             9.0849,
-             9.2851,
-             9.475,
-             9.6558,
-             9.8284,
-             9.9935,
-             10.152,
-             10.304,
-             10.45],
-            [6.8207,
-             7.061,
-             7.2724,
-             7.4614,
-             7.7955,
-             8.0892,
-             8.3543,
-             8.5977,
-             8.824,
-             9.0362,
-             9.2364,
-             9.4263,
-             9.6071,
-             9.7797,
-             9.9448,
-             10.103,
-             10.255,
-             10.402],
-            [6.7592,
-             6.9683,
-             7.1832,
-             7.374,
-             7.7097,
-             8.0041,
-             8.2695,
-             8.5131,
-             8.7395,
-             8.9518,
-             9.1521,
-             9.342,
-             9.5228,
-             9.6954,
-             9.8606,
-             10.019,
-             10.171,
-             10.317],
-            [6.7071,
-             6.8884,
-             7.107,
-             7.2995,
-             7.6368,
-             7.9319,
-             8.1977,
-             8.4415,
-             8.668,
-             8.8804,
-             9.0807,
-             9.2707,
-             9.4516,
-             9.6242,
-             9.7894,
-             9.9478,
-             10.1,
-             10.246],
-            [6.6616,
-             6.8176,
-             7.0401,
-             7.2345,
-             7.5734,
-             7.8692,
-             8.1354,
-             8.3794,
-             8.6061,
-             8.8185,
-             9.0189,
-             9.2089,
-             9.3898,
-             9.5625,
-             9.7277,
-             9.8861,
-             10.038,
-             10.185],
-            [6.6213,
-             6.7539,
-             6.9805,
-             7.1767,
-             7.5173,
-             7.8138,
-             8.0803,
-             8.3246,
-             8.5514,
-             8.7639,
-             8.9643,
-             9.1544,
-             9.3353,
-             9.508,
-             9.6732,
-             9.8316,
-             9.9838,
-             10.13],
-            [6.585,
-             6.6955,
-             6.9265,
-             7.1246,
-             7.4669,
-             7.7641,
-             8.031,
-             8.2755,
-             8.5024,
-             8.715,
-             8.9155,
-             9.1056,
-             9.2866,
-             9.4593,
-             9.6245,
-             9.783,
-             9.9351,
-             10.081],
-            [6.5217,
-             6.5909,
-             6.8313,
-             7.0335,
-             7.3793,
-             7.6779,
-             7.9455,
-             8.1904,
-             8.4176,
-             8.6303,
-             8.831,
-             9.0212,
-             9.2022,
-             9.3749,
-             9.5402,
-             9.6987,
-             9.8508,
-             9.9972],
-            [6.4675,
-             6.4975,
-             6.7488,
-             6.9552,
-             7.3046,
-             7.6047,
-             7.873,
-             8.1183,
-             8.3457,
-             8.5587,
-             8.7594,
-             8.9497,
-             9.1308,
-             9.3036,
-             9.4689,
-             9.6274,
-             9.7796,
-             9.9259],
-            [6.4199,
-             6.6753,
-             6.8863,
-             7.2394,
-             7.5409,
-             7.81,
-             8.0557,
-             8.2834,
-             8.4965,
-             8.6974,
-             8.8878,
-             9.0689,
-             9.2417,
-             9.4071,
-             9.5656,
-             9.7178,
-             9.8642],
-            [6.3775,
-             6.6087,
-             6.8246,
-             7.1814,
-             7.4845,
-             7.7543,
-             8.0004,
-             8.2284,
-             8.4416,
-             8.6426,
-             8.8331,
-             9.0143,
-             9.1872,
-             9.3526,
-             9.5111,
-             9.6634,
-             9.8098],
-            [6.339,
-             6.5475,
-             6.7684,
-             7.1292,
-             7.4337,
-             7.7043,
-             7.9509,
-             8.179,
-             8.3925,
-             8.5936,
-             8.7842,
-             8.9654,
-             9.1384,
-             9.3038,
-             9.4624,
-             9.6146,
-             9.761],
-            [6.2954,
-             6.4766,
-             6.7044,
-             7.0702,
-             7.3767,
-             7.6482,
-             7.8953,
-             8.1238,
-             8.3375,
-             8.5388,
-             8.7294,
-             8.9107,
-             9.0837,
-             9.2492,
-             9.4078,
-             9.5601,
-             9.7065],
-            [6.2558,
-             6.4107,
-             6.6459,
-             7.017,
-             7.3254,
-             7.5979,
-             7.8455,
-             8.0743,
-             8.2882,
-             8.4896,
-             8.6804,
-             8.8618,
-             9.0349,
-             9.2004,
-             9.359,
-             9.5113,
-             9.6578],
-            [6.2194,
-             6.3486,
-             6.5918,
-             6.9683,
-             7.2787,
-             7.5522,
-             7.8003,
-             8.0295,
-             8.2436,
-             8.4452,
-             8.636,
-             8.8175,
-             8.9906,
-             9.1562,
-             9.3149,
-             9.4672,
-             9.6137],
-            [6.1856,
-             6.2893,
-             6.5412,
-             6.9234,
-             7.2359,
-             7.5103,
-             7.759,
-             7.9885,
-             8.2028,
-             8.4045,
-             8.5955,
-             8.777,
-             8.9502,
-             9.1158,
-             9.2745,
-             9.4269,
-             9.5734],
-            [6.154,
-             6.2321,
-             6.4936,
-             6.8817,
-             7.1962,
-             7.4716,
-             7.7208,
-             7.9507,
-             8.1652,
-             8.3671,
-             8.5581,
-             8.7398,
-             8.913,
-             9.0787,
-             9.2374,
-             9.3898,
-             9.5363],
-            [6.1243,
-             6.1764,
-             6.4484,
-             6.8427,
-             7.1593,
-             7.4356,
-             7.6854,
-             7.9156,
-             8.1303,
-             8.3324,
-             8.5235,
-             8.7053,
-             8.8785,
-             9.0443,
-             9.203,
-             9.3555,
-             9.502],
-            [6.0963,
-             6.1215,
-             6.4053,
-             6.806,
-             7.1247,
-             7.4021,
-             7.6524,
-             7.8829,
-             8.0979,
-             8.3,
-             8.4913,
-             8.6731,
-             8.8465,
-             9.0122,
-             9.171,
-             9.3235,
-             9.47],
-            [6.0696,
-             6.3639,
-             6.7714,
-             7.0922,
-             7.3705,
-             7.6214,
-             7.8523,
-             8.0674,
-             8.2697,
-             8.4611,
-             8.643,
-             8.8164,
-             8.9822,
-             9.1411,
-             9.2935,
-             9.4401],
-            [6.0441,
-             6.324,
-             6.7384,
-             7.0614,
-             7.3408,
-             7.5922,
-             7.8234,
-             8.0388,
-             8.2413,
-             8.4328,
-             8.6147,
-             8.7882,
-             8.954,
-             9.1129,
-             9.2654,
-             9.412],
-            [6.0197,
-             6.2854,
-             6.707,
-             7.0323,
-             7.3127,
-             7.5646,
-             7.7962,
-             8.0118,
-             8.2144,
-             8.406,
-             8.588,
-             8.7615,
-             8.9274,
-             9.0863,
-             9.2389,
-             9.3855],
-            [5.9963,
-             6.2478,
-             6.677,
-             7.0046,
-             7.2859,
-             7.5385,
-             7.7703,
-             7.9862,
-             8.1889,
-             8.3806,
-             8.5627,
-             8.7363,
-             8.9023,
-             9.0612,
-             9.2138,
-             9.3605],
-            [5.9737,
-             6.211,
-             6.6483,
-             6.9781,
-             7.2605,
-             7.5136,
-             7.7458,
-             7.9618,
-             8.1648,
-             8.3566,
-             8.5388,
-             8.7124,
-             8.8784,
-             9.0374,
-             9.19,
-             9.3367],
-            [5.9307,
-             6.1397,
-             6.5939,
-             6.9285,
-             7.213,
-             7.4672,
-             7.7001,
-             7.9166,
-             8.1198,
-             8.3118,
-             8.4941,
-             8.6679,
-             8.834,
-             8.993,
-             9.1457,
-             9.2924],
-            [5.8901,
-             6.0703,
-             6.5432,
-             6.8826,
-             7.1693,
-             7.4246,
-             7.6582,
-             7.8751,
-             8.0786,
-             8.2709,
-             8.4534,
-             8.6272,
-             8.7934,
-             8.9525,
-             9.1052,
-             9.252],
-            [5.8516,
-             6.0019,
-             6.4954,
-             6.8399,
-             7.1288,
-             7.3853,
-             7.6195,
-             7.8369,
-             8.0407,
-             8.2331,
-             8.4158,
-             8.5898,
-             8.756,
-             8.9152,
-             9.068,
-             9.2148],
-            [5.8148,
-             5.9337,
-             6.4502,
-             6.8,
-             7.091,
-             7.3486,
-             7.5836,
-             7.8014,
-             8.0055,
-             8.1981,
-             8.381,
-             8.5551,
-             8.7214,
-             8.8807,
-             9.0335,
-             9.1804],
-            [5.7793,
-             5.8646,
-             6.4071,
-             6.7623,
-             7.0555,
-             7.3144,
-             7.55,
-             7.7682,
-             7.9726,
-             8.1655,
-             8.3485,
-             8.5227,
-             8.6891,
-             8.8485,
-             9.0014,
-             9.1483],
-            [5.745,
-             5.7937,
-             6.3658,
-             6.7266,
-             7.0221,
-             7.2821,
-             7.5184,
-             7.7371,
-             7.9419,
-             8.135,
-             8.3181,
-             8.4924,
-             8.6589,
-             8.8184,
-             8.9713,
-             9.1183],
-            [5.7117,
-             5.7194,
-             6.326,
-             6.6927,
-             6.9905,
-             7.2517,
-             7.4887,
-             7.7079,
-             7.9129,
-             8.1062,
-             8.2895,
-             8.4639,
-             8.6305,
-             8.79,
-             8.943,
-             9.09],
-            [5.6791,
-             6.2876,
-             6.6603,
-             6.9605,
-             7.2229,
-             7.4606,
-             7.6802,
-             7.8855,
-             8.079,
-             8.2625,
-             8.437,
-             8.6037,
-             8.7633,
-             8.9163,
-             9.0634],
-            [5.6473,
-             6.2504,
-             6.6293,
-             6.9318,
-             7.1955,
-             7.4339,
-             7.6539,
-             7.8596,
-             8.0533,
-             8.2369,
-             8.4116,
-             8.5784,
-             8.738,
-             8.8911,
-             9.0382],
-            [5.616,
-             6.2141,
-             6.5995,
-             6.9045,
-             7.1693,
-             7.4085,
-             7.629,
-             7.8349,
-             8.0288,
-             8.2126,
-             8.3874,
-             8.5543,
-             8.714,
-             8.8671,
-             9.0143],
-            [5.5545,
-             6.144,
-             6.543,
-             6.8531,
-             7.1204,
-             7.361,
-             7.5824,
-             7.7889,
-             7.9833,
-             8.1673,
-             8.3424,
-             8.5095,
-             8.6693,
-             8.8226,
-             8.9698],
-            [5.4939,
-             6.0764,
-             6.4903,
-             6.8054,
-             7.0753,
-             7.3173,
-             7.5396,
-             7.7467,
-             7.9416,
-             8.1259,
-             8.3012,
-             8.4685,
-             8.6284,
-             8.7818,
-             8.9292],
-            [5.4336,
-             6.0106,
-             6.4405,
-             6.7609,
-             7.0333,
-             7.2768,
-             7.5,
-             7.7078,
-             7.903,
-             8.0877,
-             8.2633,
-             8.4307,
-             8.5908,
-             8.7443,
-             8.8917],
-            [5.3727,
-             5.9459,
-             6.3932,
-             6.7191,
-             6.9941,
-             7.2391,
-             7.4632,
-             7.6716,
-             7.8673,
-             8.0523,
-             8.228,
-             8.3956,
-             8.5559,
-             8.7095,
-             8.857],
-            [5.3106,
-             5.8819,
-             6.348,
-             6.6796,
-             6.9572,
-             7.2037,
-             7.4288,
-             7.6378,
-             7.8339,
-             8.0192,
-             8.1952,
-             8.363,
-             8.5234,
-             8.6771,
-             8.8247],
-            [5.2463,
-             5.8179,
-             6.3046,
-             6.6421,
-             6.9224,
-             7.1703,
-             7.3964,
-             7.606,
-             7.8025,
-             7.9882,
-             8.1644,
-             8.3323,
-             8.4929,
-             8.6467,
-             8.7944],
-            [5.1787,
-             5.7536,
-             6.2628,
-             6.6063,
-             6.8894,
-             7.1388,
-             7.3658,
-             7.576,
-             7.773,
-             7.9589,
-             8.1354,
-             8.3035,
-             8.4642,
-             8.6182,
-             8.7659],
-            [5.1061,
-             5.6883,
-             6.2223,
-             6.572,
-             6.8579,
-             7.1089,
-             7.3368,
-             7.5476,
-             7.745,
-             7.9313,
-             8.108,
-             8.2763,
-             8.4372,
-             8.5912,
-             8.7391],
-            [5.0256,
-             5.6215,
-             6.1829,
-             6.5391,
-             6.8278,
-             7.0803,
-             7.3092,
-             7.5207,
-             7.7185,
-             7.9051,
-             8.082,
-             8.2505,
-             8.4115,
-             8.5657,
-             8.7136],
-            [4.9314,
-             5.5525,
-             6.1446,
-             6.5075,
-             6.799,
-             7.0531,
-             7.2829,
-             7.495,
-             7.6933,
-             7.8802,
-             8.0574,
-             8.226,
-             8.3871,
-             8.5414,
-             8.6895],
-            [5.3655,
-             6.0524,
-             6.4329,
-             6.7318,
-             6.9898,
-             7.222,
-             7.4356,
-             7.635,
-             7.8227,
-             8.0005,
-             8.1696,
-             8.3311,
-             8.4856,
-             8.6339],
-            [5.14,
-             5.9642,
-             6.3637,
-             6.6702,
-             6.9322,
-             7.1668,
-             7.382,
-             7.5825,
-             7.771,
-             7.9493,
-             8.1189,
-             8.2807,
-             8.4356,
-             8.584],
-            [4.8313,
-             5.8789,
-             6.2987,
-             6.6131,
-             6.8792,
-             7.1162,
-             7.3331,
-             7.5346,
-             7.7239,
-             7.9028,
-             8.0729,
-             8.235,
-             8.3901,
-             8.5388],
-            [4.4757,
-             5.7956,
-             6.2373,
-             6.5598,
-             6.83,
-             7.0695,
-             7.288,
-             7.4906,
-             7.6807,
-             7.8602,
-             8.0307,
-             8.1932,
-             8.3485,
-             8.4975],
-            [4.3012,
-             5.7138,
-             6.1788,
-             6.5097,
-             6.7841,
-             7.026,
-             7.2461,
-             7.4498,
-             7.6406,
-             7.8207,
-             7.9917,
-             8.1545,
-             8.3102,
-             8.4593],
-            [4.2143,
-             5.6331,
-             6.1228,
-             6.4622,
-             6.7409,
-             6.9853,
-             7.2069,
-             7.4118,
-             7.6034,
-             7.7841,
-             7.9554,
-             8.1186,
-             8.2746,
-             8.4239],
-            [4.1574,
-             5.5533,
-             6.069,
-             6.4171,
-             6.7,
-             6.9469,
-             7.1701,
-             7.3761,
-             7.5685,
-             7.7497,
-             7.9216,
-             8.0851,
-             8.2413,
-             8.3909],
-            [4.1145,
-             5.4744,
-             6.017,
-             6.374,
-             6.6612,
-             6.9106,
-             7.1355,
-             7.3425,
-             7.5357,
-             7.7175,
-             7.8897,
-             8.0536,
-             8.2101,
-             8.3599],
-            [4.0799,
-             5.3967,
-             5.9667,
-             6.3327,
-             6.6243,
-             6.8762,
-             7.1026,
-             7.3107,
-             7.5047,
-             7.6871,
-             7.8598,
-             8.024,
-             8.1807,
-             8.3308],
-            [4.0507,
-             5.3207,
-             5.9179,
-             6.293,
-             6.5889,
-             6.8433,
-             7.0713,
-             7.2805,
-             7.4753,
-             7.6583,
-             7.8314,
-             7.9959,
-             8.1529,
-             8.3032],
-            [4.0253,
-             5.2469,
-             5.8705,
-             6.2548,
-             6.5551,
-             6.812,
-             7.0415,
-             7.2518,
-             7.4473,
-             7.6309,
-             7.8044,
-             7.9693,
-             8.1266,
-             8.2771],
-            [4.0029,
-             5.1762,
-             5.8245,
-             6.2178,
-             6.5225,
-             6.7819,
-             7.0131,
-             7.2244,
-             7.4207,
-             7.6048,
-             7.7788,
-             7.944,
-             8.1015,
-             8.2522],
-            [3.9827,
-             5.1092,
-             5.7797,
-             6.1821,
-             6.4911,
-             6.753,
-             6.9857,
-             7.1982,
-             7.3952,
-             7.5799,
-             7.7543,
-             7.9198,
-             8.0777,
-             8.2285],
-            [3.9643,
-             5.0466,
-             5.7362,
-             6.1475,
-             6.4609,
-             6.7252,
-             6.9595,
-             7.173,
-             7.3708,
-             7.556,
-             7.7308,
-             7.8967,
-             8.0548,
-             8.2059],
-            [3.9474,
-             4.9887,
-             5.6938,
-             6.114,
-             6.4316,
-             6.6984,
-             6.9343,
-             7.1488,
-             7.3473,
-             7.5331,
-             7.7084,
-             7.8746,
-             8.0329,
-             8.1842],
-            [3.9317,
-             4.9356,
-             5.6527,
-             6.0814,
-             6.4033,
-             6.6725,
-             6.9099,
-             7.1255,
-             7.3248,
-             7.5111,
-             7.6868,
-             7.8533,
-             8.0119,
-             8.1635],
-            [3.917,
-             4.8871,
-             5.6128,
-             6.0498,
-             6.3758,
-             6.6475,
-             6.8864,
-             7.103,
-             7.303,
-             7.4899,
-             7.666,
-             7.8329,
-             7.9917,
-             8.1435]]}
+SH = {
+    'P': (10.0,20.0,30.0,50.0,75.0,100.0,150.0,200.0,250.0,300.0,350.0,400.0,450.0,500.0,600.0,700.0,800.0,900.0,1000.0,1200.0,1400.0,1600.0,1800.0,2000.0,2250.0,2500.0,2750.0,3000.0,3250.0,3500.0,3750.0,4000.0,4250.0,4500.0,4750.0,5000.0,5500.0,6000.0,6500.0,7000.0,7500.0,8000.0,8500.0,9000.0,9500.0,10000.0,11000.0,12000.0,13000.0,14000.0,15000.0,16000.0,17000.0,18000.0,19000.0,20000.0,22500.0,25000.0,27500.0,30000.0,32500.0,35000.0,37500.0,40000.0,42500.0,45000.0,47500.0,50000.0,52500.0,55000.0,57500.0,60000.0,62500.0),
+    'T_by_P': (
+        (45.81,50.0,100.0,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (60.06,100.0,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (69.1,100.0,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (81.32,100.0,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (91.76,100.0,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (99.61,100.0,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (111.35,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (120.21,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (127.41,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (133.52,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (138.86,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (143.61,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (147.9,150.0,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (151.83,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (158.83,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (164.95,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (170.41,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (175.35,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (179.88,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (187.96,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (195.04,200.0,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (201.37,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (207.11,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (212.38,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (218.41,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (223.95,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (229.08,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (233.85,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (238.33,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (242.56,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (246.56,250.0,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (250.35,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (253.98,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (257.44,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (260.75,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (263.94,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (269.97,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (275.58,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (280.86,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (285.83,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (290.54,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (295.01,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (299.27,300.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (303.34,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (307.25,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (311.0,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (318.08,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (324.68,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (330.85,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (336.67,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (342.16,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (347.35,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (352.29,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (356.99,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (361.47,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (365.75,400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+        (400.0,500.0,600.0,700.0,800.0,900.0,1000.0,1100.0,1200.0,1300.0,1400.0,1500.0,1600.0,1700.0),
+    ),
+    'u_by_P': (
+        (2437.2,2443.3,2515.5,2587.9,2661.3,2736.1,2812.3,2969.3,3132.9,3303.3,3480.8,3665.3,3856.9,4055.2,4260.0,4470.9,4687.4,4909.1,5135.6,5366.6,5601.6),
+        (2456.0,2514.5,2587.4,2661.0,2735.8,2812.1,2969.2,3132.8,3303.3,3480.7,3665.3,3856.9,4055.2,4260.0,4470.8,4687.3,4909.1,5135.6,5366.6,5601.6),
+        (2467.7,2513.5,2586.8,2660.7,2735.6,2811.9,2969.1,3132.7,3303.2,3480.7,3665.3,3856.8,4055.2,4260.0,4470.8,4687.3,4909.0,5135.6,5366.6,5601.6),
+        (2483.2,2511.5,2585.7,2660.0,2735.1,2811.6,2968.9,3132.6,3303.1,3480.6,3665.2,3856.8,4055.1,4259.9,4470.8,4687.3,4909.0,5135.6,5366.5,5601.6),
+        (2496.1,2508.9,2584.3,2659.1,2734.5,2811.1,2968.6,3132.4,3302.9,3480.5,3665.1,3856.7,4055.1,4259.9,4470.7,4687.2,4909.0,5135.5,5366.5,5601.6),
+        (2505.6,2506.2,2582.9,2658.2,2733.9,2810.6,2968.3,3132.2,3302.8,3480.4,3665.0,3856.6,4055.0,4259.8,4470.7,4687.2,4908.9,5135.5,5366.5,5601.5),
+        (2519.2,2580.1,2656.4,2732.7,2809.7,2967.7,3131.8,3302.5,3480.1,3664.8,3856.5,4054.9,4259.7,4470.6,4687.1,4908.9,5135.4,5366.4,5601.5),
+        (2529.1,2577.1,2654.6,2731.4,2808.8,2967.1,3131.4,3302.2,3479.9,3664.7,3856.3,4054.8,4259.6,4470.5,4687.0,4908.8,5135.4,5366.4,5601.4),
+        (2536.8,2574.1,2652.8,2730.2,2807.9,2966.6,3131.0,3301.9,3479.7,3664.5,3856.2,4054.6,4259.5,4470.4,4687.0,4908.7,5135.3,5366.3,5601.4),
+        (2543.2,2571.0,2651.0,2728.9,2807.0,2966.0,3130.6,3301.6,3479.5,3664.3,3856.0,4054.5,4259.4,4470.3,4686.9,4908.7,5135.3,5366.3,5601.3),
+        (2548.5,2567.8,2649.1,2727.7,2806.1,2965.4,3130.2,3301.3,3479.2,3664.1,3855.9,4054.4,4259.3,4470.2,4686.8,4908.6,5135.2,5366.2,5601.3),
+        (2553.1,2564.4,2647.2,2726.4,2805.1,2964.9,3129.8,3301.0,3479.0,3663.9,3855.7,4054.3,4259.2,4470.1,4686.7,4908.5,5135.1,5366.2,5601.2),
+        (2557.1,2560.9,2645.3,2725.1,2804.2,2964.3,3129.4,3300.7,3478.8,3663.7,3855.6,4054.1,4259.1,4470.0,4686.6,4908.5,5135.1,5366.1,5601.2),
+        (2560.7,2643.3,2723.8,2803.2,2963.7,3129.0,3300.4,3478.5,3663.6,3855.4,4054.0,4259.0,4470.0,4686.6,4908.4,5135.0,5366.1,5601.2),
+        (2566.8,2639.3,2721.2,2801.4,2962.5,3128.2,3299.8,3478.1,3663.2,3855.1,4053.7,4258.7,4469.8,4686.4,4908.2,5134.9,5365.9,5601.1),
+        (2571.8,2635.3,2718.6,2799.5,2961.4,3127.4,3299.2,3477.6,3662.8,3854.8,4053.5,4258.5,4469.6,4686.2,4908.1,5134.8,5365.8,5601.0),
+        (2576.0,2631.0,2715.9,2797.5,2960.2,3126.6,3298.7,3477.2,3662.4,3854.5,4053.2,4258.3,4469.4,4686.1,4908.0,5134.6,5365.7,5600.9),
+        (2579.6,2626.7,2713.1,2795.6,2959.0,3125.8,3298.1,3476.7,3662.1,3854.2,4053.0,4258.1,4469.2,4685.9,4907.8,5134.5,5365.6,5600.8),
+        (2582.7,2622.2,2710.4,2793.6,2957.9,3125.0,3297.5,3476.2,3661.7,3853.9,4052.7,4257.9,4469.0,4685.8,4907.7,5134.4,5365.5,5600.7),
+        (2587.8,2612.9,2704.7,2789.7,2955.5,3123.4,3296.3,3475.3,3661.0,3853.3,4052.2,4257.5,4468.7,4685.4,4907.4,5134.1,5365.3,5600.5),
+        (2591.8,2602.7,2698.9,2785.7,2953.1,3121.8,3295.1,3474.4,3660.2,3852.7,4051.7,4257.0,4468.3,4685.1,4907.1,5133.9,5365.1,5600.3),
+        (2594.8,2692.9,2781.6,2950.7,3120.1,3293.9,3473.5,3659.5,3852.1,4051.2,4256.6,4467.9,4684.8,4906.8,5133.6,5364.8,5600.1),
+        (2597.2,2686.7,2777.4,2948.3,3118.5,3292.7,3472.6,3658.8,3851.5,4050.7,4256.2,4467.5,4684.5,4906.6,5133.4,5364.6,5599.9),
+        (2599.1,2680.2,2773.2,2945.9,3116.9,3291.5,3471.6,3658.0,3850.9,4050.2,4255.7,4467.2,4684.1,4906.3,5133.1,5364.4,5599.7),
+        (2600.9,2671.9,2767.8,2942.9,3114.8,3290.0,3470.5,3657.1,3850.1,4049.6,4255.2,4466.7,4683.7,4905.9,5132.8,5364.1,5599.4),
+        (2602.1,2663.3,2762.2,2939.8,3112.8,3288.5,3469.3,3656.2,3849.4,4048.9,4254.7,4466.2,4683.3,4905.6,5132.5,5363.9,5599.2),
+        (2602.8,2654.2,2756.6,2936.7,3110.7,3287.0,3468.2,3655.3,3848.6,4048.3,4254.1,4465.8,4682.9,4905.2,5132.2,5363.6,5598.9),
+        (2603.2,2644.7,2750.8,2933.5,3108.6,3285.5,3467.0,3654.3,3847.9,4047.7,4253.6,4465.3,4682.5,4904.9,5131.9,5363.3,5598.7),
+        (2603.2,2634.6,2744.9,2930.4,3106.5,3284.0,3465.9,3653.4,3847.1,4047.0,4253.0,4464.9,4682.1,4904.5,5131.6,5363.0,5598.5),
+        (2602.9,2624.0,2738.8,2927.2,3104.5,3282.5,3464.7,3652.5,3846.4,4046.4,4252.5,4464.4,4681.7,4904.2,5131.3,5362.8,5598.2),
+        (2602.4,2612.7,2732.6,2924.0,3102.4,3281.0,3463.5,3651.6,3845.6,4045.8,4252.0,4463.9,4681.3,4903.8,5131.0,5362.5,5598.0),
+        (2601.7,2726.2,2920.7,3100.3,3279.4,3462.4,3650.6,3844.8,4045.1,4251.4,4463.5,4680.9,4903.5,5130.7,5362.2,5597.7),
+        (2600.8,2719.7,2917.5,3098.1,3277.9,3461.2,3649.7,3844.1,4044.5,4250.9,4463.0,4680.5,4903.1,5130.4,5361.9,5597.5),
+        (2599.7,2713.0,2914.2,3096.0,3276.4,3460.0,3648.8,3843.3,4043.9,4250.4,4462.5,4680.1,4902.7,5130.0,5361.7,5597.2),
+        (2598.4,2706.1,2910.8,3093.9,3274.9,3458.9,3647.8,3842.6,4043.2,4249.8,4462.1,4679.7,4902.4,5129.7,5361.4,5597.0),
+        (2597.0,2699.0,2907.5,3091.7,3273.3,3457.7,3646.9,3841.8,4042.6,4249.3,4461.6,4679.3,4902.0,5129.4,5361.1,5596.7),
+        (2593.7,2684.2,2900.7,3087.4,3270.2,3455.4,3645.1,3840.3,4041.3,4248.2,4460.7,4678.5,4901.3,5128.8,5360.6,5596.3),
+        (2589.9,2668.4,2893.7,3083.1,3267.2,3453.0,3643.2,3838.8,4040.1,4247.1,4459.8,4677.7,4900.6,5128.2,5360.0,5595.8),
+        (2585.7,2651.6,2886.7,3078.7,3264.1,3450.7,3641.3,3837.2,4038.8,4246.0,4458.8,4676.9,4899.9,5127.6,5359.5,5595.3),
+        (2581.0,2633.5,2879.5,3074.3,3260.9,3448.3,3639.5,3835.7,4037.5,4245.0,4457.9,4676.1,4899.2,5126.9,5358.9,5594.8),
+        (2575.9,2613.8,2872.1,3069.8,3257.8,3445.9,3637.6,3834.2,4036.2,4243.9,4457.0,4675.3,4898.5,5126.3,5358.4,5594.3),
+        (2570.5,2592.3,2864.6,3065.4,3254.7,3443.6,3635.7,3832.6,4035.0,4242.8,4456.1,4674.5,4897.8,5125.7,5357.8,5593.8),
+        (2564.7,2568.2,2857.0,3060.8,3251.5,3441.2,3633.8,3831.1,4033.7,4241.7,4455.1,4673.7,4897.1,5125.1,5357.3,5593.3),
+        (2558.5,2849.2,3056.3,3248.4,3438.8,3632.0,3829.6,4032.4,4240.6,4454.2,4672.9,4896.4,5124.5,5356.7,5592.8),
+        (2552.0,2841.2,3051.7,3245.2,3436.4,3630.1,3828.1,4031.1,4239.6,4453.3,4672.1,4895.7,5123.8,5356.2,5592.3),
+        (2545.2,2833.1,3047.0,3242.0,3434.0,3628.2,3826.5,4029.9,4238.5,4452.3,4671.3,4895.0,5123.2,5355.6,5591.9),
+        (2530.5,2816.3,3037.6,3235.6,3429.2,3624.4,3823.5,4027.3,4236.3,4450.5,4669.7,4893.6,5122.0,5354.5,5590.9),
+        (2514.3,2798.7,3028.1,3229.1,3424.4,3620.6,3820.4,4024.8,4234.2,4448.6,4668.1,4892.2,5120.7,5353.4,5589.9),
+        (2496.5,2780.3,3018.3,3222.5,3419.6,3616.9,3817.3,4022.2,4232.0,4446.8,4666.5,4890.8,5119.5,5352.3,5588.9),
+        (2477.1,2761.0,3008.4,3216.0,3414.7,3613.1,3814.2,4019.7,4229.8,4444.9,4664.8,4889.4,5118.3,5351.2,5587.9),
+        (2455.6,2740.6,2998.4,3209.3,3409.8,3609.2,3811.2,4017.1,4227.7,4443.1,4663.2,4888.0,5117.0,5350.1,5587.0),
+        (2431.8,2719.1,2988.1,3202.6,3404.9,3605.4,3808.1,4014.5,4225.5,4441.2,4661.6,4886.6,5115.8,5349.0,5586.0),
+        (2405.2,2696.2,2977.7,3195.9,3400.0,3601.6,3805.0,4012.0,4223.4,4439.4,4660.0,4885.2,5114.6,5347.9,5585.0),
+        (2374.8,2671.9,2967.1,3189.1,3395.0,3597.8,3801.9,4009.4,4221.2,4437.5,4658.4,4883.8,5113.3,5346.8,5584.0),
+        (2339.1,2645.9,2956.3,3182.2,3390.1,3593.9,3798.8,4006.9,4219.0,4435.7,4656.8,4882.4,5112.1,5345.7,5583.1),
+        (2295.0,2617.9,2945.3,3175.3,3385.1,3590.1,3795.7,4004.3,4216.9,4433.8,4655.2,4881.0,5110.8,5344.6,5582.1),
+        (2536.2,2917.0,3157.8,3372.5,3580.4,3787.9,3997.9,4211.5,4429.2,4651.2,4877.4,5107.8,5341.9,5579.7),
+        (2428.5,2887.3,3140.0,3359.9,3570.7,3780.2,3991.5,4206.0,4424.6,4647.2,4873.9,5104.7,5339.2,5577.2),
+        (2268.0,2856.4,3121.9,3347.1,3561.0,3772.4,3985.0,4200.6,4419.9,4643.2,4870.4,5101.6,5336.5,5574.8),
+        (2068.9,2824.0,3103.4,3334.3,3551.2,3764.6,3978.6,4195.2,4415.3,4639.2,4867.0,5098.5,5333.7,5572.4),
+        (1966.7,2790.3,3084.7,3321.3,3541.4,3756.8,3972.2,4189.8,4410.7,4635.2,4863.5,5095.5,5331.0,5570.0),
+        (1914.9,2755.3,3065.6,3308.3,3531.5,3748.9,3965.8,4184.4,4406.1,4631.2,4860.0,5092.4,5328.3,5567.5),
+        (1880.8,2719.0,3046.3,3295.1,3521.7,3741.1,3959.3,4179.0,4401.5,4627.2,4856.5,5089.3,5325.6,5565.1),
+        (1854.9,2681.6,3026.8,3282.0,3511.8,3733.3,3952.9,4173.7,4396.9,4623.3,4853.0,5086.3,5322.9,5562.7),
+        (1834.1,2643.3,3007.1,3268.7,3501.9,3725.5,3946.5,4168.3,4392.3,4619.3,4849.6,5083.2,5320.2,5560.3),
+        (1816.5,2604.7,2987.2,3255.4,3492.0,3717.6,3940.1,4162.9,4387.7,4615.3,4846.1,5080.2,5317.5,5557.9),
+        (1801.3,2566.1,2967.2,3242.1,3482.1,3709.8,3933.7,4157.6,4383.1,4611.4,4842.7,5077.2,5314.8,5555.5),
+        (1787.8,2528.1,2947.1,3228.7,3472.2,3702.0,3927.3,4152.2,4378.6,4607.4,4839.2,5074.1,5312.1,5553.2),
+        (1775.7,2491.4,2927.0,3215.4,3462.3,3694.2,3921.0,4146.9,4374.0,4603.5,4835.8,5071.1,5309.4,5550.8),
+        (1764.7,2456.5,2906.9,3202.0,3452.4,3686.4,3914.6,4141.5,4369.5,4599.6,4832.4,5068.1,5306.8,5548.4),
+        (1754.6,2423.7,2886.8,3188.7,3442.5,3678.7,3908.3,4136.2,4365.0,4595.7,4829.0,5065.1,5304.1,5546.0),
+        (1745.2,2393.2,2866.8,3175.4,3432.6,3670.9,3901.9,4130.9,4360.4,4591.8,4825.5,5062.1,5301.5,5543.7),
+        (1736.5,2365.0,2847.0,3162.1,3422.8,3663.2,3895.6,4125.7,4355.9,4587.9,4822.1,5059.1,5298.8,5541.3),
+    ),
+    'h_by_P': (
+        (2583.9,2592.0,2687.5,2783.0,2879.6,2977.4,3076.7,3279.9,3489.7,3706.3,3929.9,4160.6,4398.3,4642.8,4893.7,5150.7,5413.4,5681.3,5954.0,6231.1,6512.3),
+        (2608.9,2686.2,2782.3,2879.1,2977.1,3076.5,3279.8,3489.6,3706.2,3929.8,4160.6,4398.3,4642.8,4893.7,5150.7,5413.4,5681.3,5954.0,6231.1,6512.3),
+        (2624.5,2685.0,2781.6,2878.7,2976.8,3076.2,3279.6,3489.5,3706.1,3929.8,4160.5,4398.3,4642.8,4893.7,5150.7,5413.4,5681.2,5953.9,6231.1,6512.3),
+        (2645.2,2682.4,2780.2,2877.8,2976.1,3075.8,3279.3,3489.3,3706.0,3929.7,4160.4,4398.2,4642.7,4893.7,5150.7,5413.3,5681.2,5953.9,6231.1,6512.3),
+        (2662.4,2679.2,2778.4,2876.6,2975.3,3075.1,3278.9,3489.0,3705.8,3929.5,4160.3,4398.1,4642.6,4893.6,5150.6,5413.3,5681.2,5953.9,6231.0,6512.2),
+        (2674.9,2675.8,2776.6,2875.5,2974.5,3074.5,3278.6,3488.7,3705.6,3929.4,4160.2,4398.0,4642.6,4893.5,5150.6,5413.2,5681.2,5953.9,6231.0,6512.2),
+        (2693.1,2772.9,2873.1,2972.9,3073.3,3277.8,3488.2,3705.2,3929.1,4160.0,4397.8,4642.4,4893.4,5150.5,5413.2,5681.1,5953.8,6231.0,6512.2),
+        (2706.2,2769.1,2870.7,2971.2,3072.1,3277.0,3487.7,3704.8,3928.8,4159.8,4397.6,4642.3,4893.3,5150.4,5413.1,5681.0,5953.8,6230.9,6512.2),
+        (2716.5,2765.2,2868.3,2969.5,3070.8,3276.2,3487.1,3704.4,3928.5,4159.5,4397.5,4642.1,4893.2,5150.3,5413.0,5681.0,5953.7,6230.9,6512.1),
+        (2724.9,2761.2,2865.9,2967.9,3069.6,3275.5,3486.6,3704.0,3928.2,4159.3,4397.3,4642.0,4893.1,5150.2,5412.9,5680.9,5953.7,6230.9,6512.1),
+        (2732.0,2757.1,2863.4,2966.2,3068.3,3274.7,3486.1,3703.6,3927.9,4159.1,4397.1,4641.8,4893.0,5150.1,5412.9,5680.8,5953.6,6230.8,6512.1),
+        (2738.1,2752.8,2860.9,2964.5,3067.1,3273.9,3485.5,3703.2,3927.6,4158.8,4396.9,4641.7,4892.8,5150.0,5412.8,5680.8,5953.6,6230.8,6512.0),
+        (2743.4,2748.3,2858.4,2962.8,3065.8,3273.1,3485.0,3702.9,3927.3,4158.6,4396.7,4641.5,4892.7,5149.9,5412.7,5680.7,5953.5,6230.7,6512.0),
+        (2748.1,2855.8,2961.0,3064.6,3272.3,3484.5,3702.5,3927.0,4158.4,4396.6,4641.4,4892.6,5149.8,5412.6,5680.6,5953.5,6230.7,6512.0),
+        (2756.1,2850.6,2957.6,3062.0,3270.8,3483.4,3701.7,3926.4,4157.9,4396.2,4641.1,4892.4,5149.6,5412.5,5680.5,5953.4,6230.6,6511.9),
+        (2762.8,2845.3,2954.0,3059.4,3269.2,3482.3,3700.9,3925.8,4157.5,4395.8,4640.8,4892.1,5149.4,5412.3,5680.4,5953.3,6230.5,6511.8),
+        (2768.3,2839.7,2950.4,3056.9,3267.6,3481.3,3700.1,3925.3,4157.0,4395.5,4640.5,4891.9,5149.2,5412.2,5680.3,5953.2,6230.5,6511.8),
+        (2773.0,2834.1,2946.8,3054.3,3266.1,3480.2,3699.4,3924.7,4156.6,4395.1,4640.2,4891.7,5149.0,5412.0,5680.1,5953.1,6230.4,6511.7),
+        (2777.1,2828.3,2943.1,3051.6,3264.5,3479.1,3698.6,3924.1,4156.1,4394.8,4639.9,4891.4,5148.9,5411.9,5680.0,5953.0,6230.3,6511.7),
+        (2783.7,2816.1,2935.6,3046.3,3261.3,3476.9,3697.0,3922.9,4155.2,4394.0,4639.4,4891.0,5148.5,5411.5,5679.8,5952.8,6230.1,6511.5),
+        (2788.8,2803.0,2927.9,3040.9,3258.1,3474.8,3695.4,3921.7,4154.3,4393.3,4638.8,4890.5,5148.1,5411.2,5679.5,5952.6,6230.0,6511.4),
+        (2792.8,2919.9,3035.4,3254.9,3472.6,3693.9,3920.5,4153.3,4392.6,4638.2,4890.0,5147.7,5410.9,5679.3,5952.4,6229.8,6511.3),
+        (2795.9,2911.7,3029.9,3251.6,3470.4,3692.3,3919.4,4152.4,4391.9,4637.6,4889.5,5147.3,5410.6,5679.0,5952.1,6229.6,6511.1),
+        (2798.3,2903.2,3024.2,3248.3,3468.2,3690.7,3918.2,4151.5,4391.1,4637.0,4889.1,5147.0,5410.3,5678.8,5951.9,6229.5,6511.0),
+        (2800.5,2892.3,3017.0,3244.2,3465.5,3688.8,3916.7,4150.4,4390.2,4636.3,4888.5,5146.5,5409.9,5678.4,5951.7,6229.3,6510.9),
+        (2801.9,2880.9,3009.6,3240.1,3462.7,3686.8,3915.2,4149.2,4389.3,4635.6,4887.9,5146.0,5409.5,5678.1,5951.4,6229.1,6510.7),
+        (2802.8,2869.0,3002.0,3235.9,3460.0,3684.8,3913.7,4148.1,4388.4,4634.9,4887.3,5145.5,5409.1,5677.8,5951.2,6228.9,6510.5),
+        (2803.2,2856.5,2994.3,3231.7,3457.2,3682.8,3912.2,4146.9,4387.5,4634.1,4886.7,5145.0,5408.8,5677.5,5950.9,6228.7,6510.4),
+        (2803.1,2843.5,2986.5,3227.4,3454.4,3680.8,3910.7,4145.8,4386.6,4633.4,4886.1,5144.6,5408.4,5677.2,5950.7,6228.5,6510.2),
+        (2802.6,2829.7,2978.4,3223.2,3451.6,3678.9,3909.3,4144.6,4385.7,4632.7,4885.6,5144.1,5408.0,5676.9,5950.4,6228.3,6510.1),
+        (2801.9,2815.0,2970.1,3218.8,3448.8,3676.9,3907.8,4143.5,4384.8,4632.0,4885.0,5143.6,5407.6,5676.6,5950.2,6228.1,6509.9),
+        (2800.8,2961.7,3214.5,3446.0,3674.9,3906.3,4142.3,4383.9,4631.2,4884.4,5143.1,5407.2,5676.3,5949.9,6227.9,6509.8),
+        (2799.5,2953.0,3210.1,3443.2,3672.9,3904.8,4141.2,4383.0,4630.5,4883.8,5142.7,5406.8,5675.9,5949.7,6227.7,6509.6),
+        (2797.9,2944.2,3205.6,3440.4,3670.9,3903.3,4140.0,4382.1,4629.8,4883.2,5142.2,5406.4,5675.6,5949.4,6227.5,6509.4),
+        (2796.2,2935.1,3201.2,3437.5,3668.9,3901.8,4138.9,4381.1,4629.1,4882.6,5141.7,5406.0,5675.3,5949.2,6227.3,6509.3),
+        (2794.2,2925.7,3196.7,3434.7,3666.8,3900.3,4137.7,4380.2,4628.3,4882.0,5141.2,5405.7,5675.0,5948.9,6227.1,6509.1),
+        (2789.7,2906.2,3187.5,3428.9,3662.8,3897.3,4135.4,4378.4,4626.9,4880.9,5140.3,5404.9,5674.4,5948.4,6226.7,6508.8),
+        (2784.6,2885.5,3178.2,3423.1,3658.7,3894.3,4133.1,4376.6,4625.4,4879.7,5139.3,5404.1,5673.7,5947.9,6226.3,6508.5),
+        (2778.9,2863.5,3168.8,3417.3,3654.7,3891.3,4130.8,4374.8,4624.0,4878.5,5138.4,5403.3,5673.1,5947.4,6225.9,6508.2),
+        (2772.6,2839.9,3159.2,3411.4,3650.6,3888.2,4128.4,4373.0,4622.5,4877.3,5137.4,5402.6,5672.5,5946.9,6225.5,6507.9),
+        (2765.9,2814.4,3149.4,3405.5,3646.5,3885.2,4126.1,4371.1,4621.1,4876.2,5136.5,5401.8,5671.9,5946.4,6225.1,6507.6),
+        (2758.7,2786.5,3139.4,3399.5,3642.4,3882.2,4123.8,4369.3,4619.6,4875.0,5135.5,5401.0,5671.2,5945.9,6224.7,6507.2),
+        (2751.0,2755.5,3129.2,3393.5,3638.2,3879.1,4121.5,4367.5,4618.1,4873.8,5134.6,5400.3,5670.6,5945.4,6224.3,6506.9),
+        (2742.9,3118.8,3387.4,3634.1,3876.1,4119.1,4365.7,4616.7,4872.7,5133.6,5399.5,5670.0,5944.9,6223.9,6506.6),
+        (2734.4,3108.2,3381.3,3629.9,3873.0,4116.8,4363.8,4615.2,4871.5,5132.7,5398.7,5669.4,5944.4,6223.5,6506.3),
+        (2725.5,3097.4,3375.1,3625.8,3870.0,4114.5,4362.0,4613.8,4870.3,5131.7,5397.9,5668.7,5943.9,6223.1,6506.0),
+        (2706.3,3075.2,3362.7,3617.4,3863.9,4109.8,4358.3,4610.9,4868.0,5129.8,5396.4,5667.5,5942.9,6222.3,6505.4),
+        (2685.4,3052.0,3350.0,3608.9,3857.7,4105.1,4354.7,4608.0,4865.6,5127.9,5394.9,5666.3,5941.9,6221.5,6504.7),
+        (2662.7,3027.7,3337.1,3600.4,3851.5,4100.4,4351.0,4605.0,4863.3,5126.0,5393.3,5665.0,5940.9,6220.7,6504.1),
+        (2637.9,3002.3,3324.1,3591.8,3845.3,4095.8,4347.4,4602.1,4860.9,5124.2,5391.8,5663.8,5939.9,6219.9,6503.5),
+        (2610.7,2975.7,3310.8,3583.1,3839.1,4091.1,4343.7,4599.2,4858.6,5122.3,5390.3,5662.5,5938.9,6219.1,6502.9),
+        (2580.8,2947.6,3297.3,3574.4,3832.9,4086.3,4340.0,4596.3,4856.3,5120.4,5388.7,5661.3,5937.9,6218.3,6502.3),
+        (2547.5,2917.9,3283.6,3565.7,3826.6,4081.6,4336.4,4593.4,4853.9,5118.5,5387.2,5660.1,5936.9,6217.5,6501.6),
+        (2509.8,2886.4,3269.7,3556.8,3820.4,4076.9,4332.7,4590.5,4851.6,5116.6,5385.7,5658.8,5935.9,6216.7,6501.0),
+        (2466.0,2852.8,3255.5,3548.0,3814.1,4072.2,4329.0,4587.6,4849.3,5114.7,5384.2,5657.6,5934.9,6215.9,6500.4),
+        (2412.3,2816.9,3241.2,3539.0,3807.8,4067.5,4325.4,4584.7,4846.9,5112.8,5382.6,5656.4,5933.9,6215.1,6499.8),
+        (2713.1,3204.3,3516.4,3791.9,4055.6,4316.2,4577.4,4841.1,5108.2,5378.8,5653.3,5931.5,6213.2,6498.3),
+        (2578.6,3165.9,3493.5,3776.0,4043.8,4307.1,4570.2,4835.4,5103.5,5375.1,5650.3,5929.0,6211.2,6496.8),
+        (2383.6,3126.1,3470.3,3760.0,4031.9,4297.9,4563.0,4829.6,5098.8,5371.3,5647.2,5926.6,6209.3,6495.3),
+        (2152.8,3084.7,3446.7,3743.9,4020.0,4288.8,4555.8,4823.8,5094.2,5367.6,5644.2,5924.2,6207.4,6493.8),
+        (2041.6,3042.0,3423.0,3727.7,4008.1,4279.7,4548.6,4818.1,5089.6,5363.8,5641.2,5921.8,6205.5,6492.3),
+        (1988.6,2997.9,3398.9,3711.6,3996.3,4270.6,4541.5,4812.4,5085.0,5360.1,5638.2,5919.4,6203.6,6490.8),
+        (1955.4,2952.6,3374.7,3695.3,3984.4,4261.5,4534.4,4806.7,5080.5,5356.5,5635.3,5917.0,6201.7,6489.4),
+        (1931.4,2906.5,3350.4,3679.1,3972.6,4252.5,4527.3,4801.1,5075.9,5352.8,5632.3,5914.6,6199.9,6487.9),
+        (1912.8,2859.8,3325.9,3662.9,3960.9,4243.5,4520.3,4795.5,5071.4,5349.2,5629.4,5912.3,6198.0,6486.5),
+        (1897.7,2813.2,3301.5,3646.8,3949.1,4234.6,4513.3,4789.9,5066.9,5345.6,5626.5,5910.0,6196.2,6485.1),
+        (1885.1,2767.2,3277.0,3630.6,3937.4,4225.7,4506.3,4784.4,5062.5,5342.0,5623.6,5907.7,6194.4,6483.7),
+        (1874.4,2722.6,3252.5,3614.6,3925.8,4216.8,4499.4,4778.9,5058.1,5338.4,5620.8,5905.4,6192.6,6482.3),
+        (1865.1,2680.2,3228.2,3598.6,3914.2,4208.0,4492.5,4773.4,5053.7,5334.9,5617.9,5903.2,6190.8,6480.9),
+        (1856.9,2640.5,3204.1,3582.7,3902.7,4199.3,4485.7,4768.0,5049.4,5331.4,5615.1,5900.9,6189.0,6479.6),
+        (1849.7,2603.8,3180.3,3566.9,3891.3,4190.6,4478.9,4762.6,5045.0,5328.0,5612.3,5898.7,6187.3,6478.2),
+        (1843.2,2570.3,3156.8,3551.3,3880.0,4182.0,4472.2,4757.3,5040.8,5324.5,5609.6,5896.5,6185.6,6476.9),
+        (1837.4,2540.0,3133.7,3535.8,3868.8,4173.5,4465.5,4752.0,5036.5,5321.1,5606.8,5894.3,6183.9,6475.6),
+    ),
+    'v_by_P': (
+        (14.67,14.867,17.196,19.513,21.826,24.136,26.446,31.063,35.68,40.296,44.911,49.527,54.142,58.758,63.373,67.988,72.604,77.219,81.834,86.45,91.065),
+        (7.648,8.5854,9.7485,10.907,12.064,13.22,15.53,17.838,20.147,22.455,24.763,27.071,29.379,31.686,33.994,36.302,38.61,40.917,43.225,45.533),
+        (5.2284,5.7151,6.4937,7.2677,8.0399,8.811,10.352,11.891,13.431,14.97,16.508,18.047,19.586,21.124,22.663,24.201,25.74,27.278,28.817,30.355),
+        (3.24,3.4187,3.8897,4.3562,4.8206,5.284,6.2094,7.1338,8.0576,8.9812,9.9047,10.828,11.751,12.674,13.598,14.521,15.444,16.367,17.29,18.213),
+        (2.217,2.2703,2.5877,2.9004,3.211,3.5206,4.1383,4.7549,5.3711,5.9871,6.6028,7.2185,7.8341,8.4496,9.0651,9.6806,10.296,10.911,11.527,12.142),
+        (1.6939,1.6959,1.9367,2.1724,2.4062,2.6388,3.1027,3.5655,4.0279,4.49,4.9519,5.4137,5.8754,6.3371,6.7988,7.2604,7.722,8.1836,8.6452,9.1068),
+        (1.1593,1.2855,1.4445,1.6013,1.7571,2.0671,2.3761,2.6846,2.9929,3.301,3.6089,3.9168,4.2247,4.5325,4.8403,5.1481,5.4558,5.7636,6.0713),
+        (0.885682,0.959855,1.0805,1.1989,1.3162,1.5493,1.7814,2.013,2.2443,2.4755,2.7066,2.9375,3.1685,3.3994,3.6302,3.8611,4.0919,4.3228,4.5536),
+        (0.718659,0.764389,0.862059,0.957428,1.0517,1.2387,1.4246,1.61,1.7952,1.9802,2.1651,2.35,2.5347,2.7195,2.9042,3.0889,3.2736,3.4583,3.6429),
+        (0.60576,0.634014,0.716424,0.796444,0.875344,1.0315,1.1867,1.3414,1.4958,1.65,1.8042,1.9582,2.1122,2.2662,2.4202,2.5741,2.728,2.8819,3.0358),
+        (0.524179,0.54083,0.612381,0.681448,0.749373,0.883601,1.0168,1.1495,1.2819,1.4142,1.5463,1.6784,1.8105,1.9425,2.0745,2.2064,2.3383,2.4703,2.6022),
+        (0.462383,0.470883,0.534334,0.595196,0.654892,0.772645,0.889357,1.0056,1.1215,1.2373,1.353,1.4686,1.5841,1.6997,1.8152,1.9306,2.0461,2.1615,2.277),
+        (0.413897,0.41642,0.473617,0.528105,0.581404,0.686344,0.790239,0.893636,0.996761,1.0997,1.2026,1.3054,1.4081,1.5108,1.6135,1.7161,1.8188,1.9214,2.024),
+        (0.374806,0.425032,0.474428,0.522612,0.617304,0.710944,0.804086,0.896955,0.989661,1.0823,1.1748,1.2673,1.3597,1.4521,1.5445,1.6369,1.7293,1.8216),
+        (0.315583,0.352121,0.393901,0.434418,0.513741,0.592002,0.669761,0.747246,0.824568,0.901785,0.978931,1.056,1.1331,1.2101,1.2871,1.3641,1.4411,1.5181),
+        (0.272775,0.300004,0.336367,0.371416,0.439767,0.507042,0.573814,0.640311,0.706645,0.772873,0.839031,0.905138,0.97121,1.0373,1.1033,1.1693,1.2353,1.3013),
+        (0.24034,0.260881,0.293205,0.32416,0.384284,0.443322,0.501853,0.56011,0.618202,0.676189,0.734105,0.791972,0.849802,0.907605,0.965388,1.0232,1.0809,1.1387),
+        (0.214887,0.230421,0.259623,0.2874,0.34113,0.393761,0.445884,0.497731,0.549413,0.600991,0.652497,0.703953,0.755373,0.806766,0.858139,0.909496,0.96084,1.0122),
+        (0.194362,0.206022,0.232747,0.257988,0.306606,0.354113,0.401108,0.447828,0.494382,0.540832,0.58721,0.633538,0.679831,0.726096,0.77234,0.818569,0.864785,0.910991),
+        (0.163262,0.169339,0.192407,0.213858,0.254816,0.294639,0.333945,0.372973,0.411836,0.450593,0.48928,0.527916,0.566516,0.60509,0.643642,0.682179,0.720703,0.759217),
+        (0.140778,0.143025,0.163561,0.182324,0.21782,0.252156,0.28597,0.319505,0.352874,0.386137,0.41933,0.452472,0.485578,0.518657,0.551715,0.584757,0.617787,0.650807),
+        (0.12374,0.141898,0.158662,0.190071,0.220293,0.249989,0.279404,0.308653,0.337795,0.366867,0.395888,0.424874,0.453832,0.48277,0.511691,0.5406,0.569499),
+        (0.110368,0.125022,0.140248,0.168485,0.19551,0.222003,0.248214,0.274258,0.300196,0.326063,0.351879,0.37766,0.403413,0.429146,0.454862,0.480566,0.50626),
+        (0.099585,0.111496,0.125507,0.151215,0.175683,0.199615,0.223262,0.246743,0.270117,0.293419,0.316672,0.339888,0.363078,0.386246,0.409399,0.432539,0.455669),
+        (0.088715,0.097937,0.110753,0.133941,0.155855,0.177226,0.19831,0.219227,0.240037,0.260776,0.281465,0.302117,0.322742,0.343347,0.363936,0.384512,0.405078),
+        (0.079949,0.087053,0.098937,0.120119,0.139992,0.159314,0.178349,0.197215,0.215974,0.234661,0.253299,0.2719,0.290474,0.309028,0.327565,0.34609,0.364605),
+        (0.072725,0.078113,0.089257,0.108808,0.127012,0.144659,0.162016,0.179204,0.196285,0.213295,0.230254,0.247177,0.264073,0.280948,0.297807,0.314654,0.33149),
+        (0.066664,0.070627,0.081179,0.099379,0.116195,0.132446,0.148406,0.164196,0.179878,0.195489,0.21105,0.226574,0.242072,0.257548,0.273009,0.288457,0.303895),
+        (0.061505,0.064256,0.074332,0.091399,0.107041,0.122112,0.136889,0.151496,0.165996,0.180423,0.194801,0.209142,0.223456,0.237749,0.252026,0.266291,0.280545),
+        (0.057058,0.058757,0.068453,0.084556,0.099195,0.113254,0.127018,0.140611,0.154096,0.167509,0.180872,0.194199,0.207499,0.220778,0.234041,0.247291,0.260531),
+        (0.053183,0.05395,0.063347,0.078624,0.092393,0.105576,0.118462,0.131177,0.143783,0.156317,0.168801,0.181249,0.19367,0.20607,0.218453,0.230825,0.243186),
+        (0.049776,0.05887,0.073431,0.086442,0.098859,0.110976,0.122922,0.134759,0.146525,0.158239,0.169918,0.181569,0.1932,0.204814,0.216417,0.228008),
+        (0.046756,0.054909,0.068848,0.08119,0.092931,0.104371,0.115638,0.126797,0.137884,0.14892,0.15992,0.170892,0.181844,0.19278,0.203703,0.214617),
+        (0.044059,0.051378,0.064772,0.076521,0.087662,0.0985,0.109164,0.11972,0.130203,0.140636,0.151032,0.161402,0.17175,0.182083,0.192403,0.202713),
+        (0.041636,0.048208,0.061123,0.072343,0.082947,0.093246,0.103371,0.113387,0.123331,0.133224,0.143081,0.15291,0.162719,0.172512,0.182292,0.192062),
+        (0.039446,0.045346,0.057837,0.068583,0.078704,0.088518,0.098158,0.107688,0.117146,0.126553,0.135924,0.145268,0.154591,0.163898,0.173192,0.182477),
+        (0.035642,0.040373,0.052158,0.062086,0.071374,0.080351,0.089152,0.097844,0.106463,0.115031,0.123563,0.132067,0.140551,0.149019,0.157474,0.165919),
+        (0.032448,0.036189,0.047419,0.056671,0.065265,0.073545,0.081648,0.089641,0.09756,0.105429,0.113262,0.121067,0.128852,0.13662,0.144376,0.152122),
+        (0.029727,0.032607,0.043404,0.052087,0.060096,0.067786,0.075298,0.082699,0.090027,0.097305,0.104545,0.111759,0.118952,0.126129,0.133293,0.140447),
+        (0.027378,0.029492,0.039958,0.048157,0.055665,0.06285,0.069855,0.07675,0.083571,0.090341,0.097074,0.103781,0.110467,0.117136,0.123793,0.13044),
+        (0.02533,0.026742,0.036966,0.04475,0.051824,0.058572,0.065138,0.071593,0.077975,0.084306,0.0906,0.096866,0.103113,0.109343,0.11556,0.121768),
+        (0.023526,0.024279,0.034344,0.041767,0.048463,0.054828,0.061011,0.067082,0.073079,0.079025,0.084934,0.090816,0.096678,0.102523,0.108356,0.114179),
+        (0.021923,0.022036,0.032025,0.039134,0.045497,0.051525,0.057369,0.063101,0.068759,0.074365,0.079935,0.085478,0.091,0.096506,0.102,0.107483),
+        (0.02049,0.02996,0.036793,0.042861,0.048589,0.054132,0.059562,0.064918,0.070224,0.075492,0.080733,0.085954,0.091158,0.09635,0.101532),
+        (0.019199,0.028108,0.034698,0.040502,0.045962,0.051236,0.056396,0.061483,0.066518,0.071516,0.076487,0.081438,0.086373,0.091295,0.096206),
+        (0.01803,0.026436,0.032811,0.038378,0.043597,0.048629,0.053547,0.05839,0.063183,0.067938,0.072667,0.077374,0.082066,0.086745,0.091414),
+        (0.01599,0.023537,0.029549,0.034709,0.039513,0.044126,0.048625,0.053049,0.057422,0.061758,0.066067,0.070355,0.074627,0.078886,0.083136),
+        (0.014264,0.021106,0.026828,0.031651,0.036109,0.040375,0.044524,0.048599,0.052622,0.056608,0.060567,0.064505,0.068428,0.072337,0.076237),
+        (0.01278,0.019033,0.024523,0.029063,0.033229,0.0372,0.041054,0.044833,0.04856,0.052251,0.055914,0.059556,0.063182,0.066796,0.0704),
+        (0.011485,0.01724,0.022544,0.026845,0.030761,0.034479,0.03808,0.041605,0.045079,0.048516,0.051925,0.055314,0.058687,0.062047,0.065397),
+        (0.010338,0.015671,0.020827,0.024921,0.028621,0.032121,0.035503,0.038808,0.042062,0.045279,0.048468,0.051637,0.05479,0.057931,0.061061),
+        (0.009309,0.014281,0.019323,0.023238,0.026749,0.030058,0.033247,0.036361,0.039422,0.042447,0.045444,0.04842,0.051381,0.054329,0.057267),
+        (0.008371,0.013038,0.017994,0.021752,0.025097,0.028237,0.031258,0.034202,0.037093,0.039948,0.042775,0.045582,0.048373,0.051151,0.053919),
+        (0.007502,0.011916,0.01681,0.020431,0.023629,0.026619,0.029489,0.032282,0.035023,0.037727,0.040403,0.043059,0.045699,0.048327,0.050944),
+        (0.006677,0.010892,0.01575,0.019249,0.022316,0.025172,0.027907,0.030565,0.033171,0.03574,0.038281,0.040802,0.043307,0.045799,0.048282),
+        (0.005865,0.00995,0.014793,0.018185,0.021133,0.023869,0.026483,0.02902,0.031504,0.033952,0.036371,0.038771,0.041154,0.043525,0.045886),
+        (0.007862,0.012769,0.015938,0.018638,0.02112,0.023478,0.025759,0.027986,0.030177,0.03234,0.034482,0.036609,0.038723,0.040828),
+        (0.006005,0.011143,0.01414,0.016643,0.018922,0.021075,0.02315,0.025172,0.027157,0.029115,0.031052,0.032974,0.034883,0.036782),
+        (0.004204,0.009807,0.01267,0.015012,0.017124,0.01911,0.021017,0.022871,0.024688,0.026477,0.028246,0.029999,0.03174,0.033471),
+        (0.002798,0.00869,0.011445,0.013653,0.015628,0.017473,0.01924,0.020953,0.02263,0.024279,0.025908,0.027521,0.029122,0.030713),
+        (0.002305,0.007744,0.010409,0.012505,0.014362,0.016089,0.017737,0.019332,0.020889,0.02242,0.02393,0.025425,0.026907,0.028379),
+        (0.002105,0.006932,0.009523,0.011523,0.013278,0.014904,0.01645,0.017942,0.019398,0.020827,0.022235,0.023628,0.025009,0.026379),
+        (0.00199,0.006232,0.008757,0.010672,0.01234,0.013877,0.015335,0.016739,0.018106,0.019446,0.020767,0.022071,0.023364,0.024646),
+        (0.001911,0.005623,0.008089,0.00993,0.011521,0.01298,0.01436,0.015686,0.016976,0.018239,0.019482,0.020709,0.021925,0.02313),
+        (0.001851,0.005094,0.007502,0.009276,0.010799,0.012189,0.0135,0.014758,0.015979,0.017174,0.018349,0.019508,0.020655,0.021792),
+        (0.001803,0.004633,0.006982,0.008697,0.010158,0.011487,0.012737,0.013934,0.015094,0.016228,0.017342,0.01844,0.019527,0.020604),
+        (0.001764,0.004234,0.006521,0.00818,0.009586,0.01086,0.012054,0.013197,0.014302,0.015381,0.016441,0.017485,0.018517,0.01954),
+        (0.001731,0.00389,0.006108,0.007717,0.009072,0.010296,0.011441,0.012534,0.01359,0.01462,0.015631,0.016626,0.017609,0.018583),
+        (0.001702,0.003595,0.005738,0.007299,0.008609,0.009787,0.010887,0.011934,0.012946,0.013932,0.014898,0.015849,0.016788,0.017717),
+        (0.001676,0.003345,0.005405,0.006921,0.008188,0.009325,0.010383,0.01139,0.012361,0.013306,0.014232,0.015142,0.016041,0.016931),
+        (0.001653,0.003132,0.005105,0.006578,0.007806,0.008904,0.009924,0.010894,0.011827,0.012735,0.013624,0.014498,0.01536,0.016212),
+        (0.001633,0.002952,0.004833,0.006265,0.007456,0.008519,0.009504,0.010439,0.011339,0.012212,0.013067,0.013907,0.014735,0.015554),
+        (0.001614,0.0028,0.004587,0.005979,0.007135,0.008165,0.009118,0.010021,0.010889,0.011732,0.012555,0.013364,0.014161,0.014949),
+    ),
+    's_by_P': (
+        (8.1488,8.1741,8.4489,8.6892,8.9049,9.1015,9.2827,9.6094,9.8998,10.163,10.406,10.631,10.843,11.043,11.233,11.413,11.586,11.751,11.909,12.061,12.207),
+        (7.9072,8.1263,8.368,8.5843,8.7811,8.9625,9.2893,9.5798,9.8431,10.086,10.311,10.523,10.723,10.913,11.093,11.266,11.431,11.589,11.741,11.887),
+        (7.7675,7.9365,8.1796,8.3964,8.5935,8.775,9.102,9.3925,9.6559,9.8984,10.124,10.336,10.536,10.725,10.906,11.079,11.244,11.402,11.554,11.7),
+        (7.593,7.6953,7.9413,8.1592,8.3568,8.5386,8.8659,9.1566,9.4201,9.6625,9.8882,10.1,10.3,10.49,10.67,10.843,11.008,11.166,11.318,11.464),
+        (7.4557,7.5011,7.7509,7.9702,8.1685,8.3507,8.6783,8.9692,9.2328,9.4753,9.701,9.9128,10.113,10.303,10.483,10.656,10.821,10.979,11.131,11.277),
+        (7.3588,7.361,7.6148,7.8356,8.0346,8.2172,8.5452,8.8361,9.0998,9.3424,9.5681,9.78,9.98,10.17,10.35,10.523,10.688,10.846,10.998,11.145),
+        (7.223,7.4208,7.6447,7.8451,8.0284,8.3572,8.6485,8.9124,9.155,9.3808,9.5927,9.7927,9.9825,10.163,10.336,10.501,10.659,10.811,10.957),
+        (7.1269,7.281,7.5081,7.71,7.8941,8.2236,8.5152,8.7792,9.022,9.2479,9.4598,9.6599,9.8497,10.03,10.203,10.368,10.526,10.678,10.825),
+        (7.0524,7.1708,7.4012,7.6046,7.7895,8.1197,8.4117,8.6759,8.9188,9.1448,9.3567,9.5568,9.7466,9.9273,10.1,10.265,10.423,10.575,10.722),
+        (6.9916,7.0791,7.3131,7.518,7.7037,8.0347,8.3271,8.5914,8.8344,9.0604,9.2724,9.4726,9.6624,9.8431,10.016,10.181,10.339,10.491,10.637),
+        (6.9401,7.0003,7.238,7.4444,7.6309,7.9627,8.2554,8.52,8.7631,8.9891,9.2012,9.4013,9.5912,9.7719,9.9445,10.11,10.268,10.42,10.566),
+        (6.8955,6.9306,7.1723,7.3804,7.5677,7.9002,8.1933,8.458,8.7012,8.9273,9.1394,9.3396,9.5295,9.7102,9.8828,10.048,10.206,10.358,10.505),
+        (6.856,6.8678,7.1138,7.3235,7.5117,7.845,8.1384,8.4033,8.6466,8.8728,9.0849,9.2851,9.475,9.6558,9.8284,9.9935,10.152,10.304,10.45),
+        (6.8207,7.061,7.2724,7.4614,7.7955,8.0892,8.3543,8.5977,8.824,9.0362,9.2364,9.4263,9.6071,9.7797,9.9448,10.103,10.255,10.402),
+        (6.7592,6.9683,7.1832,7.374,7.7097,8.0041,8.2695,8.5131,8.7395,8.9518,9.1521,9.342,9.5228,9.6954,9.8606,10.019,10.171,10.317),
+        (6.7071,6.8884,7.107,7.2995,7.6368,7.9319,8.1977,8.4415,8.668,8.8804,9.0807,9.2707,9.4516,9.6242,9.7894,9.9478,10.1,10.246),
+        (6.6616,6.8176,7.0401,7.2345,7.5734,7.8692,8.1354,8.3794,8.6061,8.8185,9.0189,9.2089,9.3898,9.5625,9.7277,9.8861,10.038,10.185),
+        (6.6213,6.7539,6.9805,7.1767,7.5173,7.8138,8.0803,8.3246,8.5514,8.7639,8.9643,9.1544,9.3353,9.508,9.6732,9.8316,9.9838,10.13),
+        (6.585,6.6955,6.9265,7.1246,7.4669,7.7641,8.031,8.2755,8.5024,8.715,8.9155,9.1056,9.2866,9.4593,9.6245,9.783,9.9351,10.081),
+        (6.5217,6.5909,6.8313,7.0335,7.3793,7.6779,7.9455,8.1904,8.4176,8.6303,8.831,9.0212,9.2022,9.3749,9.5402,9.6987,9.8508,9.9972),
+        (6.4675,6.4975,6.7488,6.9552,7.3046,7.6047,7.873,8.1183,8.3457,8.5587,8.7594,8.9497,9.1308,9.3036,9.4689,9.6274,9.7796,9.9259),
+        (6.4199,6.6753,6.8863,7.2394,7.5409,7.81,8.0557,8.2834,8.4965,8.6974,8.8878,9.0689,9.2417,9.4071,9.5656,9.7178,9.8642),
+        (6.3775,6.6087,6.8246,7.1814,7.4845,7.7543,8.0004,8.2284,8.4416,8.6426,8.8331,9.0143,9.1872,9.3526,9.5111,9.6634,9.8098),
+        (6.339,6.5475,6.7684,7.1292,7.4337,7.7043,7.9509,8.179,8.3925,8.5936,8.7842,8.9654,9.1384,9.3038,9.4624,9.6146,9.761),
+        (6.2954,6.4766,6.7044,7.0702,7.3767,7.6482,7.8953,8.1238,8.3375,8.5388,8.7294,8.9107,9.0837,9.2492,9.4078,9.5601,9.7065),
+        (6.2558,6.4107,6.6459,7.017,7.3254,7.5979,7.8455,8.0743,8.2882,8.4896,8.6804,8.8618,9.0349,9.2004,9.359,9.5113,9.6578),
+        (6.2194,6.3486,6.5918,6.9683,7.2787,7.5522,7.8003,8.0295,8.2436,8.4452,8.636,8.8175,8.9906,9.1562,9.3149,9.4672,9.6137),
+        (6.1856,6.2893,6.5412,6.9234,7.2359,7.5103,7.759,7.9885,8.2028,8.4045,8.5955,8.777,8.9502,9.1158,9.2745,9.4269,9.5734),
+        (6.154,6.2321,6.4936,6.8817,7.1962,7.4716,7.7208,7.9507,8.1652,8.3671,8.5581,8.7398,8.913,9.0787,9.2374,9.3898,9.5363),
+        (6.1243,6.1764,6.4484,6.8427,7.1593,7.4356,7.6854,7.9156,8.1303,8.3324,8.5235,8.7053,8.8785,9.0443,9.203,9.3555,9.502),
+        (6.0963,6.1215,6.4053,6.806,7.1247,7.4021,7.6524,7.8829,8.0979,8.3,8.4913,8.6731,8.8465,9.0122,9.171,9.3235,9.47),
+        (6.0696,6.3639,6.7714,7.0922,7.3705,7.6214,7.8523,8.0674,8.2697,8.4611,8.643,8.8164,8.9822,9.1411,9.2935,9.4401),
+        (6.0441,6.324,6.7384,7.0614,7.3408,7.5922,7.8234,8.0388,8.2413,8.4328,8.6147,8.7882,8.954,9.1129,9.2654,9.412),
+        (6.0197,6.2854,6.707,7.0323,7.3127,7.5646,7.7962,8.0118,8.2144,8.406,8.588,8.7615,8.9274,9.0863,9.2389,9.3855),
+        (5.9963,6.2478,6.677,7.0046,7.2859,7.5385,7.7703,7.9862,8.1889,8.3806,8.5627,8.7363,8.9023,9.0612,9.2138,9.3605),
+        (5.9737,6.211,6.6483,6.9781,7.2605,7.5136,7.7458,7.9618,8.1648,8.3566,8.5388,8.7124,8.8784,9.0374,9.19,9.3367),
+        (5.9307,6.1397,6.5939,6.9285,7.213,7.4672,7.7001,7.9166,8.1198,8.3118,8.4941,8.6679,8.834,8.993,9.1457,9.2924),
+        (5.8901,6.0703,6.5432,6.8826,7.1693,7.4246,7.6582,7.8751,8.0786,8.2709,8.4534,8.6272,8.7934,8.9525,9.1052,9.252),
+        (5.8516,6.0019,6.4954,6.8399,7.1288,7.3853,7.6195,7.8369,8.0407,8.2331,8.4158,8.5898,8.756,8.9152,9.068,9.2148),
+        (5.8148,5.9337,6.4502,6.8,7.091,7.3486,7.5836,7.8014,8.0055,8.1981,8.381,8.5551,8.7214,8.8807,9.0335,9.1804),
+        (5.7793,5.8646,6.4071,6.7623,7.0555,7.3144,7.55,7.7682,7.9726,8.1655,8.3485,8.5227,8.6891,8.8485,9.0014,9.1483),
+        (5.745,5.7937,6.3658,6.7266,7.0221,7.2821,7.5184,7.7371,7.9419,8.135,8.3181,8.4924,8.6589,8.8184,8.9713,9.1183),
+        (5.7117,5.7194,6.326,6.6927,6.9905,7.2517,7.4887,7.7079,7.9129,8.1062,8.2895,8.4639,8.6305,8.79,8.943,9.09),
+        (5.6791,6.2876,6.6603,6.9605,7.2229,7.4606,7.6802,7.8855,8.079,8.2625,8.437,8.6037,8.7633,8.9163,9.0634),
+        (5.6473,6.2504,6.6293,6.9318,7.1955,7.4339,7.6539,7.8596,8.0533,8.2369,8.4116,8.5784,8.738,8.8911,9.0382),
+        (5.616,6.2141,6.5995,6.9045,7.1693,7.4085,7.629,7.8349,8.0288,8.2126,8.3874,8.5543,8.714,8.8671,9.0143),
+        (5.5545,6.144,6.543,6.8531,7.1204,7.361,7.5824,7.7889,7.9833,8.1673,8.3424,8.5095,8.6693,8.8226,8.9698),
+        (5.4939,6.0764,6.4903,6.8054,7.0753,7.3173,7.5396,7.7467,7.9416,8.1259,8.3012,8.4685,8.6284,8.7818,8.9292),
+        (5.4336,6.0106,6.4405,6.7609,7.0333,7.2768,7.5,7.7078,7.903,8.0877,8.2633,8.4307,8.5908,8.7443,8.8917),
+        (5.3727,5.9459,6.3932,6.7191,6.9941,7.2391,7.4632,7.6716,7.8673,8.0523,8.228,8.3956,8.5559,8.7095,8.857),
+        (5.3106,5.8819,6.348,6.6796,6.9572,7.2037,7.4288,7.6378,7.8339,8.0192,8.1952,8.363,8.5234,8.6771,8.8247),
+        (5.2463,5.8179,6.3046,6.6421,6.9224,7.1703,7.3964,7.606,7.8025,7.9882,8.1644,8.3323,8.4929,8.6467,8.7944),
+        (5.1787,5.7536,6.2628,6.6063,6.8894,7.1388,7.3658,7.576,7.773,7.9589,8.1354,8.3035,8.4642,8.6182,8.7659),
+        (5.1061,5.6883,6.2223,6.572,6.8579,7.1089,7.3368,7.5476,7.745,7.9313,8.108,8.2763,8.4372,8.5912,8.7391),
+        (5.0256,5.6215,6.1829,6.5391,6.8278,7.0803,7.3092,7.5207,7.7185,7.9051,8.082,8.2505,8.4115,8.5657,8.7136),
+        (4.9314,5.5525,6.1446,6.5075,6.799,7.0531,7.2829,7.495,7.6933,7.8802,8.0574,8.226,8.3871,8.5414,8.6895),
+        (5.3655,6.0524,6.4329,6.7318,6.9898,7.222,7.4356,7.635,7.8227,8.0005,8.1696,8.3311,8.4856,8.6339),
+        (5.14,5.9642,6.3637,6.6702,6.9322,7.1668,7.382,7.5825,7.771,7.9493,8.1189,8.2807,8.4356,8.584),
+        (4.8313,5.8789,6.2987,6.6131,6.8792,7.1162,7.3331,7.5346,7.7239,7.9028,8.0729,8.235,8.3901,8.5388),
+        (4.4757,5.7956,6.2373,6.5598,6.83,7.0695,7.288,7.4906,7.6807,7.8602,8.0307,8.1932,8.3485,8.4975),
+        (4.3012,5.7138,6.1788,6.5097,6.7841,7.026,7.2461,7.4498,7.6406,7.8207,7.9917,8.1545,8.3102,8.4593),
+        (4.2143,5.6331,6.1228,6.4622,6.7409,6.9853,7.2069,7.4118,7.6034,7.7841,7.9554,8.1186,8.2746,8.4239),
+        (4.1574,5.5533,6.069,6.4171,6.7,6.9469,7.1701,7.3761,7.5685,7.7497,7.9216,8.0851,8.2413,8.3909),
+        (4.1145,5.4744,6.017,6.374,6.6612,6.9106,7.1355,7.3425,7.5357,7.7175,7.8897,8.0536,8.2101,8.3599),
+        (4.0799,5.3967,5.9667,6.3327,6.6243,6.8762,7.1026,7.3107,7.5047,7.6871,7.8598,8.024,8.1807,8.3308),
+        (4.0507,5.3207,5.9179,6.293,6.5889,6.8433,7.0713,7.2805,7.4753,7.6583,7.8314,7.9959,8.1529,8.3032),
+        (4.0253,5.2469,5.8705,6.2548,6.5551,6.812,7.0415,7.2518,7.4473,7.6309,7.8044,7.9693,8.1266,8.2771),
+        (4.0029,5.1762,5.8245,6.2178,6.5225,6.7819,7.0131,7.2244,7.4207,7.6048,7.7788,7.944,8.1015,8.2522),
+        (3.9827,5.1092,5.7797,6.1821,6.4911,6.753,6.9857,7.1982,7.3952,7.5799,7.7543,7.9198,8.0777,8.2285),
+        (3.9643,5.0466,5.7362,6.1475,6.4609,6.7252,6.9595,7.173,7.3708,7.556,7.7308,7.8967,8.0548,8.2059),
+        (3.9474,4.9887,5.6938,6.114,6.4316,6.6984,6.9343,7.1488,7.3473,7.5331,7.7084,7.8746,8.0329,8.1842),
+        (3.9317,4.9356,5.6527,6.0814,6.4033,6.6725,6.9099,7.1255,7.3248,7.5111,7.6868,7.8533,8.0119,8.1635),
+        (3.917,4.8871,5.6128,6.0498,6.3758,6.6475,6.8864,7.103,7.303,7.4899,7.666,7.8329,7.9917,8.1435),
+    ),
+}
 
-COMP = {'P': [500.0,
-       750.0,
-       1000.0,
-       1250.0,
-       1500.0,
-       1750.0,
-       2000.0,
-       2500.0,
-       3000.0,
-       3500.0,
-       4000.0,
-       4500.0,
-       5000.0,
-       6000.0,
-       7000.0,
-       8000.0,
-       9000.0,
-       10000.0,
-       12500.0,
-       15000.0,
-       17500.0,
-       20000.0,
-       25000.0,
-       30000.0,
-       35000.0,
-       40000.0,
-       45000.0,
-       50000.0,
-       55000.0],
- 'T_by_P': [[10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             151.83],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             167.75],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             179.88],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             189.81],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             198.29],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             205.73],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             212.38],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             223.95],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             233.85],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             242.56],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             250.35],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             257.44],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             263.94],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             275.58],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             285.83],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             295.01],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             303.34],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             311.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             327.81],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             342.16],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             354.67],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             365.75],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0,
-             390.0,
-             400.0,
-             410.0,
-             420.0,
-             430.0,
-             440.0,
-             450.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0,
-             390.0,
-             400.0,
-             410.0,
-             420.0,
-             430.0,
-             440.0,
-             450.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0,
-             390.0,
-             400.0,
-             410.0,
-             420.0,
-             430.0,
-             440.0,
-             450.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0,
-             390.0,
-             400.0,
-             410.0,
-             420.0,
-             430.0,
-             440.0,
-             450.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0,
-             390.0,
-             400.0,
-             410.0,
-             420.0,
-             430.0,
-             440.0,
-             450.0],
-            [10.0,
-             20.0,
-             30.0,
-             40.0,
-             50.0,
-             60.0,
-             70.0,
-             80.0,
-             90.0,
-             100.0,
-             110.0,
-             120.0,
-             130.0,
-             140.0,
-             150.0,
-             160.0,
-             170.0,
-             180.0,
-             190.0,
-             200.0,
-             210.0,
-             220.0,
-             230.0,
-             240.0,
-             250.0,
-             260.0,
-             270.0,
-             280.0,
-             290.0,
-             300.0,
-             310.0,
-             320.0,
-             330.0,
-             340.0,
-             350.0,
-             360.0,
-             370.0,
-             380.0,
-             390.0,
-             400.0,
-             410.0,
-             420.0,
-             430.0,
-             440.0,
-             450.0]],
- 'u_by_P': [[42.008,
-             83.882,
-             125.68,
-             167.47,
-             209.26,
-             251.08,
-             292.94,
-             334.86,
-             376.85,
-             418.94,
-             461.15,
-             503.49,
-             546.0,
-             588.71,
-             631.65,
-             639.54],
-            [42.001,
-             83.866,
-             125.66,
-             167.44,
-             209.22,
-             251.03,
-             292.89,
-             334.8,
-             376.79,
-             418.87,
-             461.07,
-             503.4,
-             545.91,
-             588.6,
-             631.53,
-             674.72,
-             708.4],
-            [41.995,
-             83.851,
-             125.64,
-             167.41,
-             209.18,
-             250.99,
-             292.84,
-             334.74,
-             376.72,
-             418.8,
-             460.99,
-             503.32,
-             545.81,
-             588.5,
-             631.41,
-             674.59,
-             718.08,
-             761.39],
-            [41.989,
-             83.836,
-             125.61,
-             167.37,
-             209.14,
-             250.94,
-             292.78,
-             334.68,
-             376.66,
-             418.73,
-             460.91,
-             503.23,
-             545.71,
-             588.39,
-             631.29,
-             674.47,
-             717.94,
-             761.77,
-             805.16],
-            [41.983,
-             83.821,
-             125.59,
-             167.34,
-             209.11,
-             250.9,
-             292.73,
-             334.63,
-             376.59,
-             418.65,
-             460.83,
-             503.14,
-             545.61,
-             588.28,
-             631.18,
-             674.34,
-             717.8,
-             761.61,
-             805.83,
-             842.83],
-            [41.976,
-             83.806,
-             125.57,
-             167.31,
-             209.07,
-             250.85,
-             292.68,
-             334.57,
-             376.53,
-             418.58,
-             460.75,
-             503.05,
-             545.51,
-             588.17,
-             631.06,
-             674.21,
-             717.66,
-             761.46,
-             805.66,
-             850.33,
-             876.13],
-            [41.97,
-             83.791,
-             125.55,
-             167.28,
-             209.03,
-             250.81,
-             292.63,
-             334.51,
-             376.46,
-             418.51,
-             460.67,
-             502.96,
-             545.42,
-             588.07,
-             630.94,
-             674.08,
-             717.52,
-             761.3,
-             805.49,
-             850.14,
-             895.32,
-             906.14],
-            [41.957,
-             83.76,
-             125.5,
-             167.22,
-             208.96,
-             250.72,
-             292.53,
-             334.39,
-             376.33,
-             418.36,
-             460.51,
-             502.78,
-             545.22,
-             587.85,
-             630.71,
-             673.82,
-             717.24,
-             760.99,
-             805.15,
-             849.76,
-             894.9,
-             940.65,
-             958.91],
-            [41.945,
-             83.73,
-             125.45,
-             167.16,
-             208.88,
-             250.63,
-             292.43,
-             334.28,
-             376.2,
-             418.22,
-             460.35,
-             502.61,
-             545.03,
-             587.64,
-             630.47,
-             673.57,
-             716.95,
-             760.69,
-             804.81,
-             849.39,
-             894.49,
-             940.2,
-             986.6,
-             1004.7],
-            [41.932,
-             83.7,
-             125.41,
-             167.1,
-             208.81,
-             250.55,
-             292.33,
-             334.16,
-             376.07,
-             418.07,
-             460.19,
-             502.43,
-             544.83,
-             587.43,
-             630.24,
-             673.31,
-             716.67,
-             760.38,
-             804.47,
-             849.02,
-             894.08,
-             939.74,
-             986.09,
-             1033.3,
-             1045.5],
-            [41.919,
-             83.67,
-             125.36,
-             167.04,
-             208.74,
-             250.46,
-             292.23,
-             334.05,
-             375.95,
-             417.93,
-             460.03,
-             502.25,
-             544.64,
-             587.22,
-             630.01,
-             673.06,
-             716.4,
-             760.07,
-             804.14,
-             848.65,
-             893.67,
-             939.29,
-             985.59,
-             1032.7,
-             1080.8,
-             1082.5],
-            [41.906,
-             83.639,
-             125.32,
-             166.98,
-             208.66,
-             250.37,
-             292.13,
-             333.94,
-             375.82,
-             417.79,
-             459.87,
-             502.08,
-             544.45,
-             587.0,
-             629.78,
-             672.8,
-             716.12,
-             759.77,
-             803.8,
-             848.28,
-             893.27,
-             938.84,
-             985.09,
-             1032.1,
-             1080.1,
-             1116.5],
-            [41.893,
-             83.609,
-             125.27,
-             166.92,
-             208.59,
-             250.29,
-             292.03,
-             333.82,
-             375.69,
-             417.64,
-             459.71,
-             501.9,
-             544.26,
-             586.79,
-             629.55,
-             672.55,
-             715.84,
-             759.46,
-             803.47,
-             847.91,
-             892.86,
-             938.39,
-             984.59,
-             1031.6,
-             1079.5,
-             1128.5,
-             1148.2],
-            [41.868,
-             83.549,
-             125.18,
-             166.8,
-             208.44,
-             250.11,
-             291.82,
-             333.59,
-             375.43,
-             417.36,
-             459.39,
-             501.56,
-             543.87,
-             586.37,
-             629.08,
-             672.04,
-             715.29,
-             758.86,
-             802.81,
-             847.18,
-             892.05,
-             937.49,
-             983.6,
-             1030.5,
-             1078.2,
-             1127.1,
-             1177.3,
-             1206.0],
-            [41.841,
-             83.488,
-             125.09,
-             166.68,
-             208.3,
-             249.94,
-             291.63,
-             333.37,
-             375.18,
-             417.08,
-             459.08,
-             501.21,
-             543.49,
-             585.95,
-             628.63,
-             671.54,
-             714.74,
-             758.26,
-             802.15,
-             846.46,
-             891.25,
-             936.61,
-             982.61,
-             1029.4,
-             1077.0,
-             1125.7,
-             1175.7,
-             1227.2,
-             1258.2],
-            [41.815,
-             83.428,
-             125.0,
-             166.57,
-             208.15,
-             249.77,
-             291.43,
-             333.14,
-             374.92,
-             416.79,
-             458.77,
-             500.86,
-             543.11,
-             585.54,
-             628.17,
-             671.04,
-             714.19,
-             757.66,
-             801.49,
-             845.74,
-             890.46,
-             935.73,
-             981.64,
-             1028.3,
-             1075.8,
-             1124.3,
-             1174.1,
-             1225.4,
-             1278.6,
-             1306.2],
-            [41.789,
-             83.368,
-             124.91,
-             166.45,
-             208.01,
-             249.6,
-             291.23,
-             332.92,
-             374.67,
-             416.51,
-             458.45,
-             500.52,
-             542.74,
-             585.13,
-             627.72,
-             670.55,
-             713.65,
-             757.07,
-             800.84,
-             845.02,
-             889.67,
-             934.86,
-             980.68,
-             1027.2,
-             1074.6,
-             1123.0,
-             1172.5,
-             1223.6,
-             1276.5,
-             1331.9,
-             1351.1],
-            [41.762,
-             83.308,
-             124.82,
-             166.33,
-             207.86,
-             249.42,
-             291.03,
-             332.69,
-             374.42,
-             416.23,
-             458.14,
-             500.18,
-             542.36,
-             584.71,
-             627.27,
-             670.06,
-             713.11,
-             756.48,
-             800.19,
-             844.31,
-             888.89,
-             934.0,
-             979.72,
-             1026.1,
-             1073.4,
-             1121.6,
-             1171.0,
-             1221.8,
-             1274.4,
-             1329.4,
-             1387.5,
-             1393.5],
-            [41.695,
-             83.157,
-             124.59,
-             166.04,
-             207.5,
-             249.0,
-             290.54,
-             332.14,
-             373.8,
-             415.54,
-             457.37,
-             499.33,
-             541.43,
-             583.69,
-             626.15,
-             668.84,
-             711.78,
-             755.02,
-             798.6,
-             842.56,
-             886.97,
-             931.88,
-             977.37,
-             1023.5,
-             1070.5,
-             1118.3,
-             1167.2,
-             1217.5,
-             1269.4,
-             1323.3,
-             1380.0,
-             1440.7,
-             1492.3],
-            [41.626,
-             83.007,
-             124.37,
-             165.75,
-             207.15,
-             248.58,
-             290.06,
-             331.59,
-             373.18,
-             414.85,
-             456.61,
-             498.49,
-             540.51,
-             582.69,
-             625.05,
-             667.63,
-             710.46,
-             753.58,
-             797.03,
-             840.84,
-             885.08,
-             929.8,
-             975.08,
-             1021.0,
-             1067.6,
-             1115.1,
-             1163.6,
-             1213.4,
-             1264.6,
-             1317.6,
-             1373.1,
-             1431.9,
-             1495.7,
-             1567.9,
-             1585.3],
-            [41.557,
-             82.857,
-             124.15,
-             165.46,
-             206.79,
-             248.16,
-             289.58,
-             331.04,
-             372.57,
-             414.17,
-             455.86,
-             497.67,
-             539.6,
-             581.69,
-             623.96,
-             666.45,
-             709.17,
-             752.17,
-             795.48,
-             839.15,
-             883.23,
-             927.76,
-             972.83,
-             1018.5,
-             1064.9,
-             1112.0,
-             1160.1,
-             1209.4,
-             1260.0,
-             1312.3,
-             1366.7,
-             1423.9,
-             1485.2,
-             1552.8,
-             1632.5,
-             1679.2],
-            [41.486,
-             82.708,
-             123.93,
-             165.17,
-             206.44,
-             247.75,
-             289.1,
-             330.5,
-             371.96,
-             413.5,
-             455.12,
-             496.85,
-             538.7,
-             580.71,
-             622.89,
-             665.27,
-             707.89,
-             750.77,
-             793.96,
-             837.49,
-             881.41,
-             925.77,
-             970.63,
-             1016.1,
-             1062.2,
-             1109.0,
-             1156.8,
-             1205.5,
-             1255.6,
-             1307.1,
-             1360.6,
-             1416.6,
-             1475.9,
-             1540.2,
-             1612.7,
-             1703.6,
-             1786.4],
-            [41.341,
-             82.409,
-             123.49,
-             164.61,
-             205.75,
-             246.94,
-             288.16,
-             329.44,
-             370.77,
-             412.17,
-             453.65,
-             495.24,
-             536.94,
-             578.78,
-             620.78,
-             662.98,
-             705.39,
-             748.05,
-             790.99,
-             834.24,
-             877.86,
-             921.88,
-             966.37,
-             1011.4,
-             1057.0,
-             1103.2,
-             1150.3,
-             1198.3,
-             1247.3,
-             1297.6,
-             1349.5,
-             1403.4,
-             1459.7,
-             1519.4,
-             1583.9,
-             1656.2,
-             1743.6,
-             1880.3],
-            [41.193,
-             82.112,
-             123.06,
-             164.05,
-             205.07,
-             246.14,
-             287.24,
-             328.4,
-             369.6,
-             410.87,
-             452.22,
-             493.66,
-             535.21,
-             576.89,
-             618.73,
-             660.74,
-             702.95,
-             745.4,
-             788.1,
-             831.1,
-             874.44,
-             918.14,
-             962.27,
-             1006.9,
-             1052.0,
-             1097.8,
-             1144.2,
-             1191.5,
-             1239.6,
-             1288.9,
-             1339.5,
-             1391.6,
-             1445.7,
-             1502.3,
-             1562.2,
-             1626.7,
-             1698.3,
-             1782.0,
-             1891.3,
-             2068.9,
-             2276.0,
-             2405.3,
-             2493.7,
-             2562.1,
-             2618.9],
-            [41.04,
-             81.815,
-             122.63,
-             163.5,
-             204.4,
-             245.35,
-             286.34,
-             327.37,
-             368.46,
-             409.6,
-             450.82,
-             492.12,
-             533.53,
-             575.05,
-             616.72,
-             658.56,
-             700.58,
-             742.82,
-             785.3,
-             828.06,
-             871.12,
-             914.53,
-             958.33,
-             1002.6,
-             1047.3,
-             1092.5,
-             1138.4,
-             1185.1,
-             1232.5,
-             1280.8,
-             1330.3,
-             1381.1,
-             1433.4,
-             1487.7,
-             1544.5,
-             1604.4,
-             1668.6,
-             1739.0,
-             1819.1,
-             1914.9,
-             2037.3,
-             2184.0,
-             2315.3,
-             2417.3,
-             2497.5],
-            [40.883,
-             81.52,
-             122.21,
-             162.96,
-             203.75,
-             244.58,
-             285.45,
-             326.37,
-             367.33,
-             408.35,
-             449.44,
-             490.61,
-             531.88,
-             573.25,
-             614.77,
-             656.43,
-             698.27,
-             740.31,
-             782.58,
-             825.1,
-             867.91,
-             911.04,
-             954.52,
-             998.41,
-             1042.7,
-             1087.6,
-             1133.0,
-             1179.0,
-             1225.7,
-             1273.3,
-             1321.8,
-             1371.5,
-             1422.4,
-             1474.9,
-             1529.3,
-             1586.0,
-             1645.7,
-             1709.4,
-             1778.4,
-             1854.9,
-             1941.8,
-             2042.0,
-             2154.8,
-             2265.8,
-             2364.2],
-            [40.723,
-             81.225,
-             121.79,
-             162.42,
-             203.1,
-             243.82,
-             284.58,
-             325.39,
-             366.23,
-             407.13,
-             448.1,
-             489.13,
-             530.26,
-             571.49,
-             612.85,
-             654.35,
-             696.02,
-             737.87,
-             779.93,
-             822.23,
-             864.8,
-             907.66,
-             950.85,
-             994.41,
-             1038.4,
-             1082.8,
-             1127.7,
-             1173.2,
-             1219.4,
-             1266.2,
-             1313.9,
-             1362.6,
-             1412.3,
-             1463.4,
-             1515.9,
-             1570.3,
-             1626.9,
-             1686.2,
-             1749.1,
-             1816.5,
-             1889.7,
-             1969.8,
-             2057.5,
-             2151.7,
-             2246.4],
-            [40.559,
-             80.931,
-             121.38,
-             161.9,
-             202.46,
-             243.08,
-             283.73,
-             324.42,
-             365.15,
-             405.93,
-             446.77,
-             487.69,
-             528.68,
-             569.77,
-             610.98,
-             652.32,
-             693.82,
-             735.49,
-             777.36,
-             819.45,
-             861.78,
-             904.39,
-             947.3,
-             990.55,
-             1034.2,
-             1078.2,
-             1122.7,
-             1167.7,
-             1213.3,
-             1259.6,
-             1306.5,
-             1354.3,
-             1403.1,
-             1452.9,
-             1503.9,
-             1556.5,
-             1610.7,
-             1667.1,
-             1725.9,
-             1787.8,
-             1853.5,
-             1923.5,
-             1998.2,
-             2077.5,
-             2160.3],
-            [40.392,
-             80.637,
-             120.97,
-             161.38,
-             201.84,
-             242.34,
-             282.89,
-             323.47,
-             364.09,
-             404.76,
-             445.48,
-             486.27,
-             527.13,
-             568.09,
-             609.15,
-             650.34,
-             691.67,
-             733.17,
-             774.85,
-             816.73,
-             858.84,
-             901.21,
-             943.86,
-             986.82,
-             1030.1,
-             1073.8,
-             1117.9,
-             1162.5,
-             1207.6,
-             1253.3,
-             1299.6,
-             1346.6,
-             1394.5,
-             1443.2,
-             1493.1,
-             1544.1,
-             1596.5,
-             1650.6,
-             1706.5,
-             1764.7,
-             1825.5,
-             1889.3,
-             1956.4,
-             2026.7,
-             2099.8]],
- 'h_by_P': [[42.508,
-             84.382,
-             126.19,
-             167.97,
-             209.76,
-             251.58,
-             293.45,
-             335.37,
-             377.37,
-             419.47,
-             461.67,
-             504.02,
-             546.54,
-             589.25,
-             632.19,
-             640.09],
-            [42.751,
-             84.618,
-             126.41,
-             168.19,
-             209.98,
-             251.79,
-             293.65,
-             335.57,
-             377.57,
-             419.65,
-             461.86,
-             504.2,
-             546.71,
-             589.41,
-             632.35,
-             675.55,
-             709.24],
-            [42.995,
-             84.853,
-             126.64,
-             168.41,
-             210.19,
-             252.0,
-             293.86,
-             335.77,
-             377.76,
-             419.84,
-             462.04,
-             504.38,
-             546.88,
-             589.58,
-             632.5,
-             675.7,
-             719.2,
-             762.52],
-            [43.239,
-             85.088,
-             126.87,
-             168.63,
-             210.41,
-             252.21,
-             294.06,
-             335.97,
-             377.95,
-             420.03,
-             462.22,
-             504.55,
-             547.05,
-             589.74,
-             632.66,
-             675.84,
-             719.33,
-             763.18,
-             806.58],
-            [43.482,
-             85.323,
-             127.1,
-             168.86,
-             210.62,
-             252.42,
-             294.27,
-             336.17,
-             378.15,
-             420.22,
-             462.4,
-             504.73,
-             547.22,
-             589.9,
-             632.81,
-             675.99,
-             719.47,
-             763.3,
-             807.54,
-             844.56],
-            [43.725,
-             85.558,
-             127.33,
-             169.08,
-             210.84,
-             252.63,
-             294.47,
-             336.37,
-             378.34,
-             420.4,
-             462.58,
-             504.9,
-             547.39,
-             590.06,
-             632.97,
-             676.13,
-             719.61,
-             763.43,
-             807.66,
-             852.35,
-             878.17],
-            [43.969,
-             85.793,
-             127.55,
-             169.3,
-             211.06,
-             252.84,
-             294.68,
-             336.57,
-             378.53,
-             420.59,
-             462.77,
-             505.08,
-             547.55,
-             590.22,
-             633.12,
-             676.28,
-             719.74,
-             763.56,
-             807.77,
-             852.45,
-             897.66,
-             908.5],
-            [44.455,
-             86.262,
-             128.01,
-             169.74,
-             211.49,
-             253.26,
-             295.08,
-             336.96,
-             378.92,
-             420.97,
-             463.13,
-             505.43,
-             547.89,
-             590.55,
-             633.43,
-             676.57,
-             720.02,
-             763.81,
-             808.0,
-             852.65,
-             897.83,
-             943.63,
-             961.91],
-            [44.941,
-             86.732,
-             128.46,
-             170.18,
-             211.92,
-             253.68,
-             295.49,
-             337.36,
-             379.31,
-             421.34,
-             463.5,
-             505.78,
-             548.23,
-             590.87,
-             633.74,
-             676.87,
-             720.29,
-             764.06,
-             808.23,
-             852.86,
-             898.01,
-             943.76,
-             990.23,
-             1008.3],
-            [45.427,
-             87.201,
-             128.92,
-             170.63,
-             212.35,
-             254.1,
-             295.9,
-             337.76,
-             379.69,
-             421.72,
-             463.86,
-             506.14,
-             548.57,
-             591.2,
-             634.05,
-             677.16,
-             720.57,
-             764.32,
-             808.46,
-             853.06,
-             898.18,
-             943.9,
-             990.32,
-             1037.6,
-             1049.8],
-            [45.913,
-             87.67,
-             129.37,
-             171.07,
-             212.78,
-             254.52,
-             296.31,
-             338.16,
-             380.08,
-             422.1,
-             464.22,
-             506.49,
-             548.91,
-             591.53,
-             634.36,
-             677.45,
-             720.84,
-             764.57,
-             808.69,
-             853.27,
-             898.35,
-             944.04,
-             990.42,
-             1037.6,
-             1085.8,
-             1087.5],
-            [46.398,
-             88.138,
-             129.83,
-             171.51,
-             213.21,
-             254.94,
-             296.72,
-             338.56,
-             380.47,
-             422.47,
-             464.59,
-             506.84,
-             549.25,
-             591.85,
-             634.67,
-             677.75,
-             721.12,
-             764.83,
-             808.93,
-             853.47,
-             898.53,
-             944.18,
-             990.52,
-             1037.7,
-             1085.8,
-             1122.2],
-            [46.883,
-             88.607,
-             130.28,
-             171.95,
-             213.64,
-             255.36,
-             297.13,
-             338.95,
-             380.86,
-             422.85,
-             464.95,
-             507.19,
-             549.59,
-             592.18,
-             634.98,
-             678.04,
-             721.4,
-             765.08,
-             809.16,
-             853.68,
-             898.71,
-             944.32,
-             990.62,
-             1037.7,
-             1085.7,
-             1134.9,
-             1154.6],
-            [47.853,
-             89.543,
-             131.19,
-             172.84,
-             214.5,
-             256.2,
-             297.95,
-             339.75,
-             381.63,
-             423.6,
-             465.68,
-             507.9,
-             550.27,
-             592.83,
-             635.61,
-             678.63,
-             721.95,
-             765.6,
-             809.63,
-             854.09,
-             899.06,
-             944.61,
-             990.82,
-             1037.8,
-             1085.7,
-             1134.7,
-             1185.1,
-             1213.9],
-            [48.821,
-             90.479,
-             132.1,
-             173.72,
-             215.36,
-             257.04,
-             298.76,
-             340.55,
-             382.41,
-             424.36,
-             466.41,
-             508.61,
-             550.95,
-             593.48,
-             636.23,
-             679.22,
-             722.51,
-             766.11,
-             810.1,
-             854.51,
-             899.42,
-             944.9,
-             991.04,
-             1037.9,
-             1085.7,
-             1134.6,
-             1184.8,
-             1236.6,
-             1267.7],
-            [49.788,
-             91.414,
-             133.01,
-             174.6,
-             216.22,
-             257.88,
-             299.58,
-             341.34,
-             383.18,
-             425.11,
-             467.15,
-             509.31,
-             551.63,
-             594.14,
-             636.86,
-             679.82,
-             723.06,
-             766.63,
-             810.57,
-             854.94,
-             899.79,
-             945.2,
-             991.25,
-             1038.1,
-             1085.7,
-             1134.5,
-             1184.5,
-             1236.0,
-             1289.6,
-             1317.3],
-            [50.754,
-             92.348,
-             133.91,
-             175.48,
-             217.08,
-             258.71,
-             300.4,
-             342.14,
-             383.96,
-             425.86,
-             467.88,
-             510.02,
-             552.32,
-             594.79,
-             637.48,
-             680.41,
-             723.62,
-             767.15,
-             811.05,
-             855.37,
-             900.16,
-             945.5,
-             991.48,
-             1038.2,
-             1085.8,
-             1134.4,
-             1184.2,
-             1235.5,
-             1288.8,
-             1344.5,
-             1363.9],
-            [51.719,
-             93.281,
-             134.82,
-             176.36,
-             217.94,
-             259.55,
-             301.21,
-             342.94,
-             384.73,
-             426.62,
-             468.61,
-             510.73,
-             553.0,
-             595.45,
-             638.11,
-             681.01,
-             724.18,
-             767.68,
-             811.53,
-             855.8,
-             900.53,
-             945.81,
-             991.71,
-             1038.3,
-             1085.8,
-             1134.3,
-             1183.9,
-             1235.0,
-             1288.0,
-             1343.3,
-             1402.0,
-             1408.1],
-            [54.126,
-             95.61,
-             137.08,
-             178.57,
-             220.09,
-             261.65,
-             303.26,
-             344.93,
-             386.67,
-             428.5,
-             470.44,
-             512.5,
-             554.71,
-             597.1,
-             639.68,
-             682.51,
-             725.6,
-             768.99,
-             812.74,
-             856.89,
-             901.49,
-             946.61,
-             992.32,
-             1038.7,
-             1085.9,
-             1134.1,
-             1183.3,
-             1233.9,
-             1286.2,
-             1340.7,
-             1397.9,
-             1459.3,
-             1511.6],
-            [56.526,
-             97.934,
-             139.34,
-             180.77,
-             222.23,
-             263.74,
-             305.3,
-             346.92,
-             388.61,
-             430.39,
-             472.27,
-             514.28,
-             556.43,
-             598.75,
-             641.27,
-             684.01,
-             727.02,
-             770.32,
-             813.97,
-             857.99,
-             902.46,
-             947.43,
-             992.97,
-             1039.2,
-             1086.1,
-             1134.0,
-             1182.9,
-             1233.0,
-             1284.7,
-             1338.3,
-             1394.4,
-             1454.0,
-             1518.8,
-             1592.4,
-             1610.2],
-            [58.92,
-             100.25,
-             141.59,
-             182.96,
-             224.37,
-             265.83,
-             307.34,
-             348.91,
-             390.55,
-             432.28,
-             474.11,
-             516.06,
-             558.15,
-             600.41,
-             642.85,
-             685.53,
-             728.45,
-             771.66,
-             815.21,
-             859.12,
-             903.46,
-             948.28,
-             993.65,
-             1039.6,
-             1086.4,
-             1133.9,
-             1182.5,
-             1232.2,
-             1283.3,
-             1336.2,
-             1391.3,
-             1449.5,
-             1511.8,
-             1580.8,
-             1662.5,
-             1710.8],
-            [61.307,
-             102.57,
-             143.84,
-             185.16,
-             226.51,
-             267.92,
-             309.38,
-             350.9,
-             392.49,
-             434.17,
-             475.94,
-             517.84,
-             559.87,
-             602.07,
-             644.45,
-             687.05,
-             729.89,
-             773.02,
-             816.46,
-             860.27,
-             904.48,
-             949.16,
-             994.37,
-             1040.2,
-             1086.7,
-             1134.0,
-             1182.2,
-             1231.5,
-             1282.1,
-             1334.4,
-             1388.6,
-             1445.5,
-             1505.9,
-             1571.6,
-             1646.0,
-             1740.1,
-             1827.2],
-            [66.062,
-             107.18,
-             148.33,
-             189.53,
-             230.79,
-             272.09,
-             313.46,
-             354.88,
-             396.38,
-             437.95,
-             479.63,
-             521.41,
-             563.33,
-             605.41,
-             647.66,
-             690.11,
-             732.8,
-             775.76,
-             819.02,
-             862.61,
-             906.59,
-             951.0,
-             995.89,
-             1041.3,
-             1087.4,
-             1134.2,
-             1181.9,
-             1230.5,
-             1280.2,
-             1331.3,
-             1384.1,
-             1438.9,
-             1496.4,
-             1557.5,
-             1623.9,
-             1698.6,
-             1789.8,
-             1935.7],
-            [70.792,
-             111.77,
-             152.81,
-             193.9,
-             235.05,
-             276.26,
-             317.53,
-             358.86,
-             400.26,
-             441.74,
-             483.32,
-             525.0,
-             566.81,
-             608.76,
-             650.89,
-             693.21,
-             735.75,
-             778.54,
-             821.62,
-             865.02,
-             908.77,
-             952.93,
-             997.54,
-             1042.7,
-             1088.4,
-             1134.7,
-             1181.8,
-             1229.8,
-             1278.7,
-             1328.9,
-             1380.4,
-             1433.7,
-             1489.1,
-             1547.1,
-             1608.8,
-             1675.6,
-             1750.1,
-             1838.2,
-             1955.3,
-             2152.8,
-             2395.4,
-             2552.9,
-             2662.8,
-             2748.9,
-             2821.0],
-            [75.496,
-             116.34,
-             157.27,
-             198.26,
-             239.31,
-             280.43,
-             321.6,
-             362.84,
-             404.15,
-             445.54,
-             487.01,
-             528.59,
-             570.29,
-             612.14,
-             654.14,
-             696.33,
-             738.73,
-             781.37,
-             824.28,
-             867.48,
-             911.02,
-             954.94,
-             999.28,
-             1044.1,
-             1089.4,
-             1135.4,
-             1182.0,
-             1229.4,
-             1277.7,
-             1327.0,
-             1377.6,
-             1429.5,
-             1483.2,
-             1539.1,
-             1597.6,
-             1659.6,
-             1726.5,
-             1800.4,
-             1885.4,
-             1988.6,
-             2123.9,
-             2291.9,
-             2447.6,
-             2571.8,
-             2671.0],
-            [80.177,
-             120.9,
-             161.71,
-             202.6,
-             243.56,
-             284.58,
-             325.67,
-             366.82,
-             408.04,
-             449.33,
-             490.72,
-             532.2,
-             573.79,
-             615.53,
-             657.42,
-             699.48,
-             741.74,
-             784.23,
-             826.97,
-             870.0,
-             913.34,
-             957.04,
-             1001.1,
-             1045.7,
-             1090.7,
-             1136.3,
-             1182.4,
-             1229.3,
-             1277.0,
-             1325.6,
-             1375.3,
-             1426.2,
-             1478.5,
-             1532.6,
-             1588.8,
-             1647.7,
-             1709.9,
-             1776.6,
-             1849.6,
-             1931.4,
-             2025.5,
-             2136.4,
-             2264.5,
-             2394.2,
-             2511.8],
-            [84.834,
-             125.44,
-             166.14,
-             206.93,
-             247.8,
-             288.74,
-             329.74,
-             370.8,
-             411.93,
-             453.14,
-             494.42,
-             535.81,
-             577.31,
-             618.93,
-             660.71,
-             702.65,
-             744.78,
-             787.13,
-             829.72,
-             872.57,
-             915.72,
-             959.21,
-             1003.1,
-             1047.3,
-             1092.0,
-             1137.3,
-             1183.1,
-             1229.5,
-             1276.7,
-             1324.6,
-             1373.5,
-             1423.5,
-             1474.7,
-             1527.4,
-             1581.8,
-             1638.3,
-             1697.3,
-             1759.6,
-             1825.9,
-             1897.7,
-             1976.4,
-             2063.7,
-             2161.1,
-             2267.9,
-             2377.6],
-            [89.467,
-             129.95,
-             170.56,
-             211.25,
-             252.03,
-             292.88,
-             333.8,
-             374.78,
-             415.82,
-             456.94,
-             498.14,
-             539.43,
-             580.83,
-             622.36,
-             664.02,
-             705.84,
-             747.85,
-             790.06,
-             832.5,
-             875.19,
-             918.16,
-             961.45,
-             1005.1,
-             1049.1,
-             1093.5,
-             1138.4,
-             1183.9,
-             1229.9,
-             1276.6,
-             1324.0,
-             1372.2,
-             1421.4,
-             1471.6,
-             1523.1,
-             1576.1,
-             1630.7,
-             1687.4,
-             1746.5,
-             1808.6,
-             1874.4,
-             1944.7,
-             2020.5,
-             2102.5,
-             2190.8,
-             2284.7],
-            [94.079,
-             134.45,
-             174.96,
-             215.56,
-             256.26,
-             297.02,
-             337.86,
-             378.75,
-             419.72,
-             460.75,
-             501.86,
-             543.06,
-             584.37,
-             625.79,
-             667.35,
-             709.06,
-             750.94,
-             793.02,
-             835.32,
-             877.85,
-             920.65,
-             963.75,
-             1007.2,
-             1050.9,
-             1095.1,
-             1139.7,
-             1184.8,
-             1230.5,
-             1276.7,
-             1323.6,
-             1371.2,
-             1419.7,
-             1469.1,
-             1519.6,
-             1571.4,
-             1624.5,
-             1679.3,
-             1736.1,
-             1795.1,
-             1856.9,
-             1921.9,
-             1990.7,
-             2063.8,
-             2141.4,
-             2223.1]],
- 'v_by_P': [[0.001,
-             0.001002,
-             0.001004,
-             0.001008,
-             0.001012,
-             0.001017,
-             0.001023,
-             0.001029,
-             0.001036,
-             0.001043,
-             0.001051,
-             0.00106,
-             0.00107,
-             0.00108,
-             0.00109,
-             0.001093],
-            [0.001,
-             0.001001,
-             0.001004,
-             0.001008,
-             0.001012,
-             0.001017,
-             0.001022,
-             0.001029,
-             0.001036,
-             0.001043,
-             0.001051,
-             0.00106,
-             0.001069,
-             0.00108,
-             0.00109,
-             0.001102,
-             0.001111],
-            [0.001,
-             0.001001,
-             0.001004,
-             0.001007,
-             0.001012,
-             0.001017,
-             0.001022,
-             0.001029,
-             0.001036,
-             0.001043,
-             0.001051,
-             0.00106,
-             0.001069,
-             0.001079,
-             0.00109,
-             0.001102,
-             0.001114,
-             0.001127],
-            [0.001,
-             0.001001,
-             0.001004,
-             0.001007,
-             0.001012,
-             0.001017,
-             0.001022,
-             0.001028,
-             0.001035,
-             0.001043,
-             0.001051,
-             0.00106,
-             0.001069,
-             0.001079,
-             0.00109,
-             0.001102,
-             0.001114,
-             0.001127,
-             0.001141],
-            [0.001,
-             0.001001,
-             0.001004,
-             0.001007,
-             0.001011,
-             0.001016,
-             0.001022,
-             0.001028,
-             0.001035,
-             0.001043,
-             0.001051,
-             0.00106,
-             0.001069,
-             0.001079,
-             0.00109,
-             0.001101,
-             0.001114,
-             0.001127,
-             0.001141,
-             0.001154],
-            [0.001,
-             0.001001,
-             0.001004,
-             0.001007,
-             0.001011,
-             0.001016,
-             0.001022,
-             0.001028,
-             0.001035,
-             0.001043,
-             0.001051,
-             0.001059,
-             0.001069,
-             0.001079,
-             0.00109,
-             0.001101,
-             0.001114,
-             0.001127,
-             0.001141,
-             0.001156,
-             0.001166],
-            [0.000999,
-             0.001001,
-             0.001004,
-             0.001007,
-             0.001011,
-             0.001016,
-             0.001022,
-             0.001028,
-             0.001035,
-             0.001042,
-             0.001051,
-             0.001059,
-             0.001069,
-             0.001079,
-             0.001089,
-             0.001101,
-             0.001113,
-             0.001127,
-             0.001141,
-             0.001156,
-             0.001173,
-             0.001177],
-            [0.000999,
-             0.001001,
-             0.001003,
-             0.001007,
-             0.001011,
-             0.001016,
-             0.001022,
-             0.001028,
-             0.001035,
-             0.001042,
-             0.00105,
-             0.001059,
-             0.001068,
-             0.001078,
-             0.001089,
-             0.001101,
-             0.001113,
-             0.001126,
-             0.00114,
-             0.001156,
-             0.001172,
-             0.00119,
-             0.001197],
-            [0.000999,
-             0.001,
-             0.001003,
-             0.001007,
-             0.001011,
-             0.001016,
-             0.001021,
-             0.001028,
-             0.001035,
-             0.001042,
-             0.00105,
-             0.001059,
-             0.001068,
-             0.001078,
-             0.001089,
-             0.0011,
-             0.001113,
-             0.001126,
-             0.00114,
-             0.001155,
-             0.001171,
-             0.001189,
-             0.001209,
-             0.001217],
-            [0.000999,
-             0.001,
-             0.001003,
-             0.001006,
-             0.001011,
-             0.001016,
-             0.001021,
-             0.001027,
-             0.001034,
-             0.001042,
-             0.00105,
-             0.001058,
-             0.001068,
-             0.001078,
-             0.001088,
-             0.0011,
-             0.001112,
-             0.001125,
-             0.001139,
-             0.001155,
-             0.001171,
-             0.001189,
-             0.001208,
-             0.001229,
-             0.001235],
-            [0.000998,
-             0.001,
-             0.001003,
-             0.001006,
-             0.00101,
-             0.001015,
-             0.001021,
-             0.001027,
-             0.001034,
-             0.001041,
-             0.00105,
-             0.001058,
-             0.001068,
-             0.001077,
-             0.001088,
-             0.0011,
-             0.001112,
-             0.001125,
-             0.001139,
-             0.001154,
-             0.00117,
-             0.001188,
-             0.001207,
-             0.001228,
-             0.001252,
-             0.001253],
-            [0.000998,
-             0.001,
-             0.001002,
-             0.001006,
-             0.00101,
-             0.001015,
-             0.001021,
-             0.001027,
-             0.001034,
-             0.001041,
-             0.001049,
-             0.001058,
-             0.001067,
-             0.001077,
-             0.001088,
-             0.001099,
-             0.001111,
-             0.001124,
-             0.001138,
-             0.001154,
-             0.00117,
-             0.001187,
-             0.001207,
-             0.001228,
-             0.001251,
-             0.00127],
-            [0.000998,
-             0.001,
-             0.001002,
-             0.001006,
-             0.00101,
-             0.001015,
-             0.00102,
-             0.001027,
-             0.001034,
-             0.001041,
-             0.001049,
-             0.001058,
-             0.001067,
-             0.001077,
-             0.001087,
-             0.001099,
-             0.001111,
-             0.001124,
-             0.001138,
-             0.001153,
-             0.001169,
-             0.001187,
-             0.001206,
-             0.001227,
-             0.00125,
-             0.001275,
-             0.001286],
-            [0.000998,
-             0.000999,
-             0.001002,
-             0.001005,
-             0.001009,
-             0.001014,
-             0.00102,
-             0.001026,
-             0.001033,
-             0.00104,
-             0.001048,
-             0.001057,
-             0.001066,
-             0.001076,
-             0.001087,
-             0.001098,
-             0.00111,
-             0.001123,
-             0.001137,
-             0.001152,
-             0.001168,
-             0.001186,
-             0.001205,
-             0.001225,
-             0.001248,
-             0.001273,
-             0.001302,
-             0.001319],
-            [0.000997,
-             0.000999,
-             0.001001,
-             0.001005,
-             0.001009,
-             0.001014,
-             0.00102,
-             0.001026,
-             0.001033,
-             0.00104,
-             0.001048,
-             0.001057,
-             0.001066,
-             0.001076,
-             0.001086,
-             0.001097,
-             0.001109,
-             0.001122,
-             0.001136,
-             0.001151,
-             0.001167,
-             0.001184,
-             0.001203,
-             0.001224,
-             0.001246,
-             0.001271,
-             0.001299,
-             0.001331,
-             0.001352],
-            [0.000997,
-             0.000998,
-             0.001001,
-             0.001004,
-             0.001009,
-             0.001014,
-             0.001019,
-             0.001025,
-             0.001032,
-             0.001039,
-             0.001047,
-             0.001056,
-             0.001065,
-             0.001075,
-             0.001086,
-             0.001097,
-             0.001109,
-             0.001122,
-             0.001135,
-             0.00115,
-             0.001166,
-             0.001183,
-             0.001202,
-             0.001222,
-             0.001245,
-             0.001269,
-             0.001297,
-             0.001328,
-             0.001364,
-             0.001385],
-            [0.000996,
-             0.000998,
-             0.001,
-             0.001004,
-             0.001008,
-             0.001013,
-             0.001019,
-             0.001025,
-             0.001032,
-             0.001038,
-             0.001047,
-             0.001055,
-             0.001065,
-             0.001074,
-             0.001085,
-             0.001096,
-             0.001108,
-             0.001121,
-             0.001134,
-             0.001149,
-             0.001165,
-             0.001182,
-             0.001201,
-             0.001221,
-             0.001243,
-             0.001267,
-             0.001295,
-             0.001325,
-             0.001361,
-             0.001402,
-             0.001418],
-            [0.000996,
-             0.000997,
-             0.001,
-             0.001003,
-             0.001008,
-             0.001013,
-             0.001018,
-             0.001024,
-             0.001031,
-             0.001038,
-             0.001046,
-             0.001055,
-             0.001064,
-             0.001074,
-             0.001084,
-             0.001095,
-             0.001107,
-             0.00112,
-             0.001134,
-             0.001148,
-             0.001164,
-             0.001181,
-             0.001199,
-             0.001219,
-             0.001241,
-             0.001265,
-             0.001292,
-             0.001323,
-             0.001357,
-             0.001398,
-             0.001447,
-             0.001453],
-            [0.000994,
-             0.000996,
-             0.000999,
-             0.001002,
-             0.001007,
-             0.001012,
-             0.001017,
-             0.001023,
-             0.00103,
-             0.001037,
-             0.001045,
-             0.001054,
-             0.001063,
-             0.001072,
-             0.001083,
-             0.001094,
-             0.001105,
-             0.001118,
-             0.001131,
-             0.001146,
-             0.001161,
-             0.001178,
-             0.001196,
-             0.001216,
-             0.001237,
-             0.001261,
-             0.001287,
-             0.001316,
-             0.001349,
-             0.001388,
-             0.001434,
-             0.00149,
-             0.001546],
-            [0.000993,
-             0.000995,
-             0.000998,
-             0.001001,
-             0.001006,
-             0.001011,
-             0.001016,
-             0.001022,
-             0.001029,
-             0.001036,
-             0.001044,
-             0.001052,
-             0.001061,
-             0.001071,
-             0.001081,
-             0.001092,
-             0.001104,
-             0.001116,
-             0.001129,
-             0.001144,
-             0.001159,
-             0.001175,
-             0.001193,
-             0.001212,
-             0.001233,
-             0.001256,
-             0.001281,
-             0.00131,
-             0.001342,
-             0.001378,
-             0.001421,
-             0.001473,
-             0.001539,
-             0.001631,
-             0.001657],
-            [0.000992,
-             0.000994,
-             0.000997,
-             0.001,
-             0.001005,
-             0.001009,
-             0.001015,
-             0.001021,
-             0.001028,
-             0.001035,
-             0.001043,
-             0.001051,
-             0.00106,
-             0.001069,
-             0.001079,
-             0.00109,
-             0.001102,
-             0.001114,
-             0.001127,
-             0.001141,
-             0.001156,
-             0.001172,
-             0.00119,
-             0.001209,
-             0.001229,
-             0.001252,
-             0.001276,
-             0.001304,
-             0.001334,
-             0.001369,
-             0.00141,
-             0.001458,
-             0.001518,
-             0.001597,
-             0.001714,
-             0.001803],
-            [0.000991,
-             0.000993,
-             0.000996,
-             0.000999,
-             0.001003,
-             0.001008,
-             0.001014,
-             0.00102,
-             0.001027,
-             0.001034,
-             0.001041,
-             0.00105,
-             0.001058,
-             0.001068,
-             0.001078,
-             0.001089,
-             0.0011,
-             0.001112,
-             0.001125,
-             0.001139,
-             0.001154,
-             0.00117,
-             0.001187,
-             0.001205,
-             0.001225,
-             0.001247,
-             0.001271,
-             0.001298,
-             0.001328,
-             0.001361,
-             0.0014,
-             0.001445,
-             0.0015,
-             0.001569,
-             0.001665,
-             0.001825,
-             0.00204],
-            [0.000989,
-             0.000991,
-             0.000994,
-             0.000997,
-             0.001001,
-             0.001006,
-             0.001012,
-             0.001018,
-             0.001024,
-             0.001031,
-             0.001039,
-             0.001047,
-             0.001056,
-             0.001065,
-             0.001075,
-             0.001085,
-             0.001097,
-             0.001108,
-             0.001121,
-             0.001135,
-             0.001149,
-             0.001164,
-             0.001181,
-             0.001199,
-             0.001218,
-             0.001239,
-             0.001262,
-             0.001287,
-             0.001315,
-             0.001346,
-             0.001381,
-             0.001421,
-             0.001469,
-             0.001526,
-             0.001599,
-             0.001697,
-             0.00185,
-             0.002218],
-            [0.000987,
-             0.000989,
-             0.000992,
-             0.000995,
-             0.000999,
-             0.001004,
-             0.00101,
-             0.001016,
-             0.001022,
-             0.001029,
-             0.001037,
-             0.001045,
-             0.001053,
-             0.001062,
-             0.001072,
-             0.001082,
-             0.001093,
-             0.001105,
-             0.001117,
-             0.00113,
-             0.001144,
-             0.001159,
-             0.001176,
-             0.001193,
-             0.001211,
-             0.001231,
-             0.001253,
-             0.001277,
-             0.001303,
-             0.001332,
-             0.001365,
-             0.001401,
-             0.001444,
-             0.001493,
-             0.001553,
-             0.001628,
-             0.001727,
-             0.001873,
-             0.002133,
-             0.002798,
-             0.003981,
-             0.00492,
-             0.005637,
-             0.006227,
-             0.006737],
-            [0.000984,
-             0.000987,
-             0.000989,
-             0.000993,
-             0.000997,
-             0.001002,
-             0.001007,
-             0.001013,
-             0.00102,
-             0.001027,
-             0.001034,
-             0.001042,
-             0.001051,
-             0.00106,
-             0.001069,
-             0.001079,
-             0.00109,
-             0.001101,
-             0.001113,
-             0.001126,
-             0.00114,
-             0.001155,
-             0.00117,
-             0.001187,
-             0.001205,
-             0.001224,
-             0.001245,
-             0.001268,
-             0.001292,
-             0.00132,
-             0.00135,
-             0.001384,
-             0.001422,
-             0.001466,
-             0.001517,
-             0.001579,
-             0.001655,
-             0.001755,
-             0.001893,
-             0.002105,
-             0.002475,
-             0.003084,
-             0.00378,
-             0.004412,
-             0.004957],
-            [0.000982,
-             0.000984,
-             0.000987,
-             0.000991,
-             0.000995,
-             0.001,
-             0.001005,
-             0.001011,
-             0.001018,
-             0.001024,
-             0.001032,
-             0.00104,
-             0.001048,
-             0.001057,
-             0.001066,
-             0.001076,
-             0.001087,
-             0.001098,
-             0.00111,
-             0.001122,
-             0.001136,
-             0.00115,
-             0.001165,
-             0.001181,
-             0.001199,
-             0.001217,
-             0.001237,
-             0.001259,
-             0.001283,
-             0.001308,
-             0.001337,
-             0.001368,
-             0.001403,
-             0.001443,
-             0.001488,
-             0.001541,
-             0.001605,
-             0.001682,
-             0.00178,
-             0.001911,
-             0.002093,
-             0.00236,
-             0.002744,
-             0.003209,
-             0.003691],
-            [0.00098,
-             0.000982,
-             0.000985,
-             0.000989,
-             0.000993,
-             0.000998,
-             0.001003,
-             0.001009,
-             0.001016,
-             0.001022,
-             0.00103,
-             0.001037,
-             0.001046,
-             0.001054,
-             0.001064,
-             0.001073,
-             0.001084,
-             0.001095,
-             0.001106,
-             0.001119,
-             0.001132,
-             0.001146,
-             0.00116,
-             0.001176,
-             0.001193,
-             0.001211,
-             0.00123,
-             0.001251,
-             0.001273,
-             0.001298,
-             0.001324,
-             0.001354,
-             0.001386,
-             0.001423,
-             0.001464,
-             0.001511,
-             0.001565,
-             0.001629,
-             0.001707,
-             0.001803,
-             0.001927,
-             0.002088,
-             0.002302,
-             0.002581,
-             0.002915],
-            [0.000978,
-             0.00098,
-             0.000983,
-             0.000987,
-             0.000991,
-             0.000996,
-             0.001001,
-             0.001007,
-             0.001013,
-             0.00102,
-             0.001027,
-             0.001035,
-             0.001043,
-             0.001052,
-             0.001061,
-             0.00107,
-             0.001081,
-             0.001091,
-             0.001103,
-             0.001115,
-             0.001128,
-             0.001141,
-             0.001156,
-             0.001171,
-             0.001187,
-             0.001204,
-             0.001223,
-             0.001243,
-             0.001265,
-             0.001288,
-             0.001313,
-             0.001341,
-             0.001371,
-             0.001405,
-             0.001442,
-             0.001485,
-             0.001533,
-             0.001588,
-             0.001653,
-             0.001731,
-             0.001825,
-             0.001941,
-             0.002086,
-             0.002266,
-             0.002487],
-            [0.000976,
-             0.000978,
-             0.000982,
-             0.000985,
-             0.000989,
-             0.000994,
-             0.000999,
-             0.001005,
-             0.001011,
-             0.001018,
-             0.001025,
-             0.001033,
-             0.001041,
-             0.001049,
-             0.001058,
-             0.001068,
-             0.001078,
-             0.001088,
-             0.001099,
-             0.001111,
-             0.001124,
-             0.001137,
-             0.001151,
-             0.001166,
-             0.001182,
-             0.001199,
-             0.001216,
-             0.001236,
-             0.001256,
-             0.001279,
-             0.001303,
-             0.001329,
-             0.001358,
-             0.001389,
-             0.001424,
-             0.001462,
-             0.001506,
-             0.001555,
-             0.001611,
-             0.001676,
-             0.001753,
-             0.001844,
-             0.001954,
-             0.002085,
-             0.002242]],
- 's_by_P': [[0.151042,
-             0.29638,
-             0.436604,
-             0.57221,
-             0.703583,
-             0.831038,
-             0.954853,
-             1.0753,
-             1.1926,
-             1.3069,
-             1.4185,
-             1.5276,
-             1.6344,
-             1.7391,
-             1.8418,
-             1.8604],
-            [0.151019,
-             0.296328,
-             0.436527,
-             0.572113,
-             0.703467,
-             0.830905,
-             0.954703,
-             1.0751,
-             1.1924,
-             1.3067,
-             1.4183,
-             1.5274,
-             1.6342,
-             1.7388,
-             1.8415,
-             1.9424,
-             2.0195],
-            [0.150997,
-             0.296276,
-             0.436451,
-             0.572016,
-             0.703351,
-             0.830772,
-             0.954554,
-             1.075,
-             1.1922,
-             1.3065,
-             1.4181,
-             1.5272,
-             1.6339,
-             1.7386,
-             1.8412,
-             1.9421,
-             2.0414,
-             2.1381],
-            [0.150974,
-             0.296224,
-             0.436375,
-             0.571919,
-             0.703235,
-             0.830639,
-             0.954405,
-             1.0748,
-             1.192,
-             1.3063,
-             1.4179,
-             1.527,
-             1.6337,
-             1.7383,
-             1.8409,
-             1.9418,
-             2.0411,
-             2.1389,
-             2.2337],
-            [0.150952,
-             0.296172,
-             0.436298,
-             0.571822,
-             0.70312,
-             0.830506,
-             0.954256,
-             1.0746,
-             1.1918,
-             1.3061,
-             1.4177,
-             1.5267,
-             1.6334,
-             1.738,
-             1.8407,
-             1.9415,
-             2.0407,
-             2.1386,
-             2.2351,
-             2.3143],
-            [0.150929,
-             0.296119,
-             0.436222,
-             0.571725,
-             0.703004,
-             0.830373,
-             0.954107,
-             1.0745,
-             1.1917,
-             1.3059,
-             1.4175,
-             1.5265,
-             1.6332,
-             1.7378,
-             1.8404,
-             1.9412,
-             2.0404,
-             2.1382,
-             2.2348,
-             2.3302,
-             2.3845],
-            [0.150906,
-             0.296067,
-             0.436146,
-             0.571627,
-             0.702888,
-             0.830241,
-             0.953959,
-             1.0743,
-             1.1915,
-             1.3057,
-             1.4173,
-             1.5263,
-             1.633,
-             1.7375,
-             1.8401,
-             1.9409,
-             2.0401,
-             2.1379,
-             2.2344,
-             2.3298,
-             2.4244,
-             2.4468],
-            [0.150859,
-             0.295962,
-             0.435992,
-             0.571433,
-             0.702657,
-             0.829975,
-             0.953661,
-             1.074,
-             1.1911,
-             1.3053,
-             1.4168,
-             1.5258,
-             1.6325,
-             1.737,
-             1.8395,
-             1.9403,
-             2.0395,
-             2.1372,
-             2.2337,
-             2.329,
-             2.4235,
-             2.5173,
-             2.5543],
-            [0.150812,
-             0.295857,
-             0.435839,
-             0.571239,
-             0.702426,
-             0.82971,
-             0.953364,
-             1.0736,
-             1.1908,
-             1.305,
-             1.4164,
-             1.5254,
-             1.632,
-             1.7365,
-             1.839,
-             1.9397,
-             2.0388,
-             2.1365,
-             2.2329,
-             2.3282,
-             2.4227,
-             2.5164,
-             2.6097,
-             2.6455],
-            [0.150764,
-             0.295751,
-             0.435686,
-             0.571044,
-             0.702195,
-             0.829445,
-             0.953067,
-             1.0733,
-             1.1904,
-             1.3046,
-             1.416,
-             1.5249,
-             1.6315,
-             1.736,
-             1.8384,
-             1.9391,
-             2.0382,
-             2.1358,
-             2.2322,
-             2.3275,
-             2.4218,
-             2.5155,
-             2.6087,
-             2.7016,
-             2.7254],
-            [0.150716,
-             0.295645,
-             0.435532,
-             0.57085,
-             0.701964,
-             0.829181,
-             0.952771,
-             1.073,
-             1.19,
-             1.3042,
-             1.4156,
-             1.5245,
-             1.631,
-             1.7354,
-             1.8379,
-             1.9385,
-             2.0376,
-             2.1352,
-             2.2315,
-             2.3267,
-             2.421,
-             2.5146,
-             2.6077,
-             2.7005,
-             2.7935,
-             2.7968],
-            [0.150667,
-             0.295538,
-             0.435379,
-             0.570655,
-             0.701733,
-             0.828916,
-             0.952474,
-             1.0727,
-             1.1897,
-             1.3038,
-             1.4152,
-             1.524,
-             1.6305,
-             1.7349,
-             1.8373,
-             1.9379,
-             2.0369,
-             2.1345,
-             2.2307,
-             2.3259,
-             2.4201,
-             2.5136,
-             2.6067,
-             2.6994,
-             2.7922,
-             2.8615],
-            [0.150618,
-             0.295431,
-             0.435225,
-             0.570461,
-             0.701502,
-             0.952178,
-             0.828652,
-             1.0723,
-             1.1893,
-             1.3034,
-             1.4147,
-             1.5236,
-             1.6301,
-             1.7344,
-             1.8368,
-             1.9374,
-             2.0363,
-             2.1338,
-             2.23,
-             2.3251,
-             2.4193,
-             2.5127,
-             2.6057,
-             2.6983,
-             2.791,
-             2.8841,
-             2.921],
-            [0.150517,
-             0.295217,
-             0.434916,
-             0.570072,
-             0.70104,
-             0.828123,
-             0.951587,
-             1.0717,
-             1.1886,
-             1.3026,
-             1.4139,
-             1.5227,
-             1.6291,
-             1.7334,
-             1.8357,
-             1.9362,
-             2.0351,
-             2.1325,
-             2.2286,
-             2.3235,
-             2.4176,
-             2.5109,
-             2.6037,
-             2.6961,
-             2.7886,
-             2.8814,
-             2.975,
-             3.0278],
-            [0.150414,
-             0.295001,
-             0.434607,
-             0.569682,
-             0.700579,
-             0.827596,
-             0.950997,
-             1.071,
-             1.1879,
-             1.3019,
-             1.4131,
-             1.5218,
-             1.6282,
-             1.7324,
-             1.8346,
-             1.935,
-             2.0338,
-             2.1311,
-             2.2271,
-             2.322,
-             2.4159,
-             2.5091,
-             2.6017,
-             2.694,
-             2.7862,
-             2.8788,
-             2.972,
-             3.0665,
-             3.1224],
-            [0.150309,
-             0.294784,
-             0.434298,
-             0.569293,
-             0.700118,
-             0.827069,
-             0.950407,
-             1.0704,
-             1.1872,
-             1.3011,
-             1.4123,
-             1.5209,
-             1.6272,
-             1.7313,
-             1.8335,
-             1.9339,
-             2.0326,
-             2.1298,
-             2.2257,
-             2.3205,
-             2.4143,
-             2.5073,
-             2.5997,
-             2.6919,
-             2.7839,
-             2.8761,
-             2.969,
-             3.0631,
-             3.159,
-             3.2081],
-            [0.150202,
-             0.294565,
-             0.433988,
-             0.568903,
-             0.699658,
-             0.826543,
-             0.949819,
-             1.0697,
-             1.1865,
-             1.3003,
-             1.4114,
-             1.52,
-             1.6263,
-             1.7303,
-             1.8324,
-             1.9327,
-             2.0313,
-             2.1285,
-             2.2243,
-             2.3189,
-             2.4126,
-             2.5055,
-             2.5978,
-             2.6897,
-             2.7815,
-             2.8736,
-             2.9661,
-             3.0598,
-             3.1552,
-             3.2533,
-             3.287],
-            [0.150092,
-             0.294345,
-             0.433677,
-             0.568514,
-             0.699197,
-             0.826017,
-             0.949232,
-             1.0691,
-             1.1858,
-             1.2996,
-             1.4106,
-             1.5191,
-             1.6253,
-             1.7293,
-             1.8313,
-             1.9315,
-             2.0301,
-             2.1271,
-             2.2229,
-             2.3174,
-             2.411,
-             2.5037,
-             2.5959,
-             2.6876,
-             2.7792,
-             2.871,
-             2.9633,
-             3.0565,
-             3.1514,
-             3.2488,
-             3.3502,
-             3.3606],
-            [0.149808,
-             0.29379,
-             0.432897,
-             0.567539,
-             0.698048,
-             0.824706,
-             0.947768,
-             1.0675,
-             1.184,
-             1.2977,
-             1.4086,
-             1.5169,
-             1.623,
-             1.7268,
-             1.8287,
-             1.9287,
-             2.027,
-             2.1239,
-             2.2194,
-             2.3137,
-             2.4069,
-             2.4994,
-             2.5911,
-             2.6825,
-             2.7736,
-             2.8647,
-             2.9562,
-             3.0486,
-             3.1423,
-             3.238,
-             3.3371,
-             3.4415,
-             3.529],
-            [0.149511,
-             0.293226,
-             0.432112,
-             0.566564,
-             0.6969,
-             0.8234,
-             0.946311,
-             1.0659,
-             1.1823,
-             1.2958,
-             1.4065,
-             1.5148,
-             1.6206,
-             1.7243,
-             1.826,
-             1.9259,
-             2.024,
-             2.1206,
-             2.2159,
-             2.31,
-             2.403,
-             2.4951,
-             2.5865,
-             2.6774,
-             2.768,
-             2.8586,
-             2.9495,
-             3.0409,
-             3.1335,
-             3.2279,
-             3.325,
-             3.4263,
-             3.5345,
-             3.6555,
-             3.6846],
-            [0.1492,
-             0.292654,
-             0.431324,
-             0.565587,
-             0.695755,
-             0.822097,
-             0.94486,
-             1.0643,
-             1.1805,
-             1.2939,
-             1.4045,
-             1.5126,
-             1.6183,
-             1.7219,
-             1.8234,
-             1.923,
-             2.021,
-             2.1175,
-             2.2125,
-             2.3063,
-             2.399,
-             2.4909,
-             2.5819,
-             2.6724,
-             2.7626,
-             2.8527,
-             2.9429,
-             3.0336,
-             3.1252,
-             3.2183,
-             3.3136,
-             3.4124,
-             3.5166,
-             3.63,
-             3.7622,
-             3.8394],
-            [0.148875,
-             0.292075,
-             0.430532,
-             0.56461,
-             0.694611,
-             0.820799,
-             0.943415,
-             1.0627,
-             1.1788,
-             1.292,
-             1.4025,
-             1.5105,
-             1.616,
-             1.7194,
-             1.8208,
-             1.9203,
-             2.0181,
-             2.1143,
-             2.2091,
-             2.3027,
-             2.3952,
-             2.4867,
-             2.5774,
-             2.6676,
-             2.7573,
-             2.8469,
-             2.9365,
-             3.0265,
-             3.1172,
-             3.2091,
-             3.3029,
-             3.3996,
-             3.5006,
-             3.6086,
-             3.729,
-             3.8787,
-             4.0156],
-            [0.148187,
-             0.290892,
-             0.428936,
-             0.562653,
-             0.692327,
-             0.818213,
-             0.940542,
-             1.0595,
-             1.1754,
-             1.2883,
-             1.3986,
-             1.5062,
-             1.6115,
-             1.7146,
-             1.8156,
-             1.9148,
-             2.0122,
-             2.1081,
-             2.2025,
-             2.2956,
-             2.3876,
-             2.4786,
-             2.5687,
-             2.6582,
-             2.7471,
-             2.8357,
-             2.9242,
-             3.0129,
-             3.102,
-             3.1919,
-             3.2832,
-             3.3764,
-             3.4726,
-             3.5731,
-             3.6804,
-             3.7993,
-             3.9423,
-             4.1671],
-            [0.147448,
-             0.289679,
-             0.427324,
-             0.560692,
-             0.69005,
-             0.815641,
-             0.937692,
-             1.0564,
-             1.172,
-             1.2847,
-             1.3946,
-             1.502,
-             1.607,
-             1.7098,
-             1.8106,
-             1.9094,
-             2.0065,
-             2.102,
-             2.1961,
-             2.2888,
-             2.3803,
-             2.4707,
-             2.5603,
-             2.6491,
-             2.7373,
-             2.825,
-             2.9126,
-             3.0001,
-             3.0878,
-             3.176,
-             3.2652,
-             3.3557,
-             3.4483,
-             3.5438,
-             3.6436,
-             3.7498,
-             3.8666,
-             4.0025,
-             4.1804,
-             4.4757,
-             4.8336,
-             5.0627,
-             5.22,
-             5.3416,
-             5.4421],
-            [0.14666,
-             0.288436,
-             0.425697,
-             0.558727,
-             0.687779,
-             0.813084,
-             0.934863,
-             1.0533,
-             1.1687,
-             1.2811,
-             1.3908,
-             1.4979,
-             1.6027,
-             1.7052,
-             1.8056,
-             1.9042,
-             2.0009,
-             2.0961,
-             2.1897,
-             2.282,
-             2.3731,
-             2.4631,
-             2.5521,
-             2.6403,
-             2.7278,
-             2.8148,
-             2.9014,
-             2.9879,
-             3.0744,
-             3.1612,
-             3.2486,
-             3.337,
-             3.4268,
-             3.5186,
-             3.6132,
-             3.712,
-             3.8168,
-             3.9308,
-             4.0599,
-             4.2143,
-             4.4138,
-             4.6579,
-             4.8809,
-             5.0564,
-             5.1945],
-            [0.145825,
-             0.287163,
-             0.424055,
-             0.556758,
-             0.685513,
-             0.810541,
-             0.932055,
-             1.0503,
-             1.1654,
-             1.2775,
-             1.387,
-             1.4938,
-             1.5983,
-             1.7006,
-             1.8008,
-             1.899,
-             1.9955,
-             2.0903,
-             2.1836,
-             2.2755,
-             2.3661,
-             2.4556,
-             2.5442,
-             2.6318,
-             2.7187,
-             2.805,
-             2.8908,
-             2.9764,
-             3.0618,
-             3.1473,
-             3.2332,
-             3.3198,
-             3.4073,
-             3.4962,
-             3.5871,
-             3.6808,
-             3.7783,
-             3.8813,
-             3.9921,
-             4.1145,
-             4.2533,
-             4.4144,
-             4.5979,
-             4.781,
-             4.9448],
-            [0.144943,
-             0.285863,
-             0.422398,
-             0.554786,
-             0.683252,
-             0.80801,
-             0.929267,
-             1.0472,
-             1.1621,
-             1.274,
-             1.3832,
-             1.4898,
-             1.5941,
-             1.696,
-             1.796,
-             1.8939,
-             1.9901,
-             2.0846,
-             2.1775,
-             2.2691,
-             2.3593,
-             2.4484,
-             2.5364,
-             2.6236,
-             2.7099,
-             2.7955,
-             2.8806,
-             2.9653,
-             3.0498,
-             3.1342,
-             3.2188,
-             3.3038,
-             3.3894,
-             3.476,
-             3.564,
-             3.6539,
-             3.7464,
-             3.8425,
-             3.9433,
-             4.0507,
-             4.1667,
-             4.2937,
-             4.4331,
-             4.5839,
-             4.7367],
-            [0.144017,
-             0.284535,
-             0.420727,
-             0.55281,
-             0.680995,
-             0.805491,
-             0.926498,
-             1.0442,
-             1.1588,
-             1.2705,
-             1.3795,
-             1.4859,
-             1.5898,
-             1.6916,
-             1.7912,
-             1.8889,
-             1.9848,
-             2.079,
-             2.1716,
-             2.2628,
-             2.3527,
-             2.4414,
-             2.5289,
-             2.6156,
-             2.7013,
-             2.7864,
-             2.8708,
-             2.9547,
-             3.0383,
-             3.1218,
-             3.2052,
-             3.2888,
-             3.3728,
-             3.4575,
-             3.5431,
-             3.6301,
-             3.7189,
-             3.8101,
-             3.9045,
-             4.0029,
-             4.1066,
-             4.2168,
-             4.3342,
-             4.4589,
-             4.5896],
-            [0.143048,
-             0.283181,
-             0.419042,
-             0.550829,
-             0.678744,
-             0.802985,
-             0.923747,
-             1.0412,
-             1.1556,
-             1.2671,
-             1.3758,
-             1.4819,
-             1.5857,
-             1.6872,
-             1.7866,
-             1.884,
-             1.9796,
-             2.0735,
-             2.1658,
-             2.2567,
-             2.3462,
-             2.4345,
-             2.5216,
-             2.6078,
-             2.693,
-             2.7775,
-             2.8613,
-             2.9446,
-             3.0274,
-             3.1099,
-             3.1923,
-             3.2748,
-             3.3574,
-             3.4404,
-             3.5241,
-             3.6087,
-             3.6946,
-             3.7822,
-             3.8719,
-             3.9643,
-             4.0602,
-             4.1602,
-             4.2649,
-             4.3744,
-             4.4882]]}
+COMP = {
+    'P': (500.0,750.0,1000.0,1250.0,1500.0,1750.0,2000.0,2500.0,3000.0,3500.0,4000.0,4500.0,5000.0,6000.0,7000.0,8000.0,9000.0,10000.0,12500.0,15000.0,17500.0,20000.0,25000.0,30000.0,35000.0,40000.0,45000.0,50000.0,55000.0),
+    'T_by_P': (
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,151.83),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,167.75),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,179.88),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,189.81),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,198.29),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,205.73),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,212.38),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,223.95),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,233.85),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,242.56),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,250.35),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,257.44),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,263.94),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,275.58),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,285.83),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,295.01),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,303.34),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,311.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,327.81),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,342.16),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,354.67),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,365.75),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0,390.0,400.0,410.0,420.0,430.0,440.0,450.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0,390.0,400.0,410.0,420.0,430.0,440.0,450.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0,390.0,400.0,410.0,420.0,430.0,440.0,450.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0,390.0,400.0,410.0,420.0,430.0,440.0,450.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0,390.0,400.0,410.0,420.0,430.0,440.0,450.0),
+        (10.0,20.0,30.0,40.0,50.0,60.0,70.0,80.0,90.0,100.0,110.0,120.0,130.0,140.0,150.0,160.0,170.0,180.0,190.0,200.0,210.0,220.0,230.0,240.0,250.0,260.0,270.0,280.0,290.0,300.0,310.0,320.0,330.0,340.0,350.0,360.0,370.0,380.0,390.0,400.0,410.0,420.0,430.0,440.0,450.0),
+    ),
+    'u_by_P': (
+        (42.008,83.882,125.68,167.47,209.26,251.08,292.94,334.86,376.85,418.94,461.15,503.49,546.0,588.71,631.65,639.54),
+        (42.001,83.866,125.66,167.44,209.22,251.03,292.89,334.8,376.79,418.87,461.07,503.4,545.91,588.6,631.53,674.72,708.4),
+        (41.995,83.851,125.64,167.41,209.18,250.99,292.84,334.74,376.72,418.8,460.99,503.32,545.81,588.5,631.41,674.59,718.08,761.39),
+        (41.989,83.836,125.61,167.37,209.14,250.94,292.78,334.68,376.66,418.73,460.91,503.23,545.71,588.39,631.29,674.47,717.94,761.77,805.16),
+        (41.983,83.821,125.59,167.34,209.11,250.9,292.73,334.63,376.59,418.65,460.83,503.14,545.61,588.28,631.18,674.34,717.8,761.61,805.83,842.83),
+        (41.976,83.806,125.57,167.31,209.07,250.85,292.68,334.57,376.53,418.58,460.75,503.05,545.51,588.17,631.06,674.21,717.66,761.46,805.66,850.33,876.13),
+        (41.97,83.791,125.55,167.28,209.03,250.81,292.63,334.51,376.46,418.51,460.67,502.96,545.42,588.07,630.94,674.08,717.52,761.3,805.49,850.14,895.32,906.14),
+        (41.957,83.76,125.5,167.22,208.96,250.72,292.53,334.39,376.33,418.36,460.51,502.78,545.22,587.85,630.71,673.82,717.24,760.99,805.15,849.76,894.9,940.65,958.91),
+        (41.945,83.73,125.45,167.16,208.88,250.63,292.43,334.28,376.2,418.22,460.35,502.61,545.03,587.64,630.47,673.57,716.95,760.69,804.81,849.39,894.49,940.2,986.6,1004.7),
+        (41.932,83.7,125.41,167.1,208.81,250.55,292.33,334.16,376.07,418.07,460.19,502.43,544.83,587.43,630.24,673.31,716.67,760.38,804.47,849.02,894.08,939.74,986.09,1033.3,1045.5),
+        (41.919,83.67,125.36,167.04,208.74,250.46,292.23,334.05,375.95,417.93,460.03,502.25,544.64,587.22,630.01,673.06,716.4,760.07,804.14,848.65,893.67,939.29,985.59,1032.7,1080.8,1082.5),
+        (41.906,83.639,125.32,166.98,208.66,250.37,292.13,333.94,375.82,417.79,459.87,502.08,544.45,587.0,629.78,672.8,716.12,759.77,803.8,848.28,893.27,938.84,985.09,1032.1,1080.1,1116.5),
+        (41.893,83.609,125.27,166.92,208.59,250.29,292.03,333.82,375.69,417.64,459.71,501.9,544.26,586.79,629.55,672.55,715.84,759.46,803.47,847.91,892.86,938.39,984.59,1031.6,1079.5,1128.5,1148.2),
+        (41.868,83.549,125.18,166.8,208.44,250.11,291.82,333.59,375.43,417.36,459.39,501.56,543.87,586.37,629.08,672.04,715.29,758.86,802.81,847.18,892.05,937.49,983.6,1030.5,1078.2,1127.1,1177.3,1206.0),
+        (41.841,83.488,125.09,166.68,208.3,249.94,291.63,333.37,375.18,417.08,459.08,501.21,543.49,585.95,628.63,671.54,714.74,758.26,802.15,846.46,891.25,936.61,982.61,1029.4,1077.0,1125.7,1175.7,1227.2,1258.2),
+        (41.815,83.428,125.0,166.57,208.15,249.77,291.43,333.14,374.92,416.79,458.77,500.86,543.11,585.54,628.17,671.04,714.19,757.66,801.49,845.74,890.46,935.73,981.64,1028.3,1075.8,1124.3,1174.1,1225.4,1278.6,1306.2),
+        (41.789,83.368,124.91,166.45,208.01,249.6,291.23,332.92,374.67,416.51,458.45,500.52,542.74,585.13,627.72,670.55,713.65,757.07,800.84,845.02,889.67,934.86,980.68,1027.2,1074.6,1123.0,1172.5,1223.6,1276.5,1331.9,1351.1),
+        (41.762,83.308,124.82,166.33,207.86,249.42,291.03,332.69,374.42,416.23,458.14,500.18,542.36,584.71,627.27,670.06,713.11,756.48,800.19,844.31,888.89,934.0,979.72,1026.1,1073.4,1121.6,1171.0,1221.8,1274.4,1329.4,1387.5,1393.5),
+        (41.695,83.157,124.59,166.04,207.5,249.0,290.54,332.14,373.8,415.54,457.37,499.33,541.43,583.69,626.15,668.84,711.78,755.02,798.6,842.56,886.97,931.88,977.37,1023.5,1070.5,1118.3,1167.2,1217.5,1269.4,1323.3,1380.0,1440.7,1492.3),
+        (41.626,83.007,124.37,165.75,207.15,248.58,290.06,331.59,373.18,414.85,456.61,498.49,540.51,582.69,625.05,667.63,710.46,753.58,797.03,840.84,885.08,929.8,975.08,1021.0,1067.6,1115.1,1163.6,1213.4,1264.6,1317.6,1373.1,1431.9,1495.7,1567.9,1585.3),
+        (41.557,82.857,124.15,165.46,206.79,248.16,289.58,331.04,372.57,414.17,455.86,497.67,539.6,581.69,623.96,666.45,709.17,752.17,795.48,839.15,883.23,927.76,972.83,1018.5,1064.9,1112.0,1160.1,1209.4,1260.0,1312.3,1366.7,1423.9,1485.2,1552.8,1632.5,1679.2),
+        (41.486,82.708,123.93,165.17,206.44,247.75,289.1,330.5,371.96,413.5,455.12,496.85,538.7,580.71,622.89,665.27,707.89,750.77,793.96,837.49,881.41,925.77,970.63,1016.1,1062.2,1109.0,1156.8,1205.5,1255.6,1307.1,1360.6,1416.6,1475.9,1540.2,1612.7,1703.6,1786.4),
+        (41.341,82.409,123.49,164.61,205.75,246.94,288.16,329.44,370.77,412.17,453.65,495.24,536.94,578.78,620.78,662.98,705.39,748.05,790.99,834.24,877.86,921.88,966.37,1011.4,1057.0,1103.2,1150.3,1198.3,1247.3,1297.6,1349.5,1403.4,1459.7,1519.4,1583.9,1656.2,1743.6,1880.3),
+        (41.193,82.112,123.06,164.05,205.07,246.14,287.24,328.4,369.6,410.87,452.22,493.66,535.21,576.89,618.73,660.74,702.95,745.4,788.1,831.1,874.44,918.14,962.27,1006.9,1052.0,1097.8,1144.2,1191.5,1239.6,1288.9,1339.5,1391.6,1445.7,1502.3,1562.2,1626.7,1698.3,1782.0,1891.3,2068.9,2276.0,2405.3,2493.7,2562.1,2618.9),
+        (41.04,81.815,122.63,163.5,204.4,245.35,286.34,327.37,368.46,409.6,450.82,492.12,533.53,575.05,616.72,658.56,700.58,742.82,785.3,828.06,871.12,914.53,958.33,1002.6,1047.3,1092.5,1138.4,1185.1,1232.5,1280.8,1330.3,1381.1,1433.4,1487.7,1544.5,1604.4,1668.6,1739.0,1819.1,1914.9,2037.3,2184.0,2315.3,2417.3,2497.5),
+        (40.883,81.52,122.21,162.96,203.75,244.58,285.45,326.37,367.33,408.35,449.44,490.61,531.88,573.25,614.77,656.43,698.27,740.31,782.58,825.1,867.91,911.04,954.52,998.41,1042.7,1087.6,1133.0,1179.0,1225.7,1273.3,1321.8,1371.5,1422.4,1474.9,1529.3,1586.0,1645.7,1709.4,1778.4,1854.9,1941.8,2042.0,2154.8,2265.8,2364.2),
+        (40.723,81.225,121.79,162.42,203.1,243.82,284.58,325.39,366.23,407.13,448.1,489.13,530.26,571.49,612.85,654.35,696.02,737.87,779.93,822.23,864.8,907.66,950.85,994.41,1038.4,1082.8,1127.7,1173.2,1219.4,1266.2,1313.9,1362.6,1412.3,1463.4,1515.9,1570.3,1626.9,1686.2,1749.1,1816.5,1889.7,1969.8,2057.5,2151.7,2246.4),
+        (40.559,80.931,121.38,161.9,202.46,243.08,283.73,324.42,365.15,405.93,446.77,487.69,528.68,569.77,610.98,652.32,693.82,735.49,777.36,819.45,861.78,904.39,947.3,990.55,1034.2,1078.2,1122.7,1167.7,1213.3,1259.6,1306.5,1354.3,1403.1,1452.9,1503.9,1556.5,1610.7,1667.1,1725.9,1787.8,1853.5,1923.5,1998.2,2077.5,2160.3),
+        (40.392,80.637,120.97,161.38,201.84,242.34,282.89,323.47,364.09,404.76,445.48,486.27,527.13,568.09,609.15,650.34,691.67,733.17,774.85,816.73,858.84,901.21,943.86,986.82,1030.1,1073.8,1117.9,1162.5,1207.6,1253.3,1299.6,1346.6,1394.5,1443.2,1493.1,1544.1,1596.5,1650.6,1706.5,1764.7,1825.5,1889.3,1956.4,2026.7,2099.8),
+    ),
+    'h_by_P': (
+        (42.508,84.382,126.19,167.97,209.76,251.58,293.45,335.37,377.37,419.47,461.67,504.02,546.54,589.25,632.19,640.09),
+        (42.751,84.618,126.41,168.19,209.98,251.79,293.65,335.57,377.57,419.65,461.86,504.2,546.71,589.41,632.35,675.55,709.24),
+        (42.995,84.853,126.64,168.41,210.19,252.0,293.86,335.77,377.76,419.84,462.04,504.38,546.88,589.58,632.5,675.7,719.2,762.52),
+        (43.239,85.088,126.87,168.63,210.41,252.21,294.06,335.97,377.95,420.03,462.22,504.55,547.05,589.74,632.66,675.84,719.33,763.18,806.58),
+        (43.482,85.323,127.1,168.86,210.62,252.42,294.27,336.17,378.15,420.22,462.4,504.73,547.22,589.9,632.81,675.99,719.47,763.3,807.54,844.56),
+        (43.725,85.558,127.33,169.08,210.84,252.63,294.47,336.37,378.34,420.4,462.58,504.9,547.39,590.06,632.97,676.13,719.61,763.43,807.66,852.35,878.17),
+        (43.969,85.793,127.55,169.3,211.06,252.84,294.68,336.57,378.53,420.59,462.77,505.08,547.55,590.22,633.12,676.28,719.74,763.56,807.77,852.45,897.66,908.5),
+        (44.455,86.262,128.01,169.74,211.49,253.26,295.08,336.96,378.92,420.97,463.13,505.43,547.89,590.55,633.43,676.57,720.02,763.81,808.0,852.65,897.83,943.63,961.91),
+        (44.941,86.732,128.46,170.18,211.92,253.68,295.49,337.36,379.31,421.34,463.5,505.78,548.23,590.87,633.74,676.87,720.29,764.06,808.23,852.86,898.01,943.76,990.23,1008.3),
+        (45.427,87.201,128.92,170.63,212.35,254.1,295.9,337.76,379.69,421.72,463.86,506.14,548.57,591.2,634.05,677.16,720.57,764.32,808.46,853.06,898.18,943.9,990.32,1037.6,1049.8),
+        (45.913,87.67,129.37,171.07,212.78,254.52,296.31,338.16,380.08,422.1,464.22,506.49,548.91,591.53,634.36,677.45,720.84,764.57,808.69,853.27,898.35,944.04,990.42,1037.6,1085.8,1087.5),
+        (46.398,88.138,129.83,171.51,213.21,254.94,296.72,338.56,380.47,422.47,464.59,506.84,549.25,591.85,634.67,677.75,721.12,764.83,808.93,853.47,898.53,944.18,990.52,1037.7,1085.8,1122.2),
+        (46.883,88.607,130.28,171.95,213.64,255.36,297.13,338.95,380.86,422.85,464.95,507.19,549.59,592.18,634.98,678.04,721.4,765.08,809.16,853.68,898.71,944.32,990.62,1037.7,1085.7,1134.9,1154.6),
+        (47.853,89.543,131.19,172.84,214.5,256.2,297.95,339.75,381.63,423.6,465.68,507.9,550.27,592.83,635.61,678.63,721.95,765.6,809.63,854.09,899.06,944.61,990.82,1037.8,1085.7,1134.7,1185.1,1213.9),
+        (48.821,90.479,132.1,173.72,215.36,257.04,298.76,340.55,382.41,424.36,466.41,508.61,550.95,593.48,636.23,679.22,722.51,766.11,810.1,854.51,899.42,944.9,991.04,1037.9,1085.7,1134.6,1184.8,1236.6,1267.7),
+        (49.788,91.414,133.01,174.6,216.22,257.88,299.58,341.34,383.18,425.11,467.15,509.31,551.63,594.14,636.86,679.82,723.06,766.63,810.57,854.94,899.79,945.2,991.25,1038.1,1085.7,1134.5,1184.5,1236.0,1289.6,1317.3),
+        (50.754,92.348,133.91,175.48,217.08,258.71,300.4,342.14,383.96,425.86,467.88,510.02,552.32,594.79,637.48,680.41,723.62,767.15,811.05,855.37,900.16,945.5,991.48,1038.2,1085.8,1134.4,1184.2,1235.5,1288.8,1344.5,1363.9),
+        (51.719,93.281,134.82,176.36,217.94,259.55,301.21,342.94,384.73,426.62,468.61,510.73,553.0,595.45,638.11,681.01,724.18,767.68,811.53,855.8,900.53,945.81,991.71,1038.3,1085.8,1134.3,1183.9,1235.0,1288.0,1343.3,1402.0,1408.1),
+        (54.126,95.61,137.08,178.57,220.09,261.65,303.26,344.93,386.67,428.5,470.44,512.5,554.71,597.1,639.68,682.51,725.6,768.99,812.74,856.89,901.49,946.61,992.32,1038.7,1085.9,1134.1,1183.3,1233.9,1286.2,1340.7,1397.9,1459.3,1511.6),
+        (56.526,97.934,139.34,180.77,222.23,263.74,305.3,346.92,388.61,430.39,472.27,514.28,556.43,598.75,641.27,684.01,727.02,770.32,813.97,857.99,902.46,947.43,992.97,1039.2,1086.1,1134.0,1182.9,1233.0,1284.7,1338.3,1394.4,1454.0,1518.8,1592.4,1610.2),
+        (58.92,100.25,141.59,182.96,224.37,265.83,307.34,348.91,390.55,432.28,474.11,516.06,558.15,600.41,642.85,685.53,728.45,771.66,815.21,859.12,903.46,948.28,993.65,1039.6,1086.4,1133.9,1182.5,1232.2,1283.3,1336.2,1391.3,1449.5,1511.8,1580.8,1662.5,1710.8),
+        (61.307,102.57,143.84,185.16,226.51,267.92,309.38,350.9,392.49,434.17,475.94,517.84,559.87,602.07,644.45,687.05,729.89,773.02,816.46,860.27,904.48,949.16,994.37,1040.2,1086.7,1134.0,1182.2,1231.5,1282.1,1334.4,1388.6,1445.5,1505.9,1571.6,1646.0,1740.1,1827.2),
+        (66.062,107.18,148.33,189.53,230.79,272.09,313.46,354.88,396.38,437.95,479.63,521.41,563.33,605.41,647.66,690.11,732.8,775.76,819.02,862.61,906.59,951.0,995.89,1041.3,1087.4,1134.2,1181.9,1230.5,1280.2,1331.3,1384.1,1438.9,1496.4,1557.5,1623.9,1698.6,1789.8,1935.7),
+        (70.792,111.77,152.81,193.9,235.05,276.26,317.53,358.86,400.26,441.74,483.32,525.0,566.81,608.76,650.89,693.21,735.75,778.54,821.62,865.02,908.77,952.93,997.54,1042.7,1088.4,1134.7,1181.8,1229.8,1278.7,1328.9,1380.4,1433.7,1489.1,1547.1,1608.8,1675.6,1750.1,1838.2,1955.3,2152.8,2395.4,2552.9,2662.8,2748.9,2821.0),
+        (75.496,116.34,157.27,198.26,239.31,280.43,321.6,362.84,404.15,445.54,487.01,528.59,570.29,612.14,654.14,696.33,738.73,781.37,824.28,867.48,911.02,954.94,999.28,1044.1,1089.4,1135.4,1182.0,1229.4,1277.7,1327.0,1377.6,1429.5,1483.2,1539.1,1597.6,1659.6,1726.5,1800.4,1885.4,1988.6,2123.9,2291.9,2447.6,2571.8,2671.0),
+        (80.177,120.9,161.71,202.6,243.56,284.58,325.67,366.82,408.04,449.33,490.72,532.2,573.79,615.53,657.42,699.48,741.74,784.23,826.97,870.0,913.34,957.04,1001.1,1045.7,1090.7,1136.3,1182.4,1229.3,1277.0,1325.6,1375.3,1426.2,1478.5,1532.6,1588.8,1647.7,1709.9,1776.6,1849.6,1931.4,2025.5,2136.4,2264.5,2394.2,2511.8),
+        (84.834,125.44,166.14,206.93,247.8,288.74,329.74,370.8,411.93,453.14,494.42,535.81,577.31,618.93,660.71,702.65,744.78,787.13,829.72,872.57,915.72,959.21,1003.1,1047.3,1092.0,1137.3,1183.1,1229.5,1276.7,1324.6,1373.5,1423.5,1474.7,1527.4,1581.8,1638.3,1697.3,1759.6,1825.9,1897.7,1976.4,2063.7,2161.1,2267.9,2377.6),
+        (89.467,129.95,170.56,211.25,252.03,292.88,333.8,374.78,415.82,456.94,498.14,539.43,580.83,622.36,664.02,705.84,747.85,790.06,832.5,875.19,918.16,961.45,1005.1,1049.1,1093.5,1138.4,1183.9,1229.9,1276.6,1324.0,1372.2,1421.4,1471.6,1523.1,1576.1,1630.7,1687.4,1746.5,1808.6,1874.4,1944.7,2020.5,2102.5,2190.8,2284.7),
+        (94.079,134.45,174.96,215.56,256.26,297.02,337.86,378.75,419.72,460.75,501.86,543.06,584.37,625.79,667.35,709.06,750.94,793.02,835.32,877.85,920.65,963.75,1007.2,1050.9,1095.1,1139.7,1184.8,1230.5,1276.7,1323.6,1371.2,1419.7,1469.1,1519.6,1571.4,1624.5,1679.3,1736.1,1795.1,1856.9,1921.9,1990.7,2063.8,2141.4,2223.1),
+    ),
+    'v_by_P': (
+        (0.001,0.001002,0.001004,0.001008,0.001012,0.001017,0.001023,0.001029,0.001036,0.001043,0.001051,0.00106,0.00107,0.00108,0.00109,0.001093),
+        (0.001,0.001001,0.001004,0.001008,0.001012,0.001017,0.001022,0.001029,0.001036,0.001043,0.001051,0.00106,0.001069,0.00108,0.00109,0.001102,0.001111),
+        (0.001,0.001001,0.001004,0.001007,0.001012,0.001017,0.001022,0.001029,0.001036,0.001043,0.001051,0.00106,0.001069,0.001079,0.00109,0.001102,0.001114,0.001127),
+        (0.001,0.001001,0.001004,0.001007,0.001012,0.001017,0.001022,0.001028,0.001035,0.001043,0.001051,0.00106,0.001069,0.001079,0.00109,0.001102,0.001114,0.001127,0.001141),
+        (0.001,0.001001,0.001004,0.001007,0.001011,0.001016,0.001022,0.001028,0.001035,0.001043,0.001051,0.00106,0.001069,0.001079,0.00109,0.001101,0.001114,0.001127,0.001141,0.001154),
+        (0.001,0.001001,0.001004,0.001007,0.001011,0.001016,0.001022,0.001028,0.001035,0.001043,0.001051,0.001059,0.001069,0.001079,0.00109,0.001101,0.001114,0.001127,0.001141,0.001156,0.001166),
+        (0.000999,0.001001,0.001004,0.001007,0.001011,0.001016,0.001022,0.001028,0.001035,0.001042,0.001051,0.001059,0.001069,0.001079,0.001089,0.001101,0.001113,0.001127,0.001141,0.001156,0.001173,0.001177),
+        (0.000999,0.001001,0.001003,0.001007,0.001011,0.001016,0.001022,0.001028,0.001035,0.001042,0.00105,0.001059,0.001068,0.001078,0.001089,0.001101,0.001113,0.001126,0.00114,0.001156,0.001172,0.00119,0.001197),
+        (0.000999,0.001,0.001003,0.001007,0.001011,0.001016,0.001021,0.001028,0.001035,0.001042,0.00105,0.001059,0.001068,0.001078,0.001089,0.0011,0.001113,0.001126,0.00114,0.001155,0.001171,0.001189,0.001209,0.001217),
+        (0.000999,0.001,0.001003,0.001006,0.001011,0.001016,0.001021,0.001027,0.001034,0.001042,0.00105,0.001058,0.001068,0.001078,0.001088,0.0011,0.001112,0.001125,0.001139,0.001155,0.001171,0.001189,0.001208,0.001229,0.001235),
+        (0.000998,0.001,0.001003,0.001006,0.00101,0.001015,0.001021,0.001027,0.001034,0.001041,0.00105,0.001058,0.001068,0.001077,0.001088,0.0011,0.001112,0.001125,0.001139,0.001154,0.00117,0.001188,0.001207,0.001228,0.001252,0.001253),
+        (0.000998,0.001,0.001002,0.001006,0.00101,0.001015,0.001021,0.001027,0.001034,0.001041,0.001049,0.001058,0.001067,0.001077,0.001088,0.001099,0.001111,0.001124,0.001138,0.001154,0.00117,0.001187,0.001207,0.001228,0.001251,0.00127),
+        (0.000998,0.001,0.001002,0.001006,0.00101,0.001015,0.00102,0.001027,0.001034,0.001041,0.001049,0.001058,0.001067,0.001077,0.001087,0.001099,0.001111,0.001124,0.001138,0.001153,0.001169,0.001187,0.001206,0.001227,0.00125,0.001275,0.001286),
+        (0.000998,0.000999,0.001002,0.001005,0.001009,0.001014,0.00102,0.001026,0.001033,0.00104,0.001048,0.001057,0.001066,0.001076,0.001087,0.001098,0.00111,0.001123,0.001137,0.001152,0.001168,0.001186,0.001205,0.001225,0.001248,0.001273,0.001302,0.001319),
+        (0.000997,0.000999,0.001001,0.001005,0.001009,0.001014,0.00102,0.001026,0.001033,0.00104,0.001048,0.001057,0.001066,0.001076,0.001086,0.001097,0.001109,0.001122,0.001136,0.001151,0.001167,0.001184,0.001203,0.001224,0.001246,0.001271,0.001299,0.001331,0.001352),
+        (0.000997,0.000998,0.001001,0.001004,0.001009,0.001014,0.001019,0.001025,0.001032,0.001039,0.001047,0.001056,0.001065,0.001075,0.001086,0.001097,0.001109,0.001122,0.001135,0.00115,0.001166,0.001183,0.001202,0.001222,0.001245,0.001269,0.001297,0.001328,0.001364,0.001385),
+        (0.000996,0.000998,0.001,0.001004,0.001008,0.001013,0.001019,0.001025,0.001032,0.001038,0.001047,0.001055,0.001065,0.001074,0.001085,0.001096,0.001108,0.001121,0.001134,0.001149,0.001165,0.001182,0.001201,0.001221,0.001243,0.001267,0.001295,0.001325,0.001361,0.001402,0.001418),
+        (0.000996,0.000997,0.001,0.001003,0.001008,0.001013,0.001018,0.001024,0.001031,0.001038,0.001046,0.001055,0.001064,0.001074,0.001084,0.001095,0.001107,0.00112,0.001134,0.001148,0.001164,0.001181,0.001199,0.001219,0.001241,0.001265,0.001292,0.001323,0.001357,0.001398,0.001447,0.001453),
+        (0.000994,0.000996,0.000999,0.001002,0.001007,0.001012,0.001017,0.001023,0.00103,0.001037,0.001045,0.001054,0.001063,0.001072,0.001083,0.001094,0.001105,0.001118,0.001131,0.001146,0.001161,0.001178,0.001196,0.001216,0.001237,0.001261,0.001287,0.001316,0.001349,0.001388,0.001434,0.00149,0.001546),
+        (0.000993,0.000995,0.000998,0.001001,0.001006,0.001011,0.001016,0.001022,0.001029,0.001036,0.001044,0.001052,0.001061,0.001071,0.001081,0.001092,0.001104,0.001116,0.001129,0.001144,0.001159,0.001175,0.001193,0.001212,0.001233,0.001256,0.001281,0.00131,0.001342,0.001378,0.001421,0.001473,0.001539,0.001631,0.001657),
+        (0.000992,0.000994,0.000997,0.001,0.001005,0.001009,0.001015,0.001021,0.001028,0.001035,0.001043,0.001051,0.00106,0.001069,0.001079,0.00109,0.001102,0.001114,0.001127,0.001141,0.001156,0.001172,0.00119,0.001209,0.001229,0.001252,0.001276,0.001304,0.001334,0.001369,0.00141,0.001458,0.001518,0.001597,0.001714,0.001803),
+        (0.000991,0.000993,0.000996,0.000999,0.001003,0.001008,0.001014,0.00102,0.001027,0.001034,0.001041,0.00105,0.001058,0.001068,0.001078,0.001089,0.0011,0.001112,0.001125,0.001139,0.001154,0.00117,0.001187,0.001205,0.001225,0.001247,0.001271,0.001298,0.001328,0.001361,0.0014,0.001445,0.0015,0.001569,0.001665,0.001825,0.00204),
+        (0.000989,0.000991,0.000994,0.000997,0.001001,0.001006,0.001012,0.001018,0.001024,0.001031,0.001039,0.001047,0.001056,0.001065,0.001075,0.001085,0.001097,0.001108,0.001121,0.001135,0.001149,0.001164,0.001181,0.001199,0.001218,0.001239,0.001262,0.001287,0.001315,0.001346,0.001381,0.001421,0.001469,0.001526,0.001599,0.001697,0.00185,0.002218),
+        (0.000987,0.000989,0.000992,0.000995,0.000999,0.001004,0.00101,0.001016,0.001022,0.001029,0.001037,0.001045,0.001053,0.001062,0.001072,0.001082,0.001093,0.001105,0.001117,0.00113,0.001144,0.001159,0.001176,0.001193,0.001211,0.001231,0.001253,0.001277,0.001303,0.001332,0.001365,0.001401,0.001444,0.001493,0.001553,0.001628,0.001727,0.001873,0.002133,0.002798,0.003981,0.00492,0.005637,0.006227,0.006737),
+        (0.000984,0.000987,0.000989,0.000993,0.000997,0.001002,0.001007,0.001013,0.00102,0.001027,0.001034,0.001042,0.001051,0.00106,0.001069,0.001079,0.00109,0.001101,0.001113,0.001126,0.00114,0.001155,0.00117,0.001187,0.001205,0.001224,0.001245,0.001268,0.001292,0.00132,0.00135,0.001384,0.001422,0.001466,0.001517,0.001579,0.001655,0.001755,0.001893,0.002105,0.002475,0.003084,0.00378,0.004412,0.004957),
+        (0.000982,0.000984,0.000987,0.000991,0.000995,0.001,0.001005,0.001011,0.001018,0.001024,0.001032,0.00104,0.001048,0.001057,0.001066,0.001076,0.001087,0.001098,0.00111,0.001122,0.001136,0.00115,0.001165,0.001181,0.001199,0.001217,0.001237,0.001259,0.001283,0.001308,0.001337,0.001368,0.001403,0.001443,0.001488,0.001541,0.001605,0.001682,0.00178,0.001911,0.002093,0.00236,0.002744,0.003209,0.003691),
+        (0.00098,0.000982,0.000985,0.000989,0.000993,0.000998,0.001003,0.001009,0.001016,0.001022,0.00103,0.001037,0.001046,0.001054,0.001064,0.001073,0.001084,0.001095,0.001106,0.001119,0.001132,0.001146,0.00116,0.001176,0.001193,0.001211,0.00123,0.001251,0.001273,0.001298,0.001324,0.001354,0.001386,0.001423,0.001464,0.001511,0.001565,0.001629,0.001707,0.001803,0.001927,0.002088,0.002302,0.002581,0.002915),
+        (0.000978,0.00098,0.000983,0.000987,0.000991,0.000996,0.001001,0.001007,0.001013,0.00102,0.001027,0.001035,0.001043,0.001052,0.001061,0.00107,0.001081,0.001091,0.001103,0.001115,0.001128,0.001141,0.001156,0.001171,0.001187,0.001204,0.001223,0.001243,0.001265,0.001288,0.001313,0.001341,0.001371,0.001405,0.001442,0.001485,0.001533,0.001588,0.001653,0.001731,0.001825,0.001941,0.002086,0.002266,0.002487),
+        (0.000976,0.000978,0.000982,0.000985,0.000989,0.000994,0.000999,0.001005,0.001011,0.001018,0.001025,0.001033,0.001041,0.001049,0.001058,0.001068,0.001078,0.001088,0.001099,0.001111,0.001124,0.001137,0.001151,0.001166,0.001182,0.001199,0.001216,0.001236,0.001256,0.001279,0.001303,0.001329,0.001358,0.001389,0.001424,0.001462,0.001506,0.001555,0.001611,0.001676,0.001753,0.001844,0.001954,0.002085,0.002242),
+    ),
+    's_by_P': (
+        (0.151042,0.29638,0.436604,0.57221,0.703583,0.831038,0.954853,1.0753,1.1926,1.3069,1.4185,1.5276,1.6344,1.7391,1.8418,1.8604),
+        (0.151019,0.296328,0.436527,0.572113,0.703467,0.830905,0.954703,1.0751,1.1924,1.3067,1.4183,1.5274,1.6342,1.7388,1.8415,1.9424,2.0195),
+        (0.150997,0.296276,0.436451,0.572016,0.703351,0.830772,0.954554,1.075,1.1922,1.3065,1.4181,1.5272,1.6339,1.7386,1.8412,1.9421,2.0414,2.1381),
+        (0.150974,0.296224,0.436375,0.571919,0.703235,0.830639,0.954405,1.0748,1.192,1.3063,1.4179,1.527,1.6337,1.7383,1.8409,1.9418,2.0411,2.1389,2.2337),
+        (0.150952,0.296172,0.436298,0.571822,0.70312,0.830506,0.954256,1.0746,1.1918,1.3061,1.4177,1.5267,1.6334,1.738,1.8407,1.9415,2.0407,2.1386,2.2351,2.3143),
+        (0.150929,0.296119,0.436222,0.571725,0.703004,0.830373,0.954107,1.0745,1.1917,1.3059,1.4175,1.5265,1.6332,1.7378,1.8404,1.9412,2.0404,2.1382,2.2348,2.3302,2.3845),
+        (0.150906,0.296067,0.436146,0.571627,0.702888,0.830241,0.953959,1.0743,1.1915,1.3057,1.4173,1.5263,1.633,1.7375,1.8401,1.9409,2.0401,2.1379,2.2344,2.3298,2.4244,2.4468),
+        (0.150859,0.295962,0.435992,0.571433,0.702657,0.829975,0.953661,1.074,1.1911,1.3053,1.4168,1.5258,1.6325,1.737,1.8395,1.9403,2.0395,2.1372,2.2337,2.329,2.4235,2.5173,2.5543),
+        (0.150812,0.295857,0.435839,0.571239,0.702426,0.82971,0.953364,1.0736,1.1908,1.305,1.4164,1.5254,1.632,1.7365,1.839,1.9397,2.0388,2.1365,2.2329,2.3282,2.4227,2.5164,2.6097,2.6455),
+        (0.150764,0.295751,0.435686,0.571044,0.702195,0.829445,0.953067,1.0733,1.1904,1.3046,1.416,1.5249,1.6315,1.736,1.8384,1.9391,2.0382,2.1358,2.2322,2.3275,2.4218,2.5155,2.6087,2.7016,2.7254),
+        (0.150716,0.295645,0.435532,0.57085,0.701964,0.829181,0.952771,1.073,1.19,1.3042,1.4156,1.5245,1.631,1.7354,1.8379,1.9385,2.0376,2.1352,2.2315,2.3267,2.421,2.5146,2.6077,2.7005,2.7935,2.7968),
+        (0.150667,0.295538,0.435379,0.570655,0.701733,0.828916,0.952474,1.0727,1.1897,1.3038,1.4152,1.524,1.6305,1.7349,1.8373,1.9379,2.0369,2.1345,2.2307,2.3259,2.4201,2.5136,2.6067,2.6994,2.7922,2.8615),
+        (0.150618,0.295431,0.435225,0.570461,0.701502,0.952178,0.828652,1.0723,1.1893,1.3034,1.4147,1.5236,1.6301,1.7344,1.8368,1.9374,2.0363,2.1338,2.23,2.3251,2.4193,2.5127,2.6057,2.6983,2.791,2.8841,2.921),
+        (0.150517,0.295217,0.434916,0.570072,0.70104,0.828123,0.951587,1.0717,1.1886,1.3026,1.4139,1.5227,1.6291,1.7334,1.8357,1.9362,2.0351,2.1325,2.2286,2.3235,2.4176,2.5109,2.6037,2.6961,2.7886,2.8814,2.975,3.0278),
+        (0.150414,0.295001,0.434607,0.569682,0.700579,0.827596,0.950997,1.071,1.1879,1.3019,1.4131,1.5218,1.6282,1.7324,1.8346,1.935,2.0338,2.1311,2.2271,2.322,2.4159,2.5091,2.6017,2.694,2.7862,2.8788,2.972,3.0665,3.1224),
+        (0.150309,0.294784,0.434298,0.569293,0.700118,0.827069,0.950407,1.0704,1.1872,1.3011,1.4123,1.5209,1.6272,1.7313,1.8335,1.9339,2.0326,2.1298,2.2257,2.3205,2.4143,2.5073,2.5997,2.6919,2.7839,2.8761,2.969,3.0631,3.159,3.2081),
+        (0.150202,0.294565,0.433988,0.568903,0.699658,0.826543,0.949819,1.0697,1.1865,1.3003,1.4114,1.52,1.6263,1.7303,1.8324,1.9327,2.0313,2.1285,2.2243,2.3189,2.4126,2.5055,2.5978,2.6897,2.7815,2.8736,2.9661,3.0598,3.1552,3.2533,3.287),
+        (0.150092,0.294345,0.433677,0.568514,0.699197,0.826017,0.949232,1.0691,1.1858,1.2996,1.4106,1.5191,1.6253,1.7293,1.8313,1.9315,2.0301,2.1271,2.2229,2.3174,2.411,2.5037,2.5959,2.6876,2.7792,2.871,2.9633,3.0565,3.1514,3.2488,3.3502,3.3606),
+        (0.149808,0.29379,0.432897,0.567539,0.698048,0.824706,0.947768,1.0675,1.184,1.2977,1.4086,1.5169,1.623,1.7268,1.8287,1.9287,2.027,2.1239,2.2194,2.3137,2.4069,2.4994,2.5911,2.6825,2.7736,2.8647,2.9562,3.0486,3.1423,3.238,3.3371,3.4415,3.529),
+        (0.149511,0.293226,0.432112,0.566564,0.6969,0.8234,0.946311,1.0659,1.1823,1.2958,1.4065,1.5148,1.6206,1.7243,1.826,1.9259,2.024,2.1206,2.2159,2.31,2.403,2.4951,2.5865,2.6774,2.768,2.8586,2.9495,3.0409,3.1335,3.2279,3.325,3.4263,3.5345,3.6555,3.6846),
+        (0.1492,0.292654,0.431324,0.565587,0.695755,0.822097,0.94486,1.0643,1.1805,1.2939,1.4045,1.5126,1.6183,1.7219,1.8234,1.923,2.021,2.1175,2.2125,2.3063,2.399,2.4909,2.5819,2.6724,2.7626,2.8527,2.9429,3.0336,3.1252,3.2183,3.3136,3.4124,3.5166,3.63,3.7622,3.8394),
+        (0.148875,0.292075,0.430532,0.56461,0.694611,0.820799,0.943415,1.0627,1.1788,1.292,1.4025,1.5105,1.616,1.7194,1.8208,1.9203,2.0181,2.1143,2.2091,2.3027,2.3952,2.4867,2.5774,2.6676,2.7573,2.8469,2.9365,3.0265,3.1172,3.2091,3.3029,3.3996,3.5006,3.6086,3.729,3.8787,4.0156),
+        (0.148187,0.290892,0.428936,0.562653,0.692327,0.818213,0.940542,1.0595,1.1754,1.2883,1.3986,1.5062,1.6115,1.7146,1.8156,1.9148,2.0122,2.1081,2.2025,2.2956,2.3876,2.4786,2.5687,2.6582,2.7471,2.8357,2.9242,3.0129,3.102,3.1919,3.2832,3.3764,3.4726,3.5731,3.6804,3.7993,3.9423,4.1671),
+        (0.147448,0.289679,0.427324,0.560692,0.69005,0.815641,0.937692,1.0564,1.172,1.2847,1.3946,1.502,1.607,1.7098,1.8106,1.9094,2.0065,2.102,2.1961,2.2888,2.3803,2.4707,2.5603,2.6491,2.7373,2.825,2.9126,3.0001,3.0878,3.176,3.2652,3.3557,3.4483,3.5438,3.6436,3.7498,3.8666,4.0025,4.1804,4.4757,4.8336,5.0627,5.22,5.3416,5.4421),
+        (0.14666,0.288436,0.425697,0.558727,0.687779,0.813084,0.934863,1.0533,1.1687,1.2811,1.3908,1.4979,1.6027,1.7052,1.8056,1.9042,2.0009,2.0961,2.1897,2.282,2.3731,2.4631,2.5521,2.6403,2.7278,2.8148,2.9014,2.9879,3.0744,3.1612,3.2486,3.337,3.4268,3.5186,3.6132,3.712,3.8168,3.9308,4.0599,4.2143,4.4138,4.6579,4.8809,5.0564,5.1945),
+        (0.145825,0.287163,0.424055,0.556758,0.685513,0.810541,0.932055,1.0503,1.1654,1.2775,1.387,1.4938,1.5983,1.7006,1.8008,1.899,1.9955,2.0903,2.1836,2.2755,2.3661,2.4556,2.5442,2.6318,2.7187,2.805,2.8908,2.9764,3.0618,3.1473,3.2332,3.3198,3.4073,3.4962,3.5871,3.6808,3.7783,3.8813,3.9921,4.1145,4.2533,4.4144,4.5979,4.781,4.9448),
+        (0.144943,0.285863,0.422398,0.554786,0.683252,0.80801,0.929267,1.0472,1.1621,1.274,1.3832,1.4898,1.5941,1.696,1.796,1.8939,1.9901,2.0846,2.1775,2.2691,2.3593,2.4484,2.5364,2.6236,2.7099,2.7955,2.8806,2.9653,3.0498,3.1342,3.2188,3.3038,3.3894,3.476,3.564,3.6539,3.7464,3.8425,3.9433,4.0507,4.1667,4.2937,4.4331,4.5839,4.7367),
+        (0.144017,0.284535,0.420727,0.55281,0.680995,0.805491,0.926498,1.0442,1.1588,1.2705,1.3795,1.4859,1.5898,1.6916,1.7912,1.8889,1.9848,2.079,2.1716,2.2628,2.3527,2.4414,2.5289,2.6156,2.7013,2.7864,2.8708,2.9547,3.0383,3.1218,3.2052,3.2888,3.3728,3.4575,3.5431,3.6301,3.7189,3.8101,3.9045,4.0029,4.1066,4.2168,4.3342,4.4589,4.5896),
+        (0.143048,0.283181,0.419042,0.550829,0.678744,0.802985,0.923747,1.0412,1.1556,1.2671,1.3758,1.4819,1.5857,1.6872,1.7866,1.884,1.9796,2.0735,2.1658,2.2567,2.3462,2.4345,2.5216,2.6078,2.693,2.7775,2.8613,2.9446,3.0274,3.1099,3.1923,3.2748,3.3574,3.4404,3.5241,3.6087,3.6946,3.7822,3.8719,3.9643,4.0602,4.1602,4.2649,4.3744,4.4882),
+    ),
+}
 
-PRECISION = {'P_kPa': 4.0,
- 'T_C': 2.0,
- 'v': 6.0,
- 'u': 3.0,
- 'h': 3.0,
- 's': 6.0,
- 'x': 6,
- 'vf': 6.0,
- 'vg': 6.0,
- 'uf': 2.0,
- 'ug': 1.0,
- 'hf': 2.0,
- 'hg': 1.0,
- 'sf': 4.0,
- 'sg': 4.0}
+PRECISION = {
+  "P_kPa": 4.0,
+  "T_C": 2.0,
+  "v": 6.0,
+  "u": 3.0,
+  "h": 3.0,
+  "s": 6.0,
+  "x": 6,
+  "vf": 6.0,
+  "vg": 6.0,
+  "uf": 2.0,
+  "ug": 1.0,
+  "hf": 2.0,
+  "hg": 1.0,
+  "sf": 4.0,
+  "sg": 4.0
+}
@@ -0,0 +1,12 @@
+"""Shared sys.path bootstrap so test files can import the repo packages.
+
+Works both when a test file is run directly as a script and when the
+suite is collected by pytest (conftest.py imports this module once).
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
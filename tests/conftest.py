@@ -0,0 +1,11 @@
+"""Shared pytest setup for the XSteam-Lite suite.
+
+Performs the repo sys.path bootstrap once and pre-imports the shared
+modules so every collected test file reuses the cached imports instead
+of repeating its own path/import boilerplate.
+"""
+
+from _pathsetup import ROOT  # noqa: F401
+
+import data.steam_data  # noqa: F401,E402
+import tinspire.steam  # noqa: F401,E402
@@ -0,0 +1,75 @@
+"""Run the full XSteam-Lite test suite with independent files in parallel.
+
+test_data_integrity.py runs first on its own because it rebuilds
+data/steam_data.py and s.py; the remaining three files only read those
+outputs and are independent of each other, so they run concurrently in
+separate worker processes.
+"""
+
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERIAL_FILES = ["tests/test_data_integrity.py"]
+PARALLEL_FILES = [
+    "tests/test_steam.py",
+    "tests/test_function_matrix.py",
+    "tests/test_linearity.py",
+]
+
+
+def run_serial(rel):
+    result = subprocess.run(
+        [sys.executable, rel],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return rel, result.returncode, result.stdout
+
+
+def run_parallel(rels):
+    procs = []
+    for rel in rels:
+        procs.append(
+            (
+                rel,
+                subprocess.Popen(
+                    [sys.executable, rel],
+                    cwd=ROOT,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                ),
+            )
+        )
+    results = []
+    for rel, proc in procs:
+        output, _ = proc.communicate()
+        results.append((rel, proc.returncode, output))
+    return results
+
+
+def main():
+    results = [run_serial(rel) for rel in SERIAL_FILES]
+    results.extend(run_parallel(PARALLEL_FILES))
+
+    failed = False
+    for rel, returncode, output in results:
+        status = "ok" if returncode == 0 else "FAILED"
+        print("{}: {}".format(rel, status))
+        if returncode != 0:
+            failed = True
+            print(output)
+
+    if failed:
+        sys.exit(1)
+    print("all test files passed")
+
+
+if __name__ == "__main__":
+    main()
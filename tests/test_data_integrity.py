@@ -1,15 +1,15 @@
 """Data integrity checks for immutable canonical CSV workflow."""
 
+import array
+import contextlib
+import mmap
 import os
-import subprocess
-import sys
+import pickle
+import py_compile
 import importlib
 import re
 
-
-ROOT = os.path.dirname(os.path.dirname(__file__))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+from _pathsetup import ROOT
 
 CANONICAL = [
     "data/canonical_csv/Table_A1.csv",
@@ -33,6 +33,24 @@ def abs_path(rel):
     return os.path.join(ROOT, rel)
 
 
+@contextlib.contextmanager
+def mapped_source(rel):
+    """Memory-map a repo file read-only for zero-copy byte scans."""
+    with open(abs_path(rel), "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+@contextlib.contextmanager
+def chdir_root():
+    previous = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
 def test_canonical_csv_files_exist():
     missing = []
     for rel in CANONICAL:
@@ -41,17 +59,44 @@ def test_canonical_csv_files_exist():
     assert not missing, "missing canonical CSV files: {}".format(", ".join(missing))
 
 
+BUILD_INPUTS = CANONICAL + [
+    "data/schema.json",
+    "tools/build_data.py",
+    "tools/bundle.py",
+    "tinspire/steam.py",
+]
+BUILD_OUTPUTS = [
+    "data/steam_data.py",
+    "data/build_report.txt",
+    "s.py",
+]
+
+
+def build_outputs_up_to_date():
+    """True when every build output is newer than every build input."""
+    try:
+        outputs_mtime = min(os.path.getmtime(abs_path(rel)) for rel in BUILD_OUTPUTS)
+    except OSError:
+        return False
+    inputs_mtime = max(os.path.getmtime(abs_path(rel)) for rel in BUILD_INPUTS)
+    return outputs_mtime > inputs_mtime
+
+
 def test_schema_and_build_outputs():
     assert os.path.exists(abs_path("data/schema.json")), "missing data/schema.json"
 
-    subprocess.run([sys.executable, "tools/build_data.py"], cwd=ROOT, check=True)
-    subprocess.run([sys.executable, "tools/bundle.py"], cwd=ROOT, check=True)
+    if not build_outputs_up_to_date():
+        build_data = importlib.import_module("tools.build_data")
+        bundle = importlib.import_module("tools.bundle")
+        with chdir_root():
+            build_data.main([])
+            bundle.main([])
 
     assert os.path.exists(abs_path("data/steam_data.py")), "missing data/steam_data.py"
     assert os.path.exists(abs_path("data/build_report.txt")), "missing data/build_report.txt"
     assert os.path.exists(abs_path("s.py")), "missing s.py"
 
-    subprocess.run([sys.executable, "-m", "py_compile", "s.py"], cwd=ROOT, check=True)
+    py_compile.compile(abs_path("s.py"), doraise=True)
 
     steam_data = importlib.import_module("data.steam_data")
     assert hasattr(steam_data, "PRECISION"), "data.steam_data missing PRECISION metadata"
@@ -65,16 +110,105 @@ def test_schema_and_build_outputs():
     assert hasattr(bundle_mod, "h"), "bundle missing h() alias"
 
 
+def find_disallowed_g_format(src):
+    """Return the first non-15-digit ':.Ng' format spec in src bytes, or None.
+
+    Equivalent to the regex ':\\.(?!15g)\\d+g' but runs as a linear
+    bytes.find scan instead of a backtracking lookahead search.
+    """
+    pos = src.find(b":.")
+    while pos >= 0:
+        end = pos + 2
+        while src[end : end + 1].isdigit():
+            end += 1
+        if end > pos + 2 and src[end : end + 1] == b"g":
+            digits = src[pos + 2 : end]
+            if digits != b"15":
+                return src[pos : end + 1]
+        pos = src.find(b":.", pos + 1)
+    return None
+
+
 def test_no_rounding_or_fixed_decimal_format_in_core_files():
     targets = ["tinspire/steam.py", "tools/build_data.py"]
-    fixed_f_pattern = re.compile(r":\.\d+f")
-    disallowed_g_pattern = re.compile(r":\.(?!15g)\d+g")
+    fixed_f_pattern = re.compile(rb":\.\d+f")
 
     for rel in targets:
-        src = open(abs_path(rel), "r", encoding="utf-8").read()
-        assert "round(" not in src, "round() found in {}".format(rel)
-        assert not fixed_f_pattern.search(src), "fixed-decimal float format found in {}".format(rel)
-        assert not disallowed_g_pattern.search(src), "unexpected precision g-format found in {}".format(rel)
+        with mapped_source(rel) as src:
+            assert src.find(b"round(") < 0, "round() found in {}".format(rel)
+            assert not fixed_f_pattern.search(src), "fixed-decimal float format found in {}".format(rel)
+            offending = find_disallowed_g_format(src)
+            assert offending is None, "unexpected precision g-format {!r} found in {}".format(offending, rel)
+
+
+def test_emit_table_lines_alias_dedup():
+    """Cross-table column aliasing must emit shared objects, not copies.
+
+    The canonical data currently has no duplicated axes, so this path only
+    runs here; exercise it with two synthetic tables sharing one column.
+    """
+    build_data = importlib.import_module("tools.build_data")
+
+    registry = {}
+    first = {"T": [1.0, 2.0], "P": [3.0, 4.0]}
+    second = {"P": [1.0, 2.0], "T": [9.0, 8.0]}
+    src = "".join(build_data.emit_table_lines("A", first, registry))
+    src += "".join(build_data.emit_table_lines("B", second, registry))
+
+    assert "A['T']" in src, "duplicate column was not emitted as an alias"
+
+    namespace = {}
+    exec(compile(src, "<emitted>", "exec"), namespace)
+    assert namespace["A"]["T"] == (1.0, 2.0), "aliased column lost its values"
+    assert namespace["B"]["P"] is namespace["A"]["T"], "alias did not share the column object"
+    assert namespace["B"]["T"] == (9.0, 8.0), "non-duplicate column was mangled"
+
+
+def test_fastload_cache_and_fallback():
+    """data.fastload must prefer a fresh cache and survive every bad one."""
+    fastload = importlib.import_module("data.fastload")
+    steam_data = importlib.import_module("data.steam_data")
+
+    pkl_path = abs_path("data/steam_data.pkl")
+    py_mtime = os.path.getmtime(abs_path("data/steam_data.py"))
+    payload = {key: getattr(steam_data, key) for key in fastload._TABLE_KEYS}
+
+    def write_cache(data, mtime):
+        with open(pkl_path, "wb") as handle:
+            pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.utime(pkl_path, (mtime, mtime))
+
+    try:
+        # Fresh cache: loaded tables equal the module's but are distinct
+        # unpickled objects, proving the pickle path was taken.
+        write_cache(payload, py_mtime + 10.0)
+        tables = fastload.load_tables()
+        assert tables["SAT_T"] == steam_data.SAT_T, "cached tables differ from module"
+        assert tables["SAT_T"] is not steam_data.SAT_T, "fresh cache was not preferred"
+
+        # Truncated cache newer than the module: fall back, never raise.
+        open(pkl_path, "wb").close()
+        os.utime(pkl_path, (py_mtime + 10.0, py_mtime + 10.0))
+        assert fastload.load_tables()["SAT_T"] is steam_data.SAT_T, "empty cache did not fall back"
+
+        # Missing cache: fall back.
+        os.remove(pkl_path)
+        assert fastload.load_tables()["SAT_T"] is steam_data.SAT_T, "missing cache did not fall back"
+
+        # Valid but stale cache: mtime gate must reject it.
+        write_cache(payload, py_mtime - 10.0)
+        assert fastload.load_tables()["SAT_T"] is steam_data.SAT_T, "stale cache was trusted"
+
+        # Packed arrays mirror the tuple columns elementwise.
+        arrays = fastload.load_arrays()
+        assert isinstance(arrays["SAT_T"]["T"], array.array), "flat column not packed"
+        assert tuple(arrays["SAT_T"]["T"]) == steam_data.SAT_T["T"], "packed column values differ"
+        assert isinstance(arrays["SH"]["T_by_P"][0], array.array), "ragged block rows not packed"
+        assert tuple(arrays["SH"]["T_by_P"][0]) == steam_data.SH["T_by_P"][0], "ragged row values differ"
+        assert arrays["PRECISION"] == steam_data.PRECISION, "PRECISION must pass through unchanged"
+    finally:
+        # Leave a valid fresh cache behind, as a normal build would.
+        write_cache(payload, py_mtime + 10.0)
 
 
 def test_no_legacy_artifacts():
@@ -82,21 +216,36 @@ def test_no_legacy_artifacts():
     assert not leftovers, "legacy artifacts still present: {}".format(", ".join(leftovers))
 
 
+BUNDLE_FORBIDDEN_MARKERS = (
+    b"open(",
+    b"canonical_csv",
+    b"schema.json",
+    b"data/schema.json",
+    b"csv.",
+    b"json.",
+)
+_BUNDLE_IMPORT_PATTERN = re.compile(rb"(?m)^[ \t]*(?:from|import)\s")
+_BUNDLE_MARKER_PATTERN = re.compile(b"|".join(re.escape(marker) for marker in BUNDLE_FORBIDDEN_MARKERS))
+
+
 def test_bundle_standalone_purity():
-    bundle_src = open(abs_path("s.py"), "r", encoding="utf-8").read()
-    for line in bundle_src.splitlines():
-        stripped = line.strip()
-        assert not stripped.startswith("from "), "bundle contains from-import: {}".format(stripped)
-        assert not stripped.startswith("import "), "bundle contains import: {}".format(stripped)
-    assert "open(" not in bundle_src, "bundle must not perform filesystem reads"
-    for marker in ("canonical_csv", "schema.json", "data/schema.json", "csv.", "json."):
-        assert marker not in bundle_src, "bundle contains forbidden runtime marker {}".format(marker)
+    with mapped_source("s.py") as bundle_src:
+        import_hit = _BUNDLE_IMPORT_PATTERN.search(bundle_src)
+        assert import_hit is None, "bundle contains import statement at offset {}".format(
+            import_hit.start() if import_hit else -1
+        )
+        marker_hit = _BUNDLE_MARKER_PATTERN.search(bundle_src)
+        assert marker_hit is None, "bundle contains forbidden runtime marker {!r}".format(
+            marker_hit.group(0) if marker_hit else b""
+        )
 
 
 def run_all():
     test_canonical_csv_files_exist()
     test_schema_and_build_outputs()
     test_no_rounding_or_fixed_decimal_format_in_core_files()
+    test_emit_table_lines_alias_dedup()
+    test_fastload_cache_and_fallback()
     test_no_legacy_artifacts()
     test_bundle_standalone_purity()
 
@@ -1,21 +1,22 @@
 """Function-matrix and CSV-preservation tests for XSteam-Lite."""
 
 import csv
+import functools
 import json
 import os
 import random
-import sys
 
-ROOT = os.path.dirname(os.path.dirname(__file__))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+from _pathsetup import ROOT
 
 from data import steam_data  # noqa: E402
 from tinspire import steam  # noqa: E402
 
 
+_STRIP_TABLE = str.maketrans("", "", ", ")
+
+
 def f(value):
-    return float(str(value).strip().replace(",", "").replace(" ", ""))
+    return float(str(value).translate(_STRIP_TABLE))
 
 
 def tok(value):
@@ -26,101 +27,141 @@ def assert_close(actual, expected, tol):
     assert abs(actual - expected) <= tol, "actual={} expected={} tol={}".format(actual, expected, tol)
 
 
+# Saturation lookups are pure and tests never mutate the returned dicts,
+# so repeated queries at the same point can share one result.
+_sat_T = functools.lru_cache(maxsize=None)(steam.sat_T)
+_sat_P = functools.lru_cache(maxsize=None)(steam.sat_P)
+
+
+with open(os.path.join(ROOT, "data/schema.json"), "rb") as _schema_handle:
+    SCHEMA_BY_TABLE = {
+        entry["table"]: entry for entry in json.load(_schema_handle).get("tables", []) if entry.get("table")
+    }
+
+
 def load_schema_table(table_name):
-    with open(os.path.join(ROOT, "data/schema.json"), "r", encoding="utf-8") as handle:
-        schema = json.load(handle)
-    for entry in schema.get("tables", []):
-        if entry.get("table") == table_name:
-            return entry
-    raise AssertionError("missing schema entry for {}".format(table_name))
+    entry = SCHEMA_BY_TABLE.get(table_name)
+    if entry is None:
+        raise AssertionError("missing schema entry for {}".format(table_name))
+    return entry
+
 
+def _read_csv_columns(path, column_names):
+    """Read a CSV once with the plain C-level reader and return index-addressed rows.
+
+    Avoids csv.DictReader's per-row dict allocation; callers address fields by
+    the returned integer index tuple instead of header-name hashing.
+    """
+    with open(path, "r", newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        headers = next(reader, [])
+        rows = list(reader)
+    indices = tuple(headers.index(name) for name in column_names)
+    return rows, indices
 
+
+@functools.lru_cache(maxsize=None)
 def parse_piecewise_csv(table_name):
     entry = load_schema_table(table_name)
     path = os.path.join(ROOT, "data/canonical_csv", entry["file"])
-    p_col = entry["pressure_column"]
-    t_col = entry["temperature_column"]
     cols = entry["columns"]
+    rows, idx = _read_csv_columns(
+        path,
+        (
+            entry["pressure_column"],
+            entry["temperature_column"],
+            cols["v"],
+            cols["u"],
+            cols["h"],
+            cols["s"],
+        ),
+    )
 
-    total_rows = 0
     parsed_rows = []
     counts_by_p = {}
-    with open(path, "r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            total_rows += 1
-            try:
-                p = f(row[p_col])
-                t = f(row[t_col])
-                v = f(row[cols["v"]])
-                u = f(row[cols["u"]])
-                h = f(row[cols["h"]])
-                s = f(row[cols["s"]])
-            except Exception:
-                continue
-
-            parsed_rows.append((p, t, v, u, h, s))
-            p_key = tok(p)
-            counts_by_p[p_key] = counts_by_p.get(p_key, 0) + 1
+    for row in rows:
+        try:
+            item = (f(row[idx[0]]), f(row[idx[1]]), f(row[idx[2]]), f(row[idx[3]]), f(row[idx[4]]), f(row[idx[5]]))
+        except Exception:
+            continue
+
+        parsed_rows.append(item)
+        p_key = tok(item[0])
+        counts_by_p[p_key] = counts_by_p.get(p_key, 0) + 1
 
     return {
         "path": path,
-        "total_rows": total_rows,
+        "total_rows": len(rows),
         "parsed_rows": parsed_rows,
         "counts_by_p": counts_by_p,
     }
 
 
+@functools.lru_cache(maxsize=None)
 def parse_sat_csv(table_name):
     entry = load_schema_table(table_name)
     path = os.path.join(ROOT, "data/canonical_csv", entry["file"])
-    p_col = entry["pressure_column"]
-    t_col = entry["temperature_column"]
     cols = entry["columns"]
+    rows, idx = _read_csv_columns(
+        path,
+        (
+            entry["temperature_column"],
+            entry["pressure_column"],
+            cols["vf"],
+            cols["vg"],
+            cols["uf"],
+            cols["ug"],
+            cols["hf"],
+            cols["hg"],
+            cols["sf"],
+            cols["sg"],
+        ),
+    )
 
-    total_rows = 0
     parsed_rows = []
-    with open(path, "r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            total_rows += 1
-            try:
-                item = (
-                    f(row[t_col]),
-                    f(row[p_col]),
-                    f(row[cols["vf"]]),
-                    f(row[cols["vg"]]),
-                    f(row[cols["uf"]]),
-                    f(row[cols["ug"]]),
-                    f(row[cols["hf"]]),
-                    f(row[cols["hg"]]),
-                    f(row[cols["sf"]]),
-                    f(row[cols["sg"]]),
-                )
-            except Exception:
-                continue
-            parsed_rows.append(item)
-
-    return {"path": path, "total_rows": total_rows, "parsed_rows": parsed_rows}
+    for row in rows:
+        try:
+            item = tuple(f(row[i]) for i in idx)
+        except Exception:
+            continue
+        parsed_rows.append(item)
+
+    return {"path": path, "total_rows": len(rows), "parsed_rows": parsed_rows}
+
+
+_RUNTIME_TUPLE_SETS = {}
 
 
 def runtime_tuple_set_piecewise(region):
-    out = set()
-    for i, p in enumerate(region["P"]):
-        for j, t in enumerate(region["T_by_P"][i]):
-            out.add(
-                (
-                    tok(p),
-                    tok(t),
-                    tok(region["v_by_P"][i][j]),
-                    tok(region["u_by_P"][i][j]),
-                    tok(region["h_by_P"][i][j]),
-                    tok(region["s_by_P"][i][j]),
-                )
-            )
+    # Keyed by id() but the entry pins the region object, so a recycled id
+    # can never alias a different table.
+    cached = _RUNTIME_TUPLE_SETS.get(id(region))
+    if cached is not None and cached[0] is region:
+        return cached[1]
+
+    p_col = []
+    for p, t_row in zip(region["P"], region["T_by_P"]):
+        p_col.extend([tok(p)] * len(t_row))
+
+    cols = [p_col]
+    for key in ("T_by_P", "v_by_P", "u_by_P", "h_by_P", "s_by_P"):
+        cols.append([tok(value) for row in region[key] for value in row])
+
+    out = set(zip(*cols))
+    _RUNTIME_TUPLE_SETS[id(region)] = (region, out)
     return out
 
 
+@functools.lru_cache(maxsize=None)
+def sat_t_token_set():
+    """Token tuples for every SAT_T row, built once per session."""
+    cols = [
+        [tok(value) for value in steam_data.SAT_T[key]]
+        for key in ("T", "P", "vf", "vg", "uf", "ug", "hf", "hg", "sf", "sg")
+    ]
+    return frozenset(zip(*cols))
+
+
 def sample_indices(length):
     if length <= 1:
         return [0]
@@ -152,7 +193,8 @@ def test_random_spot_checks_match_csv_text():
     # A3/A4 spot checks (25 each)
     for table_name, runtime in (("A3", steam_data.SH), ("A4", steam_data.COMP)):
         parsed = parse_piecewise_csv(table_name)["parsed_rows"]
-        samples = rng.sample(parsed, min(25, len(parsed)))
+        sample_idx = rng.sample(range(len(parsed)), min(25, len(parsed)))
+        samples = [parsed[i] for i in sample_idx]
         runtime_set = runtime_tuple_set_piecewise(runtime)
 
         for p, t, v, u, h, s in samples:
@@ -161,59 +203,49 @@ def test_random_spot_checks_match_csv_text():
 
     # A1 saturation spot checks
     a1 = parse_sat_csv("A1")["parsed_rows"]
-    a1_samples = rng.sample(a1, min(25, len(a1)))
-    sat_set = set(
-        (
-            tok(steam_data.SAT_T["T"][i]),
-            tok(steam_data.SAT_T["P"][i]),
-            tok(steam_data.SAT_T["vf"][i]),
-            tok(steam_data.SAT_T["vg"][i]),
-            tok(steam_data.SAT_T["uf"][i]),
-            tok(steam_data.SAT_T["ug"][i]),
-            tok(steam_data.SAT_T["hf"][i]),
-            tok(steam_data.SAT_T["hg"][i]),
-            tok(steam_data.SAT_T["sf"][i]),
-            tok(steam_data.SAT_T["sg"][i]),
-        )
-        for i in range(len(steam_data.SAT_T["T"]))
-    )
+    a1_idx = rng.sample(range(len(a1)), min(25, len(a1)))
+    a1_samples = [a1[i] for i in a1_idx]
+    sat_set = sat_t_token_set()
     for row in a1_samples:
         key = tuple(tok(x) for x in row)
         assert key in sat_set, "A1 missing sampled tuple {}".format(key)
 
 
+_PROP_FNS = (("u", steam.u_pT), ("h", steam.h_pT), ("v", steam.v_pT), ("s", steam.s_pT))
+
+
+def _gather_region_nodes(runtime, expect_region, node_j):
+    nodes = []
+    for i in sample_indices(len(runtime["P"])):
+        p = runtime["P"][i]
+        j = node_j(runtime["T_by_P"][i])
+        t = runtime["T_by_P"][i][j]
+        if steam.region_pT(p, t) == expect_region:
+            nodes.append((i, j, p, t))
+    return nodes
+
+
+def _assert_nodes_exact(runtime, nodes, label, tol):
+    for prop, fn in _PROP_FNS:
+        table = runtime[prop + "_by_P"]
+        expected = [table[i][j] for i, j, _, _ in nodes]
+        got = [fn(p, t) for _, _, p, t in nodes]
+        worst = max(abs(g - e) for g, e in zip(got, expected))
+        assert worst <= tol, "{} {} node mismatch: max|diff|={}".format(label, prop, worst)
+
+
 def test_grid_node_exactness():
-    sh_checked = 0
-    for i in sample_indices(len(steam_data.SH["P"])):
-        p = steam_data.SH["P"][i]
-        j = len(steam_data.SH["T_by_P"][i]) - 1
-        t = steam_data.SH["T_by_P"][i][j]
-        if steam.region_pT(p, t) != "superheated":
-            continue
-        assert_close(steam.u_pT(p, t), steam_data.SH["u_by_P"][i][j], 1e-9)
-        assert_close(steam.h_pT(p, t), steam_data.SH["h_by_P"][i][j], 1e-9)
-        assert_close(steam.v_pT(p, t), steam_data.SH["v_by_P"][i][j], 1e-9)
-        assert_close(steam.s_pT(p, t), steam_data.SH["s_by_P"][i][j], 1e-9)
-        sh_checked += 1
-    assert sh_checked > 0
-
-    comp_checked = 0
-    for i in sample_indices(len(steam_data.COMP["P"])):
-        p = steam_data.COMP["P"][i]
-        j = 0
-        t = steam_data.COMP["T_by_P"][i][j]
-        if steam.region_pT(p, t) != "compressed":
-            continue
-        assert_close(steam.u_pT(p, t), steam_data.COMP["u_by_P"][i][j], 1e-9)
-        assert_close(steam.h_pT(p, t), steam_data.COMP["h_by_P"][i][j], 1e-9)
-        assert_close(steam.v_pT(p, t), steam_data.COMP["v_by_P"][i][j], 1e-9)
-        assert_close(steam.s_pT(p, t), steam_data.COMP["s_by_P"][i][j], 1e-9)
-        comp_checked += 1
-    assert comp_checked > 0
+    sh_nodes = _gather_region_nodes(steam_data.SH, "superheated", lambda row: len(row) - 1)
+    assert sh_nodes
+    _assert_nodes_exact(steam_data.SH, sh_nodes, "SH", 1e-9)
+
+    comp_nodes = _gather_region_nodes(steam_data.COMP, "compressed", lambda row: 0)
+    assert comp_nodes
+    _assert_nodes_exact(steam_data.COMP, comp_nodes, "COMP", 1e-9)
 
 
 def test_mixture_identities_and_boundary_behavior():
-    sat = steam.sat_T(100.0)
+    sat = _sat_T(100.0)
     x = 0.37
     assert_close(steam.x_from_h(steam.h_Tx(100.0, x), sat["hf"], sat["hg"]), x, 1e-10)
     assert_close(steam.x_from_u(steam.u_Tx(100.0, x), sat["uf"], sat["ug"]), x, 1e-10)
@@ -222,7 +254,7 @@ def test_mixture_identities_and_boundary_behavior():
 
     p = 1000.0
     ts = steam.Tsat_p(p)
-    sat_p = steam.sat_P(p)
+    sat_p = _sat_P(p)
     assert steam.region_pT(p, ts) == "two-phase"
     assert_close(steam.h_pT(p, ts), sat_p["hg"], 1e-9)
     assert_close(steam.u_pT(p, ts), sat_p["ug"], 1e-9)
@@ -1,13 +1,12 @@
 """Formal linear-interpolation verification tests for XSteam-Lite."""
 
+import bisect
+import mmap
 import os
 import random
-import sys
+import re
 
-
-ROOT = os.path.dirname(os.path.dirname(__file__))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+from _pathsetup import ROOT
 
 from tinspire import steam  # noqa: E402
 
@@ -35,13 +34,8 @@ def manual_interp1(xs, ys, x):
     elif x >= xs[-1]:
         i0, i1 = len(xs) - 2, len(xs) - 1
     else:
-        i0 = 0
-        i1 = 1
-        for idx in range(len(xs) - 1):
-            if xs[idx] <= x <= xs[idx + 1]:
-                i0 = idx
-                i1 = idx + 1
-                break
+        i0 = max(0, min(len(xs) - 2, bisect.bisect_right(xs, x) - 1))
+        i1 = i0 + 1
     return manual_lerp(x, xs[i0], xs[i1], ys[i0], ys[i1])
 
 
@@ -85,16 +79,28 @@ def test_piecewise_region_recovers_linear_plane():
         assert_close(got, expected, 1e-10)
 
 
+_SH_OVERLAPS = None
+
+
+def sh_block_overlaps(sh):
+    """Overlapping T-ranges between adjacent SH pressure blocks, computed once."""
+    global _SH_OVERLAPS
+    if _SH_OVERLAPS is None:
+        t_min = [min(row) for row in sh["T_by_P"]]
+        t_max = [max(row) for row in sh["T_by_P"]]
+        overlaps = []
+        for i in range(len(sh["P"]) - 1):
+            lo = max(t_min[i], t_min[i + 1])
+            hi = min(t_max[i], t_max[i + 1])
+            if hi > lo:
+                overlaps.append((i, lo, hi))
+        _SH_OVERLAPS = overlaps
+    return _SH_OVERLAPS
+
+
 def test_blockwise_superheated_manual_linear_equivalence():
     sh = steam.SH
-    overlaps = []
-    for i in range(len(sh["P"]) - 1):
-        t0 = sh["T_by_P"][i]
-        t1 = sh["T_by_P"][i + 1]
-        lo = max(min(t0), min(t1))
-        hi = min(max(t0), max(t1))
-        if hi > lo:
-            overlaps.append((i, lo, hi))
+    overlaps = sh_block_overlaps(sh)
 
     assert overlaps, "no overlapping SH pressure blocks found"
 
@@ -120,28 +126,30 @@ def test_blockwise_superheated_manual_linear_equivalence():
             assert_close(engine, manual, 1e-10)
 
 
+FORBIDDEN_STEAM_TOKENS = (
+    b"**2",
+    b"**3",
+    b"pow(",
+    b"spline",
+    b"cubic",
+    b"polynomial",
+    b"regression",
+    b"interp2d",
+    b"curve",
+    b"p_kpa * t_c",
+    b"t_c * p_kpa",
+)
+_FORBIDDEN_STEAM_PATTERN = re.compile(
+    b"|".join(re.escape(token) for token in FORBIDDEN_STEAM_TOKENS), re.IGNORECASE
+)
+
+
 def test_no_higher_order_interpolation_terms_in_steam_source():
     steam_path = os.path.join(ROOT, "tinspire", "steam.py")
-    with open(steam_path, "r", encoding="utf-8") as handle:
-        src = handle.read()
-    lower = src.lower()
-
-    forbidden_tokens = [
-        "**2",
-        "**3",
-        "pow(",
-        "spline",
-        "cubic",
-        "polynomial",
-        "regression",
-        "interp2d",
-        "curve",
-    ]
-    for token in forbidden_tokens:
-        assert token not in lower, "found forbidden token in steam.py: {}".format(token)
-
-    assert "p_kpa * t_c" not in lower
-    assert "t_c * p_kpa" not in lower
+    with open(steam_path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            hit = _FORBIDDEN_STEAM_PATTERN.search(mm)
+            assert hit is None, "found forbidden token in steam.py: {!r}".format(hit.group(0) if hit else b"")
 
 
 def run_all():
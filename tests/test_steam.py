@@ -1,13 +1,10 @@
 """Basic validation tests for XSteam-Lite core behavior."""
 
+import functools
 import io
-import os
-import sys
 from contextlib import redirect_stdout
 
-ROOT = os.path.dirname(os.path.dirname(__file__))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+from _pathsetup import ROOT  # noqa: F401
 
 from data import steam_data  # noqa: E402
 from tinspire import steam  # noqa: E402
@@ -17,6 +14,12 @@ def assert_close(actual, expected, tol):
     assert abs(actual - expected) <= tol, "actual={} expected={} tol={}".format(actual, expected, tol)
 
 
+# Saturation lookups are pure and tests never mutate the returned dicts,
+# so repeated queries at the same point can share one result.
+_sat_T = functools.lru_cache(maxsize=None)(steam.sat_T)
+_sat_P = functools.lru_cache(maxsize=None)(steam.sat_P)
+
+
 def capture_output(fn, *args, **kwargs):
     buf = io.StringIO()
     with redirect_stdout(buf):
@@ -25,7 +28,7 @@ def capture_output(fn, *args, **kwargs):
 
 
 def test_mixture_identities():
-    sat = steam.sat_T(100.0)
+    sat = _sat_T(100.0)
     x = 0.2
 
     h_expected = sat["hf"] + x * (sat["hg"] - sat["hf"])
@@ -39,6 +42,15 @@ def test_mixture_identities():
     assert_close(steam.v_Tx(100.0, x), v_expected, 1e-12)
 
 
+_NODE_PROP_FNS = (("h", steam.h_pT), ("u", steam.u_pT), ("v", steam.v_pT), ("s", steam.s_pT))
+
+
+def _assert_node_props_exact(runtime, i, j, p, t, tol):
+    diffs = [abs(fn(p, t) - runtime[prop + "_by_P"][i][j]) for prop, fn in _NODE_PROP_FNS]
+    worst = max(diffs)
+    assert worst <= tol, "node ({}, {}) mismatch: max|diff|={}".format(p, t, worst)
+
+
 def test_piecewise_node_exactness_comp_and_sh():
     # COMP node
     i = min(3, len(steam_data.COMP["P"]) - 1)
@@ -47,10 +59,7 @@ def test_piecewise_node_exactness_comp_and_sh():
     t = steam_data.COMP["T_by_P"][i][j]
     assert steam.region_pT(p, t) in ("compressed", "two-phase")
     if steam.region_pT(p, t) == "compressed":
-        assert_close(steam.h_pT(p, t), steam_data.COMP["h_by_P"][i][j], 1e-12)
-        assert_close(steam.u_pT(p, t), steam_data.COMP["u_by_P"][i][j], 1e-12)
-        assert_close(steam.v_pT(p, t), steam_data.COMP["v_by_P"][i][j], 1e-12)
-        assert_close(steam.s_pT(p, t), steam_data.COMP["s_by_P"][i][j], 1e-12)
+        _assert_node_props_exact(steam_data.COMP, i, j, p, t, 1e-12)
 
     # SH node
     i = min(5, len(steam_data.SH["P"]) - 1)
@@ -59,16 +68,13 @@ def test_piecewise_node_exactness_comp_and_sh():
     t = steam_data.SH["T_by_P"][i][j]
     assert steam.region_pT(p, t) in ("superheated", "two-phase")
     if steam.region_pT(p, t) == "superheated":
-        assert_close(steam.h_pT(p, t), steam_data.SH["h_by_P"][i][j], 1e-12)
-        assert_close(steam.u_pT(p, t), steam_data.SH["u_by_P"][i][j], 1e-12)
-        assert_close(steam.v_pT(p, t), steam_data.SH["v_by_P"][i][j], 1e-12)
-        assert_close(steam.s_pT(p, t), steam_data.SH["s_by_P"][i][j], 1e-12)
+        _assert_node_props_exact(steam_data.SH, i, j, p, t, 1e-12)
 
 
 def test_region_logic_at_saturation_boundary():
     p = steam_data.SAT_P["P"][min(20, len(steam_data.SAT_P["P"]) - 1)]
     ts = steam.Tsat_p(p)
-    sat = steam.sat_P(p)
+    sat = _sat_P(p)
 
     assert steam.region_pT(p, ts) == "two-phase"
     assert steam.region_pT(p, ts - 5.0) == "compressed"
@@ -212,6 +218,73 @@ def test_state_help_text():
     assert "state_u(" in printed4
 
 
+def test_make_interp1_matches_interp1():
+    xs = steam_data.SAT_T["T"]
+    ys = steam_data.SAT_T["P"]
+    fn = steam.make_interp1(xs, ys)
+
+    mid = len(xs) // 2
+    queries = [
+        (xs[mid] + xs[mid + 1]) / 2.0,  # interior
+        xs[mid],                        # exact node
+        xs[0] - 5.0,                    # below range (edge-segment extrapolation)
+        xs[-1] + 5.0,                   # above range
+    ]
+    for x in queries:
+        assert_close(fn(x), steam.interp1(xs, ys, x), 1e-12)
+
+    # Same grid objects must return the cached specialized callable.
+    assert steam.make_interp1(xs, ys) is fn
+
+    try:
+        steam.make_interp1([1.0, 2.0], [1.0])
+        raise AssertionError("expected length-mismatch error")
+    except ValueError as exc:
+        assert str(exc) == "xs and ys length mismatch"
+
+    # Throwaway grids built in a loop recycle ids; each interpolator must
+    # still answer from its own data, never a stale cache entry.
+    for i in range(20):
+        got = steam.make_interp1([float(i)], [1000.0 + i])(0.0)
+        assert got == 1000.0 + i, "iteration {}: got {} from a stale cache entry".format(i, got)
+    for i in range(20):
+        fresh = steam.make_interp1([0.0, 1.0], [float(i), float(i) + 1.0])
+        assert_close(fresh(0.5), i + 0.5, 1e-12)
+
+
+def test_state_batch_columns():
+    p_dome = steam_data.SAT_P["P"][min(20, len(steam_data.SAT_P["P"]) - 1)]
+    t_dome = steam.Tsat_p(p_dome)
+    pressures = [1000.0, 20000.0, p_dome]
+    temperatures = [400.0, 100.0, t_dome]
+
+    out = steam.state_batch(pressures, temperatures)
+    assert out["region"] == ["superheated", "compressed", "two-phase"]
+    for prop in ("v", "u", "h", "s"):
+        assert len(out[prop]) == len(pressures), "column {} has wrong length".format(prop)
+
+    # Single-phase rows agree with the scalar property functions.
+    for i in (0, 1):
+        p, t = pressures[i], temperatures[i]
+        assert_close(out["v"][i], steam.v_pT(p, t), 1e-12)
+        assert_close(out["u"][i], steam.u_pT(p, t), 1e-12)
+        assert_close(out["h"][i], steam.h_pT(p, t), 1e-12)
+        assert_close(out["s"][i], steam.s_pT(p, t), 1e-12)
+
+    # Dome rows report the saturated vapor boundary, matching u_pT and friends.
+    sat = _sat_P(p_dome)
+    assert_close(out["v"][2], sat["vg"], 1e-9)
+    assert_close(out["u"][2], sat["ug"], 1e-9)
+    assert_close(out["h"][2], sat["hg"], 1e-9)
+    assert_close(out["s"][2], sat["sg"], 1e-9)
+
+    try:
+        steam.state_batch([1000.0], [])
+        raise AssertionError("expected length-mismatch error")
+    except ValueError as exc:
+        assert str(exc) == "P_kPa and T_C length mismatch"
+
+
 def test_short_alias_s_and_h():
     ret, printed = capture_output(steam.s, P=1000, T=400)
     assert ret is None
@@ -255,6 +328,8 @@ def run_all():
     test_with_units_sat_dict_rendering()
     test_state_solver_paths()
     test_state_help_text()
+    test_make_interp1_matches_interp1()
+    test_state_batch_columns()
     test_short_alias_s_and_h()
 
 
@@ -8,30 +8,49 @@ from data.steam_data import COMP, SAT_P, SAT_T, SH
 
 
 SAT_TOL_C = 0.25
-_SAT_P_FALLBACK = None
 __version__ = "1.0.0"
 
 
+_BRACKET_HINT = {}
+_BRACKET_HINT_MAX = 32
+
+
 def bracket(xs, x):
     """Return index pair (i0, i1) such that xs[i0] <= x <= xs[i1]."""
     n = len(xs)
     if n < 2:
         raise ValueError("bracket requires at least two grid points")
 
-    if x <= xs[0]:
-        return 0, 1
-    if x >= xs[-1]:
-        return n - 2, n - 1
+    # Locality fast path: consecutive queries usually land in or next to the
+    # previously found segment of the same grid. The guess is re-verified
+    # against the actual grid values, so a stale entry can never return a
+    # wrong bracket.
+    guess = _BRACKET_HINT.get(id(xs))
+    if guess is not None and 0 <= guess <= n - 2 and xs[guess] <= x <= xs[guess + 1]:
+        return guess, guess + 1
 
+    # bisect_left insertion search, hand-rolled because the standalone TI
+    # bundle must stay import-free and cannot use the stdlib bisect module.
     lo = 0
-    hi = n - 1
-    while hi - lo > 1:
+    hi = n
+    while lo < hi:
         mid = (lo + hi) // 2
-        if xs[mid] <= x:
-            lo = mid
+        if xs[mid] < x:
+            lo = mid + 1
         else:
             hi = mid
-    return lo, hi
+
+    # Clamping the insertion point into [1, n-1] folds the below-range and
+    # above-range cases into the same return path as interior queries.
+    if lo < 1:
+        lo = 1
+    elif lo > n - 1:
+        lo = n - 1
+
+    if len(_BRACKET_HINT) >= _BRACKET_HINT_MAX:
+        _BRACKET_HINT.clear()
+    _BRACKET_HINT[id(xs)] = lo - 1
+    return lo - 1, lo
 
 
 def lerp(x, x0, x1, y0, y1):
@@ -50,7 +69,58 @@ def interp1(xs, ys, x):
     if len(xs) == 1:
         return ys[0]
     i0, i1 = bracket(xs, x)
-    return lerp(x, xs[i0], xs[i1], ys[i0], ys[i1])
+    # lerp inlined: one less Python call frame on the hottest path.
+    x0 = xs[i0]
+    x1 = xs[i1]
+    y0 = ys[i0]
+    if x1 == x0:
+        return y0
+    return y0 + (ys[i1] - y0) * (x - x0) / (x1 - x0)
+
+
+_INTERP1_CACHE = {}
+_INTERP1_CACHE_MAX = 16
+
+
+def make_interp1(xs, ys):
+    """Build a specialized interpolator bound to one fixed grid.
+
+    The reciprocal segment spacings are computed once here, so each call of
+    the returned function is a bracket search plus one multiply-add with no
+    division. Intended for repeated sweeps against the same table columns.
+    """
+    if len(xs) != len(ys):
+        raise ValueError("xs and ys length mismatch")
+    if len(xs) == 0:
+        raise ValueError("make_interp1 requires at least one grid point")
+
+    # The entry pins xs and ys and a hit requires identity, so a recycled
+    # id from garbage-collected grids can never return a stale interpolator.
+    key = (id(xs), id(ys))
+    cached = _INTERP1_CACHE.get(key)
+    if cached is not None and cached[0] is xs and cached[1] is ys:
+        return cached[2]
+
+    if len(xs) == 1:
+        y_const = ys[0]
+
+        def specialized(x):
+            return y_const
+    else:
+        inv_dx = []
+        for i in range(len(xs) - 1):
+            dx = xs[i + 1] - xs[i]
+            inv_dx.append(0.0 if dx == 0.0 else 1.0 / dx)
+
+        def specialized(x):
+            i0, i1 = bracket(xs, x)
+            y0 = ys[i0]
+            return y0 + (ys[i1] - y0) * (x - xs[i0]) * inv_dx[i0]
+
+    if len(_INTERP1_CACHE) >= _INTERP1_CACHE_MAX:
+        _INTERP1_CACHE.clear()
+    _INTERP1_CACHE[key] = (xs, ys, specialized)
+    return specialized
 
 
 def _build_sat_p_fallback():
@@ -62,32 +132,59 @@ def _build_sat_p_fallback():
     return out
 
 
-def _sat_p_table():
-    global _SAT_P_FALLBACK
+# The pressure-ordered saturation table is fully determined by the embedded
+# data, so it is resolved once at import time instead of lazily behind a
+# per-call validity check.
+if isinstance(SAT_P, dict) and "P" in SAT_P and "T" in SAT_P and len(SAT_P["P"]) >= 2:
+    _SAT_P_TABLE = SAT_P
+else:
+    _SAT_P_TABLE = _build_sat_p_fallback()
+
+
+_SAT_TABLE_KEYS = ("T", "P", "vf", "vg", "uf", "ug", "hf", "hg", "sf", "sg")
+
+
+def _inv_spacings(xs):
+    """Reciprocal spacing per grid segment; degenerate segments map to 0.0."""
+    out = []
+    for i in range(len(xs) - 1):
+        dx = xs[i + 1] - xs[i]
+        out.append(0.0 if dx == 0.0 else 1.0 / dx)
+    return out
+
+
+# Column bindings hoisted out of the saturation hot path: each entry pairs a
+# property key with its column sequence so per-call dict probes disappear.
+# The reciprocal axis spacings are fixed by the grids, so they are computed
+# once here and the per-call division becomes a multiply.
+_SAT_T_AXIS = SAT_T["T"]
+_SAT_T_COLS = tuple((key, SAT_T[key]) for key in _SAT_TABLE_KEYS if key != "T")
+_SAT_T_INV = _inv_spacings(_SAT_T_AXIS)
+_SAT_P_AXIS = _SAT_P_TABLE["P"]
+_SAT_P_COLS = tuple((key, _SAT_P_TABLE[key]) for key in _SAT_TABLE_KEYS if key != "P")
+_SAT_P_INV = _inv_spacings(_SAT_P_AXIS)
 
-    if isinstance(SAT_P, dict) and "P" in SAT_P and "T" in SAT_P and len(SAT_P["P"]) >= 2:
-        return SAT_P
 
-    if _SAT_P_FALLBACK is None:
-        _SAT_P_FALLBACK = _build_sat_p_fallback()
-    return _SAT_P_FALLBACK
+def _sat_interp_all(xs, inv_dx, cols, axis_key, x):
+    """Interpolate every saturated column at x with a single bracket search."""
+    i0, i1 = bracket(xs, x)
+    w = (x - xs[i0]) * inv_dx[i0]
+
+    out = {axis_key: x}
+    for key, col in cols:
+        y0 = col[i0]
+        out[key] = y0 + w * (col[i1] - y0)
+    return out
 
 
 def sat_T(T_C):
     """Return saturated properties at temperature T_C (degC)."""
-    out = {"T": T_C, "P": interp1(SAT_T["T"], SAT_T["P"], T_C)}
-    for key in ("vf", "vg", "uf", "ug", "hf", "hg", "sf", "sg"):
-        out[key] = interp1(SAT_T["T"], SAT_T[key], T_C)
-    return out
+    return _sat_interp_all(_SAT_T_AXIS, _SAT_T_INV, _SAT_T_COLS, "T", T_C)
 
 
 def sat_P(P_kPa):
     """Return saturated properties at pressure P_kPa."""
-    table = _sat_p_table()
-    out = {"P": P_kPa, "T": interp1(table["P"], table["T"], P_kPa)}
-    for key in ("vf", "vg", "uf", "ug", "hf", "hg", "sf", "sg"):
-        out[key] = interp1(table["P"], table[key], P_kPa)
-    return out
+    return _sat_interp_all(_SAT_P_AXIS, _SAT_P_INV, _SAT_P_COLS, "P", P_kPa)
 
 
 def pSat_T(T_C):
@@ -97,8 +194,7 @@ def pSat_T(T_C):
 
 def Tsat_p(P_kPa):
     """Saturation temperature in degC as a function of pressure in kPa."""
-    table = _sat_p_table()
-    return interp1(table["P"], table["T"], P_kPa)
+    return interp1(_SAT_P_TABLE["P"], _SAT_P_TABLE["T"], P_kPa)
 
 
 def mix(prop_f, prop_g, x):
@@ -150,14 +246,16 @@ def v_Tx(T_C, x):
     return mix(sat["vf"], sat["vg"], x)
 
 
+_REGIONS = ("compressed", "two-phase", "superheated")
+
+
 def region_pT(P_kPa, T_C):
     """Return region for (P, T): compressed, two-phase, or superheated."""
     ts = Tsat_p(P_kPa)
-    if abs(T_C - ts) <= SAT_TOL_C:
-        return "two-phase"
-    if T_C < ts:
-        return "compressed"
-    return "superheated"
+    d = T_C - ts
+    # Two boolean adds index the region tuple directly: 0 below the
+    # saturation band, 1 inside it, 2 above it.
+    return _REGIONS[(d > SAT_TOL_C) + (d >= -SAT_TOL_C)]
 
 
 def _interp_piecewise_region(region, prop, P_kPa, T_C):
@@ -179,17 +277,73 @@ def _interp_piecewise_region(region, prop, P_kPa, T_C):
     return lerp(P_kPa, p0, p1, prop0, prop1)
 
 
+def _t_row_weight(row, T_C):
+    """Return (j0, j1, w) describing the T blend within one pressure block."""
+    if len(row) < 2:
+        return 0, 0, 0.0
+    j0, j1 = bracket(row, T_C)
+    t0 = row[j0]
+    t1 = row[j1]
+    if t1 == t0:
+        return j0, j1, 0.0
+    return j0, j1, (T_C - t0) / (t1 - t0)
+
+
+def _interp_piecewise_region_multi(region, props, P_kPa, T_C):
+    """Interpolate several properties at one (P, T), sharing all grid searches."""
+    pgrid = region["P"]
+    t_rows = region["T_by_P"]
+
+    if len(pgrid) == 0:
+        raise ValueError("empty region table")
+
+    if len(pgrid) == 1:
+        j0, j1, w = _t_row_weight(t_rows[0], T_C)
+        out = []
+        for prop in props:
+            col = region[prop + "_by_P"][0]
+            y0 = col[j0]
+            out.append(y0 + w * (col[j1] - y0))
+        return out
+
+    i0, i1 = bracket(pgrid, P_kPa)
+    p0 = pgrid[i0]
+    p1 = pgrid[i1]
+    if p1 == p0:
+        wp = 0.0
+    else:
+        wp = (P_kPa - p0) / (p1 - p0)
+
+    j00, j01, w0 = _t_row_weight(t_rows[i0], T_C)
+    j10, j11, w1 = _t_row_weight(t_rows[i1], T_C)
+
+    out = []
+    for prop in props:
+        blocks = region[prop + "_by_P"]
+        col0 = blocks[i0]
+        col1 = blocks[i1]
+        y00 = col0[j00]
+        y10 = col1[j10]
+        prop0 = y00 + w0 * (col0[j01] - y00)
+        prop1 = y10 + w1 * (col1[j11] - y10)
+        out.append(prop0 + wp * (prop1 - prop0))
+    return out
+
+
+# Saturated liquid/vapor key pairs for each interpolated property; one dict
+# probe replaces the per-property if/elif chains below.
+_FG_KEYS = {
+    "v": ("vf", "vg"),
+    "u": ("uf", "ug"),
+    "h": ("hf", "hg"),
+    "s": ("sf", "sg"),
+}
+
+
 def _sat_boundary_prop(prop, P_kPa):
-    sat = sat_P(P_kPa)
-    if prop == "u":
-        return sat["ug"]
-    if prop == "h":
-        return sat["hg"]
-    if prop == "s":
-        return sat["sg"]
-    if prop == "v":
-        return sat["vg"]
-    raise ValueError("unknown property: " + str(prop))
+    if prop not in _FG_KEYS:
+        raise ValueError("unknown property: " + str(prop))
+    return sat_P(P_kPa)[prop + "g"]
 
 
 def _prop_pT_kPa(prop, P_kPa, T_C):
@@ -221,6 +375,40 @@ def v_pT(P_kPa, T_C):
     return _prop_pT_kPa("v", P_kPa, T_C)
 
 
+_BATCH_PROPS = ("v", "u", "h", "s")
+
+
+def state_batch(P_kPa, T_C):
+    """Solve v/u/h/s for paired P/T sequences, returned as columns.
+
+    Intended for sweep and plotting loops: each point pays one region
+    classification and one fused table lookup instead of four separate
+    property calls, and the column layout feeds plot consumers directly.
+    Two-phase points report the saturated vapor boundary values, matching
+    u_pT and friends at the dome.
+    """
+    if len(P_kPa) != len(T_C):
+        raise ValueError("P_kPa and T_C length mismatch")
+
+    regions = []
+    cols = {prop: [] for prop in _BATCH_PROPS}
+    for p, t in zip(P_kPa, T_C):
+        reg = region_pT(p, t)
+        regions.append(reg)
+        if reg == "two-phase":
+            sat = sat_P(p)
+            values = [sat[prop + "g"] for prop in _BATCH_PROPS]
+        else:
+            table = SH if reg == "superheated" else COMP
+            values = _interp_piecewise_region_multi(table, _BATCH_PROPS, p, t)
+        for prop, value in zip(_BATCH_PROPS, values):
+            cols[prop].append(value)
+
+    out = {"region": regions}
+    out.update(cols)
+    return out
+
+
 _STATE_UNITS = {
     "P": "kPa",
     "T": "°C",
@@ -252,44 +440,50 @@ _STATE_UNITS = {
 
 
 def _state_template(known_clean):
+    # The units map is a shared read-only constant; handing out the same
+    # object avoids a 30-key dict copy per solve. Callers must not mutate it
+    # (a frozen mapping proxy would enforce this, but the import-free TI
+    # bundle cannot reach the types module). known_clean is likewise a fresh
+    # dict built by state() for this solve, so it is adopted without a copy.
     return {
-        "known": dict(known_clean),
+        "known": known_clean,
         "region": "unknown",
         "computed": {},
         "sat": {},
         "needs": [],
-        "units": dict(_STATE_UNITS),
+        "units": _STATE_UNITS,
         "notes": [],
     }
 
 
+_STATE_DEFAULT_NEEDS = (
+    "P_kPa and T_C",
+    "P_kPa and x",
+    "T_C and x",
+    "P_kPa and one of v/u/h/s",
+    "T_C and one of v/u/h/s",
+)
+
+
 def _state_default_needs():
-    return [
-        "P_kPa and T_C",
-        "P_kPa and x",
-        "T_C and x",
-        "P_kPa and one of v/u/h/s",
-        "T_C and one of v/u/h/s",
-    ]
+    return list(_STATE_DEFAULT_NEEDS)
 
 
 def _first_known_prop(known_clean):
+    # Values are floats from state()'s input cleaning, so None doubles as
+    # the missing-key sentinel and each probe is a single dict lookup.
     for key in ("v", "u", "h", "s"):
-        if key in known_clean:
-            return key, known_clean[key]
+        value = known_clean.get(key)
+        if value is not None:
+            return key, value
     return None, None
 
 
 def _x_from_named_prop(prop_name, value, sat):
-    if prop_name == "v":
-        return x_from_v(value, sat["vf"], sat["vg"])
-    if prop_name == "u":
-        return x_from_u(value, sat["uf"], sat["ug"])
-    if prop_name == "h":
-        return x_from_h(value, sat["hf"], sat["hg"])
-    if prop_name == "s":
-        return x_from_s(value, sat["sf"], sat["sg"])
-    raise ValueError("unsupported property for quality solve: " + str(prop_name))
+    keys = _FG_KEYS.get(prop_name)
+    if keys is None:
+        raise ValueError("unsupported property for quality solve: " + str(prop_name))
+    return _x_from_prop(value, sat[keys[0]], sat[keys[1]])
 
 
 def _mix_from_sat(sat, x):
@@ -357,18 +551,31 @@ def state(**known):
     # A) Known P_kPa and T_C
     if P_kPa is not None and T_C is not None:
         try:
-            reg = region_pT(P_kPa, T_C)
+            # One saturation solve serves both the region test and the
+            # boundary context: sat_P already interpolates Tsat along the
+            # same pressure axis region_pT would search again.
+            sat = sat_P(P_kPa)
+            d = T_C - sat["T"]
+            if d < -SAT_TOL_C:
+                reg = "compressed"
+            elif d > SAT_TOL_C:
+                reg = "superheated"
+            else:
+                reg = "two-phase"
             result["region"] = reg
             if reg == "compressed" or reg == "superheated":
-                result["computed"]["v"] = v_pT(P_kPa, T_C)
-                result["computed"]["u"] = u_pT(P_kPa, T_C)
-                result["computed"]["h"] = h_pT(P_kPa, T_C)
-                result["computed"]["s"] = s_pT(P_kPa, T_C)
+                table = COMP if reg == "compressed" else SH
+                v_val, u_val, h_val, s_val = _interp_piecewise_region_multi(
+                    table, ("v", "u", "h", "s"), P_kPa, T_C
+                )
+                result["computed"]["v"] = v_val
+                result["computed"]["u"] = u_val
+                result["computed"]["h"] = h_val
+                result["computed"]["s"] = s_val
                 return result
 
             # two-phase boundary
-            sat = sat_P(P_kPa)
-            result["sat"] = dict(sat)
+            result["sat"] = sat
             result["computed"]["Tsat_C"] = sat["T"]
             _state_add_two_phase_sat_context(result, sat)
 
@@ -404,7 +611,7 @@ def state(**known):
     if T_C is not None and x is not None:
         try:
             sat = sat_T(T_C)
-            result["sat"] = dict(sat)
+            result["sat"] = sat
             result["computed"]["P_kPa"] = sat["P"]
             if _state_apply_quality(result, sat, x):
                 return result
@@ -420,7 +627,7 @@ def state(**known):
     if P_kPa is not None and x is not None:
         try:
             sat = sat_P(P_kPa)
-            result["sat"] = dict(sat)
+            result["sat"] = sat
             result["computed"]["T_C"] = sat["T"]
             if _state_apply_quality(result, sat, x):
                 return result
@@ -436,7 +643,7 @@ def state(**known):
     if P_kPa is not None and T_C is None and p_name is not None:
         try:
             sat = sat_P(P_kPa)
-            result["sat"] = dict(sat)
+            result["sat"] = sat
             x_calc = _x_from_named_prop(p_name, p_value, sat)
             result["computed"]["T_C"] = sat["T"]
             result["computed"]["x"] = x_calc
@@ -461,7 +668,7 @@ def state(**known):
     if T_C is not None and P_kPa is None and p_name is not None:
         try:
             sat = sat_T(T_C)
-            result["sat"] = dict(sat)
+            result["sat"] = sat
             x_calc = _x_from_named_prop(p_name, p_value, sat)
             result["computed"]["P_kPa"] = sat["P"]
             result["computed"]["x"] = x_calc
@@ -492,11 +699,17 @@ def state(**known):
     return result
 
 
+# Shared numeric type tuple: building a fresh (int, float) tuple inside every
+# formatter call shows up on the TI interpreter. isinstance keeps bool (an int
+# subclass) rendering as before.
+_NUM_TYPES = (int, float)
+
+
 def fmt(x):
     """Return high-precision text for TI display without manual rounding."""
     if x is None:
         return "None"
-    if isinstance(x, (int, float)):
+    if isinstance(x, _NUM_TYPES):
         return "{:.15g}".format(x)
     return str(x)
 
@@ -519,39 +732,44 @@ def _unit_from_returns(returns_spec):
     return unit
 
 
+# Display tables for the formatters below, hoisted to module scope so each
+# printed result reuses them instead of rebuilding per call.
+_SAT_PROP_UNITS = {
+    "P": "kPa",
+    "T": "°C",
+    "vf": "m^3/kg",
+    "vg": "m^3/kg",
+    "uf": "kJ/kg",
+    "ug": "kJ/kg",
+    "hf": "kJ/kg",
+    "hg": "kJ/kg",
+    "sf": "kJ/kg-K",
+    "sg": "kJ/kg-K",
+    "v": "m^3/kg",
+    "u": "kJ/kg",
+    "h": "kJ/kg",
+    "s": "kJ/kg-K",
+    "x": "-",
+}
+_SAT_KEY_ORDER = ("P", "T", "vf", "vg", "uf", "ug", "hf", "hg", "sf", "sg", "x")
+_SAT_KEY_SET = frozenset(_SAT_KEY_ORDER)
+
+
 def _format_sat_dict(values):
-    prop_units = {
-        "P": "kPa",
-        "T": "°C",
-        "vf": "m^3/kg",
-        "vg": "m^3/kg",
-        "uf": "kJ/kg",
-        "ug": "kJ/kg",
-        "hf": "kJ/kg",
-        "hg": "kJ/kg",
-        "sf": "kJ/kg-K",
-        "sg": "kJ/kg-K",
-        "v": "m^3/kg",
-        "u": "kJ/kg",
-        "h": "kJ/kg",
-        "s": "kJ/kg-K",
-        "x": "-",
-    }
-    order = ["P", "T", "vf", "vg", "uf", "ug", "hf", "hg", "sf", "sg", "x"]
     extra = []
     for key in values:
-        if key not in order:
+        if key not in _SAT_KEY_SET:
             extra.append(key)
     extra.sort()
 
     lines = []
-    for key in order + extra:
+    for key in list(_SAT_KEY_ORDER) + extra:
         if key not in values:
             continue
         value = values[key]
         label = "P_kPa" if key == "P" else ("T_C" if key == "T" else key)
-        if isinstance(value, (int, float)):
-            unit = prop_units.get(key, "")
+        if isinstance(value, _NUM_TYPES):
+            unit = _SAT_PROP_UNITS.get(key, "")
             if unit:
                 lines.append("{}: {}".format(label, fmt_with_unit(value, unit)))
             else:
@@ -561,41 +779,44 @@ def _format_sat_dict(values):
     return "\n".join(lines)
 
 
+_STATE_BASE_KEYS = (
+    "P_kPa",
+    "T_C",
+    "Tsat_C",
+    "x",
+    "v",
+    "u",
+    "h",
+    "s",
+    "vf",
+    "vg",
+    "uf",
+    "ug",
+    "hf",
+    "hg",
+    "sf",
+    "sg",
+    "sat_vf",
+    "sat_vg",
+    "sat_uf",
+    "sat_ug",
+    "sat_hf",
+    "sat_hg",
+    "sat_sf",
+    "sat_sg",
+    "P",
+    "T",
+)
+_STATE_BASE_KEY_SET = frozenset(_STATE_BASE_KEYS)
+
+
 def _state_section_keys(values):
-    base = [
-        "P_kPa",
-        "T_C",
-        "Tsat_C",
-        "x",
-        "v",
-        "u",
-        "h",
-        "s",
-        "vf",
-        "vg",
-        "uf",
-        "ug",
-        "hf",
-        "hg",
-        "sf",
-        "sg",
-        "sat_vf",
-        "sat_vg",
-        "sat_uf",
-        "sat_ug",
-        "sat_hf",
-        "sat_hg",
-        "sat_sf",
-        "sat_sg",
-        "P",
-        "T",
-    ]
     extra = []
     for key in values:
-        if key not in base:
+        if key not in _STATE_BASE_KEY_SET:
             extra.append(key)
     extra.sort()
-    return base + extra
+    return list(_STATE_BASE_KEYS) + extra
 
 
 def _state_display_key(key):
@@ -623,8 +844,8 @@ def _format_state_section(values, units_map):
             continue
         val = values[key]
         label = _state_display_key(key)
-        if isinstance(val, (int, float)):
-            unit = _state_unit_for_key(key, units_map)
+        unit = _state_unit_for_key(key, units_map)
+        if isinstance(val, _NUM_TYPES):
             lines.append("  {}: {}".format(label, fmt_with_unit(val, unit)))
         else:
             lines.append("  {}: {}".format(label, fmt(val)))
@@ -634,8 +855,12 @@ def _format_state_section(values, units_map):
 
 
 def _format_state_result(result):
-    units_map = dict(_STATE_UNITS)
-    units_map.update(result.get("units", {}))
+    units = result.get("units")
+    if units is None or units is _STATE_UNITS:
+        units_map = _STATE_UNITS
+    else:
+        units_map = dict(_STATE_UNITS)
+        units_map.update(units)
 
     lines = []
     lines.append("state() result")
@@ -764,8 +989,8 @@ def h():
 
 def with_units(func_name, *args):
     """Call a numeric function by name and return a formatted units string."""
-    fn = globals().get(func_name)
-    if not callable(fn):
+    fn = _CALLABLES.get(func_name)
+    if fn is None:
         return "Function '{}' not found. Use lookup() to search commands.".format(func_name)
 
     result = fn(*args)
@@ -775,10 +1000,8 @@ def with_units(func_name, *args):
         if "region" in result and "computed" in result and "needs" in result:
             return _format_state_result(result)
         return _format_sat_dict(result)
-    if isinstance(result, (int, float)):
-        meta = _DOCS.get(func_name, {})
-        unit = _unit_from_returns(meta.get("returns", ""))
-        return fmt_with_unit(result, unit)
+    if isinstance(result, _NUM_TYPES):
+        return fmt_with_unit(result, _RETURNS_UNIT.get(func_name, ""))
     return str(result)
 
 
@@ -822,14 +1045,8 @@ def v_Tx_u(T_C, x):
     return fmt_with_unit(v_Tx(T_C, x), "m^3/kg")
 
 
-def _lookup_score(keyword, name, meta):
-    key = keyword.lower()
-    lname = name.lower()
-    tags = [str(x).lower() for x in meta.get("tags", [])]
-    sig = str(meta.get("sig", "")).lower()
-    does = str(meta.get("does", "")).lower()
-    returns = str(meta.get("returns", "")).lower()
-    requires = " ".join(meta.get("requires", [])).lower()
+def _lookup_score(key, entry):
+    lname, tags, sig, does, returns, requires = entry
 
     if key == lname:
         return 0
@@ -870,14 +1087,11 @@ def lookup(keyword):
         key = "all"
 
     hits = []
-    for name in _DOCS:
-        meta = _DOCS[name]
-        score = _lookup_score(key, name, meta)
-        if key == "all":
-            score = 99
+    for entry, line in _DOCS_SEARCH:
+        score = 99 if key == "all" else _lookup_score(key, entry)
         if score is None:
             continue
-        hits.append((score, name.lower(), _lookup_line(meta)))
+        hits.append((score, entry[0], line))
     hits.sort()
     out = [item[2] for item in hits]
     for line in out:
@@ -1025,6 +1239,13 @@ _DOCS = {
         "returns": "matches [list[str]]",
         "tags": ["help", "docs", "discover", "search", "lookup"],
     },
+    "make_interp1": {
+        "sig": "make_interp1(xs, ys)",
+        "does": "Build a fast interpolator specialized to a fixed grid.",
+        "requires": ["xs [sorted list]", "ys [list]"],
+        "returns": "f(x) [callable]",
+        "tags": ["interpolation", "utility", "1d", "factory"],
+    },
     "mix": {
         "sig": "mix(prop_f, prop_g, x)",
         "does": "Linear quality blend between saturated liquid and vapor values.",
@@ -1121,6 +1342,13 @@ _DOCS = {
         "returns": "None [prints guide]",
         "tags": ["state", "help", "alias", "ti", "print"],
     },
+    "state_batch": {
+        "sig": "state_batch(P_kPa, T_C)",
+        "does": "Solve v/u/h/s for paired P/T sequences, returned as columns.",
+        "requires": ["P_kPa [list, kPa]", "T_C [list, °C]"],
+        "returns": "dict of columns [region, v, u, h, s]",
+        "tags": ["state", "batch", "sweep", "pT", "columns"],
+    },
     "state_help": {
         "sig": "state_help()",
         "does": "Printable TI-friendly usage guide for state() and state_u().",
@@ -1231,10 +1459,38 @@ _DOCS = {
 }
 
 
-__all__ = [
+# Search fields lowered and display lines rendered once at import: lookup()
+# then scans ready strings instead of re-lowering every _DOCS entry per query.
+_DOCS_SEARCH = tuple(
+    (
+        (
+            name.lower(),
+            tuple(str(tag).lower() for tag in meta.get("tags", [])),
+            str(meta.get("sig", "")).lower(),
+            str(meta.get("does", "")).lower(),
+            str(meta.get("returns", "")).lower(),
+            " ".join(meta.get("requires", [])).lower(),
+        ),
+        _lookup_line(meta),
+    )
+    for name, meta in _DOCS.items()
+)
+
+# Units parsed out of each documented returns spec once at import, instead of
+# re-scanning the bracket text on every numeric with_units result.
+_RETURNS_UNIT = {name: _unit_from_returns(str(meta.get("returns", ""))) for name, meta in _DOCS.items()}
+
+# Name-to-function registry for with_units: one small dict probe instead of
+# scanning the full module globals per call. _DOCS is the catalog of every
+# documented command, so it also defines what with_units may dispatch to.
+_CALLABLES = {name: globals()[name] for name in _DOCS if callable(globals().get(name))}
+
+
+__all__ = (
     "bracket",
     "lerp",
     "interp1",
+    "make_interp1",
     "sat_T",
     "sat_P",
     "pSat_T",
@@ -1267,6 +1523,7 @@ __all__ = [
     "s_Tx_u",
     "v_Tx_u",
     "state",
+    "state_batch",
     "state_u",
     "state_help",
     "s",
@@ -1274,4 +1531,4 @@ __all__ = [
     "lookup",
     "help_fn",
     "list_commands",
-]
+)
@@ -5,16 +5,26 @@ This script never rewrites canonical CSV content.
 """
 
 import argparse
+import array
 import csv
+import functools
 import json
 import os
-import pprint
+import pickle
+import py_compile
+from concurrent.futures import ProcessPoolExecutor
 
 def to_float(value, field_name, path, row_idx):
     if value is None:
         raise ValueError(
             "invalid float in {} row {} field {}: {}".format(path, row_idx, field_name, value)
         )
+    # Canonical CSV fields are usually clean numeric text, so try float()
+    # directly and only pay for the comma/space stripping on a miss.
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
     cleaned = str(value).strip().replace(",", "").replace(" ", "")
     if cleaned == "":
         raise ValueError(
@@ -23,41 +33,47 @@ def to_float(value, field_name, path, row_idx):
     return float(cleaned)
 
 
-def _parse_numeric_text(value):
+def decimals_in_text(value):
+    """Count decimal digits in the mantissa of numeric text, or None.
+
+    One validation via float() plus a single character pass, instead of the
+    previous parse/split/split/split chain per field.
+    """
     if value is None:
         return None
-    cleaned = str(value).strip().replace(",", "").replace(" ", "")
-    if cleaned == "":
-        return None
     try:
-        float(cleaned)
-        return cleaned
-    except Exception:
-        return None
-
-
-def decimals_in_text(value):
-    numeric = _parse_numeric_text(value)
-    if numeric is None:
-        return None
+        float(value)
+        text = str(value).strip()
+    except (TypeError, ValueError):
+        text = str(value).strip().replace(",", "").replace(" ", "")
+        if text == "":
+            return None
+        try:
+            float(text)
+        except Exception:
+            return None
 
-    if "e" in numeric or "E" in numeric:
-        base = numeric.split("e")[0].split("E")[0]
-    else:
-        base = numeric
-    if "." not in base:
-        return 0
-    return len(base.split(".")[1])
+    count = 0
+    counting = False
+    for ch in text:
+        if ch == "e" or ch == "E":
+            break
+        if counting:
+            count += 1
+        elif ch == ".":
+            counting = True
+    return count
 
 
-def compute_text_precision(rows, semantic_to_column):
+def compute_text_precision(rows, headers, semantic_to_column):
     precision = {}
     for semantic, column in semantic_to_column.items():
+        idx = headers.index(column)
         max_decimals = 0
         for row in rows:
-            if column not in row:
+            if idx >= len(row):
                 continue
-            d = decimals_in_text(row.get(column))
+            d = decimals_in_text(row[idx])
             if d is not None and d > max_decimals:
                 max_decimals = d
         precision[semantic] = max_decimals
@@ -112,12 +128,17 @@ def finalize_precision(raw):
 
 
 def read_csv_rows(path):
+    """Read a CSV once with the plain C-level reader.
+
+    Returns (headers, rows) where rows are lists addressed by header index;
+    this skips csv.DictReader's per-row dict construction.
+    """
     if not os.path.exists(path):
         raise FileNotFoundError("missing canonical CSV: " + path)
     with open(path, "r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        headers = next(reader, [])
         rows = list(reader)
-        headers = list(reader.fieldnames or [])
     return headers, rows
 
 
@@ -132,20 +153,30 @@ def load_schema(path):
     return out
 
 
+# Validated schema entries keyed by (id(schema), table); the schema object
+# itself is kept in the value so a recycled id can never alias a new dict.
+_SCHEMA_ENTRY_CACHE = {}
+
+
 def require_schema_entry(schema, table_name):
+    key = (id(schema), table_name)
+    cached = _SCHEMA_ENTRY_CACHE.get(key)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
     entry = schema.get(table_name)
     if entry is None:
         raise ValueError("missing schema entry for table {}".format(table_name))
     if not entry.get("file"):
         raise ValueError("schema entry for {} must define file".format(table_name))
+    _SCHEMA_ENTRY_CACHE[key] = (schema, entry)
     return entry
 
 
-def resolve_columns(table_name, headers, schema_entry, required_props):
+@functools.lru_cache(maxsize=None)
+def _resolve_columns_cached(table_name, headers, p_col, t_col, col_items, required_props):
     columns = {}
-    p_col = schema_entry.get("pressure_column")
-    t_col = schema_entry.get("temperature_column")
-    col_map = schema_entry.get("columns") or {}
+    col_map = dict(col_items)
 
     if p_col is None or t_col is None:
         raise ValueError("schema mapping for {} must include pressure_column and temperature_column".format(table_name))
@@ -168,6 +199,23 @@ def resolve_columns(table_name, headers, schema_entry, required_props):
     return columns
 
 
+def resolve_columns(table_name, headers, schema_entry, required_props):
+    # The cache key flattens the schema entry to hashable tuples; repeated
+    # resolutions of the same table (e.g. test reruns in one process) hit
+    # the memo. Callers get a copy so the cached mapping stays pristine.
+    col_map = schema_entry.get("columns") or {}
+    return dict(
+        _resolve_columns_cached(
+            table_name,
+            tuple(headers),
+            schema_entry.get("pressure_column"),
+            schema_entry.get("temperature_column"),
+            tuple(sorted(col_map.items())),
+            tuple(required_props),
+        )
+    )
+
+
 def parse_saturation_table(table_name, path, schema_entry, axis):
     headers, rows = read_csv_rows(path)
     cols = resolve_columns(
@@ -179,6 +227,7 @@ def parse_saturation_table(table_name, path, schema_entry, axis):
 
     precision = compute_text_precision(
         rows,
+        headers,
         {
             "T_C": cols["temperature"],
             "P_kPa": cols["pressure"],
@@ -193,51 +242,48 @@ def parse_saturation_table(table_name, path, schema_entry, axis):
         },
     )
 
-    parsed = []
+    if axis not in ("T", "P"):
+        raise ValueError("invalid saturation axis: {}".format(axis))
+
+    # Rows parse straight into one packed double column per output key; the
+    # intermediate dict-per-row representation is gone. Fields carry the
+    # header index of their column so each access is a plain list index.
+    fields = (
+        ("T", headers.index(cols["temperature"]), "temperature"),
+        ("P", headers.index(cols["pressure"]), "pressure"),
+        ("vf", headers.index(cols["vf"]), "vf"),
+        ("vg", headers.index(cols["vg"]), "vg"),
+        ("uf", headers.index(cols["uf"]), "uf"),
+        ("ug", headers.index(cols["ug"]), "ug"),
+        ("hf", headers.index(cols["hf"]), "hf"),
+        ("hg", headers.index(cols["hg"]), "hg"),
+        ("sf", headers.index(cols["sf"]), "sf"),
+        ("sg", headers.index(cols["sg"]), "sg"),
+    )
+    columns = {key: array.array("d") for key, _, _ in fields}
     skipped_rows = []
     for row_idx, row in enumerate(rows, start=2):
+        mark = len(columns["T"])
         try:
-            item = {
-                "T": to_float(row.get(cols["temperature"]), "temperature", path, row_idx),
-                "P": to_float(row.get(cols["pressure"]), "pressure", path, row_idx),
-                "vf": to_float(row.get(cols["vf"]), "vf", path, row_idx),
-                "vg": to_float(row.get(cols["vg"]), "vg", path, row_idx),
-                "uf": to_float(row.get(cols["uf"]), "uf", path, row_idx),
-                "ug": to_float(row.get(cols["ug"]), "ug", path, row_idx),
-                "hf": to_float(row.get(cols["hf"]), "hf", path, row_idx),
-                "hg": to_float(row.get(cols["hg"]), "hg", path, row_idx),
-                "sf": to_float(row.get(cols["sf"]), "sf", path, row_idx),
-                "sg": to_float(row.get(cols["sg"]), "sg", path, row_idx),
-            }
-            parsed.append(item)
+            # A short row raises IndexError and is skipped like any other
+            # unparsable row.
+            for key, idx, field_name in fields:
+                columns[key].append(to_float(row[idx], field_name, path, row_idx))
         except Exception:
+            # Roll back any columns this row already touched.
+            for key, _, _ in fields:
+                del columns[key][mark:]
             skipped_rows.append(row_idx)
 
-    if axis == "T":
-        parsed.sort(key=lambda x: x["T"])
-    elif axis == "P":
-        parsed.sort(key=lambda x: x["P"])
-    else:
-        raise ValueError("invalid saturation axis: {}".format(axis))
-
-    out = {
-        "T": [r["T"] for r in parsed],
-        "P": [r["P"] for r in parsed],
-        "vf": [r["vf"] for r in parsed],
-        "vg": [r["vg"] for r in parsed],
-        "uf": [r["uf"] for r in parsed],
-        "ug": [r["ug"] for r in parsed],
-        "hf": [r["hf"] for r in parsed],
-        "hg": [r["hg"] for r in parsed],
-        "sf": [r["sf"] for r in parsed],
-        "sg": [r["sg"] for r in parsed],
-    }
+    axis_col = columns[axis]
+    order = sorted(range(len(axis_col)), key=axis_col.__getitem__)
+    out = {key: [columns[key][i] for i in order] for key, _, _ in fields}
 
     stats = {
         "table": table_name,
         "file": path,
         "rows_total": len(rows),
-        "rows_parsed": len(parsed),
+        "rows_parsed": len(axis_col),
         "rows_skipped": len(skipped_rows),
         "skipped_row_numbers": skipped_rows,
     }
@@ -256,6 +302,7 @@ def parse_piecewise_table(table_name, path, schema_entry):
 
     precision = compute_text_precision(
         rows,
+        headers,
         {
             "P_kPa": cols["pressure"],
             "T_C": cols["temperature"],
@@ -270,31 +317,42 @@ def parse_piecewise_table(table_name, path, schema_entry):
     skipped_rows = []
     parsed_rows = 0
 
+    # Column names bound once: the per-row work is six dict gets and six
+    # float parses, with no repeated schema-map probes.
+    p_idx = headers.index(cols["pressure"])
+    t_idx = headers.index(cols["temperature"])
+    v_idx = headers.index(cols["v"])
+    u_idx = headers.index(cols["u"])
+    h_idx = headers.index(cols["h"])
+    s_idx = headers.index(cols["s"])
+    ft = to_float
+    get_block = block_map.get
+
     for row_idx, row in enumerate(rows, start=2):
         try:
-            p = to_float(row.get(cols["pressure"]), "pressure", path, row_idx)
-            t = to_float(row.get(cols["temperature"]), "temperature", path, row_idx)
-            v = to_float(row.get(cols["v"]), "v", path, row_idx)
-            u = to_float(row.get(cols["u"]), "u", path, row_idx)
-            h = to_float(row.get(cols["h"]), "h", path, row_idx)
-            s = to_float(row.get(cols["s"]), "s", path, row_idx)
+            # A short row raises IndexError and is skipped like any other
+            # unparsable row.
+            p = ft(row[p_idx], "pressure", path, row_idx)
+            t = ft(row[t_idx], "temperature", path, row_idx)
+            v = ft(row[v_idx], "v", path, row_idx)
+            u = ft(row[u_idx], "u", path, row_idx)
+            h = ft(row[h_idx], "h", path, row_idx)
+            s = ft(row[s_idx], "s", path, row_idx)
         except Exception:
             skipped_rows.append(row_idx)
             continue
 
-        if p not in block_map:
-            block_map[p] = {
-                "T": [],
-                "v": [],
-                "u": [],
-                "h": [],
-                "s": [],
-            }
-        block_map[p]["T"].append(t)
-        block_map[p]["v"].append(v)
-        block_map[p]["u"].append(u)
-        block_map[p]["h"].append(h)
-        block_map[p]["s"].append(s)
+        # One dict probe per row; each block is a (T, v, u, h, s) tuple of
+        # column lists rather than a per-pressure dict.
+        block = get_block(p)
+        if block is None:
+            block = ([], [], [], [], [])
+            block_map[p] = block
+        block[0].append(t)
+        block[1].append(v)
+        block[2].append(u)
+        block[3].append(h)
+        block[4].append(s)
         parsed_rows += 1
 
     # Sort each pressure block by temperature while preserving per-row values.
@@ -306,23 +364,18 @@ def parse_piecewise_table(table_name, path, schema_entry):
     s_by_p = []
     row_counts_by_p = []
     for p in pressures:
-        zipped = list(
-            zip(
-                block_map[p]["T"],
-                block_map[p]["v"],
-                block_map[p]["u"],
-                block_map[p]["h"],
-                block_map[p]["s"],
-            )
-        )
-        zipped.sort(key=lambda x: x[0])
-        row_counts_by_p.append(len(zipped))
-
-        t_by_p.append([x[0] for x in zipped])
-        v_by_p.append([x[1] for x in zipped])
-        u_by_p.append([x[2] for x in zipped])
-        h_by_p.append([x[3] for x in zipped])
-        s_by_p.append([x[4] for x in zipped])
+        t_list, v_list, u_list, h_list, s_list = block_map[p]
+        # Index sort on the temperature column, then gather each property
+        # column once — no intermediate row tuples. sorted() is stable, so
+        # duplicate temperatures keep their CSV order as before.
+        order = sorted(range(len(t_list)), key=t_list.__getitem__)
+        row_counts_by_p.append(len(order))
+
+        t_by_p.append([t_list[i] for i in order])
+        v_by_p.append([v_list[i] for i in order])
+        u_by_p.append([u_list[i] for i in order])
+        h_by_p.append([h_list[i] for i in order])
+        s_by_p.append([s_list[i] for i in order])
 
     out = {
         "P": pressures,
@@ -347,36 +400,115 @@ def parse_piecewise_table(table_name, path, schema_entry):
     return out, stats, precision
 
 
+def tuple_literal(values):
+    """Render a sequence as a compact tuple literal.
+
+    Separators carry no whitespace: on the calculator the bundle's source
+    size feeds straight into filesystem footprint and tokenizer time, and
+    the space after each comma was costing several kilobytes across the
+    tables. Single-element tuples keep their trailing comma.
+    """
+    if not values:
+        return "()"
+    if len(values) == 1:
+        return "({},)".format(repr(values[0]))
+    return "({})".format(",".join(repr(x) for x in values))
+
+
+def emit_table_lines(name, table, registry=None):
+    """Yield source lines for one dict-of-columns table.
+
+    Columns are emitted as tuples: the runtime only ever indexes them, and
+    tuples are cheaper to allocate on import and safe from accidental
+    mutation. The layout stays columnar (one tuple per property) rather
+    than row-interleaved: the runtime's fused interpolators touch two
+    adjacent elements per column, and every consumer — steam.py, the tests,
+    and the desktop loaders — addresses data as table[key][i]. Floats are
+    rendered with repr(), which round-trips exactly; no rounding or
+    fixed-width formatting is ever applied to the data.
+    """
+    if registry is None:
+        registry = {}
+    emitted = {}
+
+    yield "{} = {{\n".format(name)
+    for key, value in table.items():
+        if value and isinstance(value[0], list):
+            yield "    '{}': (\n".format(key)
+            for row in value:
+                yield "        {},\n".format(tuple_literal(row))
+            yield "    ),\n"
+        else:
+            text = tuple_literal(value)
+            # Identical columns in an earlier table are emitted once and
+            # referenced here, so duplicated axes cost one object at import.
+            alias = registry.get(text)
+            if alias is not None:
+                yield "    '{}': {},\n".format(key, alias)
+            else:
+                emitted[text] = "{}['{}']".format(name, key)
+                yield "    '{}': {},\n".format(key, text)
+    yield "}\n\n"
+
+    # Aliases may only point at completed tables, so this table's columns
+    # join the registry after its closing brace is out.
+    registry.update(emitted)
+
+
 def write_steam_data(path, sat_t, sat_p, sh, comp, precision):
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
-    text = []
-    text.append('"""Auto-generated steam lookup data.\n')
-    text.append("Generated by tools/build_data.py from immutable canonical CSV tables.\n")
-    text.append('"""\n\n')
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('"""Auto-generated steam lookup data.\n')
+        handle.write("Generated by tools/build_data.py from immutable canonical CSV tables.\n")
+        handle.write('"""\n\n')
 
-    text.append("SAT_T = ")
-    text.append(pprint.pformat(sat_t, width=100, sort_dicts=False))
-    text.append("\n\n")
+        registry = {}
+        for name, table in (("SAT_T", sat_t), ("SAT_P", sat_p), ("SH", sh), ("COMP", comp)):
+            handle.writelines(emit_table_lines(name, table, registry))
 
-    text.append("SAT_P = ")
-    text.append(pprint.pformat(sat_p, width=100, sort_dicts=False))
-    text.append("\n\n")
+        # The precision dict is all string keys and numbers, so its JSON
+        # rendering is also a valid Python literal; this drops the last
+        # pprint dependency from the emitter.
+        handle.write("PRECISION = ")
+        handle.write(json.dumps(precision, indent=2))
+        handle.write("\n")
 
-    text.append("SH = ")
-    text.append(pprint.pformat(sh, width=100, sort_dicts=False))
-    text.append("\n\n")
+    # Pre-warm the bytecode cache so the first desktop import skips parsing
+    # the big literal module. The TI bundle path concatenates source and is
+    # unaffected; a compile failure here is a real build error.
+    py_compile.compile(path, doraise=True)
 
-    text.append("COMP = ")
-    text.append(pprint.pformat(comp, width=100, sort_dicts=False))
-    text.append("\n\n")
 
-    text.append("PRECISION = ")
-    text.append(pprint.pformat(precision, width=100, sort_dicts=False))
-    text.append("\n")
+def _as_tuples(table):
+    out = {}
+    for key, value in table.items():
+        if value and isinstance(value[0], list):
+            out[key] = tuple(tuple(row) for row in value)
+        else:
+            out[key] = tuple(value)
+    return out
 
-    with open(path, "w", encoding="utf-8") as handle:
-        handle.write("".join(text))
+
+def write_steam_cache(path, sat_t, sat_p, sh, comp, precision):
+    """Write a binary companion cache for desktop imports.
+
+    data/fastload.py prefers this over re-parsing the Python module. The TI
+    bundle never touches it. Shapes mirror steam_data.py (tuple columns).
+    """
+    payload = {
+        "SAT_T": _as_tuples(sat_t),
+        "SAT_P": _as_tuples(sat_p),
+        "SH": _as_tuples(sh),
+        "COMP": _as_tuples(comp),
+        "PRECISION": dict(precision),
+    }
+    # Write-and-rename so an interrupted build can never leave a truncated
+    # cache that mtime-outranks the freshly written module.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as handle:
+        pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
 
 
 def write_build_report(path, sat_t_stats, sat_p_stats, sh_stats, comp_stats, precision):
@@ -406,13 +538,19 @@ def write_build_report(path, sat_t_stats, sat_p_stats, sh_stats, comp_stats, pre
         handle.write("\n".join(lines).rstrip() + "\n")
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Build steam_data.py from canonical CSV + schema")
     parser.add_argument("--csv-dir", default="data/canonical_csv", help="Immutable canonical CSV directory")
     parser.add_argument("--schema", default="data/schema.json", help="Schema mapping JSON")
     parser.add_argument("--output", default="data/steam_data.py", help="Output data module")
     parser.add_argument("--report", default="data/build_report.txt", help="Build report output path")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse tables in up to N worker processes (default: serial)",
+    )
+    args = parser.parse_args(argv)
 
     schema = load_schema(args.schema)
 
@@ -426,22 +564,37 @@ def main():
     a3_path = os.path.join(args.csv_dir, a3_spec["file"])
     a4_path = os.path.join(args.csv_dir, a4_spec["file"])
 
-    sat_t, sat_t_stats, sat_t_precision = parse_saturation_table("A1", a1_path, a1_spec, axis="T")
-    precision_raw = {}
-    merge_precision(precision_raw, sat_t_precision)
+    # The four tables are independent, so they can parse in worker
+    # processes; the precision merge below stays serial and ordered.
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            a1_future = pool.submit(parse_saturation_table, "A1", a1_path, a1_spec, "T")
+            a2_future = pool.submit(parse_saturation_table, "A2", a2_path, a2_spec, "P")
+            a3_future = pool.submit(parse_piecewise_table, "A3", a3_path, a3_spec)
+            a4_future = pool.submit(parse_piecewise_table, "A4", a4_path, a4_spec)
+            sat_t, sat_t_stats, sat_t_precision = a1_future.result()
+            sat_p, sat_p_stats, sat_p_precision = a2_future.result()
+            sh, sh_stats, sh_precision = a3_future.result()
+            comp, comp_stats, comp_precision = a4_future.result()
+    else:
+        sat_t, sat_t_stats, sat_t_precision = parse_saturation_table("A1", a1_path, a1_spec, axis="T")
+        sat_p, sat_p_stats, sat_p_precision = parse_saturation_table("A2", a2_path, a2_spec, axis="P")
+        sh, sh_stats, sh_precision = parse_piecewise_table("A3", a3_path, a3_spec)
+        comp, comp_stats, comp_precision = parse_piecewise_table("A4", a4_path, a4_spec)
 
-    sat_p, sat_p_stats, sat_p_precision = parse_saturation_table("A2", a2_path, a2_spec, axis="P")
     sat_p_stats["table"] = "A2"
-    merge_precision(precision_raw, sat_p_precision)
 
-    sh, sh_stats, sh_precision = parse_piecewise_table("A3", a3_path, a3_spec)
-    comp, comp_stats, comp_precision = parse_piecewise_table("A4", a4_path, a4_spec)
+    precision_raw = {}
+    merge_precision(precision_raw, sat_t_precision)
+    merge_precision(precision_raw, sat_p_precision)
     merge_precision(precision_raw, sh_precision)
     merge_precision(precision_raw, comp_precision)
 
     precision = finalize_precision(precision_raw)
 
     write_steam_data(args.output, sat_t=sat_t, sat_p=sat_p, sh=sh, comp=comp, precision=precision)
+    cache_path = os.path.splitext(args.output)[0] + ".pkl"
+    write_steam_cache(cache_path, sat_t=sat_t, sat_p=sat_p, sh=sh, comp=comp, precision=precision)
     write_build_report(
         args.report,
         sat_t_stats=sat_t_stats,
@@ -18,43 +18,43 @@ def read_text(path):
         return handle.read()
 
 
+_STRIP_PREFIXES = (
+    "from data.steam_data import",
+    "import data.steam_data",
+)
+
+
 def sanitize_steam_source(src):
     """Remove external-data import lines for single-file deployment."""
-    kept = []
-    for line in src.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("from data.steam_data import"):
-            continue
-        if stripped.startswith("import data.steam_data"):
-            continue
-        kept.append(line)
-    return "\n".join(kept).strip() + "\n"
+    kept = "\n".join(
+        line for line in src.splitlines() if not line.strip().startswith(_STRIP_PREFIXES)
+    )
+    return kept.strip() + "\n"
 
 
 def build_bundle(data_path, steam_path, output_path):
-    data_src = read_text(data_path).strip() + "\n\n"
-    steam_src = sanitize_steam_source(read_text(steam_path))
-
-    out = []
-    out.append('"""XSteam-Lite TI-Nspire bundle (auto-generated)."""\n\n')
-    out.append("# ---- embedded data tables ----\n")
-    out.append(data_src)
-    out.append("# ---- embedded steam core ----\n")
-    out.append(steam_src)
-
     out_dir = os.path.dirname(output_path)
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
+
+    # Sections are written straight to the output file; only the (small)
+    # steam core is held in memory for import stripping, never the whole
+    # bundle plus its parts.
     with open(output_path, "w", encoding="utf-8") as handle:
-        handle.write("".join(out))
+        handle.write('"""XSteam-Lite TI-Nspire bundle (auto-generated)."""\n\n')
+        handle.write("# ---- embedded data tables ----\n")
+        handle.write(read_text(data_path).strip())
+        handle.write("\n\n")
+        handle.write("# ---- embedded steam core ----\n")
+        handle.write(sanitize_steam_source(read_text(steam_path)))
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Build single-file TI deploy bundle")
     parser.add_argument("--data", default="data/steam_data.py", help="Path to steam_data.py")
     parser.add_argument("--steam", default="tinspire/steam.py", help="Path to core steam module")
     parser.add_argument("--output", default="s.py", help="Output bundle path")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     build_bundle(args.data, args.steam, args.output)
 if __name__ == "__main__":